@@ -0,0 +1,45 @@
+from cli.core.errors import BYTES_IN_MEGABYTE
+from cli.core.memory import MemoryTracker, PhaseMemory
+from rich import box
+from rich.table import Table
+
+
+def format_megabytes(size_bytes: int) -> str:
+    """Format a size in bytes as megabytes with one decimal."""
+    size_mb = size_bytes / BYTES_IN_MEGABYTE
+    return f"{size_mb:.1f}"
+
+
+class MemoryTableRenderer:
+    """Render per-phase memory high-water marks as rich tables."""
+
+    def render(self, memory_tracker: MemoryTracker) -> Table:
+        """Build the memory usage table for console output."""
+        table = Table(title=self._title(memory_tracker), box=box.ROUNDED)
+        table.add_column("Phase")
+        for column in ("Calls", "Peak MB", "Retained MB"):
+            table.add_column(column, justify="right")
+
+        for phase_memory in memory_tracker.phases:
+            table.add_row(
+                phase_memory.name,
+                f"[blue]{phase_memory.calls}",
+                self._format_peak(phase_memory, memory_tracker.budget_bytes),
+                format_megabytes(phase_memory.retained_bytes),
+            )
+
+        return table
+
+    def _title(self, memory_tracker: MemoryTracker) -> str:
+        title = f"Memory peak {format_megabytes(memory_tracker.total_peak_bytes)} MB"
+        if memory_tracker.budget_bytes is None:
+            return title
+
+        return f"{title}, budget {format_megabytes(memory_tracker.budget_bytes)} MB"
+
+    def _format_peak(self, phase_memory: PhaseMemory, budget_bytes: int | None) -> str:
+        peak = format_megabytes(phase_memory.peak_bytes)
+        if budget_bytes is not None and phase_memory.peak_bytes > budget_bytes:
+            return f"[red bold]{peak}"
+
+        return peak
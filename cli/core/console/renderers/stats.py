@@ -9,7 +9,7 @@ class StatsTableRenderer:
     def render(self, stats: StatsCollector) -> Table:
         """Build the stats table for console output."""
         table = Table(stats.table_title(), box=box.ROUNDED)
-        columns = ["", "Total", "Synced", "Errors", "Skipped"]
+        columns = ["", "Total", "Synced", "Errors", "Skipped", "Unchanged"]
         for column in columns:
             table.add_column(column)
 
@@ -20,6 +20,7 @@ class StatsTableRenderer:
                 f"[green]{tab_stats['synced']}",
                 f"[red bold]{tab_stats['error']}",
                 f"[white]{tab_stats['skipped']}",
+                f"[cyan]{tab_stats['unchanged']}",
             )
 
         return table
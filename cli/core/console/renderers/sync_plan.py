@@ -0,0 +1,67 @@
+from collections import Counter
+from pathlib import Path
+from types import MappingProxyType
+
+from cli.core.services.sync_plan import PlanAction, SyncPlan
+from rich import box
+from rich.console import Group
+from rich.table import Table
+
+ACTION_STYLES = MappingProxyType({
+    PlanAction.CREATE: "green",
+    PlanAction.UPDATE: "blue",
+    PlanAction.UNCHANGED: "cyan",
+    PlanAction.SKIP: "white",
+    PlanAction.CONFLICT: "red bold",
+})
+CHANGING_ACTIONS = frozenset((PlanAction.CREATE, PlanAction.UPDATE, PlanAction.CONFLICT))
+
+
+class SyncPlanRenderer:
+    """Render sync plans as rich tables."""
+
+    def render(self, sync_plan: SyncPlan) -> Group:
+        """Build the planned changes table and the summary table for console output.
+
+        Rows that a sync would skip or leave unchanged are only counted in the summary.
+        """
+        return Group(self._render_changes(sync_plan), self._render_summary(sync_plan))
+
+    def _render_changes(self, sync_plan: SyncPlan) -> Table:
+        table = Table(title="Planned changes", box=box.ROUNDED)
+        for column in ("Tab", "Row", "ID", "Action", "Remote ID", "Detail"):
+            table.add_column(column)
+
+        for plan_entry in sync_plan.entries:
+            if plan_entry.action not in CHANGING_ACTIONS:
+                continue
+            table.add_row(
+                plan_entry.tab,
+                plan_entry.coordinate or "",
+                plan_entry.row_id or "",
+                _styled(plan_entry.action, plan_entry.action),
+                plan_entry.remote_id or "",
+                plan_entry.detail,
+            )
+        return table
+
+    def _render_summary(self, sync_plan: SyncPlan) -> Table:
+        table = Table(
+            title="Sync plan [red bold]HAS CONFLICTS" if sync_plan.has_conflicts else "Sync plan",
+            box=box.ROUNDED,
+        )
+        for column in ("File", "Tab", *(action.capitalize() for action in PlanAction)):
+            table.add_column(column)
+
+        for (source, tab_name), action_counts in sync_plan.summary().items():
+            table.add_row(Path(source).name, tab_name, *_styled_counts(action_counts))
+        return table
+
+
+def _styled(action: PlanAction, text: object) -> str:
+    style = ACTION_STYLES[action]
+    return f"[{style}]{text}"
+
+
+def _styled_counts(action_counts: Counter[PlanAction]) -> list[str]:
+    return [_styled(action, action_counts[action]) for action in PlanAction]
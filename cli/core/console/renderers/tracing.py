@@ -0,0 +1,29 @@
+from cli.core.mpt.tracing import EndpointStats
+from rich import box
+from rich.table import Table
+
+
+class RequestTraceTableRenderer:
+    """Render per-endpoint request latency statistics as rich tables."""
+
+    def render(self, endpoint_stats: list[EndpointStats]) -> Table:
+        """Build the request latency table for console output."""
+        table = Table(title="API Requests", box=box.ROUNDED)
+        table.add_column("Method")
+        table.add_column("Endpoint")
+        for column in ("Calls", "Errors", "p50 ms", "p95 ms", "p99 ms", "Bytes"):
+            table.add_column(column, justify="right")
+
+        for stats in endpoint_stats:
+            table.add_row(
+                stats.method,
+                stats.endpoint,
+                f"[blue]{stats.calls}",
+                f"[red bold]{stats.errors}" if stats.errors else "0",
+                f"{stats.p50_ms:.1f}",
+                f"{stats.p95_ms:.1f}",
+                f"{stats.p99_ms:.1f}",
+                str(stats.total_bytes),
+            )
+
+        return table
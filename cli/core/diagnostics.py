@@ -0,0 +1,139 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import typer
+from cli.core.console import console
+from cli.core.console.renderers.memory import MemoryTableRenderer
+from cli.core.console.renderers.tracing import RequestTraceTableRenderer
+from cli.core.errors import BYTES_IN_MEGABYTE
+from cli.core.memory import MemoryBudgetAction, MemoryTracker
+from cli.core.mpt.cassette import CassettePlayer, CassetteRecorder, ReplayLatency
+from cli.core.mpt.tracing import RequestTracer
+from cli.core.profiling import Profiler
+from cli.core.state import state
+
+
+@dataclass(frozen=True)
+class DiagnosticsOptions:
+    """Diagnostics requested through the global CLI options.
+
+    Attributes:
+        trace: Print API request latency percentiles when the command ends.
+        trace_file: File path for the raw API request traces, implies ``trace``.
+        profile: File path for the cProfile statistics, enables profiling if set.
+        track_memory: Print peak and retained memory per phase when the command ends.
+        memory_budget: Soft memory budget in MB, implies ``track_memory``.
+        memory_budget_action: Whether to warn or abort when the budget is exceeded.
+        record: File path for a cassette of the API exchanges of the command.
+        replay: File path of a cassette to answer the API requests from.
+        replay_latency: Whether replayed responses take their recorded latency or none.
+
+    """
+
+    trace: bool = False
+    trace_file: Path | None = None
+    profile: Path | None = None
+    track_memory: bool = False
+    memory_budget: int | None = None
+    memory_budget_action: MemoryBudgetAction = MemoryBudgetAction.WARN
+    record: Path | None = None
+    replay: Path | None = None
+    replay_latency: ReplayLatency = ReplayLatency.ORIGINAL
+
+
+class DiagnosticsSession:  # noqa: WPS214
+    """Enable the requested diagnostics for one command and report them when it ends."""
+
+    def __init__(self, ctx: typer.Context) -> None:
+        self._ctx = ctx
+
+    def start(self, options: DiagnosticsOptions) -> None:
+        """Reset the diagnostics state and start the requested diagnostics.
+
+        Args:
+            options: The requested diagnostics.
+
+        """
+        state.request_tracer = None
+        state.span_recorder = None
+        state.memory_tracker = None
+        state.cassette = None
+        if options.record:
+            self._start_recording(options.record)
+        if options.replay:
+            self._start_replay(options.replay, options.replay_latency)
+        if options.trace or options.trace_file:
+            self._start_request_tracing(options.trace_file)
+        if options.profile:
+            self._start_profiling(options.profile)
+        if options.track_memory or options.memory_budget:
+            self._start_memory_tracking(options.memory_budget, options.memory_budget_action)
+
+    def _start_recording(self, cassette_path: Path) -> None:
+        recorder = CassetteRecorder(cassette_path)
+        recorder.start()
+        state.cassette = recorder
+        self._ctx.call_on_close(lambda: self._stop_recording(recorder))
+
+    def _stop_recording(self, recorder: CassetteRecorder) -> None:
+        state.cassette = None
+        console.print(
+            f"{recorder.recorded} API exchanges have been recorded to: {recorder.cassette_path}"
+        )
+
+    def _start_replay(self, cassette_path: Path, latency: ReplayLatency) -> None:
+        player = CassettePlayer.load(cassette_path, latency)
+        state.cassette = player
+        self._ctx.call_on_close(lambda: self._stop_replay(player))
+
+    def _stop_replay(self, player: CassettePlayer) -> None:
+        state.cassette = None
+        if player.remaining:
+            console.print(
+                f"[yellow]{player.remaining} recorded API exchanges were not replayed[/yellow]"
+            )
+
+    def _start_request_tracing(self, trace_file: Path | None) -> None:
+        request_tracer = RequestTracer()
+        state.request_tracer = request_tracer
+        self._ctx.call_on_close(lambda: self._print_request_traces(request_tracer, trace_file))
+
+    def _print_request_traces(self, request_tracer: RequestTracer, trace_file: Path | None) -> None:
+        if trace_file is not None:
+            request_tracer.dump_jsonl(trace_file)
+            console.print(f"Request traces have been written to: {trace_file}")
+
+        endpoint_stats = request_tracer.endpoint_stats()
+        if endpoint_stats:
+            console.print(RequestTraceTableRenderer().render(endpoint_stats))
+
+    def _start_profiling(self, profile_path: Path) -> None:
+        # API requests are traced as well so they show up in the Chrome trace next to the
+        # service spans.
+        if state.request_tracer is None:
+            state.request_tracer = RequestTracer()
+        request_tracer = state.request_tracer
+        profiler = Profiler(profile_path)
+        state.span_recorder = profiler.span_recorder
+        self._ctx.call_on_close(lambda: self._stop_profiling(profiler, request_tracer))
+        profiler.start()
+
+    def _stop_profiling(self, profiler: Profiler, request_tracer: RequestTracer) -> None:
+        profiler.stop(request_tracer.traces)
+        state.span_recorder = None
+        console.print(f"Profile has been written to: {profiler.profile_path}")
+        console.print(f"Chrome trace has been written to: {profiler.chrome_trace_path}")
+
+    def _start_memory_tracking(
+        self, budget_mb: int | None, budget_action: MemoryBudgetAction
+    ) -> None:
+        budget_bytes = None if budget_mb is None else budget_mb * BYTES_IN_MEGABYTE
+        memory_tracker = MemoryTracker(budget_bytes, budget_action)
+        state.memory_tracker = memory_tracker
+        self._ctx.call_on_close(lambda: self._stop_memory_tracking(memory_tracker))
+        memory_tracker.start()
+
+    def _stop_memory_tracking(self, memory_tracker: MemoryTracker) -> None:
+        memory_tracker.stop()
+        state.memory_tracker = None
+        console.print(MemoryTableRenderer().render(memory_tracker))
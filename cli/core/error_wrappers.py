@@ -4,9 +4,10 @@ from http import HTTPStatus
 from typing import Any, ParamSpec, TypeVar
 
 from mpt_api_client.exceptions import MPTHttpError as APIException
+from mpt_api_client.exceptions import MPTMaxRetryError
 from requests import RequestException, Response
 
-ErrorFactory = Callable[[str, str], Exception]
+ErrorFactory = Callable[..., Exception]
 CallableParams = ParamSpec("CallableParams")
 RetType = TypeVar("RetType")
 
@@ -56,12 +57,13 @@ class HttpErrorWrapper[**CallableParams, RetType]:
                 msg = "No response"
                 raise self._error_factory(str(error), msg) from error
 
-            if error.response.status_code != HTTPStatus.BAD_REQUEST:
+            status_code = error.response.status_code
+            if status_code != HTTPStatus.BAD_REQUEST:
                 msg = error.response.text
-                raise self._error_factory(str(error), msg) from error
+                raise self._error_factory(str(error), msg, status_code) from error
 
             msg = _parse_bad_request_message(error.response)
-            raise self._error_factory(str(error), msg) from error
+            raise self._error_factory(str(error), msg, status_code) from error
 
     def __get__(self, instance: Any, owner: type[Any] | None = None) -> Any:
         if instance is None:
@@ -91,7 +93,11 @@ class ApiErrorWrapper[**CallableParams, RetType]:
         try:
             return self._func(*args, **kwargs)
         except APIException as error:
-            raise self._error_factory(str(error), error.body) from error
+            raise self._error_factory(str(error), error.body, error.status_code) from error
+        except MPTMaxRetryError as error:
+            raise self._error_factory(
+                str(error), "No response", is_connection_error=True
+            ) from error
 
     def __get__(self, instance: Any, owner: type[Any] | None = None) -> Any:
         if instance is None:
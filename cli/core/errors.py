@@ -1,10 +1,12 @@
 from collections.abc import Callable
+from http import HTTPStatus
 from typing import ParamSpec, TypeVar, cast
 
 from cli.core.error_wrappers import ApiErrorWrapper, HttpErrorWrapper
 
 CallableParams = ParamSpec("CallableParams")
 RetType = TypeVar("RetType")
+BYTES_IN_MEGABYTE = 1024 * 1024
 
 
 class CLIError(Exception):
@@ -12,11 +14,35 @@ class CLIError(Exception):
 
 
 class MPTAPIError(CLIError):
-    """Exception raised when MPT API operations fail."""
+    """Exception raised when MPT API operations fail.
 
-    def __init__(self, request_msg: str, response_body: str):
+    Attributes:
+        status_code: HTTP status code of the response, or None if there is no response.
+        is_connection_error: Whether the request failed without a response.
+
+    """
+
+    def __init__(
+        self,
+        request_msg: str,
+        response_body: str,
+        status_code: int | None = None,
+        *,
+        is_connection_error: bool = False,
+    ):
         self._response_body = response_body
         self._request_msg = request_msg
+        self.status_code = status_code
+        self.is_connection_error = is_connection_error
+
+    @property
+    def is_transient(self) -> bool:
+        """Whether the failure may not happen again, i.e. a server or connection error."""
+        if self.is_connection_error:
+            return True
+        return self.status_code is not None and (
+            self.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+        )
 
     def __str__(self) -> str:
         return f"{self._request_msg} with response body {self._response_body}"
@@ -62,3 +88,20 @@ class NoActiveAccountFoundError(CLIError):
             "No active account found. Activate any account first using "
             "'mpt-cli accounts activate ACCOUNT-ID' command"
         )
+
+
+class MemoryBudgetExceededError(CLIError):
+    """Exception raised when a command phase exceeds the configured memory budget."""
+
+    def __init__(self, phase_name: str, peak_bytes: int, budget_bytes: int):
+        self.phase_name = phase_name
+        self.peak_bytes = peak_bytes
+        self.budget_bytes = budget_bytes
+
+    def __str__(self) -> str:
+        peak_mb = self.peak_bytes / BYTES_IN_MEGABYTE
+        budget_mb = self.budget_bytes / BYTES_IN_MEGABYTE
+        return (
+            f"Memory peak of {peak_mb:.1f} MB during '{self.phase_name}' "
+            f"exceeded the budget of {budget_mb:.1f} MB"
+        )
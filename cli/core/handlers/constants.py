@@ -1 +1,3 @@
 ERROR_COLUMN_NAME = "Error"
+# Errors of data models decoding invalid cell values, e.g. an unknown enum value.
+ROW_DECODE_ERRORS = (KeyError, OSError, TypeError, ValueError)
@@ -24,3 +24,18 @@ class RequiredFieldValuesError(ExcelFileHandlerError):
     """Exception raised when required field values are missing from Excel sheets."""
 
     _default_message = "Required value fields are missing"
+
+
+def describe_row_error(error: Exception) -> str:
+    """Describe the error of a data model decoding a row.
+
+    Args:
+        error: The error raised while decoding the row.
+
+    Returns:
+        The error message, naming the missing column of a KeyError.
+
+    """
+    if isinstance(error, KeyError):
+        return f"Missing column {error}"
+    return str(error)
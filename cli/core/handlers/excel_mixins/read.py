@@ -1,4 +1,5 @@
 import re
+from collections.abc import Generator
 from typing import Any
 
 from cli.core.handlers.excel_mixins.types import (
@@ -36,6 +37,20 @@ class ExcelReadMixin:  # noqa: WPS214
                 if fields is None or header_fields[index] in fields
             }
 
+    def get_column_from_horizontal_sheet(
+        self, sheet_name: str, field: str
+    ) -> Generator[tuple[str, Any], None, None]:
+        """Retrieves the coordinate and value of every cell below the header of one column.
+
+        Only the cells of the column are read. Nothing is retrieved if no header matches.
+        """
+        header_fields = self._get_fields_from_horizontal_worksheet(sheet_name, 1)
+        if field in header_fields:
+            column = header_fields.index(field) + 1
+            sheet = self._get_worksheet(sheet_name)
+            for column_cells in sheet.iter_cols(min_row=2, min_col=column, max_col=column):
+                yield from ((cell.coordinate, cell.value) for cell in column_cells)
+
     def get_data_from_vertical_sheet(
         self, sheet_name: str, fields: tuple[str, ...] | None = None
     ) -> SheetData:
@@ -1,6 +1,8 @@
 from pathlib import Path
 
 import openpyxl
+from cli.core.memory import memory_phase
+from cli.core.profiling import trace_span
 from openpyxl.reader.excel import load_workbook
 from openpyxl.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
@@ -20,7 +22,8 @@ class ExcelWorkbookMixin:
     @property
     def workbook(self) -> Workbook:
         if self._workbook_cache is None:
-            self._workbook_cache = load_workbook(self.file_path)
+            with trace_span("Load workbook", "excel"), memory_phase("Load workbook"):
+                self._workbook_cache = load_workbook(self.file_path)
 
         return self._workbook_cache
 
@@ -2,6 +2,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from cli.core.handlers.excel_mixins.types import SheetData
+from cli.core.memory import memory_phase
+from cli.core.profiling import trace_span
 from openpyxl.styles import NamedStyle
 from openpyxl.utils import get_column_letter
 from openpyxl.workbook import Workbook
@@ -36,7 +38,8 @@ class ExcelWriteMixin:  # noqa: WPS214
 
     def save(self) -> None:
         """Saves the current workbook to the file path and cleans worksheet cache."""
-        self.workbook.save(self.file_path)
+        with trace_span("Save workbook", "excel"), memory_phase("Save workbook"):
+            self.workbook.save(self.file_path)
         self._clean_worksheets()
 
     def write(self, sheet_rows: list[SheetData]) -> None:
@@ -13,13 +13,16 @@ class ExcelFileManager(ABC):
 
     This class provides common functionality for Excel file managers,
     including tab management, error handling, and data writing operations.
+
+    File managers of the same workbook can share its file handler, so they all read and
+    write the same loaded workbook instead of saving over each other's changes.
     """
 
     _sheet_name: str
     _data_validation_map: ClassVar[Mapping[str, DataValidation]] = {}
 
-    def __init__(self, file_path: str):
-        self.file_handler = ExcelFileHandler(Path(file_path))
+    def __init__(self, file_path: str, file_handler: ExcelFileHandler | None = None):
+        self.file_handler = file_handler or ExcelFileHandler(Path(file_path))
 
     @property
     def tab_name(self) -> str:
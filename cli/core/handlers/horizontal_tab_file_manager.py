@@ -1,18 +1,22 @@
 from abc import abstractmethod
-from collections.abc import Generator, Mapping
+from collections.abc import Callable, Generator, Mapping
 from typing import TYPE_CHECKING, Any, ClassVar, override
 
-from cli.core.handlers.constants import ERROR_COLUMN_NAME
+from cli.core.handlers.constants import ERROR_COLUMN_NAME, ROW_DECODE_ERRORS
+from cli.core.handlers.errors import describe_row_error
 from cli.core.handlers.excel_file_handler import CellPosition
 from cli.core.handlers.excel_styles import get_number_format_style, horizontal_tab_style
 from cli.core.handlers.file_manager import ExcelFileManager
+from cli.core.memory import memory_phase
 from openpyxl.styles import NamedStyle
 
 if TYPE_CHECKING:
     from cli.core.models import BaseDataModel
 
+type RowCheck[DataModel] = Callable[[DataModel], None]
 
-class HorizontalTabFileManager[DataModel: "BaseDataModel"](ExcelFileManager):
+
+class HorizontalTabFileManager[DataModel: "BaseDataModel"](ExcelFileManager):  # noqa: WPS214
     """File manager for handling horizontally-oriented Excel tabs.
 
     This class manages Excel sheets where data is organized horizontally,
@@ -59,7 +63,26 @@ class HorizontalTabFileManager[DataModel: "BaseDataModel"](ExcelFileManager):
             DataModel: An object containing the data for each item row.
         """
         for row_data in self._read_data():
-            yield self._data_model.from_dict(row_data)
+            with memory_phase("Decode rows"):
+                data_model = self._data_model.from_dict(row_data)
+            yield data_model
+
+    def find_row_errors(
+        self, check_row: RowCheck[DataModel] | None = None
+    ) -> Generator[tuple[str, str], None, None]:
+        """Decodes every row of the sheet and yields the errors of the invalid rows.
+
+        Args:
+            check_row: Additional check of the decoded rows, raising ValueError if invalid.
+
+        Yields:
+            tuple[str, str]: The coordinate of the invalid row and the error message.
+        """
+        for row_data in self._read_data():
+            try:
+                self._check_row_data(row_data, check_row)
+            except ROW_DECODE_ERRORS as error:
+                yield self._get_row_coordinate(row_data) or "", describe_row_error(error)
 
     @override
     def write_error(self, error: str, resource_id: str | None = None) -> None:
@@ -93,6 +116,19 @@ class HorizontalTabFileManager[DataModel: "BaseDataModel"](ExcelFileManager):
 
         return get_number_format_style(currency, precision)
 
+    def _check_row_data(
+        self, row_data: dict[str, Any], check_row: RowCheck[DataModel] | None
+    ) -> None:
+        data_model = self._data_model.from_dict(row_data)
+        if check_row is not None:
+            check_row(data_model)
+
+    def _get_row_coordinate(self, row_data: Mapping[str, Any]) -> str | None:
+        cell = next(iter(row_data.values()), None)
+        if not isinstance(cell, Mapping):
+            return None
+        return cell.get("coordinate")
+
     @abstractmethod
     def _read_data(self) -> Generator[dict[str, Any], None, None]:
         raise NotImplementedError
@@ -1,8 +1,9 @@
-from collections.abc import Mapping
+from collections.abc import Generator, Mapping
 from typing import TYPE_CHECKING, Any, ClassVar, override
 
-from cli.core.handlers.constants import ERROR_COLUMN_NAME
-from cli.core.handlers.excel_file_handler import CellPosition
+from cli.core.handlers.constants import ERROR_COLUMN_NAME, ROW_DECODE_ERRORS
+from cli.core.handlers.errors import describe_row_error
+from cli.core.handlers.excel_file_handler import CellPosition, ExcelFileHandler
 from cli.core.handlers.excel_styles import general_tab_title_style
 from cli.core.handlers.file_manager import ExcelFileManager
 
@@ -10,12 +11,15 @@ if TYPE_CHECKING:
     from cli.core.models import BaseDataModel
 
 
-class VerticalTabFileManager[DataModel: "BaseDataModel"](ExcelFileManager):
+class VerticalTabFileManager[DataModel: "BaseDataModel"](ExcelFileManager):  # noqa: WPS214
     """File manager for handling vertically-oriented Excel tabs.
 
     This class manages Excel sheets where data is organized vertically,
     with field names in the first column and corresponding values in
     subsequent columns.
+
+    The data model is decoded once per file manager, until ``write_ids`` or ``add``
+    writes to the sheet.
     """
 
     _data_model: type[DataModel]
@@ -25,6 +29,10 @@ class VerticalTabFileManager[DataModel: "BaseDataModel"](ExcelFileManager):
     _required_fields_by_tab: ClassVar[Mapping[str, Any]]
     _sheet_name: str
 
+    def __init__(self, file_path: str, file_handler: ExcelFileHandler | None = None):
+        super().__init__(file_path, file_handler)
+        self._data_model_cache: DataModel | None = None
+
     def add(self, data_model: DataModel) -> None:
         """Adds a data model to the Excel sheet.
 
@@ -37,6 +45,7 @@ class VerticalTabFileManager[DataModel: "BaseDataModel"](ExcelFileManager):
         for row, field in enumerate(self._fields, 2):
             row_values[f"B{row}"] = data_xlsx.get(field, "")
         self.file_handler.write([{self._sheet_name: row_values}])
+        self._data_model_cache = None
 
     def check_required_tabs(self) -> None:
         """Checks that all required tabs exist in the Excel file."""
@@ -78,8 +87,28 @@ class VerticalTabFileManager[DataModel: "BaseDataModel"](ExcelFileManager):
         Returns:
             DataModel: An object containing the information from the sheet.
         """
+        if self._data_model_cache is None:
+            row_data = self._read_data(self._fields)
+            self._data_model_cache = self._data_model.from_dict(row_data)
+        return self._data_model_cache
+
+    def find_row_errors(self) -> Generator[tuple[str, str], None, None]:
+        """Decodes the sheet and yields the error if it is invalid.
+
+        Yields:
+            tuple[str, str]: The coordinate of the ID and the error message.
+        """
         row_data = self._read_data(self._fields)
-        return self._data_model.from_dict(row_data)
+        try:
+            self._data_model.from_dict(row_data)
+        except ROW_DECODE_ERRORS as error:
+            coordinate = row_data.get(self._id_field, {}).get("coordinate", "")
+            yield coordinate, describe_row_error(error)
+
+    @override
+    def write_ids(self, id_map: dict[str, Any]) -> None:
+        super().write_ids(id_map)
+        self._data_model_cache = None
 
     @override
     def write_error(self, error: str, resource_id: str | None = None) -> None:
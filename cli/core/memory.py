@@ -0,0 +1,159 @@
+import tracemalloc
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+
+import typer
+from cli.core.console import console
+from cli.core.errors import MemoryBudgetExceededError
+from cli.core.state import state
+
+MEMORY_BUDGET_EXIT_CODE = 5
+
+
+class MemoryBudgetAction(StrEnum):
+    """What to do when a phase exceeds the memory budget."""
+
+    WARN = "warn"
+    ABORT = "abort"
+
+
+@dataclass
+class PhaseMemory:
+    """Memory accounting of every run of one named phase.
+
+    Attributes:
+        name: Phase name, e.g. ``Load workbook``.
+        calls: How many times the phase ran.
+        peak_bytes: Highest traced memory seen while the phase was running.
+        retained_bytes: Traced memory still allocated after the phase ended, summed over
+            every run of the phase.
+
+    """
+
+    name: str
+    calls: int = 0
+    peak_bytes: int = 0
+    retained_bytes: int = 0
+
+
+class MemoryTracker:
+    """Track memory high-water marks per phase with ``tracemalloc``.
+
+    Phases can be nested: the peak of an inner phase is also accounted to every
+    enclosing phase.
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int | None = None,
+        budget_action: MemoryBudgetAction = MemoryBudgetAction.WARN,
+    ) -> None:
+        self.budget_bytes = budget_bytes
+        self.budget_action = budget_action
+        self.total_peak_bytes = 0
+        self._phases: dict[str, PhaseMemory] = {}
+        self._peak_stack: list[int] = [0]
+        self._is_budget_warned = False
+
+    @property
+    def phases(self) -> list[PhaseMemory]:
+        return list(self._phases.values())
+
+    def start(self) -> None:
+        """Start tracing memory allocations."""
+        tracemalloc.start()
+
+    def stop(self) -> None:
+        """Stop tracing memory allocations and record the total peak."""
+        _, peak = tracemalloc.get_traced_memory()
+        self.total_peak_bytes = max(self._peak_stack[0], peak)
+        tracemalloc.stop()
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None]:
+        """Account the memory used by the enclosed block to the named phase.
+
+        Args:
+            name: Phase name. Runs of phases with the same name are aggregated.
+
+        Raises:
+            MemoryBudgetExceededError: If the phase peak exceeds the budget and the budget
+                action is abort.
+
+        """
+        if not tracemalloc.is_tracing():
+            yield
+            return
+
+        started, peak = tracemalloc.get_traced_memory()
+        self._peak_stack[-1] = max(self._peak_stack[-1], peak)
+        tracemalloc.reset_peak()
+        self._peak_stack.append(0)
+        try:
+            yield
+        finally:
+            phase_peak = self._finish_phase(name, started)
+
+        self.check_budget(name, phase_peak)
+
+    def check_budget(self, phase_name: str, peak_bytes: int) -> None:
+        """Warn about or abort on a memory peak above the budget.
+
+        Args:
+            phase_name: Name of the phase that reached the peak.
+            peak_bytes: The memory peak.
+
+        Raises:
+            MemoryBudgetExceededError: If the peak exceeds the budget and the budget action
+                is abort.
+
+        """
+        if self.budget_bytes is None or peak_bytes <= self.budget_bytes:
+            return
+
+        error = MemoryBudgetExceededError(phase_name, peak_bytes, self.budget_bytes)
+        if self.budget_action == MemoryBudgetAction.ABORT:
+            raise error
+
+        if not self._is_budget_warned:
+            self._is_budget_warned = True
+            console.print(f"[yellow]Warning: {error}")
+
+    def _finish_phase(self, name: str, started: int) -> int:
+        current, peak = tracemalloc.get_traced_memory()
+        phase_peak = max(self._peak_stack.pop(), peak)
+        self._peak_stack[-1] = max(self._peak_stack[-1], phase_peak)
+        phase_memory = self._phases.setdefault(name, PhaseMemory(name=name))
+        phase_memory.calls += 1
+        phase_memory.peak_bytes = max(phase_memory.peak_bytes, phase_peak)
+        phase_memory.retained_bytes += current - started
+        return phase_peak
+
+
+@contextmanager
+def memory_phase(name: str) -> Generator[None]:
+    """Account the enclosed block to a memory phase when memory tracking is enabled.
+
+    A memory budget abort is reported on the console and ends the command with exit
+    code 5 instead of a traceback.
+
+    Args:
+        name: Phase name.
+
+    Raises:
+        typer.Exit: If the phase exceeds the memory budget and the budget action is abort.
+
+    """
+    memory_tracker = state.memory_tracker
+    if memory_tracker is None:
+        yield
+        return
+
+    try:
+        with memory_tracker.phase(name):
+            yield
+    except MemoryBudgetExceededError as error:
+        console.print(f"[red]Error: {error}. Aborting.")
+        raise typer.Exit(code=MEMORY_BUDGET_EXIT_CODE) from error
@@ -5,7 +5,7 @@ from typing import Any, Self, TypeVar
 DataModel = TypeVar("DataModel", bound="BaseDataModel")
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseDataModel(ABC):
     """Abstract base data model with serialization and deserialization methods."""
 
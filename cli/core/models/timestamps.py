@@ -0,0 +1,31 @@
+import datetime as dt
+from functools import lru_cache
+
+from dateutil import parser
+
+# Exports decode the same few audit timestamps for many records.
+AUDIT_DATE_CACHE_SIZE = 4096
+
+
+def decode_audit_date(timestamp: str | None) -> dt.date | None:
+    """Decode the date of an audit timestamp of a Marketplace API resource.
+
+    Args:
+        timestamp: The ISO 8601 timestamp, e.g. ``2024-03-19T11:16:57.932Z``.
+
+    Returns:
+        The date of the timestamp, or None if there is no timestamp.
+
+    """
+    if not timestamp:
+        return None
+    return _decode_date(timestamp)
+
+
+@lru_cache(maxsize=AUDIT_DATE_CACHE_SIZE)
+def _decode_date(timestamp: str) -> dt.date:
+    try:
+        return dt.datetime.fromisoformat(timestamp).date()
+    except ValueError:
+        # Not the ISO 8601 format of the API, let dateutil guess it.
+        return parser.parse(timestamp).date()
@@ -0,0 +1,209 @@
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from pathlib import Path
+
+from cli.core.mpt.exchange import CassetteKey, redact_body, request_key
+from httpx import BaseTransport, Request, RequestError, Response
+
+MILLISECONDS_IN_SECOND = 1000
+
+
+class ReplayLatency(StrEnum):
+    """How long a replayed response takes."""
+
+    ORIGINAL = "original"
+    ZERO = "zero"
+
+
+class CassetteMissError(RequestError):
+    """Raised when a replayed command sends a request the cassette has no response for."""
+
+
+@dataclass(frozen=True)
+class CassetteEntry:
+    """A recorded request/response exchange with the Marketplace API.
+
+    Request headers and bodies are not recorded, so credentials and workbook data never
+    reach the cassette. Sensitive keys in JSON response bodies are redacted.
+
+    Attributes:
+        method: HTTP method of the request.
+        url: Request path with the raw query string, without scheme and host.
+        status: HTTP status code of the response.
+        content_type: Content type of the response.
+        body: Redacted response body.
+        latency_ms: Time between sending the request and reading the response body.
+
+    """
+
+    method: str
+    url: str
+    status: int
+    content_type: str | None
+    body: str
+    latency_ms: float
+
+    @property
+    def key(self) -> CassetteKey:
+        return self.method, self.url
+
+
+class CassetteRecorder:
+    """Record every exchange of the instrumented HTTP clients to a JSON Lines cassette."""
+
+    def __init__(self, cassette_path: Path) -> None:
+        self.cassette_path = cassette_path
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Create an empty cassette file, replacing a previous recording."""
+        self.cassette_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cassette_path.write_text("", encoding="utf-8")
+
+    def wrap(self, transport: BaseTransport) -> "RecordingTransport":
+        """Record the exchanges of a transport.
+
+        The recording transport wraps the given one, including its retries, so only the
+        final response of every request is recorded.
+
+        Args:
+            transport: The transport sending the requests of the MPT API client.
+
+        Returns:
+            The recording transport.
+
+        """
+        return RecordingTransport(transport, self)
+
+    def record(self, cassette_entry: CassetteEntry) -> None:
+        """Append an exchange to the cassette.
+
+        Args:
+            cassette_entry: The exchange to append.
+
+        """
+        with self._lock, self.cassette_path.open("a", encoding="utf-8") as file_obj:
+            file_obj.write(f"{json.dumps(asdict(cassette_entry))}\n")
+            self.recorded += 1
+
+
+class CassettePlayer:
+    """Answer the requests of the instrumented HTTP clients from a recorded cassette.
+
+    Entries are replayed in recording order per method and URL, so repeated requests to
+    the same URL, e.g. polling a resource, get their responses in the original sequence.
+    """
+
+    def __init__(self, cassette_entries: list[CassetteEntry], latency: ReplayLatency) -> None:
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._entries: dict[CassetteKey, deque[CassetteEntry]] = defaultdict(deque)
+        for cassette_entry in cassette_entries:
+            self._entries[cassette_entry.key].append(cassette_entry)
+
+    @classmethod
+    def load(cls, cassette_path: Path, latency: ReplayLatency) -> "CassettePlayer":
+        """Read a cassette written by :class:`CassetteRecorder`.
+
+        Args:
+            cassette_path: The JSON Lines cassette.
+            latency: Whether responses take their recorded latency or none.
+
+        Returns:
+            A player for the cassette.
+
+        """
+        with cassette_path.open(encoding="utf-8") as file_obj:
+            cassette_lines = [line for line in file_obj if line.strip()]
+        return cls([CassetteEntry(**json.loads(line)) for line in cassette_lines], latency)
+
+    @property
+    def remaining(self) -> int:
+        return sum(len(queued) for queued in self._entries.values())
+
+    def wrap(self, transport: BaseTransport) -> "ReplayTransport":
+        """Serve the requests of a transport from the cassette instead of the network.
+
+        Args:
+            transport: The transport sending the requests of the MPT API client, which is
+                not used.
+
+        Returns:
+            The replaying transport.
+
+        """
+        return ReplayTransport(self)
+
+    def next_entry(self, request: Request) -> CassetteEntry:
+        """Take the next recorded exchange for a request.
+
+        Args:
+            request: The outgoing request.
+
+        Returns:
+            The recorded exchange.
+
+        Raises:
+            CassetteMissError: If no recorded exchange is left for the request.
+
+        """
+        method, url = request_key(request)
+        with self._lock:
+            queued = self._entries.get((method, url))
+            if not queued:
+                raise CassetteMissError(f"No recorded response for {method} {url}", request=request)
+            return queued.popleft()
+
+
+class RecordingTransport(BaseTransport):
+    """Transport that records the exchanges of a wrapped transport."""
+
+    def __init__(self, transport: BaseTransport, recorder: CassetteRecorder) -> None:
+        self._transport = transport
+        self._recorder = recorder
+
+    def handle_request(self, request: Request) -> Response:
+        """Send the request through the wrapped transport and record the exchange."""
+        started = time.perf_counter()
+        response = self._transport.handle_request(request)
+        response.read()
+        self._recorder.record(
+            CassetteEntry(
+                method=request.method,
+                url=request_key(request)[1],
+                status=response.status_code,
+                content_type=response.headers.get("Content-Type"),
+                body=redact_body(response),
+                latency_ms=(time.perf_counter() - started) * MILLISECONDS_IN_SECOND,
+            )
+        )
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self._transport.close()
+
+
+class ReplayTransport(BaseTransport):
+    """Transport that answers requests from a cassette player."""
+
+    def __init__(self, player: CassettePlayer) -> None:
+        self._player = player
+
+    def handle_request(self, request: Request) -> Response:
+        """Return the next recorded response for the request."""
+        cassette_entry = self._player.next_entry(request)
+        if self._player.latency == ReplayLatency.ORIGINAL:
+            time.sleep(cassette_entry.latency_ms / MILLISECONDS_IN_SECOND)
+        content_type = cassette_entry.content_type
+        return Response(
+            cassette_entry.status,
+            headers={"Content-Type": content_type} if content_type else {},
+            content=cassette_entry.body.encode("utf-8"),
+            request=request,
+        )
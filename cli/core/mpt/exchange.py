@@ -0,0 +1,65 @@
+import json
+from typing import Any
+
+from httpx import Request, Response
+
+REDACTED = "[REDACTED]"
+SENSITIVE_KEYS = frozenset(("token", "password", "secret", "clientsecret", "apikey"))
+JSON_CONTENT_TYPE = "application/json"
+
+type CassetteKey = tuple[str, str]
+
+
+def request_key(request: Request) -> CassetteKey:
+    """Return the key a request is matched against recorded exchanges with.
+
+    The host is left out, so a cassette recorded against one environment replays against
+    any account.
+
+    Args:
+        request: The outgoing request.
+
+    Returns:
+        The HTTP method and the raw path with the query string.
+
+    """
+    return request.method, request.url.raw_path.decode("ascii")
+
+
+def redact(json_value: Any) -> Any:
+    """Replace the values of sensitive keys in a decoded JSON document.
+
+    Args:
+        json_value: The decoded JSON document.
+
+    Returns:
+        A copy of the document with sensitive values replaced by ``[REDACTED]``.
+
+    """
+    if isinstance(json_value, dict):
+        return {
+            key: REDACTED if key.lower() in SENSITIVE_KEYS else redact(nested)
+            for key, nested in json_value.items()
+        }
+    if isinstance(json_value, list):
+        return [redact(nested) for nested in json_value]
+    return json_value
+
+
+def redact_body(response: Response) -> str:
+    """Return the response body as text with sensitive JSON values redacted.
+
+    Args:
+        response: A response whose body has already been read.
+
+    Returns:
+        The redacted body.
+
+    """
+    if JSON_CONTENT_TYPE not in response.headers.get("Content-Type", ""):
+        return response.text
+    try:
+        json_body = response.json()
+    except ValueError:
+        return response.text
+    return json.dumps(redact(json_body))
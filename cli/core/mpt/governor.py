@@ -0,0 +1,248 @@
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+from httpx import BaseTransport, Request, Response, TransportError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_RETRIES = 5
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+THROTTLING_STATUSES = frozenset((HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE))
+SERVER_ERROR_STATUSES = frozenset((
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+))
+
+
+@dataclass(frozen=True)
+class GovernorSettings:
+    """Limits of the request governor.
+
+    Attributes:
+        max_rate: Sustained requests per second, or None to not limit the rate.
+        burst: Requests that can be sent at once before ``max_rate`` applies.
+        max_concurrency: Upper bound of the requests in flight at the same time.
+        max_retries: Retries of a throttled or failed request before giving up.
+        backoff_base: Backoff of the first retry in seconds, doubled on every retry.
+        max_backoff: Upper bound of a backoff or a Retry-After wait in seconds.
+
+    """
+
+    max_rate: float | None = None
+    burst: int = 10
+    max_concurrency: int = 16
+    max_retries: int = DEFAULT_MAX_RETRIES
+    backoff_base: float = 0.5
+    max_backoff: float = 60.0
+
+
+def parse_retry_after(header_value: str | None) -> float | None:
+    """Parse a Retry-After header.
+
+    Args:
+        header_value: The header value, in seconds or as an HTTP date.
+
+    Returns:
+        The seconds to wait, or None if the header is missing or invalid.
+
+    """
+    if not header_value:
+        return None
+    if header_value.isdigit():
+        return float(header_value)
+    try:
+        retry_at = parsedate_to_datetime(header_value)
+    except (TypeError, ValueError):
+        return None
+    return max(0, retry_at.timestamp() - time.time())
+
+
+def is_retryable(method: str, status_code: int | None) -> bool:
+    """Check whether a request can be sent again after its response.
+
+    Throttled requests were not processed, so they are retried whatever their method.
+    Server and transport errors may happen after the request was processed, so only
+    idempotent requests are retried.
+
+    Args:
+        method: HTTP method of the request.
+        status_code: Status code of the response, or None if the transport failed.
+
+    Returns:
+        True if the request can be retried.
+
+    """
+    if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        return True
+    is_failure = status_code is None or status_code in SERVER_ERROR_STATUSES
+    return is_failure and method in IDEMPOTENT_METHODS
+
+
+class RequestGovernor:
+    """Shared pacing of the requests sent to the Marketplace API.
+
+    Requests take a token from a token bucket refilled at ``max_rate`` and a slot below
+    an adaptive concurrency limit. The limit grows by one every window of successful
+    responses and is halved on 429 and 503 responses (AIMD). A Retry-After header on a
+    throttled response pauses every request until it has passed.
+
+    Attributes:
+        settings: The limits of the governor.
+        concurrency_limit: The current limit of the requests in flight.
+
+    """
+
+    def __init__(
+        self,
+        settings: GovernorSettings | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,  # noqa: S311
+    ) -> None:
+        self.settings = settings or GovernorSettings()
+        self.concurrency_limit = float(self.settings.max_concurrency)
+        self._clock = clock
+        self._sleep = sleep
+        self._jitter = jitter
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._tokens = float(self.settings.burst)
+        self._refilled_at = clock()
+        self._paused_until: float = 0
+
+    def wrap(self, transport: BaseTransport) -> "GovernedTransport":
+        """Route the requests of a transport through the governor.
+
+        Args:
+            transport: The transport sending the requests, without retries of its own.
+
+        Returns:
+            The transport pacing and retrying the requests.
+
+        """
+        return GovernedTransport(transport, self)
+
+    def acquire(self) -> None:
+        """Wait until a request can be sent and count it as in flight."""
+        while True:
+            with self._condition:
+                while self._in_flight >= int(self.concurrency_limit):
+                    self._condition.wait()
+                wait_seconds = self._take_token()
+                if wait_seconds <= 0:
+                    self._in_flight += 1
+                    return
+            self._sleep(wait_seconds)
+
+    def release(self, status_code: int | None, retry_after: float | None = None) -> None:
+        """Count a request as done and adjust the concurrency limit to its response.
+
+        Args:
+            status_code: Status code of the response, or None if the transport failed.
+            retry_after: Seconds the server asked to wait before the next request.
+
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if status_code in THROTTLING_STATUSES:
+                self.concurrency_limit = max(1.0, self.concurrency_limit / 2)
+                if retry_after is not None:
+                    pause = min(retry_after, self.settings.max_backoff)
+                    self._paused_until = max(self._paused_until, self._clock() + pause)
+            elif status_code is not None and status_code < HTTPStatus.INTERNAL_SERVER_ERROR:
+                self.concurrency_limit = min(
+                    float(self.settings.max_concurrency),
+                    self.concurrency_limit + 1 / self.concurrency_limit,
+                )
+            self._condition.notify_all()
+
+    def wait_before_retry(self, attempt: int, retry_after: float | None) -> None:
+        """Wait before sending a throttled or failed request again.
+
+        Args:
+            attempt: Number of the retry, starting with 0.
+            retry_after: Seconds the server asked to wait, used instead of the backoff.
+
+        """
+        if retry_after is None:
+            backoff = min(self.settings.max_backoff, self.settings.backoff_base * 2**attempt)
+            # Full jitter spreads the retries of concurrent requests.
+            delay = self._jitter() * backoff
+        else:
+            delay = min(retry_after, self.settings.max_backoff)
+        self._sleep(delay)
+
+    def _take_token(self) -> float:
+        now = self._clock()
+        if self._paused_until > now:
+            return self._paused_until - now
+        max_rate = self.settings.max_rate
+        if max_rate is None:
+            return 0
+        refilled = self._tokens + (now - self._refilled_at) * max_rate
+        self._tokens = min(float(self.settings.burst), refilled)
+        self._refilled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / max_rate
+
+
+class GovernedTransport(BaseTransport):
+    """Transport that paces and retries the requests of a wrapped transport."""
+
+    def __init__(self, transport: BaseTransport, governor: RequestGovernor) -> None:
+        self._transport = transport
+        self._governor = governor
+
+    def handle_request(self, request: Request) -> Response:
+        """Send the request when the governor allows it, retrying it when possible."""
+        for attempt in range(self._governor.settings.max_retries):
+            response = self._send_or_wait(request, attempt)
+            if response is not None:
+                return response
+        return self._send(request)
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self._transport.close()
+
+    def _send(self, request: Request) -> Response:
+        self._governor.acquire()
+        try:
+            response = self._transport.handle_request(request)
+        except Exception:
+            self._governor.release(None)
+            raise
+        self._governor.release(
+            response.status_code, parse_retry_after(response.headers.get("Retry-After"))
+        )
+        return response
+
+    def _send_or_wait(self, request: Request, attempt: int) -> Response | None:
+        try:
+            response = self._send(request)
+        except TransportError as error:
+            if not is_retryable(request.method, None):
+                raise
+            logger.debug("Retrying %s %s after %r", request.method, request.url, error)
+            retry_after = None
+        else:
+            if not is_retryable(request.method, response.status_code):
+                return response
+            response.close()
+            logger.debug(
+                "Retrying %s %s after status %s", request.method, request.url, response.status_code
+            )
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        self._governor.wait_before_retry(attempt, retry_after)
+        return None
@@ -1,4 +1,6 @@
 from cli.core.accounts.models import Account
+from cli.core.state import state
+from httpx import BaseTransport, Client, HTTPTransport
 from mpt_api_client import MPTClient
 from mpt_api_client.auth import BearerTokenAuthentication
 
@@ -6,12 +8,48 @@ from mpt_api_client.auth import BearerTokenAuthentication
 def create_api_mpt_client_from_account(account: Account):
     """Create an API client MPTClient instance using credentials from the given account.
 
+    Requests are paced and retried by the shared request governor, and GET requests are
+    answered from the response cache of the account when it is enabled. When request
+    tracing is enabled for the current command, the client is instrumented so every HTTP
+    exchange is recorded by the active request tracer. When a cassette is active,
+    exchanges are recorded to it or replayed from it instead of the network.
+
     Args:
         account: An Account object containing the base URL and API token.
 
     Returns:
         An instance of MPTClient to be used for API Client operations.
     """
-    return MPTClient.from_config(
+    mpt_client = MPTClient.from_config(
         authentication=BearerTokenAuthentication(account.token), base_url=account.environment
     )
+    http_client = mpt_client.http_client
+    http_client.httpx_client = _with_transport(http_client.httpx_client, _build_transport(account))
+    if state.request_tracer is not None:
+        state.request_tracer.instrument(http_client.httpx_client)
+
+    return mpt_client
+
+
+def _build_transport(account: Account) -> BaseTransport:
+    # The governor retries instead of the retrying transport of the Marketplace API client.
+    transport: BaseTransport = state.request_governor.wrap(HTTPTransport())
+    if state.response_cache is not None:
+        transport = state.response_cache.wrap(transport, account.environment, account.id)
+    if state.cassette is not None:
+        transport = state.cassette.wrap(transport)
+    return transport
+
+
+def _with_transport(httpx_client: Client, transport: BaseTransport) -> Client:
+    # httpx only takes a transport when a client is created, so the client is created again
+    # with the same configuration.
+    httpx_client.close()
+    return Client(
+        auth=httpx_client.auth,
+        base_url=httpx_client.base_url,
+        headers=httpx_client.headers,
+        timeout=httpx_client.timeout,
+        follow_redirects=httpx_client.follow_redirects,
+        transport=transport,
+    )
@@ -0,0 +1,234 @@
+import hashlib
+import json
+import shutil
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
+from http import HTTPStatus
+from pathlib import Path
+from types import MappingProxyType
+from typing import Self
+from urllib.parse import quote
+
+from cli.core.mpt.exchange import request_key
+from httpx import BaseTransport, Request, Response
+
+DEFAULT_CACHE_DIR = Path.home() / ".swocli" / "cache"
+DEFAULT_CACHE_TTL = 300
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+# Directory of the responses of a path; "@" is quoted in path segments, so no segment
+# directory has this name.
+RESPONSES_DIR_NAME = "@responses"
+# Conditional request header of every response validator.
+CONDITIONAL_HEADERS = MappingProxyType({
+    "ETag": "If-None-Match",
+    "Last-Modified": "If-Modified-Since",
+})
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A successful response to a GET request, stored on disk.
+
+    Attributes:
+        url: Request path with the raw query string, without scheme and host.
+        status: HTTP status code of the response.
+        headers: Content type and validators of the response.
+        body: Response body.
+        stored_at: Wall-clock timestamp when the response was fetched or revalidated.
+
+    """
+
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: str
+    stored_at: float = 0
+
+    @classmethod
+    def from_response(cls, url: str, response: Response) -> Self:
+        """Create the stored response of a response whose body has already been read."""
+        return cls(
+            url=url,
+            status=response.status_code,
+            headers={
+                header: response.headers[header]
+                for header in CACHED_HEADERS
+                if header in response.headers
+            },
+            body=response.text,
+        )
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Return the conditional request headers that revalidate the response."""
+        return {
+            conditional_header: self.headers[validator]
+            for validator, conditional_header in CONDITIONAL_HEADERS.items()
+            if validator in self.headers
+        }
+
+    def to_response(self, request: Request) -> Response:
+        """Build the httpx response of a request from the stored response."""
+        return Response(
+            self.status, headers=self.headers, content=self.body.encode(), request=request
+        )
+
+
+class ResponseCache:
+    """Cache the responses to GET requests on disk, per environment and account.
+
+    Responses with an ETag or a Last-Modified header are revalidated with a conditional
+    request every time, so an unchanged resource costs a ``304 Not Modified`` without a
+    body. Other responses are served from disk until they are older than the TTL.
+
+    Responses are stored in a directory tree following the segments of their path. Any
+    other request, e.g. a sync write, removes the stored responses of its path, of the
+    paths below it and of the paths above it, e.g. an item update removes the item, its
+    subresources and the item lists, so the next reads see the changes.
+
+    Attributes:
+        cache_dir: Directory the responses are stored in.
+        ttl: Seconds a response without validators is served from disk.
+
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        ttl: float = DEFAULT_CACHE_TTL,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self._clock = clock
+
+    def wrap(
+        self, transport: BaseTransport, environment: str, account_id: str
+    ) -> "CachingTransport":
+        """Serve the GET requests of a transport from the cache when possible.
+
+        Args:
+            transport: The transport sending the requests of the MPT API client.
+            environment: The API base URL of the account.
+            account_id: The ID of the account the client authenticates as.
+
+        Returns:
+            The caching transport.
+
+        """
+        namespace = _digest(f"{environment}|{account_id}")
+        return CachingTransport(transport, self, self.cache_dir / namespace)
+
+    def is_fresh(self, cached_response: CachedResponse) -> bool:
+        """Check whether a response without validators can be served without a request."""
+        return self._clock() - cached_response.stored_at < self.ttl
+
+    def save(self, account_dir: Path, cached_response: CachedResponse) -> None:
+        """Write a response to its cache file, as fetched or revalidated now.
+
+        Args:
+            account_dir: The cache directory of the account.
+            cached_response: The response to store.
+
+        """
+        cache_path = _cache_path(account_dir, cached_response.url)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        stored_response = replace(cached_response, stored_at=self._clock())
+        cache_path.write_text(json.dumps(asdict(stored_response)), encoding="utf-8")
+
+    def load(self, account_dir: Path, url: str) -> CachedResponse | None:
+        """Read the stored response to a GET request, if any.
+
+        Args:
+            account_dir: The cache directory of the account.
+            url: Request path with the raw query string.
+
+        Returns:
+            The stored response, or None if there is none or it cannot be read.
+
+        """
+        cache_path = _cache_path(account_dir, url)
+        try:
+            return CachedResponse(**json.loads(cache_path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def invalidate(self, account_dir: Path, url: str) -> None:
+        """Remove the stored responses a write request may have changed.
+
+        Args:
+            account_dir: The cache directory of the account.
+            url: Path of the write request, with the raw query string.
+
+        """
+        path_dir = _path_dir(account_dir, url)
+        shutil.rmtree(path_dir, ignore_errors=True)
+        for parent_dir in path_dir.parents:
+            shutil.rmtree(parent_dir / RESPONSES_DIR_NAME, ignore_errors=True)
+            if parent_dir == account_dir:
+                break
+
+
+class CachingTransport(BaseTransport):
+    """Transport that answers GET requests from a response cache."""
+
+    def __init__(
+        self, transport: BaseTransport, response_cache: ResponseCache, account_dir: Path
+    ) -> None:
+        self._transport = transport
+        self._cache = response_cache
+        self._account_dir = account_dir
+
+    def handle_request(self, request: Request) -> Response:
+        """Answer GET requests from the cache or revalidate them, send other requests."""
+        url = request_key(request)[1]
+        if request.method != "GET":
+            self._cache.invalidate(self._account_dir, url)
+            return self._transport.handle_request(request)
+
+        cached_response = self._cache.load(self._account_dir, url)
+        if cached_response is None:
+            return self._fetch(request, url)
+
+        if cached_response.validators:
+            return self._revalidate(request, url, cached_response)
+        if self._cache.is_fresh(cached_response):
+            return cached_response.to_response(request)
+        return self._fetch(request, url)
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self._transport.close()
+
+    def _revalidate(self, request: Request, url: str, cached_response: CachedResponse) -> Response:
+        request.headers.update(cached_response.validators)
+        response = self._fetch(request, url)
+        if response.status_code != HTTPStatus.NOT_MODIFIED:
+            return response
+        response.close()
+        self._cache.save(self._account_dir, cached_response)
+        return cached_response.to_response(request)
+
+    def _fetch(self, request: Request, url: str) -> Response:
+        response = self._transport.handle_request(request)
+        if response.status_code == HTTPStatus.OK:
+            response.read()
+            self._cache.save(self._account_dir, CachedResponse.from_response(url, response))
+        return response
+
+
+def _digest(cache_key: str) -> str:
+    return hashlib.sha256(cache_key.encode()).hexdigest()
+
+
+def _path_dir(account_dir: Path, url: str) -> Path:
+    path = url.partition("?")[0]
+    return account_dir.joinpath(
+        *(quote(segment, safe="") for segment in path.split("/") if segment)
+    )
+
+
+def _cache_path(account_dir: Path, url: str) -> Path:
+    return _path_dir(account_dir, url) / RESPONSES_DIR_NAME / f"{_digest(url)}.json"
@@ -0,0 +1,188 @@
+import json
+import math
+import re
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from pathlib import Path
+
+from httpx import Client, Request, Response
+
+TRACE_START_EXTENSION = "mpt_cli_trace_start"
+RESOURCE_ID_PATTERN = re.compile(r"(?<=/)[A-Z]{2,5}(?:-\d{4,})+(?=/|$)")
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass(frozen=True)
+class RequestTrace:
+    """A single HTTP request/response exchange with the Marketplace API.
+
+    Attributes:
+        method: HTTP method of the request.
+        endpoint: Request path with resource IDs replaced by ``{id}``.
+        status: HTTP status code of the response.
+        latency_ms: Time between sending the request and reading the response body.
+        request_bytes: Size of the request body.
+        response_bytes: Size of the response body.
+        started_at: Wall-clock timestamp when the request was sent.
+
+    """
+
+    method: str
+    endpoint: str
+    status: int
+    latency_ms: float
+    request_bytes: int
+    response_bytes: int
+    started_at: float
+
+
+@dataclass(frozen=True)
+class EndpointStats:
+    """Aggregated latency statistics for one method and endpoint template."""
+
+    method: str
+    endpoint: str
+    calls: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    total_bytes: int
+
+
+def endpoint_template(path: str) -> str:
+    """Replace Marketplace resource IDs in a URL path with an ``{id}`` placeholder.
+
+    Args:
+        path: The URL path, e.g. ``/public/v1/catalog/products/PRD-1234-1234/items``.
+
+    Returns:
+        The templated path, e.g. ``/public/v1/catalog/products/{id}/items``.
+
+    """
+    return RESOURCE_ID_PATTERN.sub("{id}", path)
+
+
+def percentile(sorted_values: list[float], rank: int) -> float:
+    """Return the nearest-rank percentile of an already sorted, non-empty list.
+
+    Args:
+        sorted_values: Values sorted in ascending order.
+        rank: Percentile rank between 1 and 100.
+
+    Returns:
+        The percentile value.
+
+    """
+    position = math.ceil(rank / 100 * len(sorted_values))
+    return sorted_values[max(position, 1) - 1]
+
+
+def summarize_traces(method: str, endpoint: str, traces: list[RequestTrace]) -> EndpointStats:
+    """Aggregate the traces recorded for one method and endpoint template.
+
+    Args:
+        method: HTTP method shared by the traces.
+        endpoint: Endpoint template shared by the traces.
+        traces: The recorded traces, at least one.
+
+    Returns:
+        The aggregated endpoint statistics.
+
+    """
+    latencies = sorted(trace.latency_ms for trace in traces)
+    p50, p95, p99 = (percentile(latencies, rank) for rank in PERCENTILES)
+    return EndpointStats(
+        method=method,
+        endpoint=endpoint,
+        calls=len(traces),
+        errors=sum(1 for trace in traces if trace.status >= HTTPStatus.BAD_REQUEST),
+        p50_ms=p50,
+        p95_ms=p95,
+        p99_ms=p99,
+        total_bytes=sum(trace.request_bytes + trace.response_bytes for trace in traces),
+    )
+
+
+class RequestTracer:  # noqa: WPS214
+    """Record request traces from an instrumented HTTP client."""
+
+    def __init__(self) -> None:
+        self._traces: list[RequestTrace] = []
+
+    @property
+    def traces(self) -> list[RequestTrace]:
+        return list(self._traces)
+
+    def instrument(self, http_client: Client) -> None:
+        """Register the tracer hooks on an httpx client.
+
+        Args:
+            http_client: The httpx client used by the MPT API client.
+
+        """
+        event_hooks = http_client.event_hooks
+        event_hooks["request"].append(self._on_request)
+        event_hooks["response"].append(self._on_response)
+        http_client.event_hooks = event_hooks
+
+    def record(self, trace: RequestTrace) -> None:
+        """Store a request trace.
+
+        Args:
+            trace: The trace to store.
+
+        """
+        self._traces.append(trace)
+
+    def endpoint_stats(self) -> list[EndpointStats]:
+        """Aggregate the recorded traces per method and endpoint template.
+
+        Returns:
+            Statistics per endpoint, slowest p95 first.
+
+        """
+        grouped: dict[tuple[str, str], list[RequestTrace]] = defaultdict(list)
+        for trace in self._traces:
+            grouped[trace.method, trace.endpoint].append(trace)
+
+        return sorted(
+            (summarize_traces(*endpoint_key, traces) for endpoint_key, traces in grouped.items()),
+            key=lambda stats: stats.p95_ms,
+            reverse=True,
+        )
+
+    def dump_jsonl(self, file_path: Path) -> None:
+        """Write every recorded trace as one JSON object per line.
+
+        Args:
+            file_path: Destination file. Parent directories are created if needed.
+
+        """
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with file_path.open("w", encoding="utf-8") as file_obj:
+            for trace in self._traces:
+                file_obj.write(f"{json.dumps(asdict(trace))}\n")
+
+    def _on_request(self, request: Request) -> None:
+        request.extensions[TRACE_START_EXTENSION] = (time.time(), time.perf_counter())
+
+    def _on_response(self, response: Response) -> None:
+        request = response.request
+        started_at, started = request.extensions.get(
+            TRACE_START_EXTENSION, (time.time(), time.perf_counter())
+        )
+        response.read()
+        self.record(
+            RequestTrace(
+                method=request.method,
+                endpoint=endpoint_template(request.url.path),
+                status=response.status_code,
+                latency_ms=(time.perf_counter() - started) * 1000,
+                request_bytes=int(request.headers.get("Content-Length", 0)),
+                response_bytes=len(response.content),
+                started_at=started_at,
+            )
+        )
@@ -29,3 +29,52 @@ def set_dict_value(original_dict: StringKeyedDict, path: str, new_value: Any) ->
 
     original_dict.update({current: set_dict_value(next_dict, next_path, new_value)})
     return original_dict
+
+
+def is_subset(expected: Any, actual: Any) -> bool:
+    """Check whether every value of ``expected`` is present and equal in ``actual``.
+
+    Dictionaries are compared recursively and may have extra keys in ``actual``; a None
+    value in ``expected`` matches a missing key. Lists are compared item by item and
+    must have the same length.
+
+    Args:
+        expected: The value that must be contained, e.g. an update payload.
+        actual: The value to look into, e.g. the resource returned by the API.
+
+    Returns:
+        True if ``actual`` already holds every value of ``expected``, False otherwise.
+
+    """
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and all(
+            is_subset(expected_value, actual.get(key)) for key, expected_value in expected.items()
+        )
+
+    if isinstance(expected, list):
+        return (
+            isinstance(actual, list)
+            and len(expected) == len(actual)
+            and all(map(is_subset, expected, actual))
+        )
+
+    return expected == actual
+
+
+def get_dict_value(original_dict: StringKeyedDict, path: str) -> Any:
+    """Get a value from a nested dictionary using a dot-separated path.
+
+    Args:
+        original_dict: The dictionary to read.
+        path: Dot-separated string representing the nested keys.
+
+    Returns:
+        The value at the given path, or None if any key along the path is missing.
+
+    """
+    current_value: Any = original_dict
+    for key in path.split("."):
+        if not isinstance(current_value, dict):
+            return None
+        current_value = current_value.get(key)
+    return current_value
@@ -61,7 +61,7 @@ class PriceListExporter:
                 abort=True,
             )
 
-        temp_path = file_path.with_name(f"{file_path.name}.tmp")
+        temp_path = file_path.with_stem(f"{file_path.stem}.tmp")
         temp_path.unlink(missing_ok=True)
         if not self._export_workbook(price_list_id, temp_path):
             return False
@@ -0,0 +1,123 @@
+from collections.abc import Mapping, Sequence
+from typing import Annotated
+
+import typer
+from cli.core.console import console
+from cli.core.file_discovery import get_files_path
+from cli.core.price_lists.errors import PriceRuleError
+from cli.core.price_lists.handlers import PriceListExcelFileManager, PriceListItemExcelFileManager
+from cli.core.price_lists.services.price_rules import RULE_COLUMNS, PriceRule, parse_variables
+
+app = typer.Typer()
+
+
+class PriceListRepricer:
+    """Apply price rules to the Price Items sheet of one or more price list files."""
+
+    def __init__(
+        self, rules: Sequence[PriceRule], variables: Mapping[str, float], *, is_dry_run: bool
+    ) -> None:
+        self._rules = rules
+        self._variables = variables
+        self._is_dry_run = is_dry_run
+        targets = dict.fromkeys(rule.target for rule in rules)
+        self._column_names = [RULE_COLUMNS[target] for target in targets]
+
+    def reprice_all(self, file_paths: list[str]) -> None:
+        """Reprice every file."""
+        for file_path in file_paths:
+            self.reprice_one(file_path)
+
+    def reprice_one(self, file_path: str) -> int:
+        """Reprice a single price list file.
+
+        Rules are applied in order, so a rule reads the prices set by the rules before it.
+        Changed prices are written to their cells and their rows are marked for update, so
+        the next sync sends them. The workbook is saved once.
+
+        Returns:
+            The number of changed rows.
+        """
+        precision = PriceListExcelFileManager(file_path).read_data().precision
+        item_manager = PriceListItemExcelFileManager(file_path)
+        table = item_manager.read_table()
+        changed_rows: set[int] = set()
+        for rule in self._rules:
+            changed_rows.update(rule.apply(table, self._variables, precision))
+
+        if changed_rows and not self._is_dry_run:
+            item_manager.write_table_rows(table, sorted(changed_rows), self._column_names)
+        self._print_summary(file_path, len(changed_rows), len(table))
+        return len(changed_rows)
+
+    def _print_summary(self, file_path: str, changed_count: int, total_count: int) -> None:
+        verb = "would change" if self._is_dry_run else "changed"
+        console.print(f"{file_path}: {verb} {changed_count} of {total_count} price items")
+
+
+@app.command(name="reprice")
+def reprice_price_lists(
+    pricelists_paths: Annotated[
+        list[str],
+        typer.Argument(help="Path to Price lists definition files", metavar="PRICELISTS-PATHS"),
+    ],
+    rules: Annotated[
+        list[str],
+        typer.Option(
+            "--rule",
+            "-r",
+            help="Price rule as '<column> = <expression>', e.g. 'unitSP = unitPP * fx'. "
+            "Can be repeated; rules are applied in order.",
+        ),
+    ],
+    variables: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--var",
+            help="Variable the rules can read, as NAME=VALUE, e.g. fx=1.08. Can be repeated.",
+        ),
+    ] = None,
+    is_dry_run: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--dry-run",
+            help="Do not write the files. Print how many price items the rules would change.",
+        ),
+    ] = False,
+):
+    """Recompute prices of price list definition files from price rules.
+
+    Args:
+        pricelists_paths: List of paths to price list definition files to reprice.
+        rules: Price rules to apply in order.
+        variables: Variables the price rules can read.
+        is_dry_run: Whether to only print what the rules would change.
+
+    Raises:
+        typer.BadParameter: If a rule or a variable is invalid.
+        typer.Exit: With code 3 if no files found.
+
+    """
+    try:
+        parsed_variables = parse_variables(variables or [])
+    except PriceRuleError as error:
+        raise typer.BadParameter(str(error), param_hint="'--var'") from error
+    try:
+        parsed_rules = [PriceRule.parse(rule, parsed_variables) for rule in rules]
+    except PriceRuleError as error:
+        raise typer.BadParameter(str(error), param_hint="'--rule'") from error
+
+    with console.status("Fetching price list files..."):
+        file_paths = get_files_path(pricelists_paths)
+
+    if not len(file_paths):
+        console.print("No files found for provided paths", ", ".join(pricelists_paths))
+        raise typer.Exit(code=3)
+
+    if not is_dry_run:
+        typer.confirm(
+            f"Do you want to reprice {len(file_paths)} price_lists files?",
+            abort=True,
+        )
+
+    PriceListRepricer(parsed_rules, parsed_variables, is_dry_run=is_dry_run).reprice_all(file_paths)
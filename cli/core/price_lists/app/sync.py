@@ -1,31 +1,38 @@
+from pathlib import Path
 from typing import Annotated
 
 import typer
 from cli.core.accounts.app import get_active_account
 from cli.core.console import console
 from cli.core.console.renderers.stats import StatsTableRenderer
+from cli.core.console.renderers.sync_plan import SyncPlanRenderer
 from cli.core.file_discovery import get_files_path
 from cli.core.mpt.mpt_client import create_api_mpt_client_from_account
 from cli.core.price_lists.api import PriceListAPIService, PriceListItemAPIService
 from cli.core.price_lists.handlers import PriceListExcelFileManager, PriceListItemExcelFileManager
 from cli.core.price_lists.models import ItemData, PriceListData
 from cli.core.price_lists.services import ItemService, PriceListService
+from cli.core.price_lists.services.sync_planner import plan_price_lists
+from cli.core.services.checkpoint import SyncCheckpoint
 from cli.core.services.service_context import ServiceContext
 from cli.core.stats import PriceListStatsCollector
 
 app = typer.Typer()
 stats_table_renderer = StatsTableRenderer()
+sync_plan_renderer = SyncPlanRenderer()
 
 
 class PriceListSyncer:
     """Coordinate the CLI-driven sync of one or more price list definition files."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, skip_unchanged: bool = False, is_resumed: bool = False) -> None:
         account = get_active_account()
         self._account = account
         self._account_label = f"{account.id} ({account.name})"
         self._mpt_client = create_api_mpt_client_from_account(account)
         self._stats = PriceListStatsCollector()
+        self._skip_unchanged = skip_unchanged
+        self._is_resumed = is_resumed
 
     def sync_all(self, file_paths: list[str]) -> None:
         """Sync every file; raise ``typer.Exit`` if any file failed."""
@@ -34,6 +41,22 @@ class PriceListSyncer:
             console.print("Price list sync [red bold]FAILED")
             raise typer.Exit(code=4)
 
+    def plan_all(self, file_paths: list[str], plan_file: Path | None) -> None:
+        """Print what syncing every file would do, without syncing.
+
+        Raises:
+            typer.Exit: With code 4 if the plan has conflicts, code 0 otherwise.
+
+        """
+        with console.status("Plan Price lists sync..."):
+            sync_plan = plan_price_lists(self._account, self._mpt_client, file_paths)
+
+        console.print(sync_plan_renderer.render(sync_plan))
+        if plan_file is not None:
+            sync_plan.write_json(plan_file)
+            console.print(f"Sync plan has been written to: {plan_file}")
+        raise typer.Exit(code=4 if sync_plan.has_conflicts else 0)
+
     def sync_one(self, file_path: str) -> bool:
         """Sync a single price list definition file.
 
@@ -73,20 +96,30 @@ class PriceListSyncer:
             if not result.success:
                 return False
 
+        self._stats.stat_id = price_list.id
+        return self._sync_items(file_path, price_list.id)
+
+    def _sync_items(self, file_path: str, price_list_id: str) -> bool:
+        checkpoint = SyncCheckpoint.for_workbook(file_path, is_resumed=self._is_resumed)
         items_service = ItemService(
             ServiceContext(
                 account=self._account,
-                api=PriceListItemAPIService(self._mpt_client, price_list_id=price_list.id),
+                api=PriceListItemAPIService(self._mpt_client, price_list_id=price_list_id),
                 data_model=ItemData,
                 file_manager=PriceListItemExcelFileManager(file_path),
                 stats=self._stats,
+                skip_unchanged=self._skip_unchanged,
+                checkpoint=checkpoint,
             )
         )
         with console.status("Sync Price list Items..."):
             result = items_service.update()
 
-        self._stats.stat_id = price_list.id
         console.print(stats_table_renderer.render(self._stats))
+        if result.success:
+            checkpoint.clear()
+        else:
+            console.print(f"Sync checkpoint has been kept in: {checkpoint.journal_path}")
         return result.success
 
 
@@ -96,14 +129,51 @@ def sync_price_lists(
         list[str],
         typer.Argument(help="Path to Price lists definition files", metavar="PRICELISTS-PATHS"),
     ],
+    skip_unchanged: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--skip-unchanged",
+            help="Fetch the current price items first and do not update the rows that "
+            "already match them.",
+        ),
+    ] = False,
+    is_plan: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--plan",
+            help="Do not sync Price lists. Print the creates, updates, no-ops and conflicts a "
+            "sync would do.",
+        ),
+    ] = False,
+    plan_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--plan-file",
+            help="Write the sync plan as JSON to the given file. Implies --plan.",
+            dir_okay=False,
+        ),
+    ] = None,
+    is_resumed: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--resume",
+            help="Continue interrupted syncs from their checkpoints, without sending the "
+            "price items they completed again.",
+        ),
+    ] = False,
 ):
     """Sync price lists to the environment from Excel definition files.
 
     Args:
         pricelists_paths: List of paths to price list definition files to sync.
+        skip_unchanged: Whether to skip the price item updates that would not change anything.
+        is_plan: Whether to only print what a sync would do.
+        plan_file: JSON file to write the sync plan to.
+        is_resumed: Whether to continue interrupted syncs from their checkpoints.
 
     Raises:
-        typer.Exit: With code 3 if no files found, code 4 if sync fails.
+        typer.Exit: With code 3 if no files found, code 4 if sync fails or the plan has
+            conflicts.
 
     """
     with console.status("Fetching price list files..."):
@@ -113,9 +183,12 @@ def sync_price_lists(
         console.print("No files found for provided paths", ", ".join(pricelists_paths))
         raise typer.Exit(code=3)
 
+    if is_plan or plan_file is not None:
+        PriceListSyncer().plan_all(file_paths, plan_file)
+
     typer.confirm(
         f"Do you want to sync {len(file_paths)} price_lists files?",
         abort=True,
     )
 
-    PriceListSyncer().sync_all(file_paths)
+    PriceListSyncer(skip_unchanged=skip_unchanged, is_resumed=is_resumed).sync_all(file_paths)
@@ -0,0 +1,12 @@
+from cli.core.errors import CLIError
+
+
+class PriceRuleError(CLIError):
+    """Exception raised when a price rule cannot be parsed."""
+
+    def __init__(self, rule: str, reason: str):
+        self.rule = rule
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f"Invalid price rule '{self.rule}': {self.reason}"
@@ -1,4 +1,4 @@
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from types import MappingProxyType
 from typing import Any
 
@@ -9,7 +9,7 @@ from cli.core.price_lists.constants import (
     PRICELIST_ITEMS_ID,
     TAB_PRICE_ITEMS,
 )
-from cli.core.price_lists.models import ItemData
+from cli.core.price_lists.models import ItemData, PriceItemTable
 from openpyxl.worksheet.datavalidation import DataValidation
 
 
@@ -24,5 +24,29 @@ class PriceListItemExcelFileManager(HorizontalTabFileManager):
         PRICELIST_ITEMS_ACTION: DataValidation(type="list", formula1='"-,update"', allow_blank=True)
     })
 
+    def read_table(self) -> PriceItemTable:
+        """Read every row of the sheet into a columnar price item table.
+
+        Returns:
+            The price items of the sheet, without decoding them into ItemData objects.
+        """
+        return PriceItemTable.from_sheet_rows(self._read_data())
+
+    def write_table_rows(
+        self, table: PriceItemTable, row_indexes: Iterable[int], column_names: Iterable[str]
+    ) -> None:
+        """Write prices of table rows back to their cells and mark the rows for update.
+
+        The workbook is saved once, whatever the number of rows.
+
+        Args:
+            table: The table read with ``read_table``.
+            row_indexes: The rows to write.
+            column_names: The price columns to write.
+        """
+        self.file_handler.write([
+            {self._sheet_name: table.to_sheet_cells(row_indexes, column_names)}
+        ])
+
     def _read_data(self) -> Generator[dict[str, Any], None, None]:
         return self.file_handler.get_data_from_horizontal_sheet(self._sheet_name, self._fields)
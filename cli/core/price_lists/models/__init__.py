@@ -1,4 +1,5 @@
 from cli.core.price_lists.models.item import ItemData
+from cli.core.price_lists.models.item_table import PRICE_COLUMNS, PriceItemTable
 from cli.core.price_lists.models.price_list import PriceListData
 
-__all__ = ["ItemData", "PriceListData"]
+__all__ = ["PRICE_COLUMNS", "ItemData", "PriceItemTable", "PriceListData"]
@@ -38,7 +38,7 @@ class ItemStatus(StrEnum):
     PRIVATE = "Private"
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemData(BaseDataModel):
     """Data model representing a price list item."""
 
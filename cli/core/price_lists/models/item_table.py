@@ -0,0 +1,317 @@
+import itertools
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from types import MappingProxyType
+from typing import Any, Self
+
+from cli.core.price_lists import constants
+from cli.core.price_lists.models.item import ItemAction, ItemStatus
+from openpyxl.utils.cell import coordinate_from_string
+
+type SheetRow = Mapping[str, Mapping[str, Any]]
+type TextColumn = list[str | None]
+
+# Sheet header and API field of every price column, by ItemData field name.
+PRICE_COLUMNS: Mapping[str, tuple[str, str]] = MappingProxyType({
+    "unit_lp": (constants.PRICELIST_ITEMS_UNIT_LP, "unitLP"),
+    "unit_pp": (constants.PRICELIST_ITEMS_UNIT_PP, "unitPP"),
+    "unit_sp": (constants.PRICELIST_ITEMS_UNIT_SP, "unitSP"),
+    "markup": (constants.PRICELIST_ITEMS_MARKUP, "markup"),
+    "lp_x1": (constants.PRICELIST_ITEMS_LPx1, "LPx1"),
+    "lp_xm": (constants.PRICELIST_ITEMS_LPxM, "LPxM"),
+    "lp_xy": (constants.PRICELIST_ITEMS_LPxY, "LPxY"),
+    "pp_x1": (constants.PRICELIST_ITEMS_PPx1, "PPx1"),
+    "pp_xm": (constants.PRICELIST_ITEMS_PPxM, "PPxM"),
+    "pp_xy": (constants.PRICELIST_ITEMS_PPxY, "PPxY"),
+    "sp_x1": (constants.PRICELIST_ITEMS_SPx1, "SPx1"),
+    "sp_xm": (constants.PRICELIST_ITEMS_SPxM, "SPxM"),
+    "sp_xy": (constants.PRICELIST_ITEMS_SPxY, "SPxY"),
+})
+# Sheet header of every text column, by ItemData field name.
+TEXT_COLUMNS: Mapping[str, str] = MappingProxyType({
+    "id": constants.PRICELIST_ITEMS_ID,
+    "item_id": constants.PRICELIST_ITEMS_ITEM_ID,
+    "vendor_id": constants.PRICELIST_ITEMS_ITEM_VENDOR_ID,
+    "erp_id": constants.PRICELIST_ITEMS_ITEM_ERP_ID,
+    "status": constants.PRICELIST_ITEMS_STATUS,
+    "action": constants.PRICELIST_ITEMS_ACTION,
+})
+STATUSES = frozenset(ItemStatus)
+ACTIONS = frozenset(ItemAction)
+
+
+class PriceItemTable:  # noqa: WPS214
+    """Price list items stored column by column.
+
+    Every price column is an ``array('d')`` with NaN for missing prices, and the IDs,
+    status and action are lists of strings, so bulk validation, diffing and serialization
+    walk flat columns instead of one ``ItemData`` per row. Rows keep the order they were
+    loaded in.
+
+    Attributes:
+        prices: Price columns by ItemData field name.
+        texts: ID, status and action columns by ItemData field name, plus the
+            ``coordinate`` of the ID cell of rows loaded from a sheet.
+        sheet_columns: Column letter of every header of the sheet the rows were loaded
+            from.
+
+    """
+
+    def __init__(self) -> None:
+        self.prices = {column_name: array("d") for column_name in PRICE_COLUMNS}
+        self.texts: dict[str, TextColumn] = {
+            column_name: [] for column_name in (*TEXT_COLUMNS, "coordinate")
+        }
+        self.sheet_columns: dict[str, str] = {}
+        self._malformed: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.texts["id"])
+
+    @classmethod
+    def from_sheet_rows(cls, sheet_rows: Iterable[SheetRow]) -> Self:
+        """Load the rows of the Price Items sheet.
+
+        Args:
+            sheet_rows: Rows as read by ``get_data_from_horizontal_sheet``.
+
+        Returns:
+            The table of the rows. Price cells that are not numbers are loaded as missing
+            prices and reported by ``invalid_rows``.
+
+        """
+        table = cls()
+        for sheet_row in sheet_rows:
+            table.add_sheet_columns(sheet_row)
+            row_texts = {
+                column_name: _cell_value(sheet_row, header)
+                for column_name, header in TEXT_COLUMNS.items()
+            }
+            row_texts["action"] = row_texts["action"] or ItemAction.SKIP
+            row_texts["coordinate"] = sheet_row.get(constants.PRICELIST_ITEMS_ID, {}).get(
+                "coordinate"
+            )
+            table.append_row(
+                row_texts,
+                {
+                    column_name: _cell_value(sheet_row, header)
+                    for column_name, (header, _) in PRICE_COLUMNS.items()
+                },
+            )
+        return table
+
+    @classmethod
+    def from_json(cls, json_records: Iterable[Mapping[str, Any]]) -> Self:
+        """Load price list items returned by the Marketplace API.
+
+        Args:
+            json_records: Price list items, e.g. the ``data`` of every listed page.
+
+        Returns:
+            The table of the price list items.
+
+        """
+        table = cls()
+        for json_record in json_records:
+            table.append_row(
+                _json_row_texts(json_record),
+                {
+                    column_name: json_record.get(json_field)
+                    for column_name, (_, json_field) in PRICE_COLUMNS.items()
+                },
+            )
+        return table
+
+    def append_row(self, row_texts: Mapping[str, Any], row_prices: Mapping[str, Any]) -> None:
+        """Add a row at the end of the table.
+
+        Args:
+            row_texts: Values of the text columns; missing columns are None.
+            row_prices: Values of the price columns; None, blank and non-numeric values
+                are stored as missing prices.
+
+        """
+        row_index = len(self)
+        for column_name, text_column in self.texts.items():
+            text_column.append(row_texts.get(column_name))
+        for column_name, price_column in self.prices.items():
+            raw_price = row_prices.get(column_name)
+            try:
+                price_column.append(_to_price(raw_price))
+            except (TypeError, ValueError):
+                price_column.append(math.nan)
+                self._add_malformed(row_index, PRICE_COLUMNS[column_name][0], raw_price)
+
+    def add_sheet_columns(self, sheet_row: SheetRow) -> None:
+        """Record the column letters of the headers of a sheet row.
+
+        Args:
+            sheet_row: A row as read by ``get_data_from_horizontal_sheet``.
+
+        """
+        for header, cell in sheet_row.items():
+            if header not in self.sheet_columns and cell.get("coordinate"):
+                self.sheet_columns[header] = coordinate_from_string(cell["coordinate"])[0]
+
+    def invalid_rows(self) -> dict[int, str]:
+        """Validate the prices, statuses and actions of every row.
+
+        Returns:
+            The first error of every invalid row, by row index.
+
+        """
+        errors = dict(self._malformed)
+        row_errors = itertools.chain(
+            self._negative_prices(),
+            self._unknown_values("status", STATUSES),
+            self._unknown_values("action", ACTIONS),
+        )
+        for row_index, error in row_errors:
+            errors.setdefault(row_index, error)
+        return dict(sorted(errors.items()))
+
+    def changed_rows(
+        self, remote_table: "PriceItemTable", column_names: Iterable[str] = PRICE_COLUMNS
+    ) -> list[int]:
+        """Find the rows whose prices differ from the same item of another table.
+
+        Rows are matched by vendor external ID, the same way the price list update
+        matches them. Rows without a matching item are not returned.
+
+        Args:
+            remote_table: The table to compare with, e.g. the current price list items.
+            column_names: The price columns to compare.
+
+        Returns:
+            The sorted indexes of the changed rows of this table.
+
+        """
+        matches = self._match_rows(remote_table)
+        changed: set[int] = set()
+        for column_name in column_names:
+            changed.update(self._changed_prices(remote_table, column_name, matches))
+        return sorted(changed)
+
+    def to_xlsx_columns(self) -> dict[str, list[Any]]:
+        """Serialize the table as Price Items sheet columns.
+
+        Returns:
+            The values of every column by sheet header, with None for missing prices.
+
+        """
+        xlsx_columns: dict[str, list[Any]] = {
+            header: list(self.texts[column_name]) for column_name, header in TEXT_COLUMNS.items()
+        }
+        for column_name, (header, _) in PRICE_COLUMNS.items():
+            xlsx_columns[header] = [_from_price(price) for price in self.prices[column_name]]
+        return xlsx_columns
+
+    def to_sheet_cells(
+        self, row_indexes: Iterable[int], column_names: Iterable[str]
+    ) -> dict[str, Any]:
+        """Serialize price cells of rows loaded from a sheet, marked for update.
+
+        Args:
+            row_indexes: The rows to serialize.
+            column_names: The price columns to serialize.
+
+        Returns:
+            The value of every cell by coordinate, including ``update`` in the Action cell
+            of every row.
+
+        """
+        column_names = tuple(column_names)
+        action_column = self.sheet_columns[constants.PRICELIST_ITEMS_ACTION]
+        sheet_cells: dict[str, Any] = {}
+        for row_index in row_indexes:
+            _, row_number = coordinate_from_string(self.texts["coordinate"][row_index])
+            sheet_cells.update(self._price_cells(row_index, row_number, column_names))
+            sheet_cells[f"{action_column}{row_number}"] = ItemAction.UPDATE.value
+        return sheet_cells
+
+    def _add_malformed(self, row_index: int, header: str, raw_price: Any) -> None:
+        self._malformed.setdefault(row_index, f"{header} is not a number: {raw_price}")
+
+    def _price_cells(
+        self, row_index: int, row_number: int, column_names: Iterable[str]
+    ) -> dict[str, float | None]:
+        column_letters = {
+            column_name: self.sheet_columns[PRICE_COLUMNS[column_name][0]]
+            for column_name in column_names
+        }
+        return {
+            f"{column_letter}{row_number}": _from_price(self.prices[column_name][row_index])
+            for column_name, column_letter in column_letters.items()
+        }
+
+    def _match_rows(self, remote_table: "PriceItemTable") -> list[tuple[int, int]]:
+        remote_rows = {
+            vendor_id: row_index
+            for row_index, vendor_id in enumerate(remote_table.texts["vendor_id"])
+        }
+        return [
+            (row_index, remote_rows[vendor_id])
+            for row_index, vendor_id in enumerate(self.texts["vendor_id"])
+            if vendor_id in remote_rows
+        ]
+
+    def _changed_prices(
+        self, remote_table: "PriceItemTable", column_name: str, matches: list[tuple[int, int]]
+    ) -> Iterator[int]:
+        prices = self.prices[column_name]
+        remote_prices = remote_table.prices[column_name]
+        return (
+            row_index
+            for row_index, remote_index in matches
+            if not _same_price(prices[row_index], remote_prices[remote_index])
+        )
+
+    def _negative_prices(self) -> Iterator[tuple[int, str]]:
+        for column_name, (header, _) in PRICE_COLUMNS.items():
+            yield from (
+                (row_index, f"{header} must not be negative: {price}")
+                for row_index, price in enumerate(self.prices[column_name])
+                if price < 0
+            )
+
+    def _unknown_values(
+        self, column_name: str, known_values: frozenset[str]
+    ) -> Iterator[tuple[int, str]]:
+        return (
+            (row_index, f"Unknown {column_name}: {column_value}")
+            for row_index, column_value in enumerate(self.texts[column_name])
+            if column_value not in known_values
+        )
+
+
+def _cell_value(sheet_row: SheetRow, header: str) -> Any:
+    return sheet_row.get(header, {}).get("value")
+
+
+def _json_row_texts(json_record: Mapping[str, Any]) -> dict[str, Any]:
+    external_ids = json_record["item"]["externalIds"]
+    return {
+        "id": json_record.get("id"),
+        "item_id": json_record["item"]["id"],
+        "vendor_id": external_ids["vendor"],
+        "erp_id": external_ids.get("operations"),
+        "status": json_record["status"],
+        "action": ItemAction.SKIP,
+    }
+
+
+def _to_price(raw_price: Any) -> float:
+    if raw_price is None or (isinstance(raw_price, str) and not raw_price.strip()):
+        return math.nan
+    return float(raw_price)
+
+
+def _from_price(price: float) -> float | None:
+    return None if math.isnan(price) else price
+
+
+def _same_price(local_price: float, remote_price: float) -> bool:
+    if math.isnan(local_price) or math.isnan(remote_price):
+        return math.isnan(local_price) and math.isnan(remote_price)
+    return math.isclose(local_price, remote_price)
@@ -3,8 +3,8 @@ from dataclasses import dataclass, field
 from typing import Any, Self, override
 
 from cli.core.models import BaseDataModel
+from cli.core.models.timestamps import decode_audit_date
 from cli.core.price_lists import constants
-from dateutil import parser
 
 
 @dataclass
@@ -72,8 +72,8 @@ class PriceListData(BaseDataModel):
             notes=json_data.get("notes", ""),
             default_markup=json_data["defaultMarkup"],
             external_id=json_data.get("externalIds", {}).get("vendor"),
-            created_date=parser.parse(json_data["audit"]["created"]["at"]).date(),
-            updated_date=(updated and parser.parse(updated).date()) or None,
+            created_date=decode_audit_date(json_data["audit"]["created"]["at"]),
+            updated_date=decode_audit_date(updated),
         )
 
     @override
@@ -1,14 +1,19 @@
 from typing import override
 
 from cli.core.errors import MPTAPIError
+from cli.core.memory import memory_phase
+from cli.core.nested_dicts import StringKeyedDict, is_subset
 from cli.core.price_lists.constants import (
     TAB_PRICE_ITEMS,
 )
+from cli.core.price_lists.models import ItemData
 from cli.core.services import RelatedBaseService
 from cli.core.services.service_result import ServiceResult
 
 EXPORT_PAGE_SIZE = 100
 EXPORT_SELECT = "audit,item.terms,priceList.precision,priceList.currency"
+REMOTE_STATE_SELECT = "item.externalIds"
+REMOTE_STATE_KEY_PATH = "item.externalIds.vendor"
 
 
 class ItemService(RelatedBaseService):
@@ -25,21 +30,22 @@ class ItemService(RelatedBaseService):
         self.file_manager.create_tab()
         offset = 0
         while True:
-            try:
-                response = self.api.list({
-                    "select": EXPORT_SELECT,
-                    "offset": offset,
-                    "limit": EXPORT_PAGE_SIZE,
-                })
-            except MPTAPIError as error:
-                self.stats.add_error(TAB_PRICE_ITEMS)
-                return ServiceResult(
-                    success=False, model=None, errors=[str(error)], stats=self.stats
-                )
-
-            self.file_manager.add([
-                self.data_model.from_json(record) for record in response["data"]
-            ])
+            with memory_phase("Export price items page"):
+                try:
+                    response = self.api.list({
+                        "select": EXPORT_SELECT,
+                        "offset": offset,
+                        "limit": EXPORT_PAGE_SIZE,
+                    })
+                except MPTAPIError as error:
+                    self.stats.add_error(TAB_PRICE_ITEMS)
+                    return ServiceResult(
+                        success=False, model=None, errors=[str(error)], stats=self.stats
+                    )
+
+                self.file_manager.add([
+                    self.data_model.from_json(record) for record in response["data"]
+                ])
 
             meta = response["meta"]
             if meta["offset"] + meta["limit"] >= meta["total"]:
@@ -66,7 +72,15 @@ class ItemService(RelatedBaseService):
     @override
     def update(self) -> ServiceResult:
         errors = []
+        self.remote_state.prefetch(
+            self.api,
+            {"select": REMOTE_STATE_SELECT, "offset": 0, "limit": EXPORT_PAGE_SIZE},
+            REMOTE_STATE_KEY_PATH,
+        )
+        resumed_rows = self._resume_checkpoint()
         for record in self.file_manager.read_data():
+            if record.coordinate in resumed_rows:
+                continue
             error_message = self._update_one_record(record)
             if error_message is not None:
                 errors.append(error_message)
@@ -78,28 +92,39 @@ class ItemService(RelatedBaseService):
             self._set_skipped()
             return None
 
-        query_params = {"item.ExternalIds.vendor": record.vendor_id, "limit": 1}
         try:
-            response = self.api.list(query_params=query_params)
-        except (MPTAPIError, KeyError) as error:
+            price_item = self._find_price_item(record)
+        except (MPTAPIError, KeyError, ValueError) as error:
             self._set_error(error, record.id)
             return str(error)
 
-        response_data = response.get("data", [])
-        if not response_data:
-            missing_item_error = ValueError(
-                f"Item {record.id}: no matching item found for vendor {record.vendor_id}"
-            )
-            self._set_error(missing_item_error, record.id)
-            return str(missing_item_error)
-
         # TODO: this logic should be moved to the price list data model creation
         record.type = "operations" if self.account.is_operations() else "vendor"
+        json_payload = record.to_json()
+        if self.remote_state.is_enabled and is_subset(json_payload, price_item):
+            self._set_unchanged(record.id, record.coordinate)
+            return None
+
         try:
-            self.api.update(response_data[0]["id"], record.to_json())
+            self.api.update(
+                price_item["id"], self.remote_state.find_changes(record.vendor_id, json_payload)
+            )
         except MPTAPIError as error:
             self._set_error(error, record.id)
             return f"Item {record.id}: {error!s}"
 
         self._set_synced(record.id, record.coordinate)
         return None
+
+    def _find_price_item(self, record: ItemData) -> StringKeyedDict:
+        price_item = self.remote_state.find(record.vendor_id)
+        if price_item is not None:
+            return price_item
+
+        query_params = {"item.ExternalIds.vendor": record.vendor_id, "limit": 1}
+        response_data = self.api.list(query_params=query_params).get("data", [])
+        if not response_data:
+            raise ValueError(
+                f"Item {record.id}: no matching item found for vendor {record.vendor_id}"
+            )
+        return response_data[0]
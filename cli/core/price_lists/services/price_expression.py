@@ -0,0 +1,160 @@
+import ast
+import itertools
+import math
+import operator
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from functools import partial
+from types import MappingProxyType
+
+from cli.core.price_lists.errors import PriceRuleError
+
+type Column = Sequence[float]
+type Operand = Column | float
+type Environment = Mapping[str, Operand]
+type Evaluator = Callable[[Environment], Operand]
+
+
+def _nan_safe(function: Callable[..., float], *prices: float) -> float:
+    if any(map(math.isnan, prices)):
+        return math.nan
+    return function(*prices)
+
+
+def _power(base: float, exponent: float) -> float:
+    try:
+        power = math.pow(base, exponent)
+    except OverflowError:
+        return math.inf
+    except ValueError:
+        return math.nan
+    return power
+
+
+BINARY_OPERATORS: Mapping[type[ast.operator], Callable[[float, float], float]] = MappingProxyType({
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: lambda dividend, divisor: dividend / divisor if divisor else math.nan,
+    ast.Pow: _power,
+})
+UNARY_OPERATORS: Mapping[type[ast.unaryop], Callable[[float], float]] = MappingProxyType({
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+})
+# Functions propagate NaN, so a missing price never turns into a price.
+FUNCTIONS: Mapping[str, Callable[..., float]] = MappingProxyType({
+    "abs": abs,
+    "max": partial(_nan_safe, max),
+    "min": partial(_nan_safe, min),
+    "round": partial(_nan_safe, lambda price, ndigits=0: round(price, int(ndigits))),
+})
+# Accepted argument counts of every function.
+FUNCTION_ARGUMENTS: Mapping[str, range] = MappingProxyType({
+    "abs": range(1, 2),
+    "max": range(2, 100),
+    "min": range(2, 100),
+    "round": range(1, 3),
+})
+
+
+class PriceExpression:
+    """Arithmetic expression over price columns, evaluated a whole column at a time.
+
+    Expressions are parsed with ``ast`` and compiled into operations on columns. Only
+    numbers, names, ``+ - * / **``, parentheses and the ``abs``, ``min``, ``max`` and
+    ``round`` functions are accepted, so an expression can never run arbitrary code.
+    A missing price (NaN) or a division by zero makes the value of its row NaN instead
+    of failing the whole column.
+
+    Attributes:
+        source: The expression as written.
+        names: The names the expression reads.
+
+    """
+
+    def __init__(self, source: str, known_names: Iterable[str]) -> None:
+        self.source = source
+        self.names: set[str] = set()
+        self._known_names = frozenset(known_names)
+        try:
+            body = ast.parse(source.strip(), mode="eval").body
+        except SyntaxError as error:
+            raise PriceRuleError(source, f"invalid syntax: {error.msg}") from error
+        self._evaluator = self._compile(body)
+
+    def evaluate(self, environment: Environment, rows: int) -> list[float]:
+        """Evaluate the expression for every row.
+
+        Args:
+            environment: The value of every name; columns for prices, numbers for
+                variables.
+            rows: The number of rows.
+
+        Returns:
+            The value of the expression for every row.
+
+        """
+        evaluated = self._evaluator(environment)
+        if isinstance(evaluated, float):
+            return list(itertools.repeat(evaluated, rows))
+        return list(evaluated)
+
+    def _compile(self, node: ast.expr) -> Evaluator:
+        match node:
+            case ast.Constant(value=int() | float() as number) if not isinstance(number, bool):
+                return self._compile_constant(number)
+            case ast.Name(id=name):
+                return self._compile_name(name)
+            case ast.BinOp(left=left, op=op, right=right) if type(op) in BINARY_OPERATORS:  # noqa: WPS516
+                return self._compile_operation(BINARY_OPERATORS[type(op)], (left, right))
+            case ast.UnaryOp(op=op, operand=operand) if type(op) in UNARY_OPERATORS:  # noqa: WPS516
+                return self._compile_operation(UNARY_OPERATORS[type(op)], (operand,))
+            case ast.Call(func=ast.Name(id=name), args=args, keywords=[]) if name in FUNCTIONS:
+                return self._compile_call(name, args)
+        raise PriceRuleError(self.source, f"unsupported syntax '{ast.unparse(node)}'")
+
+    def _compile_constant(self, number: float) -> Evaluator:
+        try:
+            return partial(_constant, float(number))
+        except OverflowError as error:
+            raise PriceRuleError(self.source, "number too large") from error
+
+    def _compile_name(self, name: str) -> Evaluator:
+        if name not in self._known_names:
+            raise PriceRuleError(self.source, f"unknown name '{name}'")
+        self.names.add(name)
+        return operator.itemgetter(name)
+
+    def _compile_call(self, name: str, args: list[ast.expr]) -> Evaluator:
+        if len(args) not in FUNCTION_ARGUMENTS[name]:
+            raise PriceRuleError(self.source, f"wrong number of arguments to {name}()")
+        return self._compile_operation(FUNCTIONS[name], args)
+
+    def _compile_operation(
+        self, function: Callable[..., float], operand_nodes: Iterable[ast.expr]
+    ) -> Evaluator:
+        operands = tuple(self._compile(operand_node) for operand_node in operand_nodes)
+        return partial(_operation, function, operands)
+
+
+def _constant(number: float, environment: Environment) -> Operand:
+    return number
+
+
+def _operation(
+    function: Callable[..., float], operands: tuple[Evaluator, ...], environment: Environment
+) -> Operand:
+    operand_values = [operand(environment) for operand in operands]
+    if all(isinstance(operand_value, float) for operand_value in operand_values):
+        return function(*operand_values)
+    return list(
+        map(
+            function,
+            *(
+                itertools.repeat(operand_value)
+                if isinstance(operand_value, float)
+                else operand_value
+                for operand_value in operand_values
+            ),
+        )
+    )
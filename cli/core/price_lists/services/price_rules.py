@@ -0,0 +1,132 @@
+import math
+import re
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Self
+
+from cli.core.price_lists.errors import PriceRuleError
+from cli.core.price_lists.models import PRICE_COLUMNS, PriceItemTable
+from cli.core.price_lists.services.price_expression import PriceExpression
+
+# Table column of every price a rule can read or write, by API field name.
+RULE_COLUMNS: Mapping[str, str] = MappingProxyType({
+    json_field: column_name for column_name, (_, json_field) in PRICE_COLUMNS.items()
+})
+VARIABLE_PATTERN = re.compile(r"^\s*(?P<name>[A-Za-z_]\w*)\s*=\s*(?P<value>.+?)\s*$")
+
+
+@dataclass(frozen=True)
+class PriceRule:
+    """Assignment of an expression to a price column, e.g. ``unitSP = unitPP * fx``.
+
+    Attributes:
+        target: The API field name of the price column to set.
+        expression: The expression computing the new prices.
+
+    """
+
+    target: str
+    expression: PriceExpression
+
+    @classmethod
+    def parse(cls, rule: str, variable_names: Iterable[str] = ()) -> Self:
+        """Parse a ``<column> = <expression>`` rule.
+
+        Args:
+            rule: The rule as written.
+            variable_names: Names of the variables the expression can read besides the
+                price columns.
+
+        Returns:
+            The parsed rule.
+
+        Raises:
+            PriceRuleError: If the rule is not an assignment to a price column or the
+                expression is not supported.
+
+        """
+        target, separator, source = rule.partition("=")
+        target = target.strip()
+        if not separator:
+            raise PriceRuleError(rule, "expected '<column> = <expression>'")
+        if target not in RULE_COLUMNS:
+            raise PriceRuleError(rule, f"unknown price column '{target}'")
+        try:
+            expression = PriceExpression(source, [*RULE_COLUMNS, *variable_names])
+        except PriceRuleError as error:
+            raise PriceRuleError(rule, error.reason) from error
+        return cls(target=target, expression=expression)
+
+    def apply(
+        self, table: PriceItemTable, variables: Mapping[str, float], precision: int
+    ) -> set[int]:
+        """Set the target prices of every row to the value of the expression.
+
+        Rows where the expression is not finite, e.g. because a price it reads is missing
+        or it divides by zero, keep their current price.
+
+        Args:
+            table: The price list items to update in place.
+            variables: The value of every variable.
+            precision: The number of decimals new prices are rounded to.
+
+        Returns:
+            The indexes of the rows whose target price changed.
+
+        """
+        prices = table.prices[RULE_COLUMNS[self.target]]
+        new_prices = [
+            round(new_price, precision)
+            for new_price in self.expression.evaluate(_environment(table, variables), len(table))
+        ]
+        changed = {
+            row_index
+            for row_index, new_price in enumerate(new_prices)
+            if math.isfinite(new_price) and new_price != prices[row_index]
+        }
+        for row_index in changed:
+            prices[row_index] = new_prices[row_index]
+        return changed
+
+
+def parse_variables(assignments: Iterable[str]) -> dict[str, float]:
+    """Parse ``NAME=VALUE`` variable assignments.
+
+    Args:
+        assignments: The assignments as written.
+
+    Returns:
+        The value of every variable by name.
+
+    Raises:
+        PriceRuleError: If an assignment is malformed, its value is not a number or the
+            name is a price column.
+
+    """
+    return dict(_parse_variable(assignment) for assignment in assignments)
+
+
+def _parse_variable(assignment: str) -> tuple[str, float]:
+    match = VARIABLE_PATTERN.match(assignment)
+    if match is None:
+        raise PriceRuleError(assignment, "expected '<name>=<number>'")
+    if match["name"] in RULE_COLUMNS:
+        raise PriceRuleError(assignment, f"'{match['name']}' is a price column")
+    try:
+        variable_value = float(match["value"])
+    except ValueError as error:
+        raise PriceRuleError(assignment, f"'{match['value']}' is not a number") from error
+    return match["name"], variable_value
+
+
+def _environment(
+    table: PriceItemTable, variables: Mapping[str, float]
+) -> dict[str, Sequence[float] | float]:
+    return {
+        **variables,
+        **{
+            json_field: table.prices[column_name]
+            for json_field, column_name in RULE_COLUMNS.items()
+        },
+    }
@@ -0,0 +1,154 @@
+from typing import Any
+
+from cli.core.accounts.models import Account
+from cli.core.errors import MPTAPIError
+from cli.core.price_lists.api import PriceListAPIService, PriceListItemAPIService
+from cli.core.price_lists.constants import TAB_GENERAL, TAB_PRICE_ITEMS
+from cli.core.price_lists.handlers import PriceListExcelFileManager, PriceListItemExcelFileManager
+from cli.core.price_lists.models import ItemData
+from cli.core.price_lists.services.item_service import (
+    EXPORT_PAGE_SIZE,
+    REMOTE_STATE_KEY_PATH,
+    REMOTE_STATE_SELECT,
+)
+from cli.core.services.remote_state import RemoteState
+from cli.core.services.service_context import ServiceContext
+from cli.core.services.sync_plan import PlanAction, PlanEntry, SyncPlan, update_action
+from cli.core.stats import PriceListStatsCollector
+from mpt_api_client import MPTClient
+
+
+def plan_price_lists(account: Account, mpt_client: MPTClient, file_paths: list[str]) -> SyncPlan:
+    """Plan the sync of price list definition files, in sync order.
+
+    Args:
+        account: The active account.
+        mpt_client: Client of the target environment.
+        file_paths: Paths of the price list definition files.
+
+    Returns:
+        What syncing every file would do.
+
+    """
+    sync_plan = SyncPlan()
+    for file_path in file_paths:
+        plan_price_list(account, mpt_client, file_path, sync_plan)
+    return sync_plan
+
+
+def plan_price_list(
+    account: Account, mpt_client: MPTClient, file_path: str, sync_plan: SyncPlan
+) -> None:
+    """Plan the sync of a price list definition file.
+
+    Args:
+        account: The active account.
+        mpt_client: Client of the target environment.
+        file_path: Path of the price list definition file.
+        sync_plan: The plan to add the rows to.
+
+    """
+    price_list_id = PriceListExcelFileManager(file_path).read_data().id
+    try:
+        is_new_price_list = price_list_id is None or not PriceListAPIService(mpt_client).exists({
+            "id": price_list_id
+        })
+    except MPTAPIError as error:
+        sync_plan.add(
+            PlanEntry(
+                file_path, TAB_GENERAL, None, price_list_id, PlanAction.CONFLICT, detail=str(error)
+            )
+        )
+        return
+
+    sync_plan.add(
+        PlanEntry(
+            source=file_path,
+            tab=TAB_GENERAL,
+            coordinate=None,
+            row_id=price_list_id,
+            action=PlanAction.CREATE if is_new_price_list else PlanAction.UPDATE,
+            remote_id=None if is_new_price_list else price_list_id,
+        )
+    )
+    items_context = ServiceContext(
+        account=account,
+        api=PriceListItemAPIService(mpt_client, price_list_id=price_list_id or ""),
+        data_model=ItemData,
+        file_manager=PriceListItemExcelFileManager(file_path),
+        stats=PriceListStatsCollector(),
+    )
+    plan_price_items(items_context, sync_plan, file_path, is_new_price_list=is_new_price_list)
+
+
+def plan_price_items(
+    service_context: ServiceContext, sync_plan: SyncPlan, source: str, *, is_new_price_list: bool
+) -> None:
+    """Plan the price items of a price list definition file.
+
+    The price items of an existing price list are listed page by page once and matched
+    to the rows by vendor external ID, the same way the update does.
+
+    Args:
+        service_context: The context of the price items service.
+        sync_plan: The plan to add the rows to.
+        source: Path of the price list definition file.
+        is_new_price_list: Whether the sync creates the price list, so there is nothing to
+            match the rows to yet.
+
+    """
+    remote_state = RemoteState(is_enabled=True)
+    if not is_new_price_list and not _fetch_price_items(
+        service_context, remote_state, sync_plan, source
+    ):
+        return
+
+    for record in service_context.file_manager.read_data():
+        record.type = "operations" if service_context.account.is_operations() else "vendor"
+        remote_record = remote_state.find(record.vendor_id)
+        action, detail = _plan_price_item(
+            record, remote_record, is_new_price_list=is_new_price_list
+        )
+        sync_plan.add(
+            PlanEntry(
+                source=source,
+                tab=TAB_PRICE_ITEMS,
+                coordinate=record.coordinate,
+                row_id=record.id,
+                action=action,
+                remote_id=remote_record["id"] if remote_record else None,
+                detail=detail,
+            )
+        )
+
+
+def _fetch_price_items(
+    service_context: ServiceContext, remote_state: RemoteState, sync_plan: SyncPlan, source: str
+) -> bool:
+    try:
+        remote_state.fetch(
+            service_context.api,
+            {"select": REMOTE_STATE_SELECT, "offset": 0, "limit": EXPORT_PAGE_SIZE},
+            REMOTE_STATE_KEY_PATH,
+        )
+    except MPTAPIError as error:
+        sync_plan.add(
+            PlanEntry(source, TAB_PRICE_ITEMS, None, None, PlanAction.CONFLICT, detail=str(error))
+        )
+        return False
+    return True
+
+
+def _plan_price_item(
+    record: Any, remote_record: Any, *, is_new_price_list: bool
+) -> tuple[PlanAction, str]:
+    if not record.to_update():
+        return PlanAction.SKIP, ""
+
+    if is_new_price_list:
+        return PlanAction.UPDATE, "Price list is created first"
+
+    if remote_record is None:
+        return PlanAction.CONFLICT, f"No matching item found for vendor {record.vendor_id}"
+
+    return update_action(record.to_json(), remote_record), ""
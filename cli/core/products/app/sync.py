@@ -1,40 +1,77 @@
-from typing import Annotated, Any
+from pathlib import Path
+from typing import Annotated, Any, NoReturn
 
 import typer
 from cli.core.console import console
 from cli.core.console.renderers.stats import StatsTableRenderer
+from cli.core.console.renderers.sync_plan import SyncPlanRenderer
 from cli.core.models import DataCollectionModel
+from cli.core.products.constants import TAB_GENERAL
 from cli.core.products.containers import ProductContainer
+from cli.core.products.services.sync_planner import plan_new_components, plan_related_components
+from cli.core.products.services.workbook_id_remapper import (
+    ITEM_GROUP_REFERENCES,
+    PARAMETER_GROUP_REFERENCES,
+    PARAMETER_REFERENCES,
+)
+from cli.core.profiling import trace_span
+from cli.core.services.checkpoint import SyncCheckpoint
+from cli.core.services.sync_plan import PlanAction, PlanEntry, SyncPlan
 from rich.status import Status
 
 app = typer.Typer()
 stats_table_renderer = StatsTableRenderer()
+sync_plan_renderer = SyncPlanRenderer()
+# Related component services in update order.
+RELATED_SERVICES = (
+    "item_service",
+    "item_group_service",
+    "template_service",
+    "parameter_group_service",
+    "agreement_parameters_service",
+    "asset_parameters_service",
+    "item_parameters_service",
+    "request_parameters_service",
+    "subscription_parameters_service",
+)
 
 
 class ProductSyncer:
     """Coordinate the CLI-driven sync of a single product definition file."""
 
-    def __init__(self, product_container: ProductContainer) -> None:
+    def __init__(self, product_container: ProductContainer, *, is_resumed: bool = False) -> None:
         self._container = product_container
+        self._is_resumed = is_resumed
         self._product_service = self._container.product_service()
         account = self._container.account_container().account()
         self._account = account
         self._account_label = f"{account.id} ({account.name})"
 
-    def sync(self, product_path: str, *, is_dry_run: bool, force_create: bool) -> None:
+    def sync(  # noqa: WPS213
+        self,
+        product_path: str,
+        *,
+        is_dry_run: bool,
+        force_create: bool,
+        is_plan: bool = False,
+        plan_file: Path | None = None,
+    ) -> None:
         """Validate the definition and either create or update the product.
 
         Args:
             product_path: Path to the product definition file (used only for messages).
             is_dry_run: When True, validate the file and exit without syncing.
             force_create: When True, create a new product even if the ID already exists.
+            is_plan: When True, print what a sync would do and exit without syncing.
+            plan_file: JSON file to write the sync plan to.
 
         Raises:
-            typer.Exit: With code 3 if validation fails or sync produces errors, code 0 on
-                successful dry runs.
+            typer.Exit: With code 3 if validation fails, sync produces errors or the plan has
+                conflicts, code 0 on successful dry runs and plans.
 
         """
-        validation = self._product_service.validate_definition()
+        with trace_span("Validate product definition", "flow"):
+            validation = self._product_service.validate_definition()
         if not validation.success:
             console.print(validation.stats.errors)
             raise typer.Exit(code=3)
@@ -43,10 +80,22 @@ class ProductSyncer:
         if is_dry_run:
             raise typer.Exit(code=0)
 
-        product = self._product_service.retrieve().model
-        self._confirm(product, force_create=force_create)
-        if product is None or force_create:
-            with console.status("Create product...") as status:
+        with trace_span("Retrieve product", "flow"):
+            product = self._product_service.retrieve().model
+        if is_plan:
+            self._plan(product_path, product, force_create=force_create, plan_file=plan_file)
+        checkpoint = SyncCheckpoint.for_workbook(product_path, is_resumed=self._is_resumed)
+        # A product journaled in the General tab was created by the interrupted sync.
+        is_create_resumed = bool(checkpoint.completed_ids(TAB_GENERAL))
+        self._confirm(product, force_create=force_create, is_create_resumed=is_create_resumed)
+        self._container.checkpoint.override(checkpoint)
+        # Resolved again, so the product service journals to the checkpoint.
+        self._product_service = self._container.product_service()
+        if product is None or force_create or is_create_resumed:
+            with (
+                console.status("Create product...") as status,
+                trace_span("Create product", "flow"),
+            ):
                 self._run_create(status)
         else:
             with console.status("Update product...") as status:
@@ -55,11 +104,18 @@ class ProductSyncer:
 
         console.print(stats_table_renderer.render(self._container.stats()))
         if self._container.stats().has_errors:
+            console.print(f"Sync checkpoint has been kept in: {checkpoint.journal_path}")
             raise typer.Exit(code=3)
+        checkpoint.clear()
 
-    def _confirm(self, product: Any, *, force_create: bool) -> None:
+    def _confirm(self, product: Any, *, force_create: bool, is_create_resumed: bool) -> None:
         if product is None:
             msg = f"Do you want to create new product for account {self._account_label}"
+        elif is_create_resumed:
+            msg = (
+                f"Do you want to continue the creation of product {product.id} ({product.name}) "
+                f"for account {self._account_label}?"
+            )
         elif force_create:
             msg = (
                 f"Do you want to create new product for account {self._account_label} "
@@ -73,8 +129,37 @@ class ProductSyncer:
             )
         typer.confirm(msg, abort=True)
 
+    def _plan(
+        self, product_path: str, product: Any, *, force_create: bool, plan_file: Path | None
+    ) -> NoReturn:
+        sync_plan = SyncPlan()
+        is_new_product = product is None or force_create
+        product_row = self._product_service.file_manager.read_data()
+        sync_plan.add(
+            PlanEntry(
+                source=product_path,
+                tab=TAB_GENERAL,
+                coordinate=None,
+                row_id=product_row.id,
+                action=PlanAction.CREATE if is_new_product else PlanAction.UPDATE,
+                remote_id=None if is_new_product else product.id,
+            )
+        )
+        if not is_new_product:
+            self._container.resource_id.override(product.id)
+        plan_components = plan_new_components if is_new_product else plan_related_components
+        with console.status("Plan product sync..."), trace_span("Plan product sync", "flow"):
+            for service_name in RELATED_SERVICES:
+                plan_components(getattr(self._container, service_name)(), sync_plan, product_path)
+
+        console.print(sync_plan_renderer.render(sync_plan))
+        if plan_file is not None:
+            sync_plan.write_json(plan_file)
+            console.print(f"Sync plan has been written to: {plan_file}")
+        raise typer.Exit(code=3 if sync_plan.has_conflicts else 0)
+
     def _create_parameter_collections(
-        self, product_id: str, parameter_group_collection: Any, status: Status
+        self, product_id: str, status: Status
     ) -> DataCollectionModel | None:
         scopes = (
             ("agreement", self._container.agreement_parameters_service()),
@@ -86,7 +171,6 @@ class ProductSyncer:
         merged: DataCollectionModel | None = None
         for scope_name, service in scopes:
             status.update(f"Create {scope_name} parameters for product {product_id}...")
-            service.set_new_parameter_group(parameter_group_collection)
             scope_collection = service.create().collection
             if merged is None:
                 merged = scope_collection
@@ -108,19 +192,20 @@ class ProductSyncer:
         status.update(f"Create parameters groups for product {product.id}...")
         parameter_group_collection = self._container.parameter_group_service().create().collection
 
-        parameters_collection = self._create_parameter_collections(
-            product.id, parameter_group_collection, status
-        )
+        id_remapper = self._container.workbook_id_remapper()
+        id_remapper.add(ITEM_GROUP_REFERENCES, item_group_collection)
+        id_remapper.add(PARAMETER_GROUP_REFERENCES, parameter_group_collection)
+        id_remapper.apply()
+
+        parameters_collection = self._create_parameter_collections(product.id, status)
         if parameters_collection is not None:
             status.update(f"Create template parameters for product {product.id}...")
-            template_service = self._container.template_service()
-            template_service.set_new_parameter_group(parameters_collection)
-            template_service.create()
+            id_remapper.add(PARAMETER_REFERENCES, parameters_collection)
+            id_remapper.apply()
+            self._container.template_service().create()
 
         status.update(f"Create items for product {product.id}...")
-        item_service = self._container.item_service()
-        item_service.set_new_item_groups(item_group_collection)
-        item_service.create()
+        self._container.item_service().create()
 
     def _run_update(self, status: Status) -> None:
         resource_id = self._container.resource_id()
@@ -164,11 +249,12 @@ class ProductSyncer:
         )
         for status_msg, service_factory in update_steps:
             status.update(status_msg)
-            service_factory().update()
+            with trace_span(status_msg.removesuffix("..."), "flow"):
+                service_factory().update()
 
 
 @app.command(name="sync")
-def sync_product(
+def sync_product(  # noqa: WPS211
     product_path: Annotated[
         str,
         typer.Argument(help="Path to Product Definition file", metavar="PRODUCT-PATH"),
@@ -189,6 +275,38 @@ def sync_product(
             help="Force create product even if the Product ID exists in the SWO Platform.",
         ),
     ] = False,
+    skip_unchanged: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--skip-unchanged",
+            help="Fetch the current product components first and do not update the rows "
+            "that already match them.",
+        ),
+    ] = False,
+    is_plan: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--plan",
+            help="Do not sync Product Definition. Print the creates, updates, no-ops and "
+            "conflicts a sync would do.",
+        ),
+    ] = False,
+    plan_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--plan-file",
+            help="Write the sync plan as JSON to the given file. Implies --plan.",
+            dir_okay=False,
+        ),
+    ] = None,
+    is_resumed: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--resume",
+            help="Continue an interrupted sync from its checkpoint, without sending the rows "
+            "it completed again.",
+        ),
+    ] = False,
 ):
     """Sync product to the environment.
 
@@ -196,10 +314,21 @@ def sync_product(
         product_path: Path to the product definition file.
         is_dry_run: Whether to only validate the file without syncing.
         force_create: Whether to force create product even if it exists.
+        skip_unchanged: Whether to skip the updates that would not change anything.
+        is_plan: Whether to only print what a sync would do.
+        plan_file: JSON file to write the sync plan to.
+        is_resumed: Whether to continue an interrupted sync from its checkpoint.
 
     Raises:
-        typer.Exit: With code 3 if validation fails or sync errors occur.
+        typer.Exit: With code 3 if validation fails, sync errors occur or the plan has
+            conflicts.
 
     """
-    container = ProductContainer(file_path=str(product_path))
-    ProductSyncer(container).sync(product_path, is_dry_run=is_dry_run, force_create=force_create)
+    container = ProductContainer(file_path=str(product_path), skip_unchanged=skip_unchanged)
+    ProductSyncer(container, is_resumed=is_resumed).sync(
+        product_path,
+        is_dry_run=is_dry_run,
+        force_create=force_create,
+        is_plan=is_plan or plan_file is not None,
+        plan_file=plan_file,
+    )
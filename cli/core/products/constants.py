@@ -50,6 +50,7 @@ GENERAL_PRODUCT_DESCRIPTION = "Product Description"
 GENERAL_STATUS = "Status"
 GENERAL_CREATED = CREATED_COLUMN_NAME
 GENERAL_MODIFIED = "Modified"
+GENERAL_ICON = "Icon"
 GENERAL_FIELDS = (
     GENERAL_PRODUCT_ID,
     GENERAL_PRODUCT_NAME,
@@ -62,6 +63,7 @@ GENERAL_FIELDS = (
     GENERAL_STATUS,
     GENERAL_CREATED,
     GENERAL_MODIFIED,
+    GENERAL_ICON,
 )
 GENERAL_REQUIRED_FIELDS = (
     GENERAL_PRODUCT_ID,
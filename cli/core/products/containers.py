@@ -1,7 +1,9 @@
 from functools import partial
+from pathlib import Path
 from typing import Any, ClassVar
 
 from cli.core.accounts.containers import AccountContainer
+from cli.core.handlers.excel_file_handler import ExcelFileHandler
 from cli.core.products import handlers as product_handlers
 from cli.core.products import models as product_models
 from cli.core.products.api import (
@@ -20,8 +22,11 @@ from cli.core.products.services import (
     ParametersService,
     ProductService,
     TemplateService,
+    WorkbookIdRemapper,
 )
+from cli.core.services.checkpoint import SyncCheckpoint
 from cli.core.services.service_context import ServiceContext
+from cli.core.state import state
 from cli.core.stats import ProductStatsCollector
 from dependency_injector import containers, providers
 
@@ -39,6 +44,7 @@ class ProductContainer(containers.DeclarativeContainer):
         request_parameters_service: Factory provider for the Request parameters.
         subscription_parameters_service: Factory provider for the Subscription parameters.
         template_service: Factory provider for the TemplateService.
+        workbook_id_remapper: Factory provider for the WorkbookIdRemapper.
 
     """
 
@@ -48,6 +54,10 @@ class ProductContainer(containers.DeclarativeContainer):
     resource_id = providers.Dependency(instance_of=str, default="")
     file_path = providers.Dependency(instance_of=str)
     stats = providers.Dependency(instance_of=ProductStatsCollector, default=ProductStatsCollector())
+    skip_unchanged = providers.Dependency(instance_of=bool, default=False)
+    checkpoint: providers.Object[SyncCheckpoint | None] = providers.Object(None)
+    # Read when a service is built, so the governor configured by the CLI options is used.
+    request_governor = providers.Object(state).provided.request_governor
     _apis = providers.Dict(
         product=providers.Factory(ProductAPIService, _api_mpt_client),
         items=providers.Factory(ItemAPIService, _api_mpt_client, resource_id),
@@ -57,28 +67,23 @@ class ProductContainer(containers.DeclarativeContainer):
         template=providers.Factory(TemplateAPIService, _api_mpt_client, resource_id),
     )
 
+    # The file managers share one workbook, so none of them saves over the others.
+    _file_handler = providers.Singleton(ExcelFileHandler, providers.Factory(Path, file_path))
+    _file_manager = partial(providers.Factory, file_path=file_path, file_handler=_file_handler)
     _file_managers = providers.Dict(
-        product=providers.Factory(product_handlers.ProductExcelFileManager, file_path),
-        items=providers.Factory(product_handlers.ItemExcelFileManager, file_path),
-        item_group=providers.Factory(product_handlers.ItemGroupExcelFileManager, file_path),
-        parameter_group=providers.Factory(
-            product_handlers.ParameterGroupExcelFileManager, file_path
+        product=_file_manager(product_handlers.ProductExcelFileManager),
+        items=_file_manager(product_handlers.ItemExcelFileManager),
+        item_group=_file_manager(product_handlers.ItemGroupExcelFileManager),
+        parameter_group=_file_manager(product_handlers.ParameterGroupExcelFileManager),
+        agreement_parameters=_file_manager(product_handlers.AgreementParametersExcelFileManager),
+        asset_parameters=_file_manager(AssetParametersExcelFileManager),
+        item_parameters=_file_manager(product_handlers.ItemParametersExcelFileManager),
+        request_parameters=_file_manager(product_handlers.RequestParametersExcelFileManager),
+        subscription_parameters=_file_manager(
+            product_handlers.SubscriptionParametersExcelFileManager
         ),
-        agreement_parameters=providers.Factory(
-            product_handlers.AgreementParametersExcelFileManager, file_path
-        ),
-        asset_parameters=providers.Factory(AssetParametersExcelFileManager, file_path),
-        item_parameters=providers.Factory(
-            product_handlers.ItemParametersExcelFileManager, file_path
-        ),
-        request_parameters=providers.Factory(
-            product_handlers.RequestParametersExcelFileManager, file_path
-        ),
-        subscription_parameters=providers.Factory(
-            product_handlers.SubscriptionParametersExcelFileManager, file_path
-        ),
-        template=providers.Factory(product_handlers.TemplateExcelFileManager, file_path),
-        settings=providers.Factory(product_handlers.SettingsExcelFileManager, file_path),
+        template=_file_manager(product_handlers.TemplateExcelFileManager),
+        settings=_file_manager(product_handlers.SettingsExcelFileManager),
     )
 
     _services: ClassVar[dict[str, Any]] = {
@@ -133,7 +138,15 @@ class ProductContainer(containers.DeclarativeContainer):
             "file_manager": _file_managers.provided["template"],
         },
     }
-    _partial_context = partial(providers.Factory, ServiceContext, account=_account, stats=stats)
+    _partial_context = partial(
+        providers.Factory,
+        ServiceContext,
+        account=_account,
+        stats=stats,
+        skip_unchanged=skip_unchanged,
+        checkpoint=checkpoint,
+        request_governor=request_governor,
+    )
 
     product_service = providers.Factory(
         ProductService, service_context=_partial_context(**_services["product"])
@@ -165,3 +178,4 @@ class ProductContainer(containers.DeclarativeContainer):
     template_service = providers.Factory(
         TemplateService, service_context=_partial_context(**_services["template"])
     )
+    workbook_id_remapper = providers.Factory(WorkbookIdRemapper, _file_handler)
@@ -1,6 +1,10 @@
+from pathlib import Path
+from typing import Any, override
+
 from cli.core.handlers.vertical_tab_file_manager import VerticalTabFileManager
 from cli.core.products.constants import (
     GENERAL_FIELDS,
+    GENERAL_ICON,
     GENERAL_PRODUCT_ID,
     REQUIRED_FIELDS_BY_TAB,
     REQUIRED_TABS,
@@ -18,3 +22,13 @@ class ProductExcelFileManager(VerticalTabFileManager):
     _required_tabs = REQUIRED_TABS
     _required_fields_by_tab = REQUIRED_FIELDS_BY_TAB
     _sheet_name = TAB_GENERAL
+
+    @override
+    def _read_data(self, fields: tuple[str, ...]) -> dict[str, Any]:
+        row_data = super()._read_data(fields)
+        icon_cell = row_data.get(GENERAL_ICON)
+        if icon_cell and icon_cell["value"]:
+            # Icon paths are relative to the definition file, not to the current directory.
+            icon_path = Path(self.file_handler.file_path).parent / str(icon_cell["value"])
+            row_data[GENERAL_ICON] = {**icon_cell, "value": str(icon_path)}
+        return row_data
@@ -3,12 +3,12 @@ from dataclasses import dataclass
 from typing import Any, Self, override
 
 from cli.core.models import BaseDataModel
+from cli.core.models.timestamps import decode_audit_date
 from cli.core.products import constants
 from cli.core.products.models.mixins import ActionMixin
-from dateutil import parser
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemGroupData(BaseDataModel, ActionMixin):
     """Data model representing an item group."""
 
@@ -53,8 +53,8 @@ class ItemGroupData(BaseDataModel, ActionMixin):
             default=json_data["default"],
             multiple=json_data["multiple"],
             required=json_data["required"],
-            created_date=parser.parse(json_data["audit"]["created"]["at"]).date(),
-            updated_date=(updated and parser.parse(updated).date()) or None,
+            created_date=decode_audit_date(json_data["audit"]["created"]["at"]),
+            updated_date=decode_audit_date(updated),
         )
 
     @override
@@ -3,15 +3,17 @@ from dataclasses import dataclass, field
 from typing import Any, Self, override
 
 from cli.core.models import BaseDataModel
+from cli.core.models.timestamps import decode_audit_date
 from cli.core.products import constants
 from cli.core.products.models.enums import ItemTermsModelEnum
 from cli.core.products.models.mixins import ItemActionMixin
-from dateutil import parser
 
 
 class ItemPayloadMixin:
     """Provide payload helpers for item models."""
 
+    __slots__ = ()
+
     item_type: str | None
     vendor_id: str
     operations_id: str | None
@@ -72,7 +74,7 @@ class ItemPayloadMixin:
         return payload
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemData(ItemPayloadMixin, BaseDataModel, ItemActionMixin):
     """Data model representing a product item."""
 
@@ -152,8 +154,8 @@ class ItemData(ItemPayloadMixin, BaseDataModel, ItemActionMixin):
             parameter_values=[],
             status=json_data["status"],
             unit_name=json_data["unit"]["name"],
-            created_date=parser.parse(json_data["audit"]["created"]["at"]).date(),
-            updated_date=(updated and parser.parse(updated).date()) or None,
+            created_date=decode_audit_date(json_data["audit"]["created"]["at"]),
+            updated_date=decode_audit_date(updated),
         )
 
     @override
@@ -177,3 +179,7 @@ class ItemData(ItemPayloadMixin, BaseDataModel, ItemActionMixin):
             constants.ITEMS_CREATED: self.created_date,
             constants.ITEMS_MODIFIED: self.updated_date,
         }
+
+    @override
+    def assign_product(self, product_id: str) -> None:
+        self.product_id = product_id
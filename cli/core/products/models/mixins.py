@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from cli.core.products.models import DataActionEnum, ItemActionEnum
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ActionMixin:
     """Mixin class providing action-related functionality for data models."""
 
@@ -45,8 +45,15 @@ class ActionMixin:
         """
         return self.action in {DataActionEnum.SKIP, DataActionEnum.SKIPPED}
 
+    def assign_product(self, product_id: str) -> None:
+        """Set the product the object belongs to, if its payload refers to it.
 
-@dataclass
+        Args:
+            product_id: The ID of the product.
+        """
+
+
+@dataclass(slots=True)
 class ItemActionMixin(ActionMixin):
     """Mixin class providing item-specific action functionality."""
 
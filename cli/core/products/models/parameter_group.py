@@ -3,12 +3,12 @@ from dataclasses import dataclass
 from typing import Any, Self, override
 
 from cli.core.models import BaseDataModel
+from cli.core.models.timestamps import decode_audit_date
 from cli.core.products import constants
 from cli.core.products.models.mixins import ActionMixin
-from dateutil import parser
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterGroupData(BaseDataModel, ActionMixin):
     """Data model representing a parameter group."""
 
@@ -47,8 +47,8 @@ class ParameterGroupData(BaseDataModel, ActionMixin):
             display_order=json_data["displayOrder"],
             label=json_data["label"],
             name=json_data["name"],
-            created_date=parser.parse(json_data["audit"]["created"]["at"]).date(),
-            updated_date=(updated and parser.parse(updated).date()) or None,
+            created_date=decode_audit_date(json_data["audit"]["created"]["at"]),
+            updated_date=decode_audit_date(updated),
         )
 
     @override
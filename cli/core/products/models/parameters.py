@@ -1,4 +1,5 @@
 import datetime as dt
+import inspect
 import json
 from abc import ABC
 from dataclasses import dataclass
@@ -6,10 +7,10 @@ from enum import StrEnum
 from typing import Any, Self, TypeVar, override
 
 from cli.core.models import BaseDataModel
+from cli.core.models.timestamps import decode_audit_date
 from cli.core.products import constants
 from cli.core.products.models import DataActionEnum
 from cli.core.products.models.mixins import ActionMixin
-from dateutil import parser
 
 BaseParametersData = TypeVar("BaseParametersData", bound="ParametersData")
 
@@ -24,8 +25,8 @@ class ParamScopeEnum(StrEnum):
     SUBSCRIPTION = "Subscription"
 
 
-@dataclass
-class ParametersData(BaseDataModel, ActionMixin, ABC):
+@dataclass(slots=True)
+class ParametersData(BaseDataModel, ActionMixin, ABC):  # noqa: WPS214
     """Abstract data model representing parameters."""
 
     id: str
@@ -53,6 +54,19 @@ class ParametersData(BaseDataModel, ActionMixin, ABC):
 
         return None
 
+    @classmethod
+    def default_scope(cls) -> ParamScopeEnum | None:
+        """Return the scope of the parameters the class represents.
+
+        Slotted dataclasses do not keep field defaults as class attributes, so the
+        scope is read from the signature of the class.
+
+        Returns:
+            The default value of the scope field.
+
+        """
+        return inspect.signature(cls).parameters["scope"].default
+
     @classmethod
     @override
     def from_dict(cls, row_data: dict[str, Any]) -> Self:
@@ -66,8 +80,8 @@ class ParametersData(BaseDataModel, ActionMixin, ABC):
             name=row_data[constants.PARAMETERS_NAME]["value"],
             phase=row_data[constants.PARAMETERS_PHASE]["value"],
             type=row_data[constants.PARAMETERS_TYPE]["value"],
-            constraints=json.loads(row_data[constants.PARAMETERS_CONSTRAINTS]["value"]),
-            options=json.loads(row_data[constants.PARAMETERS_OPTIONS]["value"]),
+            constraints=cls._load_json_cell(row_data, constants.PARAMETERS_CONSTRAINTS),
+            options=cls._load_json_cell(row_data, constants.PARAMETERS_OPTIONS),
             group_id=row_data[constants.PARAMETERS_GROUP_ID]["value"],
             group_id_coordinate=row_data[constants.PARAMETERS_GROUP_ID]["coordinate"],
         )
@@ -88,8 +102,8 @@ class ParametersData(BaseDataModel, ActionMixin, ABC):
             options=json_data["options"],
             group_id=json_data.get("group", {}).get("id"),
             group_name=json_data.get("group", {}).get("name"),
-            created_date=parser.parse(json_data["audit"]["created"]["at"]).date(),
-            updated_date=(updated and parser.parse(updated).date()) or None,
+            created_date=decode_audit_date(json_data["audit"]["created"]["at"]),
+            updated_date=decode_audit_date(updated),
         )
 
     def is_order_request(self) -> bool:
@@ -144,36 +158,43 @@ class ParametersData(BaseDataModel, ActionMixin, ABC):
             constants.PARAMETERS_MODIFIED: self.updated_date,
         }
 
+    @classmethod
+    def _load_json_cell(cls, row_data: dict[str, Any], field_name: str) -> Any:
+        try:
+            return json.loads(row_data[field_name]["value"])
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"Invalid JSON in {field_name}: {error}") from error
+
 
-@dataclass
+@dataclass(slots=True)
 class AgreementParametersData(ParametersData):
     """Data model representing agreement parameters."""
 
     scope: ParamScopeEnum = ParamScopeEnum.AGREEMENT
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetParametersData(ParametersData):
     """Data model representing agreement parameters."""
 
     scope: ParamScopeEnum = ParamScopeEnum.ASSET
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemParametersData(ParametersData):
     """Data model representing item parameters."""
 
     scope: ParamScopeEnum = ParamScopeEnum.ITEM_SCOPE
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestParametersData(ParametersData):
     """Data model representing request parameters."""
 
     scope: ParamScopeEnum = ParamScopeEnum.REQUEST
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscriptionParametersData(ParametersData):
     """Data model representing subscription parameters."""
 
@@ -1,16 +1,22 @@
 import datetime as dt
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Self, override
 
 from cli.core.models.data_model import BaseDataModel
+from cli.core.models.timestamps import decode_audit_date
 from cli.core.nested_dicts import set_dict_value
 from cli.core.products import constants
+from cli.core.products.models.enums import DataActionEnum
 from cli.core.products.models.mixins import ActionMixin
-from dateutil import parser
 
+DEFAULT_ICON_PATH = Path(__file__).parent / "icons" / "fake-icon.png"
+# Icons are read once per process, a batch sync reads the same few icons for every product.
+ICON_CACHE_SIZE = 64
 
-@dataclass
+
+@dataclass(slots=True)
 class SettingsRecords(BaseDataModel, ActionMixin):
     """Data model representing a product settings item."""
 
@@ -23,7 +29,8 @@ class SettingsRecords(BaseDataModel, ActionMixin):
     @override
     def from_dict(cls, row_data: dict[str, Any]) -> Self:
         return cls(
-            action=row_data[constants.SETTINGS_ACTION]["value"],
+            # The Action column is optional, settings without one are not updated.
+            action=row_data.get(constants.SETTINGS_ACTION, {}).get("value", DataActionEnum.SKIP),
             name=row_data[constants.SETTINGS_SETTING]["value"],
             coordinate=row_data[constants.SETTINGS_SETTING]["coordinate"],
             setting_value=row_data[constants.SETTINGS_VALUE]["value"],
@@ -146,8 +153,6 @@ class ProductData(BaseDataModel):
             if "settings" in row_data
             else SettingsData()
         )
-        icon_path = Path(Path(__file__).parent) / "icons/fake-icon.png"
-        default_icon = Path(icon_path).read_bytes()
         return cls(
             id=row_data[constants.GENERAL_PRODUCT_ID]["value"],
             coordinate=row_data[constants.GENERAL_PRODUCT_ID]["coordinate"],
@@ -160,7 +165,7 @@ class ProductData(BaseDataModel):
             account_name=row_data.get(constants.GENERAL_ACCOUNT_NAME),
             export_date=row_data.get(constants.GENERAL_EXPORT_DATE, {}).get("value"),
             status=row_data[constants.GENERAL_STATUS]["value"],
-            icon=default_icon,
+            icon=load_icon(row_data.get(constants.GENERAL_ICON, {}).get("value")),
         )
 
     @classmethod
@@ -176,8 +181,8 @@ class ProductData(BaseDataModel):
             long_description=json_data["longDescription"],
             website=json_data["website"],
             status=json_data["status"],
-            created_date=parser.parse(json_data["audit"]["created"]["at"]).date(),
-            updated_date=(updated and parser.parse(updated).date()) or None,
+            created_date=decode_audit_date(json_data["audit"]["created"]["at"]),
+            updated_date=decode_audit_date(updated),
             settings=SettingsData.from_json(json_data["settings"]),
         )
 
@@ -205,3 +210,25 @@ class ProductData(BaseDataModel):
             constants.GENERAL_CREATED: self.created_date,
             constants.GENERAL_MODIFIED: self.updated_date,
         }
+
+
+def load_icon(icon_path: str | Path | None = None) -> bytes:
+    """Load the icon of a product.
+
+    Icons are read once per process and cached by path, so a change made to an icon file
+    while the process runs is not seen.
+
+    Args:
+        icon_path: The path of the PNG icon. The default icon is loaded when there is no
+            path.
+
+    Returns:
+        The content of the icon file.
+
+    """
+    return _read_icon(Path(icon_path or DEFAULT_ICON_PATH))
+
+
+@lru_cache(maxsize=ICON_CACHE_SIZE)
+def _read_icon(icon_path: Path) -> bytes:
+    return icon_path.read_bytes()
@@ -3,13 +3,13 @@ from dataclasses import dataclass
 from typing import Any, Self, override
 
 from cli.core.models import BaseDataModel
+from cli.core.models.timestamps import decode_audit_date
 from cli.core.products import constants
 from cli.core.products.models import DataActionEnum
 from cli.core.products.models.mixins import ActionMixin
-from dateutil import parser
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateData(BaseDataModel, ActionMixin):
     """Data model representing a template resource."""
 
@@ -49,8 +49,8 @@ class TemplateData(BaseDataModel, ActionMixin):
             type=json_data["type"],
             template_content=json_data["content"],
             default=json_data.get("default"),
-            created_date=parser.parse(json_data["audit"]["created"]["at"]).date(),
-            updated_date=(updated and parser.parse(updated).date()) or None,
+            created_date=decode_audit_date(json_data["audit"]["created"]["at"]),
+            updated_date=decode_audit_date(updated),
         )
 
     @override
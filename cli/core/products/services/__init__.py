@@ -4,6 +4,7 @@ from cli.core.products.services.parameter_group_service import ParameterGroupSer
 from cli.core.products.services.parameters_service import ParametersService
 from cli.core.products.services.product_service import ProductService
 from cli.core.products.services.template_service import TemplateService
+from cli.core.products.services.workbook_id_remapper import WorkbookIdRemapper
 
 __all__ = [
     "ItemGroupService",
@@ -12,4 +13,5 @@ __all__ = [
     "ParametersService",
     "ProductService",
     "TemplateService",
+    "WorkbookIdRemapper",
 ]
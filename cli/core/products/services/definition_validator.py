@@ -0,0 +1,58 @@
+from collections.abc import Iterator
+from typing import Any
+
+from cli.core.handlers.excel_file_handler import ExcelFileHandler
+from cli.core.handlers.horizontal_tab_file_manager import HorizontalTabFileManager
+from cli.core.products import handlers
+from cli.core.products.handlers.parameters_excel_file_manager import (
+    AssetParametersExcelFileManager,
+)
+from cli.core.products.models import DataActionEnum, ItemActionEnum
+
+# Every Action a sync handles, empty Action cells are read as None.
+KNOWN_ACTIONS = frozenset((*DataActionEnum, *ItemActionEnum, None))
+# File managers of the tabs with one component per row, in sync order.
+ROW_FILE_MANAGERS: tuple[type[HorizontalTabFileManager], ...] = (
+    handlers.SettingsExcelFileManager,
+    handlers.ItemGroupExcelFileManager,
+    handlers.ParameterGroupExcelFileManager,
+    handlers.AgreementParametersExcelFileManager,
+    AssetParametersExcelFileManager,
+    handlers.ItemParametersExcelFileManager,
+    handlers.RequestParametersExcelFileManager,
+    handlers.SubscriptionParametersExcelFileManager,
+    handlers.TemplateExcelFileManager,
+    handlers.ItemExcelFileManager,
+)
+
+type DefinitionError = tuple[str, str, str]
+
+
+def find_definition_errors(file_handler: ExcelFileHandler) -> Iterator[DefinitionError]:
+    """Decode every row of every tab of a product definition and yield the invalid rows.
+
+    Rows are invalid when their data model cannot be decoded, e.g. because of an unknown
+    terms model or malformed JSON options, or when their action is unknown. All tabs are
+    read through the given handler, so the workbook is loaded once, and the tabs the
+    definition doesn't have are skipped.
+
+    Args:
+        file_handler: The handler of the product definition file.
+
+    Yields:
+        The tab, the coordinate and the error message of every invalid row.
+
+    """
+    for file_manager_class in ROW_FILE_MANAGERS:
+        file_manager = file_manager_class(str(file_handler.file_path))
+        file_manager.file_handler = file_handler
+        if file_manager.tab_name not in file_handler.sheet_names:
+            continue
+        for coordinate, error_message in file_manager.find_row_errors(_check_action):
+            yield file_manager.tab_name, coordinate, error_message
+
+
+def _check_action(data_model: Any) -> None:
+    action = getattr(data_model, "action", None)
+    if action not in KNOWN_ACTIONS:
+        raise ValueError(f"Invalid action: {action}")
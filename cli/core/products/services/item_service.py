@@ -2,7 +2,6 @@ from collections.abc import Callable
 from typing import Any, cast, override
 
 from cli.core.errors import MPTAPIError
-from cli.core.models import DataCollectionModel
 from cli.core.models.data_model import DataModel
 from cli.core.mpt.flows import search_uom_by_name
 from cli.core.products.models import DataActionEnum, ItemActionEnum, ItemData
@@ -14,6 +13,11 @@ from cli.core.products.services.related_components_base_service import (
 class ItemService(RelatedComponentsBaseService):
     """Service for managing item operations."""
 
+    remote_key_path = "externalIds.vendor"
+    row_key_attribute = "vendor_id"
+    external_key_path = "externalIds.vendor"
+    external_key_attribute = "vendor_id"
+
     @override
     def prepare_data_model_to_create(self, data_model: DataModel) -> DataModel:
         data_model = super().prepare_data_model_to_create(data_model)
@@ -29,28 +33,6 @@ class ItemService(RelatedComponentsBaseService):
 
         return data_model
 
-    def set_new_item_groups(self, item_groups: DataCollectionModel | None) -> None:
-        """Update item group references in item content.
-
-        Args:
-            item_groups: A collection of item groups to update.
-
-        """
-        if item_groups is None or not item_groups.collection:
-            return
-
-        new_ids = {}
-        for item_data in self.file_manager.read_data():
-            try:
-                new_group = item_groups.retrieve_by_id(item_data.group_id)
-            except KeyError:
-                continue
-
-            new_ids[item_data.group_coordinate] = new_group.id
-
-        if new_ids:
-            self.file_manager.write_ids(new_ids)
-
     @override
     def set_export_params(self) -> dict[str, Any]:
         export_query = super().set_export_params()
@@ -80,12 +62,14 @@ class ItemService(RelatedComponentsBaseService):
     def _action_update_item(self, data_model: DataModel) -> None:
         item_data = cast(ItemData, data_model)
 
-        query_params = {
-            "externalIds.vendor": item_data.vendor_id,
-            "product.id": item_data.product_id,
-            "limit": 1,
-        }
-        existing_item = self.api.list(query_params=query_params)["data"][0]
+        existing_item = self.remote_state.find(item_data.vendor_id)
+        if existing_item is None:
+            query_params = {
+                "externalIds.vendor": item_data.vendor_id,
+                "product.id": item_data.product_id,
+                "limit": 1,
+            }
+            existing_item = self.api.list(query_params=query_params)["data"][0]
         item_data.id = existing_item["id"]
 
         super()._action_update_item(data_model)
@@ -1,45 +1,30 @@
 import json
-from typing import override
+from typing import Any, override
 
 from cli.core.errors import MPTAPIError
 from cli.core.handlers.errors import RequiredFieldsError, RequiredSheetsError
 from cli.core.products.handlers import SettingsExcelFileManager
-from cli.core.products.models import DataActionEnum, SettingsData
+from cli.core.products.models import DataActionEnum, ProductData, SettingsData
+from cli.core.products.services.definition_validator import find_definition_errors
 from cli.core.services.base_service import BaseService
+from cli.core.services.create_retries import post_with_retries
 from cli.core.services.service_result import ServiceResult
 from requests_toolbelt import MultipartEncoder  # type: ignore
 
 
-class ProductService(BaseService):
+class ProductService(BaseService):  # noqa: WPS214
     """Service for managing product operations."""
 
     @override
     def create(self) -> ServiceResult:
         product = self.file_manager.read_data()
-        multipart_payload = MultipartEncoder(
-            fields={
-                "product": json.dumps(product.to_json()),
-                "icon": ("icon.png", product.icon, "image/png"),
-            }
-        )
-        headers = {"Content-Type": multipart_payload.content_type}
         try:
-            new_product_data = self.api.post(form_payload=multipart_payload, headers=headers)
+            self._create_product(product)
         except MPTAPIError as error:
             self._set_error(error)
             error_messages = [str(error)]
             return ServiceResult(success=False, errors=error_messages, model=None, stats=self.stats)
 
-        product.id = new_product_data["id"]
-        try:
-            # TODO: Handle this gracefully using update_settings function
-            self.api.update(f"{product.id}/settings", json_payload=product.settings.to_json())
-        except MPTAPIError as error:
-            self._set_error(error)
-            error_messages = [str(error)]
-            return ServiceResult(success=False, errors=error_messages, model=None, stats=self.stats)
-
-        self._set_synced(product.id, product.coordinate)
         return ServiceResult(success=True, model=product, stats=self.stats)
 
     @override
@@ -56,7 +41,7 @@ class ProductService(BaseService):
         # They cannot be retrieved as separate resources, so special handling is required
         # to maintain simple code organization and logic.
         settings_excel_file_manager = SettingsExcelFileManager(
-            self.file_manager.file_handler.file_path
+            self.file_manager.file_handler.file_path, self.file_manager.file_handler
         )
         settings_excel_file_manager.create_tab()
 
@@ -93,6 +78,9 @@ class ProductService(BaseService):
     def validate_definition(self) -> ServiceResult:
         """Validates the definition of the product file.
 
+        Besides the required tabs and fields, every row of every tab is decoded, so all the
+        invalid values are reported with their coordinates before anything is synced.
+
         Returns:
             ServiceResult: The result of the validation, including errors if any.
 
@@ -121,13 +109,13 @@ class ProductService(BaseService):
             error_messages = [str(error)]
             return ServiceResult(success=False, errors=error_messages, model=None, stats=self.stats)
 
-        return ServiceResult(success=True, model=None, stats=self.stats)
+        return self._validate_rows()
 
     @override
     def update(self) -> ServiceResult:
         product = self.file_manager.read_data()
         settings_excel_file_manager = SettingsExcelFileManager(
-            self.file_manager.file_handler.file_path
+            self.file_manager.file_handler.file_path, self.file_manager.file_handler
         )
         setting_items = [
             settings_item
@@ -144,3 +132,71 @@ class ProductService(BaseService):
             return ServiceResult(success=False, errors=error_messages, model=None, stats=self.stats)
 
         return ServiceResult(success=True, model=product, stats=self.stats)
+
+    def _create_product(self, product: ProductData) -> None:
+        if not self._resume_created_product(product):
+            self._post_product(product)
+        # TODO: Handle this gracefully using update_settings function
+        self.api.update(f"{product.id}/settings", json_payload=product.settings.to_json())
+
+    def _post_product(self, product: ProductData) -> None:
+        # Products have no external ID, so a failed create is looked up by its name among
+        # the products that did not exist before it.
+        existing_ids = set()
+        if self._request_governor is not None:
+            existing_ids = {found["id"] for found in self._list_named_products(product.name)}
+        new_product_data = post_with_retries(
+            lambda: self._send_product(product),
+            lambda: self._find_created_product(product.name, existing_ids),
+            self._request_governor,
+            product.name,
+        )
+        product.id = new_product_data["id"]
+        # Journaled before the settings are sent, so a resumed sync never creates it again.
+        self._set_synced(product.id, product.coordinate or "")
+
+    def _send_product(self, product: ProductData) -> dict[str, Any]:
+        # Built for every attempt, as the encoder is consumed when it is sent.
+        multipart_payload = MultipartEncoder(
+            fields={
+                "product": json.dumps(product.to_json()),
+                "icon": ("icon.png", product.icon, "image/png"),
+            }
+        )
+        headers = {"Content-Type": multipart_payload.content_type}
+        return self.api.post(form_payload=multipart_payload, headers=headers)
+
+    def _find_created_product(self, name: str, existing_ids: set[str]) -> dict[str, Any] | None:
+        return next(
+            (found for found in self._list_named_products(name) if found["id"] not in existing_ids),
+            None,
+        )
+
+    def _list_named_products(self, name: str) -> list[dict[str, Any]]:
+        return self.api.list(query_params={"name": name})["data"]
+
+    def _resume_created_product(self, product: ProductData) -> bool:
+        resumed_id = self._resume_checkpoint().get(product.coordinate or "")
+        if resumed_id is None:
+            return False
+
+        # Created before the sync was interrupted, its settings are sent again.
+        product.id = resumed_id
+        return True
+
+    def _validate_rows(self) -> ServiceResult:
+        general_errors = (
+            (self.file_manager.tab_name, coordinate, error_message)
+            for coordinate, error_message in self.file_manager.find_row_errors()
+        )
+        error_messages = []
+        for tab_name, coordinate, error_message in (
+            *general_errors,
+            *find_definition_errors(self.file_manager.file_handler),
+        ):
+            self.stats.errors.add_msg(tab_name, coordinate, error_message)
+            error_messages.append(f"{tab_name} {coordinate}: {error_message}")
+
+        return ServiceResult(
+            success=not error_messages, errors=error_messages, model=None, stats=self.stats
+        )
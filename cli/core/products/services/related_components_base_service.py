@@ -1,22 +1,54 @@
 import logging
 from abc import ABC
 from collections.abc import Callable
-from typing import Any, override
+from typing import Any, cast, override
 
 from cli.core.errors import MPTAPIError
 from cli.core.models import DataCollectionModel
 from cli.core.models.data_model import DataModel
+from cli.core.mpt.governor import RequestGovernor
 from cli.core.products.models import DataActionEnum
+from cli.core.profiling import trace_span
 from cli.core.services import RelatedBaseService
+from cli.core.services.create_retries import post_with_retries
+from cli.core.services.remote_state import RemoteState
 from cli.core.services.service_result import ServiceResult
 
 logger = logging.getLogger(__name__)
 
 
-class RelatedComponentsActionMixin:
-    """Provide related-component action handlers."""
+class RelatedComponentsActionMixin:  # noqa: WPS214
+    """Provide related-component action handlers.
+
+    Attributes:
+        remote_key_path: Path of the remote resource value rows are matched by.
+        row_key_attribute: Data model attribute holding the value rows are matched by.
+        external_key_path: Path of the remote resource external ID, or None if the
+            resource has none.
+        external_key_attribute: Data model attribute holding the external ID.
+
+    """
 
     api: Any
+    export_params: dict[str, Any]
+    remote_state: RemoteState
+    _request_governor: RequestGovernor | None
+    remote_key_path = "id"
+    row_key_attribute = "id"
+    external_key_path: str | None = None
+    external_key_attribute = "external_id"
+
+    def check_update_action(self, model_action: DataActionEnum) -> None:
+        """Check that the update supports an action, without running it.
+
+        Args:
+            model_action: The action type to check.
+
+        Raises:
+            ValueError: If the action type is not supported.
+
+        """
+        self._get_update_action_handler(model_action)
 
     def _action_create_item(self, data_model: DataModel):
         """Creates the item in the API.
@@ -28,9 +60,39 @@ class RelatedComponentsActionMixin:
             data_model: The data model to be created
 
         """
-        new_data_model = self.api.post(json=data_model.to_json())
+        new_data_model = self._post_new_item(data_model)
         data_model.id = new_data_model["id"]  # type: ignore[attr-defined]
 
+    def _post_new_item(self, data_model: DataModel) -> dict[str, Any]:
+        """Create the item in the API, retrying server and connection errors.
+
+        A failed create may have reached the API, so before every retry the item is
+        looked up by its external ID and returned if it exists. Items without an external
+        ID are not retried, because the retry could create them twice.
+
+        Args:
+            data_model: The data model to be created
+
+        Returns:
+            The created item.
+
+        """
+        external_id = self.external_key_path and getattr(data_model, self.external_key_attribute)
+        if not external_id:
+            return self.api.post(json=data_model.to_json())
+        return post_with_retries(
+            lambda: self.api.post(json=data_model.to_json()),
+            lambda: self._find_created_item(external_id),
+            self._request_governor,
+            external_id,
+        )
+
+    def _find_created_item(self, external_id: str) -> dict[str, Any] | None:
+        key_path = cast(str, self.external_key_path)
+        query_params = {**self.export_params, key_path: external_id, "limit": 1}
+        found_items = self.api.list(query_params=query_params)["data"]
+        return found_items[0] if found_items else None
+
     def _action_delete_item(self, _data_model: DataModel) -> None:
         """Delete the item in the API.
 
@@ -46,6 +108,7 @@ class RelatedComponentsActionMixin:
     def _action_update_item(self, data_model: DataModel) -> None:
         """Update the item in the API.
 
+        Only the values that differ from the prefetched remote resource are sent.
         This method could be overridden by subclasses to customize the data model before
         sending to API.
 
@@ -53,7 +116,9 @@ class RelatedComponentsActionMixin:
             data_model: The data model to be updated
 
         """
-        self.api.update(data_model.id, data_model.to_json())  # type: ignore[attr-defined]
+        row_key = getattr(data_model, self.row_key_attribute)
+        json_payload = self.remote_state.find_changes(row_key, data_model.to_json())
+        self.api.update(data_model.id, json_payload)  # type: ignore[attr-defined]
 
     def _get_update_action_handler(self, model_action: DataActionEnum) -> Callable:
         """Retrieve the appropriate action handler based on the action type.
@@ -83,27 +148,57 @@ class RelatedComponentsActionMixin:
 
         raise ValueError(f"Invalid action: {model_action}")
 
+    def _is_unchanged(self, data_model: Any) -> bool:
+        """Check whether the prefetched remote resource already matches the data model.
+
+        The id of a matching resource is set on the data model, so it is written back
+        to the file.
+
+        Args:
+            data_model: The data model to be updated
+
+        Returns:
+            True if the update would not change the remote resource, False otherwise.
+
+        """
+        row_key = getattr(data_model, self.row_key_attribute)
+        remote_record = self.remote_state.find_unchanged(row_key, data_model.to_json())
+        if remote_record is None:
+            return False
+
+        data_model.id = remote_record["id"]
+        return True
+
 
 class RelatedComponentsBaseService(RelatedComponentsActionMixin, RelatedBaseService, ABC):
     """Base service for managing related component operations."""
 
     @override
-    def create(self) -> ServiceResult:
+    def create(self) -> ServiceResult:  # noqa: WPS210
         errors = []
         collection = {}
+        resumed_ids = self._resume_checkpoint()
+        source_ids = self._resumed_source_ids()
         for raw_model_data in self.file_manager.read_data():
             data_model = self.prepare_data_model_to_create(raw_model_data)
+            source_id = source_ids.get(data_model.coordinate, data_model.id)
+            resumed_id = resumed_ids.get(data_model.coordinate)
+            if resumed_id is not None:
+                # Created before the sync was interrupted.
+                collection[source_id] = data_model
+                data_model.id = resumed_id
+                continue
 
             try:
-                new_item = self.api.post(json=data_model.to_json())
+                new_item = self._post_new_item(data_model)
             except MPTAPIError as error:
                 errors.append(str(error))
                 self._set_error(error, data_model.id)
                 continue
 
-            collection[data_model.id] = data_model
+            collection[source_id] = data_model
             data_model.id = new_item["id"]
-            self._set_synced(new_item["id"], data_model.coordinate)
+            self._set_synced(new_item["id"], data_model.coordinate, source_id)
 
         return ServiceResult(
             success=len(errors) == 0,
@@ -171,15 +266,20 @@ class RelatedComponentsBaseService(RelatedComponentsActionMixin, RelatedBaseServ
     @override
     def update(self) -> ServiceResult:
         errors = []
-        for data_model in self.file_manager.read_data():
-            error_message = self._update_one_record(data_model)
-            if error_message is not None:
-                errors.append(error_message)
+        with trace_span(f"{type(self).__name__}.update"):
+            self.remote_state.prefetch(self.api, self.export_params, self.remote_key_path)
+            resumed_rows = self._resume_checkpoint()
+            for data_model in self.file_manager.read_data():
+                if data_model.coordinate in resumed_rows:
+                    continue
+                error_message = self._update_one_record(data_model)
+                if error_message is not None:
+                    errors.append(error_message)
         success = not errors
         return ServiceResult(success=success, errors=errors, model=None, stats=self.stats)
 
     def _update_one_record(self, data_model: Any) -> str | None:
-        data_model.product_id = self.resource_id
+        data_model.assign_product(self.resource_id)
         if data_model.to_skip:
             self._set_skipped()
             return None
@@ -190,6 +290,10 @@ class RelatedComponentsBaseService(RelatedComponentsActionMixin, RelatedBaseServ
             self._set_error(error, data_model.id)
             return str(error)
 
+        if data_model.action == DataActionEnum.UPDATE and self._is_unchanged(data_model):
+            self._set_unchanged(data_model.id, data_model.coordinate)
+            return None
+
         try:
             action_handler(data_model)
         except MPTAPIError as error:
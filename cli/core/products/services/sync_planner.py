@@ -0,0 +1,113 @@
+from typing import Any
+
+from cli.core.errors import MPTAPIError
+from cli.core.products.models import DataActionEnum
+from cli.core.products.services.related_components_base_service import (
+    RelatedComponentsBaseService,
+)
+from cli.core.services.remote_state import RemoteState
+from cli.core.services.sync_plan import PlanAction, PlanEntry, SyncPlan, update_action
+
+type PlannedAction = tuple[PlanAction, str]
+
+
+def plan_new_components(
+    service: RelatedComponentsBaseService, sync_plan: SyncPlan, source: str
+) -> None:
+    """Plan the rows of a related components tab of a product that is created.
+
+    Creating a product creates every row of its tabs, whatever their action.
+
+    Args:
+        service: The service of the tab.
+        sync_plan: The plan to add the rows to.
+        source: Path of the product definition file.
+
+    """
+    tab_name = service.file_manager.tab_name
+    for data_model in service.file_manager.read_data():
+        sync_plan.add(
+            PlanEntry(source, tab_name, data_model.coordinate, data_model.id, PlanAction.CREATE)
+        )
+
+
+def plan_related_components(
+    service: RelatedComponentsBaseService, sync_plan: SyncPlan, source: str
+) -> None:
+    """Plan the rows of a related components tab of a product that is updated.
+
+    The remote resources of the tab are listed page by page once and matched to the rows
+    the same way the update does, instead of looking up every row.
+
+    Args:
+        service: The service of the tab.
+        sync_plan: The plan to add the rows to.
+        source: Path of the product definition file.
+
+    """
+    remote_state = _fetch_remote_state(service, sync_plan, source)
+    if remote_state is None:
+        return
+
+    for data_model in service.file_manager.read_data():
+        data_model.assign_product(service.resource_id)
+        remote_record = remote_state.find(getattr(data_model, service.row_key_attribute))
+        action, detail = _plan_row(service, data_model, remote_record)
+        sync_plan.add(
+            PlanEntry(
+                source=source,
+                tab=service.file_manager.tab_name,
+                coordinate=data_model.coordinate,
+                row_id=data_model.id,
+                action=action,
+                remote_id=remote_record["id"] if remote_record else None,
+                detail=detail,
+            )
+        )
+
+
+def _fetch_remote_state(
+    service: RelatedComponentsBaseService, sync_plan: SyncPlan, source: str
+) -> RemoteState | None:
+    remote_state = RemoteState(is_enabled=True)
+    try:
+        remote_state.fetch(service.api, service.export_params, service.remote_key_path)
+    except MPTAPIError as error:
+        tab_name = service.file_manager.tab_name
+        sync_plan.add(
+            PlanEntry(source, tab_name, None, None, PlanAction.CONFLICT, detail=str(error))
+        )
+        return None
+    return remote_state
+
+
+def _plan_row(
+    service: RelatedComponentsBaseService, data_model: Any, remote_record: Any
+) -> PlannedAction:
+    if data_model.to_skip:
+        return PlanAction.SKIP, ""
+
+    try:
+        service.check_update_action(data_model.action)
+    except ValueError as error:
+        return PlanAction.CONFLICT, str(error)
+
+    if data_model.action == DataActionEnum.CREATE:
+        return _plan_create(remote_record)
+    return _plan_update(data_model, remote_record)
+
+
+def _plan_create(remote_record: Any) -> PlannedAction:
+    if remote_record is None:
+        return PlanAction.CREATE, ""
+    return PlanAction.CONFLICT, "Already exists in the target environment"
+
+
+def _plan_update(data_model: Any, remote_record: Any) -> PlannedAction:
+    if remote_record is None:
+        return PlanAction.CONFLICT, "Not found in the target environment"
+
+    if data_model.action == DataActionEnum.UPDATE:
+        return update_action(data_model.to_json(), remote_record), ""
+
+    return PlanAction.UPDATE, str(data_model.action)
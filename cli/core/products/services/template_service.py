@@ -1,4 +1,3 @@
-from cli.core.models import DataCollectionModel
 from cli.core.products.services.related_components_base_service import (
     RelatedComponentsBaseService,
 )
@@ -6,28 +5,3 @@ from cli.core.products.services.related_components_base_service import (
 
 class TemplateService(RelatedComponentsBaseService):
     """Service for managing template-related operations."""
-
-    def set_new_parameter_group(self, param_groups: DataCollectionModel | None) -> None:
-        """
-        Update parameter group references in template content.
-
-        Args:
-            param_groups: A collection of parameter groups to update.
-
-        """
-        if param_groups is None or not param_groups.collection:
-            return
-
-        new_ids = {}
-        for data_model in self.file_manager.read_data():
-            template_content = data_model.template_content
-
-            for item_id, parameter_group in param_groups.collection.items():
-                if item_id not in template_content:
-                    continue
-
-                template_content = template_content.replace(item_id, parameter_group.id)
-                new_ids[data_model.content_coordinate] = template_content
-
-        if new_ids:
-            self.file_manager.write_ids(new_ids)
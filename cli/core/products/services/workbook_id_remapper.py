@@ -0,0 +1,110 @@
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from cli.core.handlers.excel_file_handler import ExcelFileHandler
+from cli.core.models import DataCollectionModel
+from cli.core.products import constants
+from cli.core.services.id_remapper import IdRemapper
+
+
+@dataclass(frozen=True)
+class IdReference:
+    """Column of a sheet referring to the IDs of the rows of another sheet.
+
+    Attributes:
+        sheet_name: The sheet of the column.
+        field: The header of the column.
+        is_embedded: Whether the IDs are embedded in text, e.g. template content, instead
+            of filling the cell.
+
+    """
+
+    sheet_name: str
+    field: str
+    is_embedded: bool = False
+
+
+ITEM_GROUP_REFERENCES = (IdReference(constants.TAB_ITEMS, constants.ITEMS_GROUP_ID),)
+PARAMETER_GROUP_REFERENCES = tuple(
+    IdReference(sheet_name, constants.PARAMETERS_GROUP_ID)
+    for sheet_name in (
+        constants.TAB_AGREEMENT_PARAMETERS,
+        constants.TAB_ASSET_PARAMETERS,
+        constants.TAB_ITEM_PARAMETERS,
+        constants.TAB_REQUEST_PARAMETERS,
+        constants.TAB_SUBSCRIPTION_PARAMETERS,
+    )
+)
+PARAMETER_REFERENCES = (
+    IdReference(constants.TAB_TEMPLATES, constants.TEMPLATES_CONTENT, is_embedded=True),
+)
+
+
+class WorkbookIdRemapper:
+    """Rewrite the IDs created during a product create in every column referring to them.
+
+    Mappings are collected with ``add`` as components are created, and ``apply`` rewrites
+    all of them in one pass over the referring columns: only those cells are read, no
+    data model is decoded, and the workbook is saved once. The rewrite goes through the
+    file handler of the services, so their later writes keep the rewritten IDs.
+    """
+
+    def __init__(self, file_handler: ExcelFileHandler) -> None:
+        self._file_handler = file_handler
+        self._pending: list[tuple[IdReference, IdRemapper]] = []
+
+    def add(
+        self, references: Iterable[IdReference], collection: DataCollectionModel | None
+    ) -> None:
+        """Queue the rewrite of the old IDs of created components in the columns referring to them.
+
+        Args:
+            references: The columns referring to the components.
+            collection: The created components by old ID.
+
+        """
+        id_remapper = IdRemapper.from_collection(collection)
+        if id_remapper:
+            self._pending.extend((reference, id_remapper) for reference in references)
+
+    def apply(self) -> int:
+        """Rewrite every queued reference and save the workbook.
+
+        Returns:
+            The number of rewritten cells.
+
+        """
+        if not self._pending:
+            return 0
+
+        file_handler = self._file_handler
+        sheet_cells: dict[str, dict[str, Any]] = defaultdict(dict)
+        for reference, id_remapper in self._pending:
+            if reference.sheet_name in file_handler.sheet_names:
+                sheet_cells[reference.sheet_name].update(
+                    _remapped_cells(file_handler, reference, id_remapper)
+                )
+        self._pending.clear()
+
+        rewritten = sum(len(cells) for cells in sheet_cells.values())
+        if rewritten:
+            file_handler.write([sheet_cells])
+        return rewritten
+
+
+def _remapped_cells(
+    file_handler: ExcelFileHandler, reference: IdReference, id_remapper: IdRemapper
+) -> Iterator[tuple[str, str]]:
+    cells = file_handler.get_column_from_horizontal_sheet(reference.sheet_name, reference.field)
+    for coordinate, cell_value in cells:
+        if cell_value is None:
+            continue
+        old_value = str(cell_value)
+        if reference.is_embedded:
+            new_value = id_remapper.remap(old_value)
+        else:
+            new_value = id_remapper.id_map.get(old_value, old_value)
+        if new_value != old_value:
+            yield coordinate, new_value
@@ -0,0 +1,124 @@
+import cProfile
+import json
+import os
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from cli.core.mpt.tracing import RequestTrace
+from cli.core.spans import Span, SpanRecorder
+from cli.core.state import state
+
+CHROME_TRACE_SUFFIX = ".trace.json"
+MICROSECONDS_IN_SECOND = 1_000_000
+MICROSECONDS_IN_MILLISECOND = 1000
+
+
+@contextmanager
+def trace_span(name: str, category: str = "service") -> Generator[None]:
+    """Record the enclosed block as a span when profiling is enabled.
+
+    Can be used both as a context manager and as a decorator. When no span recorder is
+    active the block runs untouched.
+
+    Args:
+        name: Span name.
+        category: Span category, e.g. ``service``, ``excel`` or ``flow``.
+
+    """
+    span_recorder = state.span_recorder
+    if span_recorder is None:
+        yield
+        return
+
+    with span_recorder.span(name, category):
+        yield
+
+
+def span_to_chrome_event(span: Span, origin: float) -> dict[str, Any]:
+    """Convert a span into a Chrome trace-event complete (``X``) event.
+
+    Args:
+        span: The span to convert.
+        origin: Wall-clock timestamp used as the trace time origin.
+
+    Returns:
+        The trace event.
+
+    """
+    return {
+        "name": span.name,
+        "cat": span.category,
+        "ph": "X",
+        "ts": round((span.started_at - origin) * MICROSECONDS_IN_SECOND),
+        "dur": round(span.duration_ms * MICROSECONDS_IN_MILLISECOND),
+        "pid": os.getpid(),
+        "tid": span.thread_id,
+    }
+
+
+def request_to_chrome_event(trace: RequestTrace, origin: float) -> dict[str, Any]:
+    """Convert an API request trace into a Chrome trace-event complete (``X``) event.
+
+    Args:
+        trace: The request trace to convert.
+        origin: Wall-clock timestamp used as the trace time origin.
+
+    Returns:
+        The trace event.
+
+    """
+    return {
+        "name": f"{trace.method} {trace.endpoint}",
+        "cat": "api",
+        "ph": "X",
+        "ts": round((trace.started_at - origin) * MICROSECONDS_IN_SECOND),
+        "dur": round(trace.latency_ms * MICROSECONDS_IN_MILLISECOND),
+        "pid": os.getpid(),
+        "tid": "api",
+        "args": {"status": trace.status, "bytes": trace.request_bytes + trace.response_bytes},
+    }
+
+
+class Profiler:
+    """Run cProfile for a CLI command and collect spans for a Chrome trace.
+
+    The cProfile statistics are written to the given path and the Chrome trace-event JSON
+    next to it, with the ``.trace.json`` suffix.
+    """
+
+    def __init__(self, profile_path: Path) -> None:
+        self.profile_path = profile_path
+        self.span_recorder = SpanRecorder()
+        self._started_at = time.time()
+        self._profile = cProfile.Profile()
+
+    @property
+    def chrome_trace_path(self) -> Path:
+        return self.profile_path.with_suffix(CHROME_TRACE_SUFFIX)
+
+    def start(self) -> None:
+        """Start collecting cProfile statistics."""
+        self._started_at = time.time()
+        self._profile.enable()
+
+    def stop(self, request_traces: list[RequestTrace]) -> None:
+        """Stop profiling and write the cProfile dump and the Chrome trace.
+
+        Args:
+            request_traces: API request traces to add to the Chrome trace.
+
+        """
+        self._profile.disable()
+        self.profile_path.parent.mkdir(parents=True, exist_ok=True)
+        self._profile.dump_stats(self.profile_path)
+        trace_events = [
+            span_to_chrome_event(span, self._started_at) for span in self.span_recorder.spans
+        ]
+        trace_events.extend(
+            request_to_chrome_event(trace, self._started_at) for trace in request_traces
+        )
+        with self.chrome_trace_path.open("w", encoding="utf-8") as file_obj:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, file_obj)
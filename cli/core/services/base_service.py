@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from cli.core.services.checkpoint import SyncCheckpoint
+from cli.core.services.remote_state import RemoteState
 from cli.core.services.service_context import ServiceContext
 from cli.core.services.service_result import ServiceResult
 
@@ -24,18 +26,56 @@ class ServiceStatsMixin:
 
     file_manager: Any
     stats: Any
+    _checkpoint: SyncCheckpoint | None
 
     def _set_error(self, error: Exception, resource_id: str | None = None) -> None:
         self.file_manager.write_error(str(error), resource_id)
         self.stats.add_error(self.file_manager.tab_name)
 
-    def _set_synced(self, resource_id: str, item_coordinate: str) -> None:
+    def _set_synced(self, resource_id: str, item_coordinate: str, source_id: Any = None) -> None:
         self.file_manager.write_ids({item_coordinate: resource_id})
         self.stats.add_synced(self.file_manager.tab_name)
+        self._record_checkpoint(resource_id, item_coordinate, source_id)
 
     def _set_skipped(self) -> None:
         self.stats.add_skipped(self.file_manager.tab_name)
 
+    def _set_unchanged(self, resource_id: str, item_coordinate: str) -> None:
+        self.file_manager.write_ids({item_coordinate: resource_id})
+        self.stats.add_unchanged(self.file_manager.tab_name)
+        self._record_checkpoint(resource_id, item_coordinate)
+
+    def _record_checkpoint(
+        self, resource_id: str, item_coordinate: str, source_id: Any = None
+    ) -> None:
+        if self._checkpoint is not None:
+            self._checkpoint.record(
+                self.file_manager.tab_name, item_coordinate, resource_id, source_id
+            )
+
+    def _resume_checkpoint(self) -> dict[str, str]:
+        """Restore the rows of the tab that an interrupted sync completed.
+
+        Their IDs are written back to the file at once and they are counted as synced.
+
+        Returns:
+            The ID of every restored row, which must not be sent again, by its coordinate.
+
+        """
+        if self._checkpoint is None:
+            return {}
+
+        completed_ids = self._checkpoint.completed_ids(self.file_manager.tab_name)
+        if completed_ids:
+            self.file_manager.write_ids(completed_ids)
+            self.stats.add_synced(self.file_manager.tab_name, len(completed_ids))
+        return completed_ids
+
+    def _resumed_source_ids(self) -> dict[str, Any]:
+        if self._checkpoint is None:
+            return {}
+        return self._checkpoint.source_ids(self.file_manager.tab_name)
+
 
 class Service(ExportParamsMixin, ServiceStatsMixin, ABC):
     """Abstract base class for all service operations.
@@ -52,6 +92,9 @@ class Service(ExportParamsMixin, ServiceStatsMixin, ABC):
         self.data_model = service_context.data_model
         self.file_manager = service_context.file_manager
         self.stats = service_context.stats
+        self.remote_state = RemoteState(is_enabled=service_context.skip_unchanged)
+        self._checkpoint = service_context.checkpoint
+        self._request_governor = service_context.request_governor
 
     @abstractmethod
     def create(self) -> ServiceResult:
@@ -0,0 +1,116 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Self
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_SUFFIX = ".checkpoint.jsonl"
+
+
+class SyncCheckpoint:
+    """Journal of the rows a sync has completed, kept next to the definition file.
+
+    Every synced or unchanged row is appended to the journal as soon as it is done, with
+    its tab, its row and its ID, so a sync that dies keeps the last processed row of every
+    tab and the IDs it created so far. Created rows also keep the ID they had in the file
+    before, so the references to it can still be rewritten. A resumed sync restores those
+    rows instead of sending them again.
+
+    Attributes:
+        journal_path: Path of the JSON lines journal.
+
+    """
+
+    def __init__(self, journal_path: Path, *, is_resumed: bool = False) -> None:
+        self.journal_path = journal_path
+        self._completed: dict[str, dict[str, str]] = {}
+        self._source_ids: dict[str, dict[str, Any]] = {}
+        if is_resumed:
+            self._load()
+        else:
+            self.clear()
+
+    @classmethod
+    def for_workbook(cls, file_path: str, *, is_resumed: bool = False) -> Self:
+        """Create the checkpoint of a definition file.
+
+        Args:
+            file_path: Path of the definition file.
+            is_resumed: Whether to load the journal left by an interrupted sync. Otherwise
+                the journal is started over.
+
+        Returns:
+            The checkpoint journaled in ``<file_path>.checkpoint.jsonl``.
+
+        """
+        return cls(Path(f"{file_path}{CHECKPOINT_SUFFIX}"), is_resumed=is_resumed)
+
+    def completed_ids(self, tab_name: str) -> dict[str, str]:
+        """Return the IDs of the rows of a tab completed before the sync was resumed.
+
+        Args:
+            tab_name: The name of the tab.
+
+        Returns:
+            The ID of every completed row, by the coordinate of its ID cell.
+
+        """
+        return dict(self._completed.get(tab_name, {}))
+
+    def source_ids(self, tab_name: str) -> dict[str, Any]:
+        """Return the IDs the rows of a tab had in the file before they were created.
+
+        Args:
+            tab_name: The name of the tab.
+
+        Returns:
+            The previous ID of every completed row created by the sync, by the coordinate
+            of its ID cell.
+
+        """
+        return dict(self._source_ids.get(tab_name, {}))
+
+    def record(
+        self, tab_name: str, coordinate: str, resource_id: str, source_id: Any = None
+    ) -> None:
+        """Append a completed row to the journal and flush it to disk.
+
+        Args:
+            tab_name: The name of the tab of the row.
+            coordinate: The coordinate of the ID cell of the row.
+            resource_id: The ID of the row.
+            source_id: The ID the row had in the file before it was created, if any.
+
+        """
+        completed_row = {"tab": tab_name, "row": coordinate, "id": resource_id}
+        if source_id is not None:
+            completed_row["sourceId"] = source_id
+        journal_line = json.dumps(completed_row)
+        with self.journal_path.open("a", encoding="utf-8") as journal:
+            journal.write(f"{journal_line}\n")
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def clear(self) -> None:
+        """Remove the journal, e.g. once the sync has completed."""
+        self.journal_path.unlink(missing_ok=True)
+
+    def _load(self) -> None:
+        if not self.journal_path.exists():
+            logger.warning("No sync checkpoint found at %s", self.journal_path)
+            return
+
+        with self.journal_path.open(encoding="utf-8") as journal:
+            for journal_line in journal:
+                try:
+                    completed_row = json.loads(journal_line)
+                except json.JSONDecodeError:
+                    # The last line is cut short if the sync died while writing it.
+                    continue
+                tab_name = completed_row["tab"]
+                self._completed.setdefault(tab_name, {})[completed_row["row"]] = completed_row["id"]
+                source_id = completed_row.get("sourceId")
+                if source_id is not None:
+                    self._source_ids.setdefault(tab_name, {})[completed_row["row"]] = source_id
@@ -0,0 +1,49 @@
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from cli.core.errors import MPTAPIError
+from cli.core.mpt.governor import RequestGovernor
+
+logger = logging.getLogger(__name__)
+
+type CreatedResource = dict[str, Any]
+
+
+def post_with_retries(
+    post: Callable[[], CreatedResource],
+    find_created: Callable[[], CreatedResource | None],
+    governor: RequestGovernor | None,
+    description: str,
+) -> CreatedResource:
+    """Create a resource, retrying the server and connection errors.
+
+    A failed create may have reached the API, so before every retry the resource is
+    looked up and returned if the failed create made it.
+
+    Args:
+        post: Sends the create request and returns the created resource.
+        find_created: Looks up the resource, returning None if it was not created.
+        governor: Paces the retries and limits their number, the create is sent once
+            if None.
+        description: What is created, for the retry warnings.
+
+    Returns:
+        The created resource.
+
+    """
+    if governor is None:
+        return post()
+
+    for attempt in range(governor.settings.max_retries):
+        try:
+            return post()
+        except MPTAPIError as error:
+            if not error.is_transient:
+                raise
+            logger.warning("Retrying the create of %s after: %s", description, error)
+        governor.wait_before_retry(attempt, None)
+        created_resource = find_created()
+        if created_resource is not None:
+            return created_resource
+    return post()
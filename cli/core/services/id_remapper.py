@@ -0,0 +1,95 @@
+import re
+from collections.abc import Mapping
+from typing import Any, Self
+
+from cli.core.models import DataCollectionModel
+
+# Trie node key marking that an old ID ends at the node.
+_END = ""
+
+type TrieNode = dict[str, "TrieNode"]
+
+
+class IdRemapper:
+    """Rewrite old IDs to new IDs in text with a single scan.
+
+    The old IDs are compiled once into one regular expression whose alternation is
+    shaped as a trie of their characters, so matching at a position costs the length
+    of the longest old ID instead of the number of old IDs. The longest old ID wins
+    when several match at the same position, and replaced text is never scanned again,
+    so a new ID that equals another old ID is not rewritten twice.
+
+    Attributes:
+        id_map: The new ID of every old ID.
+
+    """
+
+    def __init__(self, id_map: Mapping[str, str]) -> None:
+        changed_ids = {old_id: new_id for old_id, new_id in id_map.items() if old_id != new_id}
+        self.id_map = changed_ids
+        self._pattern = None
+        if changed_ids:
+            self._pattern = re.compile(_trie_pattern(_build_trie(self.id_map)))
+
+    def __bool__(self) -> bool:
+        return bool(self.id_map)
+
+    @classmethod
+    def from_collection(cls, collection: DataCollectionModel[Any] | None) -> Self:
+        """Create a remapper from the models created for the old IDs of a sheet.
+
+        Args:
+            collection: The created models by old ID. Old IDs without a model are ignored.
+
+        Returns:
+            The remapper from every old ID to the ID of its created model.
+
+        """
+        if collection is None:
+            return cls({})
+        return cls({
+            str(old_id): data_model.id
+            for old_id, data_model in collection.collection.items()
+            if data_model is not None
+        })
+
+    def remap(self, text: str) -> str:
+        """Replace every old ID in a text.
+
+        Args:
+            text: The text to rewrite.
+
+        Returns:
+            The text with every old ID replaced by its new ID.
+
+        """
+        if self._pattern is None:
+            return text
+        return self._pattern.sub(self._replacement, text)
+
+    def _replacement(self, match: re.Match[str]) -> str:
+        return self.id_map[match[0]]
+
+
+def _build_trie(words: Mapping[str, Any]) -> TrieNode:
+    trie: TrieNode = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[_END] = {}
+    return trie
+
+
+def _trie_pattern(node: TrieNode) -> str:
+    branches = []
+    for char, child in node.items():
+        if char != _END:
+            branches.append(re.escape(char) + _trie_pattern(child))
+    if not branches:
+        return ""
+    pattern = "|".join(branches)
+    if len(branches) > 1:
+        pattern = f"(?:{pattern})"
+    # Greedy optional groups prefer the longer IDs sharing the prefix of a shorter one.
+    return f"(?:{pattern})?" if _END in node else pattern
@@ -0,0 +1,111 @@
+import logging
+from typing import Any
+
+from cli.core.errors import MPTAPIError
+from cli.core.nested_dicts import StringKeyedDict, get_dict_value, is_subset
+
+logger = logging.getLogger(__name__)
+
+
+class RemoteState:
+    """Remote resources prefetched before an update.
+
+    Services compare the update payload of every row with the prefetched resource, do
+    not send the updates that would not change anything and send only the changed
+    values of the others.
+
+    Attributes:
+        is_enabled: Whether the update should compare rows with the remote state at all.
+
+    """
+
+    def __init__(self, *, is_enabled: bool = False) -> None:
+        self.is_enabled = is_enabled
+        self._records: dict[str, StringKeyedDict] = {}
+
+    def prefetch(self, api: Any, query_params: StringKeyedDict, key_path: str = "id") -> None:
+        """Fetch the remote resources if the comparison is enabled.
+
+        A failed prefetch is logged, and the rows whose resource was not prefetched are
+        updated as usual.
+
+        Args:
+            api: The API service to list the resources with.
+            query_params: The list query, including its ``offset`` and ``limit``.
+            key_path: Dot-separated path of the resource value rows are matched by.
+
+        """
+        if not self.is_enabled:
+            return
+
+        try:
+            self.fetch(api, query_params, key_path)
+        except MPTAPIError as error:
+            logger.warning("Unable to prefetch the remote state: %s", error)
+
+    def fetch(self, api: Any, query_params: StringKeyedDict, key_path: str = "id") -> None:
+        """List every remote resource page by page and index it by a key.
+
+        Args:
+            api: The API service to list the resources with.
+            query_params: The list query, including its ``offset`` and ``limit``.
+            key_path: Dot-separated path of the resource value rows are matched by.
+
+        Raises:
+            MPTAPIError: If a page cannot be listed. The pages listed before are kept.
+
+        """
+        page_query = dict(query_params)
+        while True:
+            response = api.list(query_params=page_query)
+            for remote_record in response["data"]:
+                self._records[get_dict_value(remote_record, key_path)] = remote_record
+
+            meta = response["meta"]
+            if meta["offset"] + meta["limit"] >= meta["total"]:
+                return
+            page_query["offset"] += page_query["limit"]
+
+    def find(self, row_key: str | None) -> StringKeyedDict | None:
+        """Return the prefetched resource of a row, or None if it was not prefetched."""
+        return self._records.get(row_key) if row_key else None
+
+    def find_unchanged(
+        self, row_key: str | None, payload: StringKeyedDict
+    ) -> StringKeyedDict | None:
+        """Return the prefetched resource of a row if it already holds the whole payload.
+
+        Args:
+            row_key: The key of the row.
+            payload: The payload the row would be updated with.
+
+        Returns:
+            The remote resource, or None if it was not prefetched or differs from the payload.
+
+        """
+        remote_record = self.find(row_key)
+        if remote_record is None or not is_subset(payload, remote_record):
+            return None
+        return remote_record
+
+    def find_changes(self, row_key: str | None, payload: StringKeyedDict) -> StringKeyedDict:
+        """Return the values of an update payload the prefetched resource does not hold.
+
+        A nested value that differs is returned whole, so the result stays a valid payload.
+
+        Args:
+            row_key: The key of the row.
+            payload: The payload the row would be updated with.
+
+        Returns:
+            The changed values, or the whole payload if the resource was not prefetched.
+
+        """
+        remote_record = self.find(row_key)
+        if remote_record is None:
+            return payload
+        return {
+            key: payload_value
+            for key, payload_value in payload.items()
+            if not is_subset(payload_value, remote_record.get(key))
+        }
@@ -1,15 +1,30 @@
 from dataclasses import dataclass
 
 from cli.core.accounts.models import Account
+from cli.core.mpt.governor import RequestGovernor
+from cli.core.services.checkpoint import SyncCheckpoint
 from cli.core.stats import StatsCollector
 
 
 @dataclass(frozen=True)
 class ServiceContext[APIService, DataModel, ExcelFileManager]:
-    """Context object that holds dependencies for service operations."""
+    """Context object that holds dependencies for service operations.
+
+    Attributes:
+        skip_unchanged: Compare update payloads with the prefetched remote state and do
+            not send the updates that would not change anything.
+        checkpoint: Journal of the completed rows, which a resumed sync does not send
+            again.
+        request_governor: Paces the retries of the creates that failed with a server or
+            connection error, which are not retried if None.
+
+    """
 
     account: Account
     api: APIService
     data_model: type[DataModel]
     file_manager: ExcelFileManager
     stats: StatsCollector
+    skip_unchanged: bool = False
+    checkpoint: SyncCheckpoint | None = None
+    request_governor: RequestGovernor | None = None
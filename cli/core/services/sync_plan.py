@@ -0,0 +1,101 @@
+import json
+from collections import Counter
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from pathlib import Path
+
+from cli.core.nested_dicts import StringKeyedDict, is_subset
+
+
+class PlanAction(StrEnum):
+    """What a sync would do with a row of a definition file."""
+
+    CREATE = "create"
+    UPDATE = "update"
+    UNCHANGED = "unchanged"
+    SKIP = "skip"
+    CONFLICT = "conflict"
+
+
+type PlanSummary = dict[tuple[str, str], Counter[PlanAction]]
+
+
+@dataclass(frozen=True)
+class PlanEntry:
+    """A row of a definition file and what a sync would do with it.
+
+    Attributes:
+        source: Path of the definition file.
+        tab: Name of the tab the row belongs to.
+        coordinate: Cell of the row ID, None for rows without one.
+        row_id: ID of the row in the file.
+        action: What a sync would do with the row.
+        remote_id: ID of the remote resource the row was matched to.
+        detail: Why a row conflicts, or the action sent for an update.
+
+    """
+
+    source: str
+    tab: str
+    coordinate: str | None
+    row_id: str | None
+    action: PlanAction
+    remote_id: str | None = None
+    detail: str = ""
+
+
+def update_action(payload: StringKeyedDict, remote_record: StringKeyedDict | None) -> PlanAction:
+    """Return what updating a remote resource with a payload would do.
+
+    Args:
+        payload: The payload the row would be updated with.
+        remote_record: The remote resource the row was matched to, None if none matched.
+
+    Returns:
+        A conflict when no resource matched, otherwise an update or a no-op.
+
+    """
+    if remote_record is None:
+        return PlanAction.CONFLICT
+    if is_subset(payload, remote_record):
+        return PlanAction.UNCHANGED
+    return PlanAction.UPDATE
+
+
+class SyncPlan:
+    """The creates, updates, no-ops and conflicts a sync would do, in sync order."""
+
+    def __init__(self) -> None:
+        self.entries: list[PlanEntry] = []
+
+    @property
+    def has_conflicts(self) -> bool:
+        return any(plan_entry.action == PlanAction.CONFLICT for plan_entry in self.entries)
+
+    def add(self, plan_entry: PlanEntry) -> None:
+        """Append a planned row.
+
+        Args:
+            plan_entry: The row and what a sync would do with it.
+
+        """
+        self.entries.append(plan_entry)
+
+    def summary(self) -> PlanSummary:
+        """Count the planned actions by definition file and tab, in sync order."""
+        counts: PlanSummary = {}
+        for plan_entry in self.entries:
+            tab_counts = counts.setdefault((plan_entry.source, plan_entry.tab), Counter())
+            tab_counts[plan_entry.action] += 1
+        return counts
+
+    def write_json(self, plan_path: Path) -> None:
+        """Write every planned row to a JSON file.
+
+        Args:
+            plan_path: The JSON file to write.
+
+        """
+        plan_path.parent.mkdir(parents=True, exist_ok=True)
+        serialized = json.dumps([asdict(plan_entry) for plan_entry in self.entries], indent=2)
+        plan_path.write_text(f"{serialized}\n", encoding="utf-8")
@@ -0,0 +1,71 @@
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Span:
+    """A named, timed section of a CLI command.
+
+    Attributes:
+        name: Human readable span name, e.g. ``ItemService.update``.
+        category: Span category used to group spans in trace viewers.
+        started_at: Wall-clock timestamp when the span started.
+        duration_ms: Span duration measured with a monotonic clock.
+        thread_id: Identifier of the thread that ran the span.
+
+    """
+
+    name: str
+    category: str
+    started_at: float
+    duration_ms: float
+    thread_id: int
+
+
+class SpanRecorder:
+    """Collect spans emitted by instrumented code paths."""
+
+    def __init__(self) -> None:
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    @property
+    def spans(self) -> list[Span]:
+        return list(self._spans)
+
+    def record(self, span: Span) -> None:
+        """Store a finished span.
+
+        Args:
+            span: The span to store.
+
+        """
+        with self._lock:
+            self._spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, category: str) -> Generator[None]:
+        """Time the enclosed block and record it as a span, even if it raises.
+
+        Args:
+            name: Span name.
+            category: Span category.
+
+        """
+        started_at = time.time()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(
+                Span(
+                    name=name,
+                    category=category,
+                    started_at=started_at,
+                    duration_ms=(time.perf_counter() - started) * 1000,
+                    thread_id=threading.get_ident(),
+                )
+            )
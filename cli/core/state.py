@@ -1,8 +1,26 @@
-class State:
+from typing import TYPE_CHECKING
+
+from cli.core.mpt.cassette import CassettePlayer, CassetteRecorder
+from cli.core.mpt.governor import RequestGovernor
+from cli.core.mpt.response_cache import ResponseCache
+from cli.core.mpt.tracing import RequestTracer
+from cli.core.spans import SpanRecorder
+
+if TYPE_CHECKING:
+    from cli.core.memory import MemoryTracker
+
+
+class State:  # noqa: WPS230
     """Global state for the CLI."""
 
     def __init__(self):
         self.verbose = False
+        self.request_tracer: RequestTracer | None = None
+        self.span_recorder: SpanRecorder | None = None
+        self.memory_tracker: MemoryTracker | None = None
+        self.cassette: CassetteRecorder | CassettePlayer | None = None
+        self.request_governor = RequestGovernor()
+        self.response_cache: ResponseCache | None = None
 
 
 state = State()
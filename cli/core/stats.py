@@ -12,6 +12,7 @@ class TabResults(TypedDict):
         error: The number of items that encountered errors.
         total: The total number of processed items.
         skipped: The number of items that were skipped.
+        unchanged: The number of items whose remote state already matched the file.
 
     """
 
@@ -19,6 +20,7 @@ class TabResults(TypedDict):
     error: int
     total: int
     skipped: int
+    unchanged: int
 
 
 def default_results() -> TabResults:
@@ -28,6 +30,7 @@ def default_results() -> TabResults:
         "error": 0,
         "total": 0,
         "skipped": 0,
+        "unchanged": 0,
     }
 
 
@@ -45,15 +45,16 @@ class StatsMutationMixin:
         self._tab_aliases[tab_name]["total"] += 1
         self._has_error = True
 
-    def add_synced(self, tab_name: str) -> None:
+    def add_synced(self, tab_name: str, count: int = 1) -> None:
         """Increment synced and total counters for a tab.
 
         Args:
             tab_name: The name of the tab to update.
+            count: The number of synced items.
 
         """
-        self._tab_aliases[tab_name]["synced"] += 1
-        self._tab_aliases[tab_name]["total"] += 1
+        self._tab_aliases[tab_name]["synced"] += count
+        self._tab_aliases[tab_name]["total"] += count
 
     def add_skipped(self, tab_name: str) -> None:
         """Increment skipped and total counters for a tab.
@@ -64,3 +65,14 @@ class StatsMutationMixin:
         """
         self._tab_aliases[tab_name]["skipped"] += 1
         self._tab_aliases[tab_name]["total"] += 1
+
+    def add_unchanged(self, tab_name: str) -> None:
+        """Increment unchanged and total counters for a tab.
+
+        Args:
+            tab_name: The name of the tab to update.
+
+        """
+        tab_results = self._tab_aliases[tab_name]
+        tab_results["unchanged"] += 1
+        tab_results["total"] += 1
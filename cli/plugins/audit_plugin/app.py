@@ -6,11 +6,8 @@ from cli.core.console import console
 from cli.core.console.renderers.audit import AuditDiffRenderer
 from cli.core.mpt.mpt_client import create_api_mpt_client_from_account
 from cli.plugins.audit_plugin.api import get_audit_records_by_object, get_audit_trail
-from cli.plugins.audit_plugin.audit_records import (
-    display_audit_records,
-    flatten_dict,
-    format_json_path,
-)
+from cli.plugins.audit_plugin.audit_diff import AuditTreeDiff
+from cli.plugins.audit_plugin.audit_records import display_audit_records
 
 app = typer.Typer(name="audit", help="Audit commands.")
 
@@ -73,16 +70,13 @@ class AuditTrailComparator:
     def _get_differences(
         self, source_trail: dict[str, Any], target_trail: dict[str, Any]
     ) -> list[tuple[str, str, str]]:
-        source_flat = flatten_dict(source_trail)
-        target_flat = flatten_dict(target_trail)
         return [
             (
-                format_json_path(key, source_trail, target_trail),
-                self._format_value(source_flat.get(key)),
-                self._format_value(target_flat.get(key)),
+                change.path,
+                self._format_value(change.source_value),
+                self._format_value(change.target_value),
             )
-            for key in sorted(set(source_flat.keys()) | set(target_flat.keys()))
-            if source_flat.get(key) != target_flat.get(key)
+            for change in AuditTreeDiff.compare(source_trail, target_trail)
         ]
 
     def _format_value(self, audit_value: Any) -> str:
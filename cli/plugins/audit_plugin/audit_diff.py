@@ -0,0 +1,233 @@
+import json
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from itertools import chain
+from typing import Any
+
+type AuditTrail = dict[str, Any]
+type AlignmentToken = tuple[str, str]
+type IndexPair = tuple[int | None, int | None]
+
+# Keys identifying the elements of a list across versions, by priority.
+IDENTITY_KEYS = ("id", "externalId")
+# Alignment token kind of the elements without identity, compared by value.
+UNIDENTIFIED = "value"
+
+
+@dataclass(frozen=True)
+class AuditChange:
+    """Value that differs between two audit trails.
+
+    Attributes:
+        path: The JSON path of the value, e.g. ``object.parameters[3].name``, followed by
+            the external ID of the outermost list element it belongs to, if any.
+        source_value: The value in the source trail, None if it is missing.
+        target_value: The value in the target trail, None if it is missing.
+
+    """
+
+    path: str
+    source_value: Any
+    target_value: Any
+
+
+class AuditTreeDiff:
+    """Structural diff of two audit trails.
+
+    Both trails are walked once, together, and equal subtrees are skipped with a single
+    comparison. List elements are aligned by their ``id`` or ``externalId`` instead of their
+    index, so an element inserted into a list only yields the changes of that element
+    rather than shifting every element after it.
+    """
+
+    def __init__(self) -> None:
+        self._changes: list[AuditChange] = []
+
+    @classmethod
+    def compare(cls, source_trail: AuditTrail, target_trail: AuditTrail) -> list[AuditChange]:
+        """Find the values that differ between two audit trails.
+
+        Missing values and null values are equal, and added or removed subtrees are
+        reported value by value.
+
+        Args:
+            source_trail: The source audit trail.
+            target_trail: The target audit trail.
+
+        Returns:
+            The changes, in the order of the target trail.
+
+        """
+        tree_diff = cls()
+        tree_diff._diff_nodes("", source_trail, target_trail, None)
+        return tree_diff._changes
+
+    def _diff_nodes(
+        self, path: str, source_node: Any, target_node: Any, external_id: str | None
+    ) -> None:
+        if source_node == target_node:
+            return
+
+        if isinstance(source_node, dict) and isinstance(target_node, dict):
+            self._diff_dicts(path, source_node, target_node, external_id)
+        elif isinstance(source_node, list) and isinstance(target_node, list):
+            self._diff_lists(path, source_node, target_node, external_id)
+        else:
+            self._diff_leaves(path, source_node, target_node, external_id)
+
+    def _diff_dicts(
+        self,
+        path: str,
+        source_node: dict[str, Any],
+        target_node: dict[str, Any],
+        external_id: str | None,
+    ) -> None:
+        for key in sorted(source_node.keys() | target_node.keys()):
+            self._diff_nodes(
+                _child_path(path, key), source_node.get(key), target_node.get(key), external_id
+            )
+
+    def _diff_lists(
+        self,
+        path: str,
+        source_node: list[Any],
+        target_node: list[Any],
+        external_id: str | None,
+    ) -> None:
+        for source_index, target_index in ListAligner(source_node, target_node).align():
+            source_element = None if source_index is None else source_node[source_index]
+            target_element = None if target_index is None else target_node[target_index]
+            element_index = source_index if target_index is None else target_index
+            self._diff_nodes(
+                f"{path}[{element_index}]",
+                source_element,
+                target_element,
+                external_id or self._external_id(source_element, target_element),
+            )
+
+    def _diff_leaves(
+        self, path: str, source_node: Any, target_node: Any, external_id: str | None
+    ) -> None:
+        source_leaves = dict(_leaves(path, source_node))
+        target_leaves = dict(_leaves(path, target_node))
+        path_suffix = "" if external_id is None else f" (externalId: {external_id})"
+        for leaf_path in dict.fromkeys([*target_leaves, *source_leaves]):
+            leaf_values = (source_leaves.get(leaf_path), target_leaves.get(leaf_path))
+            if leaf_values[0] != leaf_values[1]:
+                self._changes.append(AuditChange(f"{leaf_path}{path_suffix}", *leaf_values))
+
+    def _external_id(self, *elements: Any) -> str | None:
+        for element in elements:
+            if isinstance(element, dict) and element.get("externalId") is not None:
+                return element["externalId"]
+        return None
+
+
+class ListAligner:
+    """Pair the elements of two versions of a list.
+
+    Elements with an ``id`` or ``externalId`` are paired with the element with the same
+    identity, wherever it moved. The other elements are aligned on the longest blocks of
+    equal elements found by difflib, and the unequal ones left over are paired in order.
+    """
+
+    def __init__(self, source_list: list[Any], target_list: list[Any]) -> None:
+        self._source_tokens = [_alignment_token(element) for element in source_list]
+        self._target_tokens = [_alignment_token(element) for element in target_list]
+        self._pairs: list[IndexPair] = []
+
+    def align(self) -> list[IndexPair]:
+        """Pair the source and target indexes of the elements.
+
+        Returns:
+            The pairs of source and target indexes in target order, with None for the side
+            an element was added to or removed from.
+
+        """
+        self._pair_equal_blocks()
+        removed, added = self._pair_moved(*self._unpaired())
+        self._pair_changed(removed, added)
+        return sorted(self._pairs, key=self._position)
+
+    def _pair_equal_blocks(self) -> None:
+        matcher = SequenceMatcher(None, self._source_tokens, self._target_tokens, autojunk=False)
+        for block in matcher.get_matching_blocks():
+            self._pairs.extend(
+                zip(
+                    range(block.a, block.a + block.size),
+                    range(block.b, block.b + block.size),
+                    strict=True,
+                )
+            )
+
+    def _unpaired(self) -> tuple[list[int], list[int]]:
+        paired_sources = {index_pair[0] for index_pair in self._pairs}
+        paired_targets = {index_pair[1] for index_pair in self._pairs}
+        return (
+            [index for index in range(len(self._source_tokens)) if index not in paired_sources],
+            [index for index in range(len(self._target_tokens)) if index not in paired_targets],
+        )
+
+    def _pair_moved(
+        self,
+        removed: list[int],
+        added: list[int],
+    ) -> tuple[list[int], list[int]]:
+        removed_by_token: dict[AlignmentToken, deque[int]] = defaultdict(deque)
+        for source_index in removed:
+            removed_by_token[self._source_tokens[source_index]].append(source_index)
+        unpaired_added = []
+        for target_index in added:
+            same_token = removed_by_token.get(self._target_tokens[target_index])
+            if same_token:
+                self._pairs.append((same_token.popleft(), target_index))
+            else:
+                unpaired_added.append(target_index)
+        return sorted(chain.from_iterable(removed_by_token.values())), unpaired_added
+
+    def _pair_changed(self, removed: list[int], added: list[int]) -> None:
+        changed_sources = deque(
+            index for index in removed if self._source_tokens[index][0] == UNIDENTIFIED
+        )
+        for target_index in added:
+            source_index = None
+            if changed_sources and self._target_tokens[target_index][0] == UNIDENTIFIED:
+                source_index = changed_sources.popleft()
+            self._pairs.append((source_index, target_index))
+        self._pairs.extend(
+            (source_index, None)
+            for source_index in removed
+            if self._source_tokens[source_index][0] != UNIDENTIFIED
+            or source_index in changed_sources
+        )
+
+    def _position(self, index_pair: IndexPair) -> tuple[int, int]:
+        source_index, target_index = index_pair
+        if target_index is None:
+            return source_index or 0, 1
+        return target_index, 0
+
+
+def _alignment_token(element: Any) -> AlignmentToken:
+    if isinstance(element, dict):
+        for identity_key in IDENTITY_KEYS:
+            if element.get(identity_key) is not None:
+                return identity_key, str(element[identity_key])
+    return UNIDENTIFIED, json.dumps(element, sort_keys=True, default=str)
+
+
+def _leaves(path: str, node: Any) -> Iterator[tuple[str, Any]]:
+    if isinstance(node, dict):
+        for key, child_node in node.items():
+            yield from _leaves(_child_path(path, key), child_node)
+    elif isinstance(node, list):
+        for index, child_node in enumerate(node):
+            yield from _leaves(f"{path}[{index}]", child_node)
+    else:
+        yield path, node
+
+
+def _child_path(path: str, key: str) -> str:
+    return f"{path}.{key}" if path else key
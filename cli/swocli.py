@@ -7,6 +7,11 @@ import typer
 from cli.core.accounts import app as accounts_app
 from cli.core.alias_group import AliasTyperGroup
 from cli.core.console import console, show_banner
+from cli.core.diagnostics import DiagnosticsOptions, DiagnosticsSession
+from cli.core.memory import MemoryBudgetAction
+from cli.core.mpt.cassette import ReplayLatency
+from cli.core.mpt.governor import DEFAULT_MAX_RETRIES, GovernorSettings, RequestGovernor
+from cli.core.mpt.response_cache import DEFAULT_CACHE_TTL, ResponseCache
 from cli.core.plugins import load_plugins
 from cli.core.price_lists import app as price_lists_app
 from cli.core.products import app as products_app
@@ -44,8 +49,32 @@ def version_callback(show_version: bool) -> None:  # noqa: FBT001
         raise typer.Exit
 
 
+def configure_api_requests(
+    max_request_rate: float | None, max_retries: int, cache_ttl: int | None, *, is_cached: bool
+) -> None:
+    """Configure the request governor and the response cache of the API clients.
+
+    Args:
+        max_request_rate: Maximum API requests per second, not limited if None.
+        max_retries: Retries of a throttled or failed API request, 0 to not retry.
+        cache_ttl: Seconds a cached response without validators is reused, enables the
+            cache if set.
+        is_cached: Whether to cache the API GET responses.
+
+    """
+    state.request_governor = RequestGovernor(
+        GovernorSettings(max_rate=max_request_rate, max_retries=max_retries)
+    )
+    state.response_cache = None
+    if is_cached or cache_ttl is not None:
+        state.response_cache = ResponseCache(
+            ttl=DEFAULT_CACHE_TTL if cache_ttl is None else cache_ttl
+        )
+
+
 @app.callback()
-def main(
+def main(  # noqa: WPS211
+    ctx: typer.Context,
     version: Annotated[
         bool | None,
         typer.Option("--version", callback=version_callback, is_eager=True),
@@ -66,19 +95,147 @@ def main(
             dir_okay=False,
         ),
     ] = None,
+    trace: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--trace",
+            help="Print API request latency percentiles per endpoint when the command ends",
+        ),
+    ] = False,
+    trace_file: Annotated[
+        Path | None,
+        typer.Option(
+            "--trace-file",
+            help="File path for raw API request traces in JSON Lines format (implies --trace)",
+            dir_okay=False,
+        ),
+    ] = None,
+    profile: Annotated[
+        Path | None,
+        typer.Option(
+            "--profile",
+            help=(
+                "File path for cProfile statistics of the command. A Chrome trace of the "
+                "service spans is written next to it with the .trace.json suffix"
+            ),
+            dir_okay=False,
+        ),
+    ] = None,
+    track_memory: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--track-memory",
+            help="Print peak and retained memory per sync phase when the command ends",
+        ),
+    ] = False,
+    memory_budget: Annotated[
+        int | None,
+        typer.Option(
+            "--memory-budget",
+            help="Soft memory budget in MB checked after every phase (implies --track-memory)",
+            min=1,
+        ),
+    ] = None,
+    memory_budget_action: Annotated[
+        MemoryBudgetAction,
+        typer.Option(
+            "--memory-budget-action",
+            help="Warn or abort the command when the memory budget is exceeded",
+        ),
+    ] = MemoryBudgetAction.WARN,
+    record: Annotated[
+        Path | None,
+        typer.Option(
+            "--record",
+            help=(
+                "File path for a cassette of every API request and response of the command. "
+                "Request headers and bodies are not recorded, and secrets in responses are "
+                "redacted"
+            ),
+            dir_okay=False,
+        ),
+    ] = None,
+    replay: Annotated[
+        Path | None,
+        typer.Option(
+            "--replay",
+            help="Answer API requests from a cassette recorded with --record instead of the API",
+            exists=True,
+            dir_okay=False,
+        ),
+    ] = None,
+    replay_latency: Annotated[
+        ReplayLatency,
+        typer.Option(
+            "--replay-latency",
+            help="Replay responses with their recorded latency or instantly",
+        ),
+    ] = ReplayLatency.ORIGINAL,
+    max_request_rate: Annotated[
+        float | None,
+        typer.Option(
+            "--max-request-rate",
+            help="Maximum API requests per second, sent in bursts of up to 10 requests",
+            min=0.1,
+        ),
+    ] = None,
+    max_retries: Annotated[
+        int,
+        typer.Option(
+            "--max-retries",
+            help="Retries of a throttled or failed API request, 0 to send every request once",
+            min=0,
+        ),
+    ] = DEFAULT_MAX_RETRIES,
+    cache: Annotated[  # noqa: FBT002
+        bool,
+        typer.Option(
+            "--cache",
+            help="Cache API GET responses in ~/.swocli/cache and revalidate them with "
+            "conditional requests",
+        ),
+    ] = False,
+    cache_ttl: Annotated[
+        int | None,
+        typer.Option(
+            "--cache-ttl",
+            help=f"Seconds a cached response without ETag or Last-Modified is reused, "
+            f"{DEFAULT_CACHE_TTL} by default (implies --cache)",
+            min=0,
+        ),
+    ] = None,
 ) -> None:
     """Main callback for the CLI application.
 
     Args:
+        ctx: The Typer context of the invoked command.
         version: If True, displays the CLI version and exits.
         verbose: Enables verbose mode with console output.
         log_file: File path for debug logs, disables console output if set.
+        trace: Enables API request tracing with a latency summary at the end.
+        trace_file: File path for the raw API request traces, enables tracing if set.
+        profile: File path for the cProfile statistics, enables profiling if set.
+        track_memory: Enables memory tracking with a per-phase report at the end.
+        memory_budget: Soft memory budget in MB, enables memory tracking if set.
+        memory_budget_action: Whether to warn or abort when the memory budget is exceeded.
+        record: File path for a cassette of the API exchanges, enables recording if set.
+        replay: File path of a cassette to replay the API exchanges from.
+        replay_latency: Whether replayed responses take their recorded latency or none.
+        max_request_rate: Maximum API requests per second, not limited if not set.
+        max_retries: Retries of a throttled or failed API request.
+        cache: Enables the on-disk cache of the API GET responses.
+        cache_ttl: Seconds a cached response without validators is reused, enables the
+            cache if set.
 
     """
     if verbose and log_file:
         console.print("[red]Error: Cannot use both --verbose and --log-file together[/]")
         raise typer.Exit(1)
 
+    if record and replay:
+        console.print("[red]Error: Cannot use both --record and --replay together[/]")
+        raise typer.Exit(1)
+
     if verbose or log_file:
         if log_file:
             # Create parent directories if they don't exist
@@ -96,6 +253,21 @@ def main(
             handlers=[log_handler],
         )
         state.verbose = True
+
+    configure_api_requests(max_request_rate, max_retries, cache_ttl, is_cached=cache)
+    DiagnosticsSession(ctx).start(
+        DiagnosticsOptions(
+            trace=trace,
+            trace_file=trace_file,
+            profile=profile,
+            track_memory=track_memory,
+            memory_budget=memory_budget,
+            memory_budget_action=memory_budget_action,
+            record=record,
+            replay=replay,
+            replay_latency=replay_latency,
+        )
+    )
     show_banner()
 
 
@@ -1 +1,5 @@
 ## Add repo-specific targets here. Do not modify the shared *.mk files.
+
+bench:  ## Run the end-to-end benchmarks (update=1 rewrites the baselines)
+	$(RUN) bash -c "BENCH_UPDATE_BASELINES=$(update) pytest -m 'benchmark and not large_benchmark' -p no:randomly --no-cov tests/benchmarks"
+	$(RUN) bash -c "BENCH_UPDATE_BASELINES=$(update) pytest -m large_benchmark -p no:randomly --no-cov tests/benchmarks"
@@ -0,0 +1,104 @@
+import json
+import os
+from contextlib import contextmanager
+from functools import partial
+
+import pytest
+from cli.core.accounts.handlers import JsonFileHandler
+from cli.core.accounts.models import Account
+
+from tests.benchmarks.metrics import (
+    BenchmarkResult,
+    find_regressions,
+    is_updating_baselines,
+    measure,
+    scaling_exponents,
+    update_baseline,
+)
+from tests.workloads import FakeMPTServer, FaultInjection
+from tests.workloads.records import OPERATIONS_ACCOUNT, OPERATIONS_API_TOKEN_ID
+
+LATENCY_ENV = "BENCH_LATENCY"
+SUMMARY_ROW = "{:<48}{:>8}{:>10}{:>10}{:>14}{:>10}"
+SCALING_ROW = "{:<48}{:>8}{:>10}"
+BENCHMARK_RESULTS = pytest.StashKey[list[BenchmarkResult]]()
+
+
+@pytest.fixture
+def fake_marketplace():
+    faults = FaultInjection(latency=float(os.getenv(LATENCY_ENV, "0")))
+    with FakeMPTServer(faults=faults) as server:
+        yield server
+
+
+@pytest.fixture
+def operations_account(fake_marketplace, tmp_path, mocker):
+    account = Account(
+        id=OPERATIONS_ACCOUNT["id"],
+        name=OPERATIONS_ACCOUNT["name"],
+        type=OPERATIONS_ACCOUNT["type"],
+        token=f"idt:{OPERATIONS_API_TOKEN_ID}:synthetic",
+        token_id=OPERATIONS_API_TOKEN_ID,
+        environment=fake_marketplace.base_url,
+        is_active=True,
+    )
+    accounts_path = tmp_path / "accounts.json"
+    accounts_path.write_text(json.dumps([account.model_dump()]), "utf-8")
+    mocker.patch.object(JsonFileHandler, "_default_file_path", accounts_path)
+    mocker.patch("typer.confirm", return_value=True)
+    return account
+
+
+@pytest.fixture
+def run_benchmark(request, fake_marketplace):
+    return partial(_run_benchmark, request.node, fake_marketplace)
+
+
+@pytest.fixture
+def run_micro_benchmark(request):
+    return partial(_run_benchmark, request.node, None)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    benchmark_results = config.stash.get(BENCHMARK_RESULTS, [])
+    if not benchmark_results:
+        return
+
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        SUMMARY_ROW.format("benchmark", "rows", "rows/s", "req/row", "peak mem MB", "wall s")
+    )
+    for benchmark_result in benchmark_results:
+        terminalreporter.write_line(
+            SUMMARY_ROW.format(benchmark_result.name, *benchmark_result.to_json().values())
+        )
+
+    _write_scaling_exponents(terminalreporter, benchmark_results)
+
+
+def _write_scaling_exponents(terminalreporter, benchmark_results):
+    exponents = scaling_exponents(benchmark_results)
+    if not exponents:
+        return
+
+    terminalreporter.write_line("")
+    terminalreporter.write_line(SCALING_ROW.format("scaling (time ~ rows^k)", "columns", "k"))
+    for (group, columns), exponent in exponents.items():
+        terminalreporter.write_line(SCALING_ROW.format(group, columns, exponent))
+
+
+@contextmanager
+def _run_benchmark(node, fake_server, rows, columns=0):
+    benchmark_result = BenchmarkResult(
+        name=node.name, rows=rows, group=node.originalname, columns=columns
+    )
+    with measure(benchmark_result, fake_server):
+        yield benchmark_result
+
+    node.config.stash.setdefault(BENCHMARK_RESULTS, []).append(benchmark_result)
+    if is_updating_baselines():
+        update_baseline(benchmark_result)
+        return
+    regressions = find_regressions(benchmark_result)
+    if regressions:
+        pytest.fail("\n".join(regressions))
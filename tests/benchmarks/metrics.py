@@ -0,0 +1,221 @@
+"""Measure benchmark runs and compare them with the stored JSON baselines."""
+
+import json
+import math
+import os
+import time
+import tracemalloc
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import groupby
+from operator import attrgetter
+from pathlib import Path
+from typing import Any
+
+from tests.workloads import FakeMPTServer
+
+type Metrics = dict[str, Any]
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+UPDATE_BASELINES_ENV = "BENCH_UPDATE_BASELINES"
+TOLERANCE_ENV = "BENCH_TOLERANCE"
+# Throughput swings a lot between a laptop and a shared CI runner; request counts do not.
+DEFAULT_TOLERANCE = 0.5
+# Shorter runs are dominated by timer and GC noise, so their throughput is not compared.
+MIN_TIMED_SECONDS = 0.05
+BYTES_IN_MEGABYTE = 1024 * 1024
+PRECISION = 3
+
+
+@dataclass
+class BenchmarkResult:
+    """Metrics of one benchmark run.
+
+    Attributes:
+        name: Benchmark name, used as the baseline key.
+        rows: Workbook rows processed by the run.
+        group: Benchmark function name, shared by every size of a parameterized benchmark.
+        columns: Worksheet columns of a micro-benchmark, 0 for end-to-end runs.
+        requests: HTTP requests the fake Marketplace API served during the run.
+        wall_time_s: Wall time of the run in seconds.
+        peak_memory_mb: Peak memory allocated by Python during the run, traced with
+            tracemalloc from the start of the run, so it does not depend on the benchmarks
+            that ran before it in the same process.
+
+    """
+
+    name: str
+    rows: int
+    group: str = ""
+    columns: int = 0
+    requests: int = 0
+    wall_time_s: float = 0
+    peak_memory_mb: float = 0
+
+    @property
+    def shape(self) -> tuple[str, int]:
+        return self.group, self.columns
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.wall_time_s if self.wall_time_s else 0
+
+    @property
+    def requests_per_row(self) -> float:
+        return self.requests / self.rows if self.rows else 0
+
+    def to_json(self) -> Metrics:
+        """Return the metrics stored in the baselines file."""
+        return {
+            "rows": self.rows,
+            "rows_per_second": round(self.rows_per_second, PRECISION),
+            "requests_per_row": round(self.requests_per_row, PRECISION),
+            "peak_memory_mb": round(self.peak_memory_mb, PRECISION),
+            "wall_time_s": round(self.wall_time_s, PRECISION),
+        }
+
+
+@contextmanager
+def measure(
+    benchmark_result: BenchmarkResult, fake_server: FakeMPTServer | None = None
+) -> Generator[None]:
+    """Measure the enclosed block and fill in the result when it ends.
+
+    Memory is traced with tracemalloc during the block, which slows it down, so throughput
+    is only comparable with baselines recorded the same way.
+
+    Args:
+        benchmark_result: The result to fill in.
+        fake_server: The fake Marketplace API the block talks to. Micro-benchmarks pass
+            None and report no requests.
+
+    """
+    requests_before = _request_count(fake_server)
+    with _trace_memory(benchmark_result):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            benchmark_result.wall_time_s = time.perf_counter() - started
+            benchmark_result.requests = _request_count(fake_server) - requests_before
+
+
+def is_updating_baselines() -> bool:
+    """Whether the run should store its results as the new baselines."""
+    return bool(os.getenv(UPDATE_BASELINES_ENV))
+
+
+def update_baseline(
+    benchmark_result: BenchmarkResult, baselines_path: Path = BASELINES_PATH
+) -> None:
+    """Store the result as the baseline of its benchmark."""
+    baselines = _read_baselines(baselines_path)
+    baselines[benchmark_result.name] = benchmark_result.to_json()
+    serialized = json.dumps(baselines, indent=2, sort_keys=True)
+    baselines_path.write_text(f"{serialized}\n", "utf-8")
+
+
+def find_regressions(
+    benchmark_result: BenchmarkResult, baselines_path: Path = BASELINES_PATH
+) -> list[str]:
+    """Compare a result with its baseline.
+
+    Throughput and peak memory may deviate by the ``BENCH_TOLERANCE`` fraction; throughput is
+    only compared for baselines of at least ``MIN_TIMED_SECONDS``. Requests per row are
+    deterministic, so any increase is a regression.
+
+    Args:
+        benchmark_result: The measured run.
+        baselines_path: The JSON baselines file.
+
+    Returns:
+        One message per regressed metric, empty if the run is within the baseline.
+
+    """
+    baseline = _read_baselines(baselines_path).get(benchmark_result.name)
+    if baseline is None:
+        return [f"No baseline for {benchmark_result.name}, run `make bench update=1`"]
+
+    tolerance = float(os.getenv(TOLERANCE_ENV, str(DEFAULT_TOLERANCE)))
+    measured = benchmark_result.to_json()
+    regressed_metrics = []
+    if _is_slower(measured, baseline, tolerance):
+        regressed_metrics.append("rows_per_second")
+    if measured["requests_per_row"] > baseline["requests_per_row"]:
+        regressed_metrics.append("requests_per_row")
+    if measured["peak_memory_mb"] > baseline["peak_memory_mb"] * (1 + tolerance):
+        regressed_metrics.append("peak_memory_mb")
+    return [
+        f"{benchmark_result.name}: {metric} {measured[metric]} regressed from {baseline[metric]}"
+        for metric in regressed_metrics
+    ]
+
+
+def scaling_exponents(
+    benchmark_results: Iterable[BenchmarkResult],
+) -> dict[tuple[str, int], float]:
+    """Estimate how wall time grows with the row count for each micro-benchmark.
+
+    The exponent is the slope of wall time over rows on a log-log scale between the
+    smallest and the largest run of a benchmark with the same column count: about 1 for
+    linear primitives and about 2 for quadratic ones.
+
+    Args:
+        benchmark_results: Results of parameterized micro-benchmarks.
+
+    Returns:
+        The exponent by benchmark group and column count, for groups with at least two
+        row counts.
+
+    """
+    ordered_results = sorted(benchmark_results, key=attrgetter("shape", "rows"))
+    runs_by_shape = {
+        shape: list(shape_results)
+        for shape, shape_results in groupby(ordered_results, attrgetter("shape"))
+    }
+    return {
+        shape: _scaling_exponent(runs[0], runs[-1])
+        for shape, runs in runs_by_shape.items()
+        if _spans_row_counts(runs)
+    }
+
+
+@contextmanager
+def _trace_memory(benchmark_result: BenchmarkResult) -> Generator[None]:
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        yield
+    finally:
+        benchmark_result.peak_memory_mb = tracemalloc.get_traced_memory()[1] / BYTES_IN_MEGABYTE
+        if not was_tracing:
+            tracemalloc.stop()
+
+
+def _is_slower(measured: Metrics, baseline: Metrics, tolerance: float) -> bool:
+    if baseline["wall_time_s"] < MIN_TIMED_SECONDS:
+        return False
+    return measured["rows_per_second"] < baseline["rows_per_second"] * (1 - tolerance)
+
+
+def _spans_row_counts(runs: list[BenchmarkResult]) -> bool:
+    smallest, largest = runs[0], runs[-1]
+    return smallest.rows < largest.rows and smallest.wall_time_s > 0
+
+
+def _scaling_exponent(smallest: BenchmarkResult, largest: BenchmarkResult) -> float:
+    rows_ratio = largest.rows / smallest.rows
+    return round(math.log(largest.wall_time_s / smallest.wall_time_s, rows_ratio), 2)
+
+
+def _request_count(fake_server: FakeMPTServer | None) -> int:
+    return fake_server.request_count if fake_server else 0
+
+
+def _read_baselines(baselines_path: Path) -> dict[str, Metrics]:
+    if not baselines_path.exists():
+        return {}
+    return json.loads(baselines_path.read_text("utf-8"))
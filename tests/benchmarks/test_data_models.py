@@ -0,0 +1,76 @@
+import tracemalloc
+from dataclasses import dataclass, field, fields, make_dataclass
+from functools import partial
+
+import pytest
+from cli.core.price_lists.models import ItemData as PriceItemData
+from cli.core.products.models import ItemData, ItemParametersData
+
+from tests.workloads.records import item_record, parameter_record, price_item_record
+
+# The 100,000 rows leave a heap that would skew the benchmarks after them in the process.
+pytestmark = [pytest.mark.benchmark, pytest.mark.large_benchmark]
+
+ROWS = 100_000
+ITEM_GROUPS = 10
+MODEL_RECORDS = (
+    pytest.param(PriceItemData, price_item_record, id="price_item"),
+    pytest.param(ItemData, partial(item_record, item_groups=ITEM_GROUPS), id="item"),
+    pytest.param(
+        ItemParametersData,
+        partial(parameter_record, scope="Item", parameter_groups=ITEM_GROUPS),
+        id="item_parameter",
+    ),
+)
+
+
+@dataclass(frozen=True)
+class RowMemory:
+    slotted: float
+    dict_backed: float
+
+
+def dict_backed_twin(model):
+    """Return a plain dataclass with the fields of a model, stored in a ``__dict__``."""
+    return make_dataclass(
+        f"DictBacked{model.__name__}",
+        [
+            (model_field.name, model_field.type, field(default=None))
+            for model_field in fields(model)
+        ],
+    )
+
+
+def bytes_per_row(model, row_values):
+    tracemalloc.start()
+    rows = [model(**row_kwargs) for row_kwargs in row_values]
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(rows) == len(row_values)
+    return allocated / len(row_values)
+
+
+def row_memory(rows):
+    model = type(rows[0])
+    row_values = [
+        {model_field.name: getattr(row, model_field.name) for model_field in fields(row)}
+        for row in rows
+    ]
+    return RowMemory(
+        slotted=bytes_per_row(model, row_values),
+        dict_backed=bytes_per_row(dict_backed_twin(model), row_values),
+    )
+
+
+@pytest.mark.parametrize(("model", "record_factory"), MODEL_RECORDS)
+def test_from_json_memory(run_micro_benchmark, record_property, model, record_factory):
+    records = [record_factory(index) for index in range(1, ROWS + 1)]
+
+    with run_micro_benchmark(ROWS):
+        rows = [model.from_json(record) for record in records]  # act
+
+    memory = row_memory(rows)
+    record_property("bytes_per_row", round(memory.slotted))
+    record_property("dict_backed_bytes_per_row", round(memory.dict_backed))
+    assert not hasattr(rows[0], "__dict__")
+    assert memory.slotted < memory.dict_backed, memory
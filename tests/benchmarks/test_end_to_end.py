@@ -0,0 +1,67 @@
+import pytest
+from cli.core.accounts.containers import AccountContainer
+from cli.core.price_lists.app.export import PriceListExporter
+from cli.core.price_lists.app.sync import PriceListSyncer
+from cli.core.price_lists.models.item import ItemAction
+from cli.core.products.app.export import ProductExporter
+from cli.core.products.app.sync import ProductSyncer
+from cli.core.products.containers import ProductContainer
+from cli.core.products.models import DataActionEnum
+
+from tests.workloads import (
+    ProductWorkload,
+    generate_price_list_workbook,
+    generate_product_workbook,
+    seed_price_list,
+    seed_product_catalog,
+)
+from tests.workloads.records import PRICE_LIST_ID, PRODUCT_ID
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.usefixtures("operations_account")]
+
+SYNC_ITEMS = 40
+SYNC_PARAMETERS = 20
+EXPORT_ITEMS = 200
+EXPORT_PARAMETERS = 100
+SYNC_WORKLOAD = ProductWorkload(
+    item_count=SYNC_ITEMS, parameter_count=SYNC_PARAMETERS, action=DataActionEnum.UPDATE
+)
+EXPORT_WORKLOAD = ProductWorkload(item_count=EXPORT_ITEMS, parameter_count=EXPORT_PARAMETERS)
+SYNC_PRICE_ITEMS = 40
+EXPORT_PRICE_ITEMS = 500
+
+
+def test_product_sync(tmp_path, fake_marketplace, run_benchmark):
+    seed_product_catalog(fake_marketplace.api, SYNC_WORKLOAD)
+    product_path = str(generate_product_workbook(tmp_path / "product.xlsx", SYNC_WORKLOAD))
+    syncer = ProductSyncer(ProductContainer(file_path=product_path))
+
+    with run_benchmark(SYNC_WORKLOAD.row_count):
+        syncer.sync(product_path, is_dry_run=False, force_create=False)  # act
+
+
+def test_price_list_sync(tmp_path, fake_marketplace, run_benchmark):
+    seed_price_list(fake_marketplace.api, SYNC_PRICE_ITEMS)
+    price_list_path = generate_price_list_workbook(
+        tmp_path / "price_list.xlsx", SYNC_PRICE_ITEMS, action=ItemAction.UPDATE
+    )
+    syncer = PriceListSyncer()
+
+    with run_benchmark(SYNC_PRICE_ITEMS):
+        syncer.sync_all([str(price_list_path)])  # act
+
+
+def test_product_export(tmp_path, fake_marketplace, run_benchmark):
+    seed_product_catalog(fake_marketplace.api, EXPORT_WORKLOAD)
+    exporter = ProductExporter(AccountContainer(), str(tmp_path))
+
+    with run_benchmark(EXPORT_WORKLOAD.row_count):
+        exporter.export_all([PRODUCT_ID])  # act
+
+
+def test_price_list_export(tmp_path, fake_marketplace, run_benchmark):
+    seed_price_list(fake_marketplace.api, EXPORT_PRICE_ITEMS)
+    exporter = PriceListExporter(str(tmp_path))
+
+    with run_benchmark(EXPORT_PRICE_ITEMS):
+        exporter.export_all([PRICE_LIST_ID])  # act
@@ -0,0 +1,172 @@
+import re
+from dataclasses import dataclass
+from itertools import product
+from pathlib import Path
+from typing import Any, Self, override
+
+import pytest
+from cli.core.handlers.constants import ERROR_COLUMN_NAME
+from cli.core.handlers.excel_file_handler import ExcelFileHandler
+from cli.core.handlers.horizontal_tab_file_manager import HorizontalTabFileManager
+from cli.core.models import BaseDataModel
+from openpyxl.workbook import Workbook
+from openpyxl.worksheet.datavalidation import DataValidation
+
+pytestmark = pytest.mark.benchmark
+
+SHEET_NAME = "Benchmark"
+ID_FIELD = "ID"
+DYNAMIC_COLUMN_PATTERNS = (re.compile(r"Column \d+"),)
+ROW_COUNTS = (250, 1000)
+COLUMN_COUNTS = (10, 40)
+ERROR_COUNT = 5
+SHEET_SHAPES = tuple(
+    pytest.param(rows, columns, id=f"{rows}x{columns}")
+    for rows, columns in product(ROW_COUNTS, COLUMN_COUNTS)
+)
+
+
+@dataclass
+class BenchmarkRow(BaseDataModel):
+    cells: dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, source_dict: dict[str, Any]) -> Self:
+        return cls(source_dict)
+
+    @classmethod
+    def from_json(cls, json_dict: dict[str, Any]) -> Self:
+        return cls(json_dict)
+
+    def to_json(self) -> dict[str, Any]:
+        return self.cells
+
+    def to_xlsx(self) -> dict[str, Any]:
+        return self.cells
+
+
+class BenchmarkTabFileManager(HorizontalTabFileManager):
+    _data_model = BenchmarkRow
+    _id_field = ID_FIELD
+    _sheet_name = SHEET_NAME
+
+    def __init__(self, file_path: str, fields: tuple[str, ...]):
+        super().__init__(file_path)
+        self._fields = fields
+        self._data_validation_map = {
+            fields[1]: DataValidation(type="list", formula1='"-,update"', allow_blank=True)
+        }
+
+    @override
+    def _read_data(self):
+        return self.file_handler.get_data_from_horizontal_sheet(self._sheet_name, self._fields)
+
+
+def header_fields(columns: int) -> tuple[str, ...]:
+    return (ID_FIELD, *(f"Column {column}" for column in range(2, columns + 1)))
+
+
+def row_values(row: int, columns: int) -> list[str]:
+    cell_values = (f"R{row}C{column}" for column in range(2, columns + 1))
+    return [f"ID-{row}", *cell_values]
+
+
+def load_file_handler(workbook: Workbook, file_path: Path) -> ExcelFileHandler:
+    workbook.save(file_path)
+    file_handler = ExcelFileHandler(file_path)
+    assert file_handler.workbook is not None  # load outside the measured block
+    return file_handler
+
+
+def horizontal_file_handler(file_path: Path, rows: int, columns: int) -> ExcelFileHandler:
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = SHEET_NAME
+    worksheet.append(header_fields(columns))
+    for row in range(1, rows + 1):
+        worksheet.append(row_values(row, columns))
+    return load_file_handler(workbook, file_path)
+
+
+def vertical_file_handler(file_path: Path, rows: int, columns: int) -> ExcelFileHandler:
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = SHEET_NAME
+    worksheet.append(["General Information"])
+    for row in range(1, rows + 1):
+        worksheet.append([f"Field {row}", *row_values(row, columns - 1)])
+    return load_file_handler(workbook, file_path)
+
+
+@pytest.mark.parametrize(("rows", "columns"), SHEET_SHAPES)
+def test_get_data_from_horizontal_sheet(tmp_path, run_micro_benchmark, rows, columns):
+    file_handler = horizontal_file_handler(tmp_path / "horizontal.xlsx", rows, columns)
+
+    with run_micro_benchmark(rows, columns):
+        sheet_rows = list(file_handler.get_data_from_horizontal_sheet(SHEET_NAME))  # act
+
+    assert len(sheet_rows) == rows
+
+
+@pytest.mark.parametrize(("rows", "columns"), SHEET_SHAPES)
+def test_get_values_for_dynamic_sheet(tmp_path, run_micro_benchmark, rows, columns):
+    file_handler = horizontal_file_handler(tmp_path / "dynamic.xlsx", rows, columns)
+
+    with run_micro_benchmark(rows, columns):
+        sheet_rows = list(  # act
+            file_handler.get_values_for_dynamic_sheet(
+                SHEET_NAME, (ID_FIELD,), list(DYNAMIC_COLUMN_PATTERNS)
+            )
+        )
+
+    assert len(sheet_rows) == rows
+
+
+@pytest.mark.parametrize(("rows", "columns"), SHEET_SHAPES)
+def test_get_data_from_vertical_sheet(tmp_path, run_micro_benchmark, rows, columns):
+    file_handler = vertical_file_handler(tmp_path / "vertical.xlsx", rows, columns)
+
+    with run_micro_benchmark(rows, columns):
+        sheet_data = file_handler.get_data_from_vertical_sheet(SHEET_NAME)  # act
+
+    assert len(sheet_data) == rows
+
+
+@pytest.mark.parametrize(("rows", "columns"), SHEET_SHAPES)
+def test_add(tmp_path, run_micro_benchmark, rows, columns):
+    fields = header_fields(columns)
+    file_manager = BenchmarkTabFileManager(str(tmp_path / "add.xlsx"), fields)
+    file_manager.create_tab()
+    records = [
+        BenchmarkRow(dict(zip(fields, row_values(row, columns), strict=True)))
+        for row in range(1, rows + 1)
+    ]
+
+    with run_micro_benchmark(rows, columns):
+        file_manager.add(records)  # act
+
+    assert file_manager.file_handler.get_sheet_next_row(SHEET_NAME) == rows + 2
+
+
+@pytest.mark.parametrize(("rows", "columns"), SHEET_SHAPES)
+def test_write_error(tmp_path, run_micro_benchmark, rows, columns):
+    file_path = tmp_path / "errors.xlsx"
+    horizontal_file_handler(file_path, rows, columns)
+    file_manager = BenchmarkTabFileManager(str(file_path), header_fields(columns))
+
+    with run_micro_benchmark(rows, columns):
+        for row in range(rows - ERROR_COUNT + 1, rows + 1):
+            file_manager.write_error("Synthetic error", f"ID-{row}")  # act
+
+    sheet_rows = list(file_manager.file_handler.get_data_from_horizontal_sheet(SHEET_NAME))
+    assert sheet_rows[-1][ERROR_COLUMN_NAME]["value"] == "Synthetic error"
+
+
+@pytest.mark.parametrize(("rows", "columns"), SHEET_SHAPES)
+def test_save(tmp_path, run_micro_benchmark, rows, columns):
+    file_handler = horizontal_file_handler(tmp_path / "save.xlsx", rows, columns)
+
+    with run_micro_benchmark(rows, columns):
+        file_handler.save()  # act
+
+    assert file_handler.file_path.stat().st_size > 0
@@ -160,6 +160,18 @@ def test_get_data_from_horizontal_sheet_by_fields(excel_file_handler):
     assert result[0] == {"Header2": {"value": "Value2", "coordinate": "B2"}}
 
 
+def test_get_column_from_horizontal_sheet(excel_file_handler):
+    result = list(excel_file_handler.get_column_from_horizontal_sheet("HorizontalSheet", "Header2"))
+
+    assert result == [("B2", "Value2")]
+
+
+def test_get_horizontal_column_missing_field(excel_file_handler):
+    result = list(excel_file_handler.get_column_from_horizontal_sheet("HorizontalSheet", "Other"))
+
+    assert result == []
+
+
 def test_get_data_from_vertical_sheet(excel_file_handler):
     result = excel_file_handler.get_data_from_vertical_sheet("VerticalSheet")
 
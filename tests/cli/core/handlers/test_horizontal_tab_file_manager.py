@@ -187,6 +187,32 @@ def test_read_data(mocker, fake_horizontal_tab_file_manager):
     })
 
 
+def test_find_row_errors(mocker, fake_horizontal_tab_file_manager):
+    rows = [
+        {"ID": {"value": "fake_id_1", "coordinate": "A2"}},
+        {"ID": {"value": "fake_id_2", "coordinate": "A3"}},
+    ]
+    mocker.patch.object(fake_horizontal_tab_file_manager, "_read_data", return_value=rows)
+    mocker.patch.object(
+        FakeDataModel,
+        "from_dict",
+        side_effect=[FakeDataModel(), ValueError("'fake' is not a valid FakeEnum")],
+    )
+
+    result = list(fake_horizontal_tab_file_manager.find_row_errors())
+
+    assert result == [("A3", "'fake' is not a valid FakeEnum")]
+
+
+def test_find_row_errors_check_row(mocker, fake_horizontal_tab_file_manager):
+    check_row_mock = mocker.Mock(side_effect=[KeyError("Name")])
+
+    result = list(fake_horizontal_tab_file_manager.find_row_errors(check_row_mock))
+
+    assert result == [("", "Missing column 'Name'")]
+    check_row_mock.assert_called_once_with(FakeDataModel())
+
+
 def test_write_error(mocker, fake_horizontal_tab_file_manager):
     file_handler = fake_horizontal_tab_file_manager.file_handler
     mock_data = {
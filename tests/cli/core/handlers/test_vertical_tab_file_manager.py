@@ -119,6 +119,42 @@ def test_read_data(mocker, file_manager):
     get_data_from_vertical_sheet_mock.assert_called_once()
 
 
+def test_read_data_decodes_once(mocker, file_manager):
+    mocker.patch.object(file_manager.file_handler, "get_data_from_vertical_sheet", return_value={})
+    data_model_spy = mocker.spy(file_manager._data_model, "from_dict")  # noqa: SLF001
+    first_result = file_manager.read_data()
+
+    result = file_manager.read_data()
+
+    assert result is first_result
+    data_model_spy.assert_called_once()
+
+
+def test_read_data_after_write_ids(mocker, file_manager):
+    mocker.patch.object(file_manager.file_handler, "get_data_from_vertical_sheet", return_value={})
+    mocker.patch.object(file_manager.file_handler, "write")
+    data_model_spy = mocker.spy(file_manager._data_model, "from_dict")  # noqa: SLF001
+    file_manager.read_data()
+    file_manager.write_ids({"B2": "new_id"})
+
+    file_manager.read_data()  # act
+
+    assert data_model_spy.call_count == 2
+
+
+def test_find_row_errors(mocker, file_manager):
+    mocker.patch.object(
+        file_manager.file_handler,
+        "get_data_from_vertical_sheet",
+        return_value={"ID": {"value": "fake_id", "coordinate": "B2"}},
+    )
+    mocker.patch.object(FakeDataModel, "from_dict", side_effect=OSError("No such file"))
+
+    result = list(file_manager.find_row_errors())
+
+    assert result == [("B2", "No such file")]
+
+
 def test_write_error_existing_column(mocker, file_manager):
     mock_data = {ERROR_COLUMN_NAME: {"value": "Error", "coordinate": "B2"}}
     get_data_from_vertical_sheet_mock = mocker.patch.object(
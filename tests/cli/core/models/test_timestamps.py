@@ -0,0 +1,36 @@
+import datetime as dt
+
+import pytest
+from cli.core.models.timestamps import decode_audit_date
+
+AUDIT_DATE = dt.date.fromisoformat("2024-03-19")
+MEMOIZED_DATE = dt.date.fromisoformat("2024-03-20")
+
+
+@pytest.mark.parametrize(
+    ("timestamp", "expected"),
+    [
+        ("2024-03-19T11:16:57.932Z", AUDIT_DATE),
+        ("2025-06-03T23:59:59+02:00", dt.date.fromisoformat("2025-06-03")),
+        ("March 19, 2024 11:16", AUDIT_DATE),
+        (None, None),
+        ("", None),
+    ],
+)
+def test_decode_audit_date(timestamp, expected):
+    result = decode_audit_date(timestamp)
+
+    assert result == expected
+
+
+def test_decode_audit_date_memoizes_timestamps(mocker):
+    parsed_time = dt.time(hour=10)
+    parsed_timestamp = dt.datetime.combine(MEMOIZED_DATE, parsed_time, tzinfo=dt.UTC)
+    parse_mock = mocker.patch(
+        "cli.core.models.timestamps.parser.parse", return_value=parsed_timestamp
+    )
+
+    result = [decode_audit_date("20 March 2024, 10:00") for _ in range(3)]
+
+    assert set(result) == {MEMOIZED_DATE}
+    parse_mock.assert_called_once_with("20 March 2024, 10:00")
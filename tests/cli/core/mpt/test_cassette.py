@@ -0,0 +1,134 @@
+import json
+from dataclasses import asdict
+from http import HTTPStatus
+
+import httpx
+import pytest
+from cli.core.mpt.cassette import (
+    CassetteEntry,
+    CassetteMissError,
+    CassettePlayer,
+    CassetteRecorder,
+    ReplayLatency,
+)
+from cli.core.mpt.exchange import REDACTED
+
+PRODUCT_URL = "/public/v1/catalog/products/PRD-1234-1234"
+LATENCY_MS = 250
+LATENCY_S = LATENCY_MS / 1000
+
+
+def build_entry(status=HTTPStatus.OK, body='{"id": "PRD-1234-1234"}', latency_ms=LATENCY_MS):
+    return CassetteEntry(
+        method="GET",
+        url=PRODUCT_URL,
+        status=status,
+        content_type="application/json",
+        body=body,
+        latency_ms=latency_ms,
+    )
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    cassette_recorder = CassetteRecorder(tmp_path / "nested" / "cassette.jsonl")
+    cassette_recorder.start()
+    return cassette_recorder
+
+
+def respond_with_token(request):
+    return httpx.Response(HTTPStatus.CREATED, json={"id": "TKN-1234-1234", "token": "idt:secret"})
+
+
+def build_player_client(player, base_url="https://example.com"):
+    return httpx.Client(base_url=base_url, transport=player.wrap(httpx.HTTPTransport()))
+
+
+@pytest.fixture
+def recorded_client(recorder):
+    transport = recorder.wrap(httpx.MockTransport(respond_with_token))
+    return httpx.Client(base_url="https://example.com", transport=transport)
+
+
+def test_recorder_records_exchange(recorder, recorded_client):
+    result = recorded_client.post(
+        "/public/v1/accounts/api-tokens?select=account",
+        json={"name": "Token"},
+        headers={"Authorization": "Bearer idt:secret"},
+    )
+
+    assert result.json() == {"id": "TKN-1234-1234", "token": "idt:secret"}
+    cassette_text = recorder.cassette_path.read_text(encoding="utf-8")
+    assert "idt:secret" not in cassette_text
+    recorded = json.loads(cassette_text)
+    assert (recorded["method"], recorded["url"], recorded["status"]) == (
+        "POST",
+        "/public/v1/accounts/api-tokens?select=account",
+        HTTPStatus.CREATED,
+    )
+    assert json.loads(recorded["body"]) == {"id": "TKN-1234-1234", "token": REDACTED}
+
+
+def test_recorder_start_truncates_cassette(tmp_path):
+    cassette_path = tmp_path / "cassette.jsonl"
+    cassette_path.write_text("previous\n", encoding="utf-8")
+
+    CassetteRecorder(cassette_path).start()  # act
+
+    assert not cassette_path.read_text(encoding="utf-8")
+
+
+def test_player_replays_in_recorded_order(mocker):
+    sleep_mock = mocker.patch("cli.core.mpt.cassette.time.sleep", autospec=True)
+    player = CassettePlayer(
+        [build_entry(status=HTTPStatus.NOT_FOUND, body="{}"), build_entry()],
+        ReplayLatency.ORIGINAL,
+    )
+    client = build_player_client(player, "https://other.example.com")
+    first_response = client.get(PRODUCT_URL)
+
+    second_response = client.get(PRODUCT_URL)  # act
+
+    assert first_response.status_code == HTTPStatus.NOT_FOUND
+    assert second_response.json() == {"id": "PRD-1234-1234"}
+    assert sleep_mock.call_args_list == [mocker.call(LATENCY_S), mocker.call(LATENCY_S)]
+    assert player.remaining == 0
+
+
+def test_player_zero_latency(mocker):
+    sleep_mock = mocker.patch("cli.core.mpt.cassette.time.sleep", autospec=True)
+    player = CassettePlayer([build_entry()], ReplayLatency.ZERO)
+    client = build_player_client(player)
+
+    client.get(PRODUCT_URL)  # act
+
+    sleep_mock.assert_not_called()
+
+
+def test_player_raises_on_unrecorded_request():
+    player = CassettePlayer([build_entry()], ReplayLatency.ZERO)
+    client = build_player_client(player)
+
+    with pytest.raises(CassetteMissError, match="No recorded response for GET"):
+        client.get(f"{PRODUCT_URL}/items")
+
+    assert player.remaining == 1
+
+
+def test_player_loads_recorded_cassette(recorder, recorded_client):
+    recorded_client.post("/public/v1/accounts/api-tokens", json={})
+
+    result = CassettePlayer.load(recorder.cassette_path, ReplayLatency.ZERO)
+
+    assert result.remaining == 1
+    assert result.latency == ReplayLatency.ZERO
+
+
+def test_player_load_skips_blank_lines(tmp_path):
+    cassette_path = tmp_path / "cassette.jsonl"
+    entry_line = json.dumps(asdict(build_entry()))
+    cassette_path.write_text(f"{entry_line}\n\n  \n", encoding="utf-8")
+
+    result = CassettePlayer.load(cassette_path, ReplayLatency.ZERO)
+
+    assert result.remaining == 1
@@ -0,0 +1,52 @@
+from http import HTTPStatus
+
+import httpx
+import pytest
+from cli.core.mpt.exchange import REDACTED, redact, redact_body, request_key
+
+
+def test_request_key_ignores_host():
+    request = httpx.Request(
+        "GET", "https://api.example.com/public/v1/catalog/products?limit=10&eq(id,PRD-1)"
+    )
+
+    result = request_key(request)
+
+    assert result == ("GET", "/public/v1/catalog/products?limit=10&eq(id,PRD-1)")
+
+
+def test_redact_nested_sensitive_keys():
+    json_document = {
+        "id": "TKN-1234-1234",
+        "Token": "idt:TKN-1234-1234:secret",
+        "account": {"id": "ACC-1234", "password": "pass"},
+        "items": [{"apiKey": "key", "name": "Item"}],
+    }
+
+    result = redact(json_document)
+
+    assert result == {
+        "id": "TKN-1234-1234",
+        "Token": REDACTED,
+        "account": {"id": "ACC-1234", "password": REDACTED},
+        "items": [{"apiKey": REDACTED, "name": "Item"}],
+    }
+
+
+@pytest.mark.parametrize(
+    ("response", "expected_body"),
+    [
+        (httpx.Response(HTTPStatus.OK, json={"token": "secret"}), f'{{"token": "{REDACTED}"}}'),
+        (httpx.Response(HTTPStatus.OK, text="token=secret"), "token=secret"),
+        (
+            httpx.Response(
+                HTTPStatus.OK, headers={"Content-Type": "application/json"}, text="{invalid"
+            ),
+            "{invalid",
+        ),
+    ],
+)
+def test_redact_body(response, expected_body):
+    result = redact_body(response)
+
+    assert result == expected_body
@@ -0,0 +1,205 @@
+from functools import partial
+from http import HTTPStatus
+
+import httpx
+import pytest
+from cli.core.mpt.governor import (
+    GovernedTransport,
+    GovernorSettings,
+    RequestGovernor,
+    is_retryable,
+    parse_retry_after,
+)
+
+PRODUCT_URL = "https://example.com/public/v1/catalog/products/PRD-1234-1234"
+MAX_RATE = 2.0
+RETRY_AFTER_S = 3.0
+LIMIT_AFTER_FIRST_SUCCESS = 2.5
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def build_governor(clock, **settings):
+    return RequestGovernor(
+        GovernorSettings(**settings), clock=clock, sleep=clock.sleep, jitter=lambda: 0.5
+    )
+
+
+def respond_from(responses, request):
+    response = responses.pop(0)
+    if isinstance(response, Exception):
+        raise response
+    return response
+
+
+def build_client(governor, responses):
+    transport = httpx.MockTransport(partial(respond_from, responses))
+    return httpx.Client(transport=governor.wrap(transport))
+
+
+@pytest.mark.parametrize(
+    ("header_value", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("3", 3.0),
+        ("Thu, 01 Jan 1970 00:00:00 GMT", 0),
+        ("soon", None),
+    ],
+)
+def test_parse_retry_after(header_value, expected):
+    result = parse_retry_after(header_value)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("method", "status_code", "expected"),
+    [
+        ("POST", HTTPStatus.TOO_MANY_REQUESTS, True),
+        ("GET", HTTPStatus.SERVICE_UNAVAILABLE, True),
+        ("PUT", None, True),
+        ("POST", HTTPStatus.SERVICE_UNAVAILABLE, False),
+        ("POST", None, False),
+        ("GET", HTTPStatus.NOT_FOUND, False),
+        ("GET", HTTPStatus.OK, False),
+    ],
+)
+def test_is_retryable(method, status_code, expected):
+    result = is_retryable(method, status_code)
+
+    assert result is expected
+
+
+def test_wrap():
+    governor = RequestGovernor()
+
+    result = governor.wrap(httpx.HTTPTransport())
+
+    assert isinstance(result, GovernedTransport)
+
+
+def test_token_bucket_paces_requests(clock):
+    governor = build_governor(clock, max_rate=MAX_RATE, burst=2)
+
+    for _ in range(4):  # act
+        governor.acquire()
+        governor.release(HTTPStatus.OK)
+
+    assert clock.sleeps == [1 / MAX_RATE, 1 / MAX_RATE]
+
+
+def test_throttling_halves_concurrency(clock):
+    governor = build_governor(clock, max_concurrency=8)
+    governor.acquire()
+
+    governor.release(HTTPStatus.TOO_MANY_REQUESTS, retry_after=RETRY_AFTER_S)  # act
+
+    assert governor.concurrency_limit == 4
+    governor.acquire()
+    assert clock.sleeps == [RETRY_AFTER_S]
+
+
+def test_successes_increase_concurrency(clock):
+    governor = build_governor(clock, max_concurrency=8)
+    governor.concurrency_limit = 2
+
+    for _ in range(2):  # act
+        governor.acquire()
+        governor.release(HTTPStatus.OK)
+
+    # Every success adds the inverse of the current limit.
+    expected_limit = LIMIT_AFTER_FIRST_SUCCESS + 1 / LIMIT_AFTER_FIRST_SUCCESS
+    assert governor.concurrency_limit == pytest.approx(expected_limit)
+
+
+def test_concurrency_limit_is_capped(clock):
+    governor = build_governor(clock, max_concurrency=2)
+    governor.acquire()
+
+    governor.release(HTTPStatus.OK)  # act
+
+    assert governor.concurrency_limit == 2
+
+
+def test_retries_throttled_post_after_retry_after(clock):
+    governor = build_governor(clock)
+    client = build_client(
+        governor,
+        [
+            httpx.Response(HTTPStatus.TOO_MANY_REQUESTS, headers={"Retry-After": "2"}),
+            httpx.Response(HTTPStatus.CREATED),
+        ],
+    )
+
+    result = client.post(PRODUCT_URL, json={})
+
+    assert result.status_code == HTTPStatus.CREATED
+    assert clock.sleeps == [2.0]
+
+
+def test_retries_server_errors_with_backoff(clock):
+    governor = build_governor(clock, backoff_base=1.0)
+    client = build_client(
+        governor,
+        [
+            httpx.Response(HTTPStatus.SERVICE_UNAVAILABLE),
+            httpx.ConnectError("Connection reset"),
+            httpx.Response(HTTPStatus.OK),
+        ],
+    )
+
+    result = client.get(PRODUCT_URL)
+
+    assert result.status_code == HTTPStatus.OK
+    assert clock.sleeps == [0.5, 1.0]
+
+
+def test_does_not_retry_failed_post(clock):
+    governor = build_governor(clock)
+    client = build_client(
+        governor,
+        [httpx.Response(HTTPStatus.INTERNAL_SERVER_ERROR), httpx.Response(HTTPStatus.CREATED)],
+    )
+
+    result = client.post(PRODUCT_URL, json={})
+
+    assert result.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert clock.sleeps == []
+
+
+def test_does_not_retry_post_transport_error(clock):
+    governor = build_governor(clock)
+    client = build_client(governor, [httpx.ReadTimeout("Timed out")])
+
+    with pytest.raises(httpx.ReadTimeout):
+        client.post(PRODUCT_URL, json={})
+
+    assert clock.sleeps == []
+
+
+def test_returns_last_response_after_max_retries(clock):
+    governor = build_governor(clock, max_retries=2, max_backoff=1.0)
+    bad_gateway_responses = [httpx.Response(HTTPStatus.BAD_GATEWAY) for _ in range(3)]
+    client = build_client(governor, bad_gateway_responses)
+
+    result = client.get(PRODUCT_URL)
+
+    assert result.status_code == HTTPStatus.BAD_GATEWAY
+    assert clock.sleeps == [0.25, 0.5]
@@ -0,0 +1,84 @@
+import httpx
+import pytest
+from cli.core.mpt.cassette import CassettePlayer, ReplayLatency, ReplayTransport
+from cli.core.mpt.governor import GovernedTransport
+from cli.core.mpt.mpt_client import create_api_mpt_client_from_account
+from cli.core.mpt.response_cache import CachingTransport, ResponseCache
+from cli.core.mpt.tracing import RequestTracer
+from cli.core.state import state
+from mpt_api_client import MPTClient
+from mpt_api_client.auth import BearerTokenAuthentication
+
+
+@pytest.fixture
+def request_tracer(mocker):
+    tracer = RequestTracer()
+    mocker.patch.object(state, "request_tracer", tracer)
+    return tracer
+
+
+def test_create_api_mpt_client_from_account(mocker, active_vendor_account):
+    mocker.patch.object(state, "request_tracer", None)
+
+    result = create_api_mpt_client_from_account(active_vendor_account)
+
+    assert result.http_client.httpx_client.event_hooks["response"] == []
+
+
+def test_create_api_mpt_client_with_tracer(active_vendor_account, request_tracer):
+    result = create_api_mpt_client_from_account(active_vendor_account)
+
+    event_hooks = result.http_client.httpx_client.event_hooks
+    assert event_hooks["request"][-1] == request_tracer._on_request  # noqa: SLF001
+    assert event_hooks["response"] == [request_tracer._on_response]  # noqa: SLF001
+
+
+def test_create_api_mpt_client_with_cassette(mocker, active_vendor_account):
+    mocker.patch.object(state, "request_tracer", None)
+    mocker.patch.object(state, "cassette", CassettePlayer([], ReplayLatency.ZERO))
+
+    result = create_api_mpt_client_from_account(active_vendor_account)
+
+    transport = result.http_client.httpx_client._transport  # noqa: SLF001
+    assert isinstance(transport, ReplayTransport)
+
+
+def test_create_api_mpt_client_with_governor(mocker, active_vendor_account):
+    mocker.patch.object(state, "request_tracer", None)
+    mocker.patch.object(state, "cassette", None)
+
+    result = create_api_mpt_client_from_account(active_vendor_account)
+
+    transport = result.http_client.httpx_client._transport  # noqa: SLF001
+    assert isinstance(transport, GovernedTransport)
+    assert isinstance(transport._transport, httpx.HTTPTransport)  # noqa: SLF001
+
+
+def test_create_api_mpt_client_keeps_config(mocker, active_vendor_account):
+    mocker.patch.object(state, "request_tracer", None)
+    mocker.patch.object(state, "cassette", None)
+    expected_client = MPTClient.from_config(
+        authentication=BearerTokenAuthentication(active_vendor_account.token),
+        base_url=active_vendor_account.environment,
+    ).http_client.httpx_client
+
+    result = create_api_mpt_client_from_account(active_vendor_account)
+
+    httpx_client = result.http_client.httpx_client
+    assert (httpx_client.base_url, httpx_client.timeout) == (
+        expected_client.base_url,
+        expected_client.timeout,
+    )
+    assert httpx_client.headers == expected_client.headers
+    assert isinstance(httpx_client.auth, BearerTokenAuthentication)
+
+
+def test_create_api_mpt_client_with_cache(mocker, tmp_path, active_vendor_account):
+    mocker.patch.object(state, "request_tracer", None)
+    mocker.patch.object(state, "cassette", None)
+    mocker.patch.object(state, "response_cache", ResponseCache(tmp_path))
+
+    result = create_api_mpt_client_from_account(active_vendor_account)
+
+    transport = result.http_client.httpx_client._transport  # noqa: SLF001
+    assert isinstance(transport, CachingTransport)
@@ -0,0 +1,185 @@
+from functools import partial
+from http import HTTPStatus
+from types import MappingProxyType
+
+import httpx
+import pytest
+from cli.core.mpt.response_cache import CachingTransport, ResponseCache
+
+PRODUCT_URL = "https://example.com/public/v1/catalog/products/PRD-1234-1234"
+PRODUCTS_URL = "https://example.com/public/v1/catalog/products?limit=10"
+TEMPLATES_URL = f"{PRODUCT_URL}/templates"
+ITEMS_URL = "https://example.com/public/v1/catalog/items?eq(product.id,PRD-1234-1234)"
+CACHE_TTL = 60
+FRESH_AGE = CACHE_TTL / 2
+CLOCK_START = 1000
+OLD_PRODUCT = MappingProxyType({"name": "Old"})
+NEW_PRODUCT = MappingProxyType({"name": "New"})
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = CLOCK_START
+
+    def __call__(self):
+        return self.now
+
+
+def respond_from(responses, sent_requests, request):
+    sent_requests.append(request)
+    return responses.pop(0)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def response_cache(tmp_path, clock):
+    return ResponseCache(tmp_path / "cache", ttl=CACHE_TTL, clock=clock)
+
+
+@pytest.fixture
+def sent_requests():
+    return []
+
+
+def build_client(response_cache, responses, sent_requests, account_id="ACC-1234-1234"):
+    transport = httpx.MockTransport(partial(respond_from, responses, sent_requests))
+    return httpx.Client(transport=response_cache.wrap(transport, "https://example.com", account_id))
+
+
+def build_primed_client(response_cache, responses, sent_requests, url=PRODUCT_URL):
+    client = build_client(response_cache, responses, sent_requests)
+    client.get(url)
+    return client
+
+
+def test_wrap(response_cache):
+    transport = httpx.HTTPTransport()
+
+    result = response_cache.wrap(transport, "https://example.com", "ACC-1234-1234")
+
+    assert isinstance(result, CachingTransport)
+
+
+def test_serves_fresh_response_from_disk(response_cache, sent_requests, clock):
+    responses = [httpx.Response(HTTPStatus.OK, json={"id": "PRD-1234-1234"})]
+    client = build_primed_client(response_cache, responses, sent_requests)
+    clock.now += FRESH_AGE
+
+    result = client.get(PRODUCT_URL)
+
+    assert result.json() == {"id": "PRD-1234-1234"}
+    assert len(sent_requests) == 1
+
+
+def test_refetches_expired_response(response_cache, sent_requests, clock):
+    responses = [
+        httpx.Response(HTTPStatus.OK, json=dict(OLD_PRODUCT)),
+        httpx.Response(HTTPStatus.OK, json=dict(NEW_PRODUCT)),
+    ]
+    client = build_primed_client(response_cache, responses, sent_requests, ITEMS_URL)
+    clock.now += CACHE_TTL + 1
+
+    result = client.get(ITEMS_URL)
+
+    assert result.json() == NEW_PRODUCT
+    assert len(sent_requests) == 2
+
+
+def test_revalidates_response_with_etag(response_cache, sent_requests):
+    responses = [
+        httpx.Response(HTTPStatus.OK, json={"name": "Product"}, headers={"ETag": '"v1"'}),
+        httpx.Response(HTTPStatus.NOT_MODIFIED),
+    ]
+    client = build_primed_client(response_cache, responses, sent_requests)
+
+    result = client.get(PRODUCT_URL)
+
+    assert result.status_code == HTTPStatus.OK
+    assert result.json() == {"name": "Product"}
+    assert sent_requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_revalidation_stores_changed_response(response_cache, sent_requests):
+    last_modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+    responses = [
+        httpx.Response(
+            HTTPStatus.OK, json=dict(OLD_PRODUCT), headers={"Last-Modified": last_modified}
+        ),
+        httpx.Response(HTTPStatus.OK, json=dict(NEW_PRODUCT)),
+    ]
+    client = build_primed_client(response_cache, responses, sent_requests)
+    client.get(PRODUCT_URL)
+
+    result = client.get(PRODUCT_URL)
+
+    assert result.json() == NEW_PRODUCT
+    assert sent_requests[1].headers["If-Modified-Since"] == last_modified
+    assert len(sent_requests) == 2
+
+
+def test_write_invalidates_related_paths(response_cache, sent_requests):
+    cached_urls = (PRODUCTS_URL, TEMPLATES_URL, ITEMS_URL)
+    responses = [httpx.Response(HTTPStatus.OK, json={}) for _ in range(6)]
+    client = build_client(response_cache, responses, sent_requests)
+    for cached_url in cached_urls:
+        client.get(cached_url)
+    client.put(PRODUCT_URL, json=dict(NEW_PRODUCT))
+
+    for cached_url in cached_urls:  # act
+        client.get(cached_url)
+
+    refetched_urls = [str(request.url) for request in sent_requests[4:]]
+    assert refetched_urls == [PRODUCTS_URL, TEMPLATES_URL]
+
+
+def test_write_keeps_sibling_paths(response_cache, sent_requests):
+    responses = [httpx.Response(HTTPStatus.OK, json={}) for _ in range(3)]
+    client = build_primed_client(response_cache, responses, sent_requests)
+    client.put(PRODUCT_URL.replace("PRD-1234-1234", "PRD-0000-0000"), json={})
+
+    client.get(PRODUCT_URL)  # act
+
+    assert len(sent_requests) == 2
+
+
+def test_does_not_cache_errors(response_cache, sent_requests):
+    responses = [
+        httpx.Response(HTTPStatus.NOT_FOUND),
+        httpx.Response(HTTPStatus.OK, json=dict(NEW_PRODUCT)),
+    ]
+    client = build_primed_client(response_cache, responses, sent_requests, ITEMS_URL)
+
+    result = client.get(ITEMS_URL)
+
+    assert result.status_code == HTTPStatus.OK
+
+
+def test_accounts_have_separate_caches(response_cache, sent_requests):
+    responses = [
+        httpx.Response(HTTPStatus.OK, json={"name": "Vendor"}),
+        httpx.Response(HTTPStatus.OK, json={"name": "Operations"}),
+    ]
+    build_primed_client(response_cache, responses, sent_requests)
+    client = build_client(response_cache, responses, sent_requests, "ACC-0000-0001")
+
+    result = client.get(PRODUCT_URL)
+
+    assert result.json() == {"name": "Operations"}
+
+
+def test_ignores_unreadable_cache_file(response_cache, sent_requests):
+    responses = [
+        httpx.Response(HTTPStatus.OK, json=dict(OLD_PRODUCT)),
+        httpx.Response(HTTPStatus.OK, json=dict(NEW_PRODUCT)),
+    ]
+    client = build_primed_client(response_cache, responses, sent_requests, ITEMS_URL)
+    for cache_path in response_cache.cache_dir.rglob("*.json"):
+        cache_path.write_text("{", encoding="utf-8")
+
+    result = client.get(ITEMS_URL)
+
+    assert result.json() == NEW_PRODUCT
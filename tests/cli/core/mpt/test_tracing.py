@@ -0,0 +1,129 @@
+import json
+from http import HTTPStatus
+
+import httpx
+import pytest
+from cli.core.mpt.tracing import (
+    RequestTrace,
+    RequestTracer,
+    endpoint_template,
+    percentile,
+    summarize_traces,
+)
+
+SLOW_LATENCY_MS = 50
+
+
+def build_trace(latency_ms, status=HTTPStatus.OK, endpoint="/catalog/products/{id}"):
+    return RequestTrace(
+        method="GET",
+        endpoint=endpoint,
+        status=status,
+        latency_ms=latency_ms,
+        request_bytes=0,
+        response_bytes=10,
+        started_at=0,
+    )
+
+
+def respond(request):
+    if request.url.path.endswith("missing"):
+        return httpx.Response(HTTPStatus.NOT_FOUND, json={"error": "not found"})
+    return httpx.Response(HTTPStatus.OK, json={"id": "PRD-1234-1234"})
+
+
+@pytest.fixture
+def traced_client():
+    tracer = RequestTracer()
+    client = httpx.Client(base_url="https://example.com", transport=httpx.MockTransport(respond))
+    tracer.instrument(client)
+    return tracer, client
+
+
+@pytest.mark.parametrize(
+    ("path", "expected_template"),
+    [
+        ("/public/v1/catalog/products/PRD-1234-1234", "/public/v1/catalog/products/{id}"),
+        (
+            "/public/v1/catalog/products/PRD-1234-1234/items/ITM-1234-1234-1234-0001",
+            "/public/v1/catalog/products/{id}/items/{id}",
+        ),
+        ("/public/v1/catalog/products", "/public/v1/catalog/products"),
+        (
+            "/public/v1/catalog/price-lists/PRC-1234-1234-1234/items",
+            "/public/v1/catalog/price-lists/{id}/items",
+        ),
+    ],
+)
+def test_endpoint_template(path, expected_template):
+    result = endpoint_template(path)
+
+    assert result == expected_template
+
+
+@pytest.mark.parametrize(
+    ("rank", "expected_value"),
+    [(50, 5), (95, 10), (99, 10), (1, 1)],
+)
+def test_percentile(rank, expected_value):
+    sorted_values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+    result = percentile(sorted_values, rank)
+
+    assert result == expected_value
+
+
+def test_summarize_traces():
+    traces = [build_trace(latency) for latency in range(1, 100)]
+    traces.append(build_trace(1000, status=HTTPStatus.INTERNAL_SERVER_ERROR))
+
+    result = summarize_traces("GET", "/catalog/products/{id}", traces)
+
+    assert (result.method, result.endpoint) == ("GET", "/catalog/products/{id}")
+    assert (result.calls, result.errors, result.total_bytes) == (100, 1, 1000)
+    assert (result.p50_ms, result.p95_ms, result.p99_ms) == (50, 95, 99)
+
+
+def test_instrumented_client_records_traces(traced_client):
+    tracer, client = traced_client
+    client.post("/public/v1/catalog/products/PRD-1234-1234/items", json={"name": "Item"})
+
+    client.get("/public/v1/catalog/products/PRD-1234-1234/missing")  # act
+
+    first_trace, second_trace = tracer.traces
+    assert first_trace.latency_ms >= 0
+    assert first_trace == RequestTrace(
+        method="POST",
+        endpoint="/public/v1/catalog/products/{id}/items",
+        status=HTTPStatus.OK,
+        latency_ms=first_trace.latency_ms,
+        request_bytes=len(b'{"name":"Item"}'),
+        response_bytes=len(b'{"id":"PRD-1234-1234"}'),
+        started_at=first_trace.started_at,
+    )
+    assert second_trace.status == HTTPStatus.NOT_FOUND
+
+
+def test_endpoint_stats_sorted_by_p95():
+    tracer = RequestTracer()
+    tracer.record(build_trace(5, endpoint="/fast"))
+    tracer.record(build_trace(SLOW_LATENCY_MS, endpoint="/slow"))
+    tracer.record(build_trace(10, endpoint="/fast"))
+
+    result = tracer.endpoint_stats()
+
+    assert [stats.endpoint for stats in result] == ["/slow", "/fast"]
+    assert result[1].calls == 2
+
+
+def test_dump_jsonl(tmp_path):
+    tracer = RequestTracer()
+    tracer.record(build_trace(5))
+    tracer.record(build_trace(7, status=HTTPStatus.BAD_REQUEST))
+    trace_file = tmp_path / "nested" / "traces.jsonl"
+
+    tracer.dump_jsonl(trace_file)  # act
+
+    lines = trace_file.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["latency_ms"] for line in lines] == [5, 7]
+    assert json.loads(lines[1])["status"] == HTTPStatus.BAD_REQUEST
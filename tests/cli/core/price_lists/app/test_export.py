@@ -146,3 +146,20 @@ def test_export_price_list_no_success(mocker, active_operations_account):
     assert "Price list export FAILED" in strip_ansi(result.stdout)
     price_list_service_export_mock.assert_called_once()
     item_service_export_spy.assert_not_called()
+
+
+def test_export_temp_workbook_keeps_xlsx_suffix(mocker, active_operations_account):
+    mocker.patch(
+        "cli.core.price_lists.app.export.get_active_account",
+        return_value=active_operations_account,
+    )
+    file_manager_mock = mocker.patch("cli.core.price_lists.app.export.PriceListExcelFileManager")
+    mocker.patch(
+        "cli.core.price_lists.services.PriceListService.export",
+        return_value=ServiceResult(success=False, model=None, stats=PriceListStatsCollector()),
+    )
+
+    result = runner.invoke(app, ["export", "PRC-1234-1234-1234", "-o", "out"], input="y\n")
+
+    assert result.exit_code == 4
+    file_manager_mock.assert_called_once_with("out/PRC-1234-1234-1234.tmp.xlsx")
@@ -0,0 +1,87 @@
+import re
+
+import pytest
+from cli.core.price_lists import app
+from cli.core.price_lists.handlers import PriceListItemExcelFileManager
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def price_list_path(price_list_new_file):
+    return str(price_list_new_file)
+
+
+def strip_ansi(text):
+    return re.sub(r"\x1b\[[0-9;]*m", "", text)
+
+
+def test_reprice_price_lists(price_list_path):
+    result = runner.invoke(
+        app,
+        [
+            "reprice",
+            price_list_path,
+            "--rule",
+            "unitSP = unitPP * fx",
+            "-r",
+            "markup = unitSP / unitPP - 1",
+            "--var",
+            "fx=1.1",
+        ],
+        input="y\n",
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert "changed 4 of 4 price items" in strip_ansi(result.stdout)
+    table = PriceListItemExcelFileManager(price_list_path).read_table()
+    assert list(table.prices["unit_sp"])[:2] == [13.31, 13.53]
+    assert list(table.prices["markup"])[:2] == [0.1, 0.1]
+    assert set(table.texts["action"]) == {"update"}
+
+
+def test_reprice_price_lists_dry_run(price_list_path):
+    original_table = PriceListItemExcelFileManager(price_list_path).read_table()
+
+    result = runner.invoke(app, ["reprice", price_list_path, "-r", "unitSP = unitSP", "--dry-run"])
+
+    assert result.exit_code == 0, result.stdout
+    assert "would change 0 of 4 price items" in strip_ansi(result.stdout)
+    table = PriceListItemExcelFileManager(price_list_path).read_table()
+    assert table.texts == original_table.texts
+
+
+def test_reprice_dry_run_does_not_write(mocker, price_list_path):
+    write_mock = mocker.patch.object(PriceListItemExcelFileManager, "write_table_rows")
+
+    result = runner.invoke(
+        app, ["reprice", price_list_path, "-r", "unitSP = unitPP * 2", "--dry-run"]
+    )
+
+    assert result.exit_code == 0, result.stdout
+    assert "would change 4 of 4 price items" in strip_ansi(result.stdout)
+    write_mock.assert_not_called()
+
+
+def test_reprice_price_lists_invalid_rule(price_list_path):
+    result = runner.invoke(app, ["reprice", price_list_path, "-r", "unitSP = unitPP * fx"])
+
+    assert result.exit_code == 2
+    assert "unknown name 'fx'" in strip_ansi(result.output)
+
+
+def test_reprice_price_lists_invalid_variable(price_list_path):
+    result = runner.invoke(
+        app, ["reprice", price_list_path, "-r", "unitSP = unitPP", "--var", "fx"]
+    )
+
+    assert result.exit_code == 2
+    assert "Invalid price rule 'fx'" in strip_ansi(result.output)
+
+
+def test_reprice_price_lists_not_files_found():
+    result = runner.invoke(app, ["reprice", "some-file.xlsx", "-r", "unitSP = unitPP"])
+
+    assert result.exit_code == 3, result.stdout
+    assert "No files found for provided paths" in strip_ansi(result.stdout)
@@ -1,8 +1,12 @@
+import json
 import re
 
+import pytest
 from cli.core.price_lists import app
+from cli.core.price_lists.app.sync import PriceListSyncer
 from cli.core.price_lists.services import ItemService, PriceListService
 from cli.core.services.service_result import ServiceResult
+from cli.core.services.sync_plan import PlanAction, PlanEntry
 from cli.core.stats import PriceListStatsCollector
 from typer.testing import CliRunner
 
@@ -218,3 +222,70 @@ def test_sync_price_lists_update_error(
     price_list_service_retrieve_mock.assert_called_once()
     price_list_service_update_mock.assert_called_once()
     item_service_update_spy.assert_not_called()
+
+
+def test_sync_price_lists_skip_unchanged(mocker, price_list_new_file):
+    syncer_mock = mocker.patch("cli.core.price_lists.app.sync.PriceListSyncer")
+
+    result = runner.invoke(app, ["sync", "--skip-unchanged", str(price_list_new_file)], input="y\n")
+
+    assert result.exit_code == 0, result.stdout
+    syncer_mock.assert_called_once_with(skip_unchanged=True, is_resumed=False)
+
+
+@pytest.fixture
+def plan_price_list_mock(mocker, active_vendor_account):
+    mocker.patch(
+        "cli.core.price_lists.app.sync.get_active_account",
+        return_value=active_vendor_account,
+        autospec=True,
+    )
+    mocker.patch("cli.core.price_lists.app.sync.create_api_mpt_client_from_account")
+    mocker.patch("cli.core.price_lists.app.sync.sync_plan_renderer.render", return_value="")
+    return mocker.patch("cli.core.price_lists.services.sync_planner.plan_price_list")
+
+
+def test_sync_price_lists_plan(mocker, plan_price_list_mock, price_list_file_path):
+    sync_all_spy = mocker.spy(PriceListSyncer, "sync_all")
+
+    result = runner.invoke(app, ["sync", "--plan", price_list_file_path.as_posix()])
+
+    assert result.exit_code == 0, result.stdout
+    assert "Do you want to sync" not in result.stdout
+    plan_price_list_mock.assert_called_once()
+    sync_all_spy.assert_not_called()
+
+
+def add_conflict(account, mpt_client, file_path, sync_plan):
+    sync_plan.add(PlanEntry(file_path, "General", None, "PRC-1", PlanAction.CONFLICT))
+
+
+def test_sync_price_lists_plan_conflicts(tmp_path, plan_price_list_mock, price_list_file_path):
+    plan_price_list_mock.side_effect = add_conflict
+    plan_path = tmp_path / "plan.json"
+    file_path = str(price_list_file_path)
+
+    result = runner.invoke(app, ["sync", "--plan-file", str(plan_path), file_path])
+
+    assert result.exit_code == 4, result.stdout
+    plan_entries = json.loads(plan_path.read_text(encoding="utf-8"))
+    assert plan_entries == [
+        {
+            "source": file_path,
+            "tab": "General",
+            "coordinate": None,
+            "row_id": "PRC-1",
+            "action": "conflict",
+            "remote_id": None,
+            "detail": "",
+        }
+    ]
+
+
+def test_sync_price_lists_resume(mocker, price_list_new_file):
+    syncer_mock = mocker.patch("cli.core.price_lists.app.sync.PriceListSyncer")
+
+    result = runner.invoke(app, ["sync", "--resume", str(price_list_new_file)], input="y\n")
+
+    assert result.exit_code == 0, result.stdout
+    syncer_mock.assert_called_once_with(skip_unchanged=False, is_resumed=True)
@@ -2,6 +2,8 @@ from cli.core.handlers.excel_file_handler import ExcelFileHandler
 from cli.core.price_lists.constants import (
     PRICELIST_ITEMS_ACTION,
     PRICELIST_ITEMS_FIELDS,
+    PRICELIST_ITEMS_ID,
+    PRICELIST_ITEMS_UNIT_PP,
     TAB_PRICE_ITEMS,
 )
 from cli.core.price_lists.handlers import PriceListItemExcelFileManager
@@ -30,3 +32,20 @@ def test_read_data(mocker, item_data_from_dict):
     get_data_from_horizontal_sheet_mock.assert_called_once_with(
         TAB_PRICE_ITEMS, PRICELIST_ITEMS_FIELDS
     )
+
+
+def test_read_table(mocker):
+    sheet_row = {
+        PRICELIST_ITEMS_ID: {"value": "PRI-3969-9403-0001-0035", "coordinate": "A2"},
+        PRICELIST_ITEMS_UNIT_PP: {"value": 1.0, "coordinate": "J2"},
+    }
+    mocker.patch.object(
+        ExcelFileHandler, "get_data_from_horizontal_sheet", return_value=iter([sheet_row])
+    )
+    excel_manager = PriceListItemExcelFileManager("fake_file.xlsx")
+
+    result = excel_manager.read_table()
+
+    assert result.texts["id"] == ["PRI-3969-9403-0001-0035"]
+    assert result.texts["coordinate"] == ["A2"]
+    assert list(result.prices["unit_pp"]) == [1.0]
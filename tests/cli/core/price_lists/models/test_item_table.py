@@ -0,0 +1,114 @@
+import math
+
+import pytest
+from cli.core.price_lists import constants
+from cli.core.price_lists.models import ItemData, PriceItemTable
+
+
+@pytest.fixture
+def sheet_table(item_file_data):
+    return PriceItemTable.from_sheet_rows([item_file_data])
+
+
+@pytest.fixture
+def remote_table(mpt_item_data):
+    remote_item = {
+        **mpt_item_data,
+        "item": {
+            **mpt_item_data["item"],
+            "externalIds": {"vendor": "AO03.25842.MN"},
+        },
+    }
+    return PriceItemTable.from_json([remote_item])
+
+
+def first_row(table):
+    return {
+        **{column_name: text_column[0] for column_name, text_column in table.texts.items()},
+        **{
+            column_name: None if math.isnan(prices[0]) else prices[0]
+            for column_name, prices in table.prices.items()
+        },
+    }
+
+
+def with_cell(sheet_row, header, cell_value):
+    return {**sheet_row, header: {"value": cell_value, "coordinate": "A1"}}
+
+
+def test_from_sheet_rows(item_file_data):
+    result = PriceItemTable.from_sheet_rows([item_file_data])
+
+    item_data = ItemData.from_dict(item_file_data)
+    assert len(result) == 1
+    assert first_row(result) == {
+        **{column_name: getattr(item_data, column_name) for column_name in result.texts},
+        **{column_name: getattr(item_data, column_name) for column_name in result.prices},
+    }
+
+
+def test_from_json(mpt_item_data):
+    result = PriceItemTable.from_json([mpt_item_data])
+
+    item_data = ItemData.from_json(mpt_item_data)
+    assert first_row(result) == {
+        **{column_name: getattr(item_data, column_name) for column_name in result.texts},
+        **{column_name: getattr(item_data, column_name) for column_name in result.prices},
+    }
+
+
+def test_invalid_rows(item_file_data):
+    table = PriceItemTable.from_sheet_rows([
+        item_file_data,
+        with_cell(item_file_data, constants.PRICELIST_ITEMS_UNIT_PP, -1),
+        with_cell(item_file_data, constants.PRICELIST_ITEMS_UNIT_LP, "1,5"),
+        with_cell(item_file_data, constants.PRICELIST_ITEMS_STATUS, "Retired"),
+        with_cell(item_file_data, constants.PRICELIST_ITEMS_ACTION, "create"),
+    ])
+
+    result = table.invalid_rows()
+
+    assert result == {
+        1: "Unit PP must not be negative: -1.0",
+        2: "Unit LP is not a number: 1,5",
+        3: "Unknown status: Retired",
+        4: "Unknown action: create",
+    }
+
+
+def test_changed_rows(sheet_table, remote_table):
+    sheet_table.prices["unit_lp"][0] = 2.0
+
+    result = sheet_table.changed_rows(remote_table, ("unit_lp", "unit_pp"))
+
+    assert result == [0]
+
+
+def test_changed_rows_same_prices(sheet_table, remote_table):
+    result = sheet_table.changed_rows(remote_table, ("unit_lp", "unit_pp"))
+
+    assert result == []
+
+
+def test_changed_rows_missing_price(sheet_table, remote_table):
+    result = sheet_table.changed_rows(remote_table, ("unit_sp",))
+
+    assert result == [0]
+
+
+def test_changed_rows_skips_unmatched_rows(sheet_table, mpt_item_data):
+    remote_table = PriceItemTable.from_json([mpt_item_data])
+    sheet_table.prices["unit_lp"][0] = 2.0
+
+    result = sheet_table.changed_rows(remote_table)
+
+    assert result == []
+
+
+def test_to_xlsx_columns(item_file_data, sheet_table):
+    result = sheet_table.to_xlsx_columns()
+
+    assert result[constants.PRICELIST_ITEMS_ID] == ["PRI-3969-9403-0001-0035"]
+    assert result[constants.PRICELIST_ITEMS_UNIT_LP] == [1.0]
+    assert result[constants.PRICELIST_ITEMS_UNIT_SP] == [None]
+    assert result[constants.PRICELIST_ITEMS_ACTION] == ["update"]
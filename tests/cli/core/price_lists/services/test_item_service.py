@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 import pytest
 from cli.core.errors import MPTAPIError
 from cli.core.price_lists.api import PriceListItemAPIService
@@ -5,6 +7,7 @@ from cli.core.price_lists.constants import TAB_PRICE_ITEMS
 from cli.core.price_lists.handlers import PriceListItemExcelFileManager
 from cli.core.price_lists.models import ItemData
 from cli.core.price_lists.services import ItemService
+from cli.core.services.checkpoint import SyncCheckpoint
 from cli.core.services.service_context import ServiceContext
 from cli.core.stats import PriceListStatsCollector
 from requests import Response
@@ -108,7 +111,7 @@ def test_retrieve_from_mpt_error(mocker, service_context, item_service):
 
 
 def test_update_item(mocker, service_context, item_service, mpt_item_data, item_data_from_dict):
-    mocker.patch.object(item_data_from_dict, "to_update", return_value=True)
+    mocker.patch.object(type(item_data_from_dict), "to_update", return_value=True)
     mocker.patch.object(
         service_context.file_manager, "read_data", return_value=[item_data_from_dict]
     )
@@ -127,6 +130,21 @@ def test_update_item(mocker, service_context, item_service, mpt_item_data, item_
     stats_spy.assert_called_once_with(TAB_PRICE_ITEMS)
 
 
+def test_update_item_sends_full_payload(mocker, service_context, item_service, item_data_from_dict):
+    mocker.patch.object(type(item_data_from_dict), "to_update", return_value=True)
+    mocker.patch.object(
+        service_context.file_manager, "read_data", return_value=[item_data_from_dict]
+    )
+    partial_item = {"id": "PRI-1234-1234-1234-0001", "unitPP": item_data_from_dict.unit_pp}
+    mocker.patch.object(service_context.api, "list", return_value={"data": [partial_item]})
+    mocker.patch.object(service_context.file_manager, "write_ids")
+    update_mock = mocker.patch.object(service_context.api, "update", return_value=partial_item)
+
+    item_service.update()  # act
+
+    update_mock.assert_called_once_with(partial_item["id"], item_data_from_dict.to_json())
+
+
 def test_update_item_api_list_error(mocker, service_context, item_service):
     mocker.patch.object(
         service_context.api,
@@ -166,7 +184,7 @@ def test_update_item_empty_list_response(mocker, service_context, item_service):
 def test_update_item_api_update_error(
     mocker, service_context, item_service, mpt_item_data, item_data_from_dict
 ):
-    mocker.patch.object(item_data_from_dict, "to_update", return_value=True)
+    mocker.patch.object(type(item_data_from_dict), "to_update", return_value=True)
     mocker.patch.object(
         service_context.file_manager, "read_data", return_value=[item_data_from_dict]
     )
@@ -207,7 +225,7 @@ def test_update_item_skip(
     mocker.patch.object(
         service_context.file_manager, "read_data", return_value=[item_data_from_json]
     )
-    mocker.patch.object(item_data_from_json, "to_update", return_value=False)
+    mocker.patch.object(type(item_data_from_json), "to_update", return_value=False)
     write_ids_mock = mocker.spy(service_context.file_manager, "write_ids")
     api_update_spy = mocker.spy(service_context.api, "update")
     stats_spy = mocker.spy(service_context.stats, "add_skipped")
@@ -218,3 +236,90 @@ def test_update_item_skip(
     write_ids_mock.assert_not_called()
     api_update_spy.assert_not_called()
     stats_spy.assert_called_once_with(TAB_PRICE_ITEMS)
+
+
+@pytest.fixture
+def skip_unchanged_context(mocker, service_context, item_data_from_dict):
+    mocker.patch.object(
+        service_context.file_manager, "read_data", return_value=[item_data_from_dict]
+    )
+    mocker.patch.object(service_context.file_manager, "write_ids")
+    mocker.patch.object(service_context.api, "update")
+    return replace(service_context, skip_unchanged=True)
+
+
+def remote_items_page(remote_item):
+    return {"data": [remote_item], "meta": {"offset": 0, "limit": 100, "total": 1}}
+
+
+def test_update_item_unchanged(mocker, skip_unchanged_context, mpt_item_data, item_data_from_dict):
+    item_data_from_dict.type = "vendor"
+    remote_item = {
+        **mpt_item_data,
+        **item_data_from_dict.to_json(),
+        "item": {"externalIds": {"vendor": item_data_from_dict.vendor_id}},
+    }
+    mocker.patch.object(
+        skip_unchanged_context.api, "list", return_value=remote_items_page(remote_item)
+    )
+
+    result = ItemService(skip_unchanged_context).update()
+
+    assert result.success is True
+    assert skip_unchanged_context.stats.tabs[TAB_PRICE_ITEMS]["unchanged"] == 1
+    skip_unchanged_context.api.list.assert_called_once()
+    skip_unchanged_context.api.update.assert_not_called()
+    skip_unchanged_context.file_manager.write_ids.assert_called_once_with({
+        item_data_from_dict.coordinate: item_data_from_dict.id
+    })
+
+
+def test_update_item_changed(mocker, skip_unchanged_context, mpt_item_data, item_data_from_dict):
+    remote_item = {
+        **mpt_item_data,
+        "unitLP": 2.0,
+        "item": {"externalIds": {"vendor": item_data_from_dict.vendor_id}},
+    }
+    mocker.patch.object(
+        skip_unchanged_context.api, "list", return_value=remote_items_page(remote_item)
+    )
+
+    result = ItemService(skip_unchanged_context).update()
+
+    assert result.success is True
+    assert skip_unchanged_context.stats.tabs[TAB_PRICE_ITEMS]["synced"] == 1
+    skip_unchanged_context.api.list.assert_called_once()
+    skip_unchanged_context.api.update.assert_called_once_with(
+        mpt_item_data["id"], {"unitLP": item_data_from_dict.to_json()["unitLP"]}
+    )
+
+
+def test_update_item_resumes_checkpoint(
+    mocker, tmp_path, service_context, mpt_item_data, item_data_from_dict
+):
+    resumed_item = replace(item_data_from_dict, coordinate="A3")
+    mocker.patch.object(
+        service_context.file_manager,
+        "read_data",
+        return_value=[item_data_from_dict, resumed_item],
+    )
+    mocker.patch.object(service_context.api, "list", return_value={"data": [mpt_item_data]})
+    mocker.patch.object(service_context.api, "update")
+    write_ids_mock = mocker.patch.object(service_context.file_manager, "write_ids")
+    journal_path = tmp_path / "checkpoint.jsonl"
+    SyncCheckpoint(journal_path).record(TAB_PRICE_ITEMS, "A3", "PRI-RESUMED")
+    checkpoint = SyncCheckpoint(journal_path, is_resumed=True)
+
+    result = ItemService(replace(service_context, checkpoint=checkpoint)).update()
+
+    assert not result.errors
+    assert service_context.stats.tabs[TAB_PRICE_ITEMS]["synced"] == 2
+    service_context.api.update.assert_called_once()
+    assert write_ids_mock.call_args_list == [
+        mocker.call({"A3": "PRI-RESUMED"}),
+        mocker.call({item_data_from_dict.coordinate: item_data_from_dict.id}),
+    ]
+    assert SyncCheckpoint(journal_path, is_resumed=True).completed_ids(TAB_PRICE_ITEMS) == {
+        "A3": "PRI-RESUMED",
+        item_data_from_dict.coordinate: item_data_from_dict.id,
+    }
@@ -0,0 +1,79 @@
+import math
+import sys
+from types import MappingProxyType
+
+import pytest
+from cli.core.price_lists.errors import PriceRuleError
+from cli.core.price_lists.services.price_expression import PriceExpression
+
+KNOWN_NAMES = ("unitPP", "unitLP", "fx")
+TOO_LARGE_NUMBER = int(sys.float_info.max) * 2
+ENVIRONMENT = MappingProxyType({
+    "unitPP": [1.0, 2.0],
+    "unitLP": [3.0, 5.0],
+    "fx": 2.0,
+})
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        ("unitPP * fx", [2.0, 4.0]),
+        ("(unitPP + unitLP) / 2", [2.0, 3.5]),
+        ("-unitPP ** 2", [-1.0, -4.0]),
+        ("max(unitPP, unitLP, 4)", [4.0, 5.0]),
+        ("round(unitLP / 3, 2)", [1.0, 1.67]),
+        ("abs(unitPP - unitLP)", [2.0, 3.0]),
+    ],
+)
+def test_evaluate(source, expected):
+    expression = PriceExpression(source, KNOWN_NAMES)
+
+    result = expression.evaluate(ENVIRONMENT, 2)
+
+    assert result == expected
+
+
+def test_evaluate_constant():
+    expression = PriceExpression("fx * 10", KNOWN_NAMES)
+
+    result = expression.evaluate({"fx": 1.5}, 3)
+
+    assert result == [15.0, 15.0, 15.0]
+
+
+def test_evaluate_propagates_nan():
+    expression = PriceExpression("max(unitPP, 1) / unitLP", KNOWN_NAMES)
+    environment = {"unitPP": [math.nan, 2, 3], "unitLP": [1, 0, 3]}
+
+    result = expression.evaluate(environment, 3)
+
+    assert [math.isnan(row_value) for row_value in result] == [True, True, False]
+
+
+def test_names():
+    result = PriceExpression("unitPP * fx", KNOWN_NAMES)
+
+    assert result.names == {"unitPP", "fx"}
+
+
+@pytest.mark.parametrize(
+    ("source", "reason"),
+    [
+        ("unitPP *", "invalid syntax"),
+        ("unitSP * 2", "unknown name 'unitSP'"),
+        ("__import__('os')", "unsupported syntax"),
+        ("unitPP.real", "unsupported syntax"),
+        ("unitPP % 2", "unsupported syntax"),
+        ("True * unitPP", "unsupported syntax"),
+        ("'1' * unitPP", "unsupported syntax"),
+        ("round(unitPP, ndigits=2)", "unsupported syntax"),
+        ("max(unitPP)", "wrong number of arguments to max()"),
+        (f"unitPP * {TOO_LARGE_NUMBER}", "number too large"),
+    ],
+)
+def test_invalid_expression(source, reason):
+    with pytest.raises(PriceRuleError, match=reason) as error:
+        PriceExpression(source, KNOWN_NAMES)
+
+    assert error.value.rule == source
@@ -0,0 +1,94 @@
+import math
+
+import pytest
+from cli.core.price_lists.errors import PriceRuleError
+from cli.core.price_lists.models import PriceItemTable
+from cli.core.price_lists.services.price_rules import PriceRule, parse_variables
+
+
+@pytest.fixture
+def price_table():
+    table = PriceItemTable()
+    table.append_row({"id": "PRI-1"}, {"unit_pp": 10, "unit_sp": 10.8})
+    table.append_row({"id": "PRI-2"}, {"unit_pp": 20, "unit_sp": 1})
+    table.append_row({"id": "PRI-3"}, {"unit_sp": 5})
+    return table
+
+
+def test_parse():
+    result = PriceRule.parse(" unitSP = unitPP * fx ", ["fx"])
+
+    assert result.target == "unitSP"
+    assert result.expression.names == {"unitPP", "fx"}
+
+
+@pytest.mark.parametrize(
+    ("rule", "reason"),
+    [
+        ("unitPP * fx", "expected '<column> = <expression>'"),
+        ("price = unitPP", "unknown price column 'price'"),
+        ("unitSP = unitPP * fx", "unknown name 'fx'"),
+    ],
+)
+def test_parse_invalid(rule, reason):
+    with pytest.raises(PriceRuleError, match=reason) as error:
+        PriceRule.parse(rule)
+
+    assert error.value.rule == rule
+
+
+def test_apply(price_table):
+    rule = PriceRule.parse("unitSP = unitPP * fx", ["fx"])
+
+    result = rule.apply(price_table, {"fx": 1.08}, 2)
+
+    assert result == {1}
+    assert list(price_table.prices["unit_sp"]) == [10.8, 21.6, 5.0]
+
+
+def test_apply_sets_missing_prices(price_table):
+    rule = PriceRule.parse("unitLP = unitSP + 1")
+
+    result = rule.apply(price_table, {}, 0)
+
+    assert result == {0, 1, 2}
+    assert list(price_table.prices["unit_lp"]) == [12.0, 2.0, 6.0]
+
+
+def test_apply_keeps_price_when_not_finite(price_table):
+    rule = PriceRule.parse("unitSP = unitSP / unitPP")
+
+    result = rule.apply(price_table, {}, 2)
+
+    assert result == {0, 1}
+    assert list(price_table.prices["unit_sp"]) == [1.08, 0.05, 5.0]
+
+
+def test_apply_unchanged(price_table):
+    rule = PriceRule.parse("markup = unitPP * 0")
+    rule.apply(price_table, {}, 2)
+
+    result = rule.apply(price_table, {}, 2)
+
+    assert result == set()
+    assert math.isnan(price_table.prices["markup"][2])
+
+
+def test_parse_variables():
+    result = parse_variables(["fx=1.08", " margin = 0.2 "])
+
+    assert result == {"fx": 1.08, "margin": 0.2}
+
+
+@pytest.mark.parametrize(
+    ("assignment", "reason"),
+    [
+        ("fx", "expected '<name>=<number>'"),
+        ("1fx=2", "expected '<name>=<number>'"),
+        ("fx=one", "'one' is not a number"),
+        ("unitPP=2", "'unitPP' is a price column"),
+    ],
+)
+def test_parse_variables_invalid(assignment, reason):
+    with pytest.raises(PriceRuleError, match=reason):
+        parse_variables([assignment])
@@ -0,0 +1,119 @@
+import pytest
+from cli.core.errors import MPTAPIError
+from cli.core.price_lists.api import PriceListItemAPIService
+from cli.core.price_lists.constants import TAB_GENERAL, TAB_PRICE_ITEMS
+from cli.core.price_lists.handlers import PriceListItemExcelFileManager
+from cli.core.price_lists.models import ItemData
+from cli.core.price_lists.services.sync_planner import plan_price_items, plan_price_list
+from cli.core.services.service_context import ServiceContext
+from cli.core.services.sync_plan import PlanAction, SyncPlan
+from cli.core.stats import PriceListStatsCollector
+
+
+@pytest.fixture
+def service_context(
+    mocker, mock_mpt_api_client, price_list_file_path, active_vendor_account, item_data_from_dict
+):
+    service_context = ServiceContext(
+        account=active_vendor_account,
+        api=PriceListItemAPIService(mock_mpt_api_client, item_data_from_dict.id),
+        data_model=ItemData,
+        file_manager=PriceListItemExcelFileManager(price_list_file_path),
+        stats=PriceListStatsCollector(),
+    )
+    mocker.patch.object(
+        service_context.file_manager, "read_data", return_value=[item_data_from_dict]
+    )
+    mocker.patch.object(service_context.api, "list")
+    return service_context
+
+
+@pytest.fixture
+def price_list_api_mock(mocker):
+    mocker.patch(
+        "cli.core.price_lists.services.sync_planner.PriceListExcelFileManager"
+    ).return_value.read_data.return_value.id = "PRC-1"
+    return mocker.patch("cli.core.price_lists.services.sync_planner.PriceListAPIService")
+
+
+def remote_items_page(remote_item):
+    return {"data": [remote_item], "meta": {"offset": 0, "limit": 100, "total": 1}}
+
+
+def test_plan_price_items_unchanged(service_context, mpt_item_data, item_data_from_dict):
+    item_data_from_dict.type = "vendor"
+    service_context.api.list.return_value = remote_items_page({
+        **mpt_item_data,
+        **item_data_from_dict.to_json(),
+        "item": {"externalIds": {"vendor": item_data_from_dict.vendor_id}},
+    })
+    sync_plan = SyncPlan()
+
+    plan_price_items(service_context, sync_plan, "price_list.xlsx", is_new_price_list=False)  # act
+
+    plan_entry = sync_plan.entries[0]
+    assert plan_entry.action == PlanAction.UNCHANGED
+    assert plan_entry.remote_id == mpt_item_data["id"]
+    service_context.api.list.assert_called_once()
+
+
+def test_plan_price_items_not_found(service_context):
+    service_context.api.list.return_value = remote_items_page({
+        "id": "PRI-1",
+        "item": {"externalIds": {"vendor": "other"}},
+    })
+    sync_plan = SyncPlan()
+
+    plan_price_items(service_context, sync_plan, "price_list.xlsx", is_new_price_list=False)  # act
+
+    plan_entry = sync_plan.entries[0]
+    assert plan_entry.action == PlanAction.CONFLICT
+    assert plan_entry.tab == TAB_PRICE_ITEMS
+
+
+def test_plan_price_items_new_price_list(service_context):
+    sync_plan = SyncPlan()
+
+    plan_price_items(service_context, sync_plan, "price_list.xlsx", is_new_price_list=True)  # act
+
+    assert sync_plan.entries[0].action == PlanAction.UPDATE
+    service_context.api.list.assert_not_called()
+
+
+def test_plan_price_items_fetch_error(service_context):
+    service_context.api.list.side_effect = MPTAPIError("API Error", "Error listing items")
+    sync_plan = SyncPlan()
+
+    plan_price_items(service_context, sync_plan, "price_list.xlsx", is_new_price_list=False)  # act
+
+    assert len(sync_plan.entries) == 1
+    assert sync_plan.entries[0].action == PlanAction.CONFLICT
+    service_context.file_manager.read_data.assert_not_called()
+
+
+def test_plan_price_list_new(
+    mocker, price_list_api_mock, active_vendor_account, mock_mpt_api_client
+):
+    price_list_api_mock.return_value.exists.return_value = False
+    plan_items_mock = mocker.patch("cli.core.price_lists.services.sync_planner.plan_price_items")
+    sync_plan = SyncPlan()
+
+    plan_price_list(active_vendor_account, mock_mpt_api_client, "price_list.xlsx", sync_plan)  # act
+
+    plan_entry = sync_plan.entries[0]
+    assert plan_entry.tab == TAB_GENERAL
+    assert plan_entry.action == PlanAction.CREATE
+    assert plan_items_mock.call_args.kwargs == {"is_new_price_list": True}
+
+
+def test_plan_price_list_exists_error(
+    mocker, price_list_api_mock, active_vendor_account, mock_mpt_api_client
+):
+    price_list_api_mock.return_value.exists.side_effect = MPTAPIError("API Error", "Error")
+    plan_items_mock = mocker.patch("cli.core.price_lists.services.sync_planner.plan_price_items")
+    sync_plan = SyncPlan()
+
+    plan_price_list(active_vendor_account, mock_mpt_api_client, "price_list.xlsx", sync_plan)  # act
+
+    assert sync_plan.entries[0].action == PlanAction.CONFLICT
+    plan_items_mock.assert_not_called()
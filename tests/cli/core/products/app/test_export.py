@@ -24,7 +24,11 @@ EXPECTED_PRODUCT_SHEETS = (
     "Templates",
 )
 EXPECTED_PRODUCT_MAIN_SHEET_VALUES = (
-    ("General", 12, (("A1", "General Information"), ("A2", "Product ID"), ("B2", PRODUCT_ID))),
+    (
+        "General",
+        13,
+        (("A1", "General Information"), ("A2", "Product ID"), ("B2", PRODUCT_ID), ("A13", "Icon")),
+    ),
     (
         "Settings",
         12,
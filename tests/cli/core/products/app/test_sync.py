@@ -1,10 +1,22 @@
+import json
+
 import pytest
+import typer
+from cli.core.errors import MPTAPIError
 from cli.core.models import DataCollectionModel
 from cli.core.products import app as product_app
+from cli.core.products.api import ProductAPIService
+from cli.core.products.app.sync import ProductSyncer
+from cli.core.products.constants import TAB_GENERAL
+from cli.core.products.containers import ProductContainer
+from cli.core.services.checkpoint import SyncCheckpoint
 from cli.core.services.service_result import ServiceResult
+from cli.core.services.sync_plan import PlanAction, PlanEntry
 from cli.core.stats import ProductStatsCollector
 from typer.testing import CliRunner
 
+from tests.workloads import ProductWorkload, generate_product_workbook
+
 runner = CliRunner()
 
 
@@ -194,6 +206,8 @@ def test_sync_product_no_product_runs_create_flow(
     product_container_mock.product_service().create.assert_called_once()
     product_container_mock.item_service().create.assert_called_once()
     product_container_mock.template_service().create.assert_called_once()
+    assert product_container_mock.workbook_id_remapper().add.call_count == 3
+    assert product_container_mock.workbook_id_remapper().apply.call_count == 2
     assert add_collection_spy.call_count == 4
     render_mock.assert_called_once()
 
@@ -217,3 +231,121 @@ def test_sync_aborts_when_product_create_fails(mocker, product_new_file, product
     product_container_mock.product_service().create.assert_called_once()
     product_container_mock.item_service().create.assert_not_called()
     product_container_mock.item_group_service().create.assert_not_called()
+
+
+def test_sync_product_skip_unchanged(mocker):
+    container_mock = mocker.patch("cli.core.products.app.sync.ProductContainer")
+    mocker.patch("cli.core.products.app.sync.ProductSyncer")
+
+    result = runner.invoke(product_app, ["sync", "--skip-unchanged", "fake_file.xlsx"])
+
+    assert result.exit_code == 0, result.stdout
+    container_mock.assert_called_once_with(file_path="fake_file.xlsx", skip_unchanged=True)
+
+
+@pytest.fixture
+def product_plan_container(mocker, product_container_mock, existing_product_sync):
+    product_service = product_container_mock.product_service()
+    product_service.file_manager = mocker.Mock()
+    product_service.file_manager.read_data.return_value = (
+        product_service.retrieve.return_value.model
+    )
+    mocker.patch("cli.core.products.app.sync.sync_plan_renderer.render", return_value="")
+    return product_container_mock
+
+
+def test_sync_product_plan(mocker, product_plan_container):
+    plan_mock = mocker.patch("cli.core.products.app.sync.plan_related_components")
+
+    result = runner.invoke(product_app, ["sync", "--plan", "fake_file.xlsx"])
+
+    assert result.exit_code == 0, result.stdout
+    assert plan_mock.call_count == 9
+    product_plan_container.product_service().update.assert_not_called()
+    product_plan_container.item_service().update.assert_not_called()
+
+
+def add_conflict(service, sync_plan, source):
+    sync_plan.add(PlanEntry(source, "Items", "A2", "ITM-1", PlanAction.CONFLICT, detail="Missing"))
+
+
+def test_sync_product_plan_file_with_conflicts(mocker, tmp_path, product_plan_container):
+    mocker.patch("cli.core.products.app.sync.plan_related_components", side_effect=add_conflict)
+    plan_path = tmp_path / "plan.json"
+
+    result = runner.invoke(product_app, ["sync", "--plan-file", str(plan_path), "fake_file.xlsx"])
+
+    assert result.exit_code == 3, result.stdout
+    plan_entries = json.loads(plan_path.read_text(encoding="utf-8"))
+    assert plan_entries[0]["action"] == "update"
+    assert plan_entries[1]["action"] == "conflict"
+    product_plan_container.product_service().update.assert_not_called()
+
+
+def test_sync_product_resume(mocker):
+    mocker.patch("cli.core.products.app.sync.ProductContainer")
+    syncer_mock = mocker.patch("cli.core.products.app.sync.ProductSyncer")
+
+    runner.invoke(product_app, ["sync", "--resume", "fake_file.xlsx"])  # act
+
+    assert syncer_mock.call_args.kwargs == {"is_resumed": True}
+    syncer_mock.return_value.sync.assert_called_once()
+
+
+def test_sync_product_update_keeps_checkpoint(mocker, tmp_path, product_update_container):
+    mocker.patch.object(ProductStatsCollector, "has_errors", new=True)
+    product_path = tmp_path / "PRD-1234.xlsx"
+
+    result = runner.invoke(product_app, ["sync", str(product_path)], input="y\n")
+
+    assert result.exit_code == 3, result.stdout
+    assert "Sync checkpoint has been kept" in result.stdout
+    assert product_update_container.checkpoint().journal_path.name == (
+        "PRD-1234.xlsx.checkpoint.jsonl"
+    )
+
+
+def test_sync_product_resumes_create(tmp_path, product_update_container):
+    product_path = tmp_path / "PRD-1234.xlsx"
+    SyncCheckpoint.for_workbook(str(product_path)).record(TAB_GENERAL, "B3", "PRD-1234")
+
+    result = runner.invoke(product_app, ["sync", "--resume", str(product_path)], input="y\n")
+
+    assert result.exception is None, result.stdout
+    assert "Do you want to continue the creation of product" in result.stdout
+    product_update_container.product_service().create.assert_called_once()
+    product_update_container.item_service().create.assert_called_once()
+    product_update_container.product_service().update.assert_not_called()
+
+
+def run_product_sync(product_path, account_container, *, is_resumed):
+    container = ProductContainer(file_path=product_path, stats=ProductStatsCollector())
+    container.account_container.override(account_container)
+    ProductSyncer(container, is_resumed=is_resumed).sync(
+        product_path, is_dry_run=False, force_create=False
+    )
+
+
+@pytest.fixture
+def crashed_product_create(mocker, tmp_path, account_container_mock):
+    product_path = str(generate_product_workbook(tmp_path / "product.xlsx", ProductWorkload()))
+    mocker.patch.object(
+        ProductAPIService, "exists", side_effect=lambda query: query["id"] == "PRD-5678"
+    )
+    mocker.patch.object(ProductAPIService, "post", return_value={"id": "PRD-5678"})
+    mocker.patch.object(
+        ProductAPIService, "update", side_effect=MPTAPIError("API Error", "Settings failed")
+    )
+    mocker.patch("cli.core.products.app.sync.typer.confirm")
+    with pytest.raises(typer.Exit):
+        run_product_sync(product_path, account_container_mock, is_resumed=False)
+    return product_path
+
+
+def test_sync_product_resumes_created_product(crashed_product_create, account_container_mock):
+    with pytest.raises(typer.Exit):
+        run_product_sync(crashed_product_create, account_container_mock, is_resumed=True)
+
+    assert "continue the creation of product PRD-5678" in typer.confirm.call_args.args[0]
+    ProductAPIService.post.assert_called_once()
+    assert ProductAPIService.update.call_args.args[0] == "PRD-5678/settings"
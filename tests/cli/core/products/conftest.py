@@ -15,6 +15,7 @@ from cli.core.products.services import (
     ParametersService,
     ProductService,
     TemplateService,
+    WorkbookIdRemapper,
 )
 from freezegun import freeze_time
 from requests import Response
@@ -38,6 +39,7 @@ def product_container_mock(mocker, account_container_mock):
     for service_provider in parameter_service_providers:
         service_provider.override(MagicMock(ParametersService))
     container.template_service.override(MagicMock(TemplateService))
+    container.workbook_id_remapper.override(MagicMock(WorkbookIdRemapper))
     export_mock = mocker.patch("cli.core.products.app.export.ProductContainer", autospec=True)
     export_mock.return_value = container
     sync_mock = mocker.patch("cli.core.products.app.sync.ProductContainer", autospec=True)
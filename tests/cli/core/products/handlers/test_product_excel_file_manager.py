@@ -1,6 +1,7 @@
 import pytest
 from cli.core.products.constants import (
     GENERAL_FIELDS,
+    GENERAL_ICON,
     TAB_GENERAL,
 )
 from cli.core.products.handlers import ProductExcelFileManager
@@ -26,3 +27,18 @@ def test_read_data(mocker, file_manager, product_data_from_dict):
     assert result == product_data_from_dict
     get_data_from_vertical_sheet_mock.assert_called_once_with(TAB_GENERAL, GENERAL_FIELDS)
     product_from_dict_mock.assert_called_once_with(mock_data)
+
+
+def test_read_data_icon_relative_to_file(mocker, tmp_path, product_file_data):
+    icon_path = tmp_path / "icons" / "icon.png"
+    icon_path.parent.mkdir()
+    icon_path.write_bytes(b"fake icon")
+    product_file_data[GENERAL_ICON] = {"value": "icons/icon.png", "coordinate": "B13"}
+    file_manager = ProductExcelFileManager(str(tmp_path / "PRD-1234-1234.xlsx"))
+    mocker.patch.object(
+        file_manager.file_handler, "get_data_from_vertical_sheet", return_value=product_file_data
+    )
+
+    result = file_manager.read_data()
+
+    assert result.icon == b"fake icon"
@@ -81,3 +81,11 @@ def test_item_group_to_xlsx(date_factory, item_group_data_from_json):
         product_constants.ITEMS_GROUPS_CREATED: date_factory("2024-03-19"),
         product_constants.ITEMS_GROUPS_MODIFIED: None,
     }
+
+
+def test_item_group_assign_product(item_group_data_from_dict):
+    json_before = item_group_data_from_dict.to_json()
+
+    item_group_data_from_dict.assign_product("PRD-0000-0001")  # act
+
+    assert item_group_data_from_dict.to_json() == json_before
@@ -77,6 +77,12 @@ def test_item_data_to_json(item_data_from_dict):
     }
 
 
+def test_item_data_assign_product(item_data_from_dict):
+    item_data_from_dict.assign_product("PRD-0000-0001")  # act
+
+    assert item_data_from_dict.to_json()["product"] == {"id": "PRD-0000-0001"}
+
+
 @pytest.mark.parametrize(
     ("action", "attr"),
     [
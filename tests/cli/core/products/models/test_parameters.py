@@ -35,6 +35,14 @@ def test_parameters_data_from_dict(parameters_file_data):
     } == expected_data
 
 
+@pytest.mark.parametrize("options", ["{invalid", None])
+def test_parameters_data_from_dict_invalid_json(options, parameters_file_data):
+    parameters_file_data[product_constants.PARAMETERS_OPTIONS]["value"] = options
+
+    with pytest.raises(ValueError, match="Invalid JSON in Options"):
+        AgreementParametersData.from_dict(parameters_file_data)
+
+
 def test_parameters_data_from_json(date_factory, mpt_agreement_parameter_data):
     result = AgreementParametersData.from_json(mpt_agreement_parameter_data)
 
@@ -200,7 +208,7 @@ def test_parameters_data_to_xlsx(date_factory, parameters_data_from_json):
 )
 def test_group_property(is_order_request, expected_result, mocker, parameters_data_from_dict):
     mocker.patch.object(
-        parameters_data_from_dict, "is_order_request", return_value=is_order_request
+        type(parameters_data_from_dict), "is_order_request", return_value=is_order_request
     )
 
     result = parameters_data_from_dict.group
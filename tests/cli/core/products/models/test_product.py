@@ -1,6 +1,14 @@
+from pathlib import Path
+
 from cli.core.products import constants as product_constants
 from cli.core.products.models import DataActionEnum
-from cli.core.products.models.product import ProductData, SettingsData, SettingsRecords
+from cli.core.products.models.product import (
+    DEFAULT_ICON_PATH,
+    ProductData,
+    SettingsData,
+    SettingsRecords,
+    load_icon,
+)
 from freezegun import freeze_time
 
 SETTINGS_RECORDS_COUNT = 11
@@ -22,6 +30,45 @@ def test_product_data_from_dict(product_file_data):
     } == expected_data
 
 
+def test_product_data_from_dict_default_icon(product_file_data):
+    result = ProductData.from_dict(product_file_data)
+
+    assert result.icon == DEFAULT_ICON_PATH.read_bytes()
+
+
+def test_product_data_from_dict_icon(tmp_path, product_file_data):
+    icon_path = tmp_path / "icon.png"
+    icon_path.write_bytes(b"fake icon")
+    product_file_data[product_constants.GENERAL_ICON] = {"value": str(icon_path)}
+
+    result = ProductData.from_dict(product_file_data)
+
+    assert result.icon == b"fake icon"
+
+
+def test_load_icon_reads_file_once(mocker, tmp_path):
+    icon_path = tmp_path / "icon.png"
+    icon_path.write_bytes(b"fake icon")
+    read_bytes_spy = mocker.spy(Path, "read_bytes")
+    first_icon = load_icon(icon_path)
+
+    result = load_icon(icon_path)
+
+    assert result is first_icon
+    read_bytes_spy.assert_called_once_with(icon_path)
+
+
+def test_load_icon_keeps_changed_file(tmp_path):
+    icon_path = tmp_path / "icon.png"
+    icon_path.write_bytes(b"fake icon")
+    load_icon(icon_path)
+    icon_path.write_bytes(b"new fake icon")
+
+    result = load_icon(icon_path)
+
+    assert result == b"fake icon"
+
+
 def test_product_data_from_json(date_factory, mpt_product_data):
     with freeze_time("2025-05-30"):
         result = ProductData.from_json(mpt_product_data)
@@ -160,6 +207,18 @@ def test_setting_item_from_dict(settings_file_data):
     assert result.action == DataActionEnum.DELETE
 
 
+def test_setting_item_from_dict_without_action():
+    result = SettingsRecords.from_dict({
+        product_constants.SETTINGS_SETTING: {
+            "value": "Purchase order validation (query)",
+            "coordinate": "A10",
+        },
+        product_constants.SETTINGS_VALUE: {"value": "Off", "coordinate": "B10"},
+    })
+
+    assert result.action == DataActionEnum.SKIP
+
+
 def test_setting_item_from_json(mpt_product_data):
     result = SettingsRecords.from_json({"name": "Product requests", "value": False})
 
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import pytest
+from cli.core.handlers.excel_file_handler import ExcelFileHandler
+from cli.core.products.constants import (
+    ITEMS_TERMS_MODEL,
+    ITEMS_TERMS_PERIOD,
+    TAB_AGREEMENT_PARAMETERS,
+    TAB_ITEMS,
+    TAB_TEMPLATES,
+)
+from cli.core.products.services.definition_validator import find_definition_errors
+from openpyxl import load_workbook
+
+
+@pytest.fixture
+def definition_file(product_new_file):
+    workbook = load_workbook(product_new_file)
+    items_sheet = workbook[TAB_ITEMS]
+    items_sheet.delete_rows(4, items_sheet.max_row)
+    # The items of the product file predate the billing model and period columns.
+    items_sheet["G1"] = ITEMS_TERMS_PERIOD
+    terms_column = items_sheet.max_column + 1
+    items_sheet.cell(row=1, column=terms_column, value=ITEMS_TERMS_MODEL)
+    items_sheet.cell(row=2, column=terms_column, value="usage")
+    items_sheet.cell(row=3, column=terms_column, value="usage")
+    workbook.save(product_new_file)
+    return product_new_file
+
+
+def set_cells(file_path, sheet_name, cell_values):
+    workbook = load_workbook(file_path)
+    for coordinate, cell_value in cell_values.items():
+        workbook[sheet_name][coordinate] = cell_value
+    workbook.save(file_path)
+
+
+def test_find_definition_errors_valid(definition_file):
+    result = list(find_definition_errors(ExcelFileHandler(Path(definition_file))))
+
+    assert result == []
+
+
+def test_find_definition_errors(definition_file):
+    set_cells(definition_file, TAB_ITEMS, {"S3": "per-seat"})
+    set_cells(definition_file, TAB_AGREEMENT_PARAMETERS, {"J2": "{invalid"})
+    set_cells(definition_file, TAB_TEMPLATES, {"C3": "udpate"})
+
+    result = list(find_definition_errors(ExcelFileHandler(Path(definition_file))))
+
+    assert result == [
+        (
+            TAB_AGREEMENT_PARAMETERS,
+            "A2",
+            (
+                "Invalid JSON in Options: Expecting property name enclosed in double quotes: "
+                "line 1 column 2 (char 1)"
+            ),
+        ),
+        (TAB_TEMPLATES, "A3", "'udpate' is not a valid DataActionEnum"),
+        (TAB_ITEMS, "A3", "'per-seat' is not a valid ItemTermsModelEnum"),
+    ]
+
+
+def test_find_definition_errors_item_action(definition_file):
+    set_cells(definition_file, TAB_ITEMS, {"C2": "archive"})
+
+    result = list(find_definition_errors(ExcelFileHandler(Path(definition_file))))
+
+    assert result == [(TAB_ITEMS, "A2", "Invalid action: archive")]
+
+
+def test_find_definition_errors_missing_tabs(definition_file):
+    workbook = load_workbook(definition_file)
+    del workbook[TAB_TEMPLATES]  # noqa: WPS420
+    workbook.save(definition_file)
+    set_cells(definition_file, TAB_ITEMS, {"S2": "per-seat"})
+
+    result = list(find_definition_errors(ExcelFileHandler(Path(definition_file))))
+
+    assert result == [(TAB_ITEMS, "A2", "'per-seat' is not a valid ItemTermsModelEnum")]
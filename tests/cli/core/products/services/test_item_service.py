@@ -1,6 +1,7 @@
+from dataclasses import replace
+
 import pytest
 from cli.core.errors import MPTAPIError
-from cli.core.models import DataCollectionModel
 from cli.core.mpt.models import Uom
 from cli.core.products.api import ItemAPIService
 from cli.core.products.constants import TAB_ITEMS
@@ -154,51 +155,6 @@ def test_update_item_publish(
     stats_spy.assert_called_once_with(TAB_ITEMS)
 
 
-def test_set_new_item_groups(
-    mocker, service_context, item_service, item_data_from_dict, item_group_data_from_dict
-):
-    read_data_mock = mocker.patch.object(
-        service_context.file_manager, "read_data", return_value=[item_data_from_dict]
-    )
-    param_group = DataCollectionModel(collection={"old_group_id": item_group_data_from_dict})
-    item_data_from_dict.group_id = "old_group_id"
-    write_ids_mock = mocker.patch.object(service_context.file_manager, "write_ids")
-
-    item_service.set_new_item_groups(param_group)  # act
-
-    read_data_mock.assert_called_once()
-    write_ids_mock.assert_called_once_with({
-        item_data_from_dict.group_coordinate: item_group_data_from_dict.id
-    })
-
-
-def test_set_new_item_groups_error(
-    mocker, service_context, item_data_from_dict, item_group_data_from_dict
-):
-    read_data_mock = mocker.patch.object(
-        service_context.file_manager, "read_data", return_value=[item_data_from_dict]
-    )
-    param_group = DataCollectionModel(collection={"not_found_it": item_group_data_from_dict})
-    write_ids_spy = mocker.spy(service_context.file_manager, "write_ids")
-    service = ItemService(service_context)
-
-    service.set_new_item_groups(param_group)  # act
-
-    read_data_mock.assert_called_once()
-    write_ids_spy.assert_not_called()
-
-
-def test_set_new_parameter_groups_empty(mocker, service_context):
-    read_data_spy = mocker.spy(service_context.file_manager, "read_data")
-    write_ids_spy = mocker.spy(service_context.file_manager, "write_ids")
-    service = ItemService(service_context)
-
-    service.set_new_item_groups(DataCollectionModel(collection={}))  # act
-
-    read_data_spy.assert_not_called()
-    write_ids_spy.assert_not_called()
-
-
 def test_set_export_params(service_context, item_data_from_dict):
     service = ItemService(service_context)
 
@@ -232,3 +188,63 @@ def test_prepare_data_model_no_unit_name(service_context, item_data_from_dict):
         service.prepare_data_model_to_create(item_data_from_dict)
 
     assert "Unit of measure name is required" in str(error.value)
+
+
+@pytest.fixture
+def skip_unchanged_context(mocker, service_context, item_data_from_dict):
+    mocker.patch.object(
+        service_context.file_manager, "read_data", return_value=[item_data_from_dict]
+    )
+    mocker.patch.object(service_context.file_manager, "write_ids")
+    mocker.patch.object(service_context.api, "update")
+    return replace(service_context, skip_unchanged=True)
+
+
+def remote_items_page(remote_item):
+    return {"data": [remote_item], "meta": {"offset": 0, "limit": 100, "total": 1}}
+
+
+def test_update_item_unchanged(mocker, skip_unchanged_context, item_data_from_dict, mpt_item_data):
+    item_data_from_dict.product_id = skip_unchanged_context.api.resource_id
+    remote_item = {
+        **mpt_item_data,
+        **item_data_from_dict.to_json(),
+        "externalIds": {"vendor": item_data_from_dict.vendor_id},
+    }
+    mocker.patch.object(
+        skip_unchanged_context.api, "list", return_value=remote_items_page(remote_item)
+    )
+
+    result = ItemService(skip_unchanged_context).update()
+
+    assert result.success is True
+    assert skip_unchanged_context.stats.tabs["Items"]["unchanged"] == 1
+    skip_unchanged_context.api.list.assert_called_once()
+    skip_unchanged_context.api.update.assert_not_called()
+    skip_unchanged_context.file_manager.write_ids.assert_called_once_with({
+        item_data_from_dict.coordinate: mpt_item_data["id"]
+    })
+
+
+def test_update_item_uses_prefetched_id(
+    mocker, skip_unchanged_context, item_data_from_dict, mpt_item_data
+):
+    remote_item = {**mpt_item_data, "externalIds": {"vendor": item_data_from_dict.vendor_id}}
+    mocker.patch.object(
+        skip_unchanged_context.api, "list", return_value=remote_items_page(remote_item)
+    )
+    unchanged_keys = {"unit", "externalIds"}
+
+    result = ItemService(skip_unchanged_context).update()
+
+    assert result.success is True
+    assert skip_unchanged_context.stats.tabs["Items"]["synced"] == 1
+    skip_unchanged_context.api.list.assert_called_once()
+    skip_unchanged_context.api.update.assert_called_once_with(
+        mpt_item_data["id"],
+        {
+            key: json_value
+            for key, json_value in item_data_from_dict.to_json().items()
+            if key not in unchanged_keys
+        },
+    )
@@ -1,13 +1,16 @@
+from dataclasses import replace
 from unittest.mock import Mock, call
 
 import pytest
 from cli.core.errors import MPTAPIError
 from cli.core.handlers.errors import RequiredFieldsError, RequiredSheetsError
+from cli.core.mpt.governor import GovernorSettings, RequestGovernor
 from cli.core.products.api import ProductAPIService
 from cli.core.products.constants import TAB_GENERAL
 from cli.core.products.handlers import ProductExcelFileManager, SettingsExcelFileManager
 from cli.core.products.models import ProductData
 from cli.core.products.services import ProductService
+from cli.core.services.checkpoint import SyncCheckpoint
 from cli.core.services.service_context import ServiceContext
 from cli.core.stats import ProductStatsCollector
 from freezegun import freeze_time
@@ -55,6 +58,7 @@ def product_create_update_error_flow(
         "update",
         side_effect=MPTAPIError("API Error", "Error creating product"),
     )
+    mocker.patch.object(service_context.file_manager, "write_ids")
     mocker.patch.object(service_context.file_manager, "write_error")
     mocker.spy(service_context.stats, "add_error")
     return service_context
@@ -100,6 +104,37 @@ def test_create(product_create_flow, product_service, product_data_from_dict):
     product_create_flow.api.update.assert_called_once()
 
 
+def test_create_resumes_checkpoint(tmp_path, product_create_flow, product_data_from_dict):
+    journal_path = tmp_path / "checkpoint.jsonl"
+    SyncCheckpoint(journal_path).record(TAB_GENERAL, "B3", "PRD-5678")
+    checkpoint = SyncCheckpoint(journal_path, is_resumed=True)
+    product_service = ProductService(replace(product_create_flow, checkpoint=checkpoint))
+
+    result = product_service.create()
+
+    assert result.model.id == "PRD-5678"
+    product_create_flow.file_manager.write_ids.assert_called_once_with({"B3": "PRD-5678"})
+    product_create_flow.stats.add_synced.assert_called_once_with(TAB_GENERAL, 1)
+    product_create_flow.api.post.assert_not_called()
+    product_create_flow.api.update.assert_called_once_with(
+        "PRD-5678/settings", json_payload=product_data_from_dict.settings.to_json()
+    )
+
+
+def test_create_journals_product_before_settings(
+    tmp_path, product_create_update_error_flow, mpt_product_data
+):
+    checkpoint = SyncCheckpoint(tmp_path / "checkpoint.jsonl")
+    product_service = ProductService(
+        replace(product_create_update_error_flow, checkpoint=checkpoint)
+    )
+
+    product_service.create()  # act
+
+    resumed_checkpoint = SyncCheckpoint(checkpoint.journal_path, is_resumed=True)
+    assert resumed_checkpoint.completed_ids(TAB_GENERAL) == {"B3": mpt_product_data["id"]}
+
+
 def test_create_post_error(mocker, service_context, product_service, product_data_from_dict):
     read_data_mock = mocker.patch.object(
         service_context.file_manager, "read_data", return_value=product_data_from_dict
@@ -123,6 +158,58 @@ def test_create_post_error(mocker, service_context, product_service, product_dat
     file_handler_write_mock.assert_called_once()
 
 
+@pytest.fixture
+def request_governor(mocker):
+    return mocker.Mock(spec=RequestGovernor, settings=GovernorSettings(max_retries=2))
+
+
+@pytest.fixture
+def retrying_product_service(product_create_flow, request_governor):
+    return ProductService(replace(product_create_flow, request_governor=request_governor))
+
+
+@pytest.fixture
+def transient_error():
+    return MPTAPIError("Connection reset", "No response", is_connection_error=True)
+
+
+def test_create_retries_transient_error(
+    mocker, request_governor, retrying_product_service, transient_error, mpt_product_data
+):
+    api = retrying_product_service.api
+    post_mock = mocker.patch.object(api, "post", side_effect=[transient_error, mpt_product_data])
+    same_name_products = {"data": [{"id": "PRD-0000-0001"}]}
+    list_mock = mocker.patch.object(api, "list", return_value=same_name_products)
+
+    result = retrying_product_service.create()
+
+    assert result.success
+    assert result.model.id == mpt_product_data["id"]
+    assert post_mock.call_count == 2
+    assert list_mock.call_count == 2
+    request_governor.wait_before_retry.assert_called_once_with(0, None)
+
+
+def test_create_finds_product_made_before_error(
+    mocker, product_create_flow, retrying_product_service, transient_error
+):
+    post_mock = mocker.patch.object(product_create_flow.api, "post", side_effect=transient_error)
+    mocker.patch.object(
+        product_create_flow.api,
+        "list",
+        side_effect=[
+            {"data": [{"id": "PRD-0000-0001"}]},
+            {"data": [{"id": "PRD-0000-0001"}, {"id": "PRD-0000-0002"}]},
+        ],
+    )
+
+    result = retrying_product_service.create()
+
+    assert result.success
+    assert result.model.id == "PRD-0000-0002"
+    post_mock.assert_called_once()
+
+
 def test_create_update_error(product_create_update_error_flow, product_service):
 
     result = product_service.create()
@@ -167,12 +254,41 @@ def test_export_mpt_error(mocker, service_context, product_service):
 def test_validate_definition(mocker, service_context, product_service):
     mocker.patch.object(service_context.file_manager, "check_required_tabs")
     mocker.patch.object(service_context.file_manager, "check_required_fields_by_section")
+    find_definition_errors_mock = mocker.patch(
+        "cli.core.products.services.product_service.find_definition_errors", return_value=[]
+    )
 
     result = product_service.validate_definition()
 
     assert result.success is True
     assert result.errors == []
     assert result.model is None
+    find_definition_errors_mock.assert_called_once_with(service_context.file_manager.file_handler)
+
+
+def test_validate_definition_invalid_rows(mocker, service_context, product_service):
+    mocker.patch.object(service_context.file_manager, "check_required_tabs")
+    mocker.patch.object(service_context.file_manager, "check_required_fields_by_section")
+    mocker.patch.object(
+        service_context.file_manager, "find_row_errors", return_value=[("B3", "Invalid ID")]
+    )
+    mocker.patch(
+        "cli.core.products.services.product_service.find_definition_errors",
+        return_value=[("Items", "A3", "'fake' is not a valid ItemTermsModelEnum")],
+    )
+    stats_spy = mocker.spy(service_context.stats.errors, "add_msg")
+
+    result = product_service.validate_definition()
+
+    assert not result.success
+    assert result.errors == [
+        "General B3: Invalid ID",
+        "Items A3: 'fake' is not a valid ItemTermsModelEnum",
+    ]
+    stats_spy.assert_has_calls([
+        call(TAB_GENERAL, "B3", "Invalid ID"),
+        call("Items", "A3", "'fake' is not a valid ItemTermsModelEnum"),
+    ])
 
 
 def test_validate_definition_file_doesnt_exist(mocker, service_context, product_service):
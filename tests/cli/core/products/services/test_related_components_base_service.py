@@ -1,14 +1,16 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import StrEnum
 from typing import Any, Self
 
 import pytest
 from cli.core.errors import MPTAPIError
 from cli.core.models import BaseDataModel, DataCollectionModel
+from cli.core.mpt.governor import GovernorSettings, RequestGovernor
 from cli.core.products.models import DataActionEnum
 from cli.core.products.services.related_components_base_service import (
     RelatedComponentsBaseService,
 )
+from cli.core.services.checkpoint import SyncCheckpoint
 from cli.core.services.service_context import ServiceContext
 from cli.core.stats import ProductStatsCollector
 
@@ -18,11 +20,16 @@ class FakeRelatedComponentsService(RelatedComponentsBaseService):
         return data_model
 
 
+class FakeExternalIdService(FakeRelatedComponentsService):
+    external_key_path = "externalId"
+    external_key_attribute = "id"
+
+
 class FakeActionEnum(StrEnum):
     FAKE_ACTION = "fake_action"
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeDataModel(BaseDataModel):
     id: str = "fake_id"
     coordinate: str = "fake_coordinate"
@@ -32,6 +39,9 @@ class FakeDataModel(BaseDataModel):
     def to_skip(self):
         return False
 
+    def assign_product(self, product_id: str) -> None:
+        """The fake resource does not refer to a product."""
+
     @classmethod
     def from_dict(cls, row_data: dict[str, Any]) -> Self:
         return cls()
@@ -128,6 +138,150 @@ def test_create_api_error(
     add_error_mock.assert_called_once_with("fake_tab_name")
 
 
+class SyncInterruptedError(Exception):
+    """Stand-in for the sync process dying."""
+
+
+@pytest.fixture
+def interrupted_create(mocker, tmp_path, service_context):
+    mocker.patch.object(
+        service_context.file_manager,
+        "read_data",
+        side_effect=lambda: [
+            FakeDataModel(id="IGR-1", coordinate="A2"),
+            FakeDataModel(id="IGR-2", coordinate="A3"),
+        ],
+    )
+    mocker.patch.object(service_context.file_manager, "write_ids")
+    mocker.patch.object(service_context.stats, "add_synced")
+    mocker.patch.object(
+        service_context.api, "post", side_effect=[{"id": "IGR-NEW-1"}, SyncInterruptedError()]
+    )
+    journal_path = tmp_path / "checkpoint.jsonl"
+    service = FakeRelatedComponentsService(
+        replace(service_context, checkpoint=SyncCheckpoint(journal_path))
+    )
+    with pytest.raises(SyncInterruptedError):
+        service.create()
+    service_context.api.post.reset_mock(side_effect=True)
+    service_context.api.post.return_value = {"id": "IGR-NEW-2"}
+    service_context.stats.add_synced.reset_mock()
+    return journal_path
+
+
+def test_create_resumes_checkpoint(mocker, service_context, interrupted_create):
+    checkpoint = SyncCheckpoint(interrupted_create, is_resumed=True)
+    service = FakeRelatedComponentsService(replace(service_context, checkpoint=checkpoint))
+
+    result = service.create()
+
+    assert result.errors == []
+    service_context.api.post.assert_called_once_with(json={"id": "IGR-2"})
+    assert {
+        old_id: data_model.id for old_id, data_model in result.collection.collection.items()
+    } == {"IGR-1": "IGR-NEW-1", "IGR-2": "IGR-NEW-2"}
+    assert service_context.stats.add_synced.call_args_list == [
+        mocker.call("fake_tab_name", 1),
+        mocker.call("fake_tab_name"),
+    ]
+
+
+@pytest.fixture
+def request_governor(mocker):
+    return mocker.Mock(spec=RequestGovernor, settings=GovernorSettings(max_retries=2))
+
+
+@pytest.fixture
+def retrying_service(service_context, request_governor):
+    return FakeExternalIdService(replace(service_context, request_governor=request_governor))
+
+
+@pytest.fixture
+def transient_error(mocker, service_context):
+    mocker.patch.object(service_context.stats, "add_synced")
+    mocker.patch.object(service_context.stats, "add_error")
+    return MPTAPIError("Connection reset", "No response", is_connection_error=True)
+
+
+def test_create_retries_transient_error(
+    mocker, service_context, request_governor, retrying_service, transient_error
+):
+    mocker.patch.object(service_context.file_manager, "read_data", return_value=[FakeDataModel()])
+    post_mock = mocker.patch.object(
+        service_context.api, "post", side_effect=[transient_error, {"id": "new_fake_id"}]
+    )
+    list_mock = mocker.patch.object(service_context.api, "list", return_value={"data": []})
+
+    result = retrying_service.create()
+
+    assert not result.errors
+    assert post_mock.call_count == 2
+    request_governor.wait_before_retry.assert_called_once_with(0, None)
+    list_mock.assert_called_once_with(
+        query_params={"select": "audit", "limit": 1, "offset": 0, "externalId": "fake_id"}
+    )
+    service_context.file_manager.write_ids.assert_called_once_with({
+        "fake_coordinate": "new_fake_id"
+    })
+
+
+def test_create_finds_item_created_before_error(
+    mocker, service_context, retrying_service, transient_error
+):
+    mocker.patch.object(service_context.file_manager, "read_data", return_value=[FakeDataModel()])
+    post_mock = mocker.patch.object(service_context.api, "post", side_effect=transient_error)
+    created_items = {"data": [{"id": "new_fake_id"}]}
+    mocker.patch.object(service_context.api, "list", return_value=created_items)
+
+    result = retrying_service.create()
+
+    assert not result.errors
+    post_mock.assert_called_once()
+    service_context.file_manager.write_ids.assert_called_once_with({
+        "fake_coordinate": "new_fake_id"
+    })
+
+
+def test_create_gives_up_after_max_retries(
+    mocker, service_context, retrying_service, transient_error
+):
+    mocker.patch.object(service_context.file_manager, "read_data", return_value=[FakeDataModel()])
+    post_mock = mocker.patch.object(service_context.api, "post", side_effect=transient_error)
+    mocker.patch.object(service_context.api, "list", return_value={"data": []})
+
+    result = retrying_service.create()
+
+    assert len(result.errors) == 1
+    assert post_mock.call_count == 3
+    service_context.file_manager.write_error.assert_called_once()
+
+
+def test_create_without_external_id_no_retry(
+    mocker, service_context, request_governor, transient_error
+):
+    mocker.patch.object(service_context.file_manager, "read_data", return_value=[FakeDataModel()])
+    post_mock = mocker.patch.object(service_context.api, "post", side_effect=transient_error)
+    service = FakeRelatedComponentsService(
+        replace(service_context, request_governor=request_governor)
+    )
+
+    result = service.create()
+
+    assert len(result.errors) == 1
+    post_mock.assert_called_once()
+    request_governor.wait_before_retry.assert_not_called()
+
+
+def test_create_without_governor_no_retry(mocker, service_context, transient_error):
+    mocker.patch.object(service_context.file_manager, "read_data", return_value=[FakeDataModel()])
+    post_mock = mocker.patch.object(service_context.api, "post", side_effect=transient_error)
+
+    result = FakeExternalIdService(service_context).create()
+
+    assert len(result.errors) == 1
+    post_mock.assert_called_once()
+
+
 def test_export(mocker, service_context, related_components_service, mpt_agreement_parameter_data):
     create_data_mock = mocker.patch.object(service_context.file_manager, "create_tab")
     response_payload = {"meta": {"offset": 0, "limit": 100, "total": 0}, "data": []}
@@ -250,6 +404,11 @@ def test_update_action_value_error(mocker, service_context, related_components_s
     stats_error_mock.assert_called_once_with("fake_tab_name")
 
 
+def test_check_update_action(related_components_service):
+    with pytest.raises(ValueError, match="not supported"):
+        related_components_service.check_update_action(DataActionEnum.DELETE)
+
+
 def test_update_action_api_error(mocker, service_context, related_components_service):
     mocker.patch.object(
         service_context.file_manager,
@@ -271,3 +430,68 @@ def test_update_action_api_error(mocker, service_context, related_components_ser
     )
     stats_error_mock.assert_called_once_with("fake_tab_name")
     api_update_mock.assert_called_once_with("update_id", {"id": "update_id"})
+
+
+def test_update_skips_unchanged(mocker, service_context):
+    mocker.patch.object(
+        service_context.file_manager,
+        "read_data",
+        return_value=[
+            FakeDataModel(id="unchanged_id", action=DataActionEnum.UPDATE),
+            FakeDataModel(id="changed_id", coordinate="changed", action=DataActionEnum.UPDATE),
+        ],
+    )
+    mocker.patch.object(
+        service_context.api,
+        "list",
+        return_value={
+            "data": [{"id": "unchanged_id", "name": "Remote only"}],
+            "meta": {"offset": 0, "limit": 100, "total": 1},
+        },
+    )
+    mocker.patch.object(service_context.api, "update")
+    mocker.patch.object(service_context.file_manager, "write_ids")
+    mocker.patch.multiple(
+        service_context.stats, add_unchanged=mocker.DEFAULT, add_synced=mocker.DEFAULT
+    )
+    service = FakeRelatedComponentsService(replace(service_context, skip_unchanged=True))
+
+    result = service.update()
+
+    assert result.success is True
+    service_context.api.list.assert_called_once()
+    service_context.api.update.assert_called_once_with("changed_id", {"id": "changed_id"})
+    assert service_context.file_manager.write_ids.call_args_list == [
+        mocker.call({"fake_coordinate": "unchanged_id"}),
+        mocker.call({"changed": "changed_id"}),
+    ]
+    service_context.stats.add_unchanged.assert_called_once_with("fake_tab_name")
+    service_context.stats.add_synced.assert_called_once_with("fake_tab_name")
+
+
+def test_update_resumes_checkpoint(mocker, tmp_path, service_context):
+    mocker.patch.object(
+        service_context.file_manager,
+        "read_data",
+        return_value=[
+            FakeDataModel(id="resumed_id", coordinate="A2", action=DataActionEnum.UPDATE),
+            FakeDataModel(id="pending_id", coordinate="A3", action=DataActionEnum.UPDATE),
+        ],
+    )
+    mocker.patch.object(service_context.api, "update")
+    mocker.patch.object(service_context.file_manager, "write_ids")
+    add_synced_mock = mocker.patch.object(service_context.stats, "add_synced")
+    journal_path = tmp_path / "checkpoint.jsonl"
+    SyncCheckpoint(journal_path).record("fake_tab_name", "A2", "resumed_id")
+    checkpoint = SyncCheckpoint(journal_path, is_resumed=True)
+    service = FakeRelatedComponentsService(replace(service_context, checkpoint=checkpoint))
+
+    result = service.update()
+
+    assert result.success is True
+    service_context.api.update.assert_called_once_with("pending_id", {"id": "pending_id"})
+    assert add_synced_mock.call_args_list == [
+        mocker.call("fake_tab_name", 1),
+        mocker.call("fake_tab_name"),
+    ]
+    assert checkpoint.journal_path.read_text(encoding="utf-8").count("pending_id") == 1
@@ -0,0 +1,104 @@
+import pytest
+from cli.core.errors import MPTAPIError
+from cli.core.products.models import DataActionEnum, ItemActionEnum
+from cli.core.products.services.sync_planner import plan_new_components, plan_related_components
+from cli.core.services.sync_plan import PlanAction, SyncPlan
+
+
+@pytest.fixture
+def related_service(mocker):
+    service = mocker.Mock(
+        spec_set=[
+            "api",
+            "export_params",
+            "file_manager",
+            "remote_key_path",
+            "resource_id",
+            "row_key_attribute",
+            "check_update_action",
+        ]
+    )
+    service.export_params = {"offset": 0, "limit": 100}
+    service.file_manager.tab_name = "Items"
+    service.remote_key_path = "id"
+    service.resource_id = "PRD-1"
+    service.row_key_attribute = "id"
+    service.api.list.return_value = {
+        "data": [{"id": "ITM-1", "name": "Name"}, {"id": "ITM-2", "name": "Remote name"}],
+        "meta": {"offset": 0, "limit": 100, "total": 2},
+    }
+    return service
+
+
+def data_model(mocker, row_id, action, *, to_skip=False):
+    return mocker.Mock(
+        id=row_id,
+        coordinate=f"A-{row_id}",
+        action=action,
+        to_skip=to_skip,
+        to_json=mocker.Mock(return_value={"name": "Name"}),
+    )
+
+
+def test_plan_new_components(mocker, related_service):
+    related_service.file_manager.read_data.return_value = [
+        data_model(mocker, "ITM-1", DataActionEnum.UPDATE)
+    ]
+    sync_plan = SyncPlan()
+
+    plan_new_components(related_service, sync_plan, "product.xlsx")  # act
+
+    assert [plan_entry.action for plan_entry in sync_plan.entries] == [PlanAction.CREATE]
+    related_service.api.list.assert_not_called()
+
+
+def test_plan_related_components(mocker, related_service):
+    related_service.file_manager.read_data.return_value = [
+        data_model(mocker, "ITM-1", DataActionEnum.UPDATE),
+        data_model(mocker, "ITM-2", DataActionEnum.UPDATE),
+        data_model(mocker, "ITM-3", DataActionEnum.UPDATE),
+        data_model(mocker, "ITM-4", DataActionEnum.CREATE),
+        data_model(mocker, "ITM-1", DataActionEnum.CREATE),
+        data_model(mocker, "ITM-2", ItemActionEnum.PUBLISH),
+        data_model(mocker, "ITM-5", DataActionEnum.SKIP, to_skip=True),
+    ]
+    sync_plan = SyncPlan()
+
+    plan_related_components(related_service, sync_plan, "product.xlsx")  # act
+
+    assert [plan_entry.action for plan_entry in sync_plan.entries] == [
+        PlanAction.UNCHANGED,
+        PlanAction.UPDATE,
+        PlanAction.CONFLICT,
+        PlanAction.CREATE,
+        PlanAction.CONFLICT,
+        PlanAction.UPDATE,
+        PlanAction.SKIP,
+    ]
+    assert sync_plan.entries[0].remote_id == "ITM-1"
+    assert sync_plan.entries[5].detail == ItemActionEnum.PUBLISH
+    related_service.api.list.assert_called_once()
+
+
+def test_plan_unsupported_action(mocker, related_service):
+    related_service.file_manager.read_data.return_value = [
+        data_model(mocker, "ITM-1", ItemActionEnum.REVIEW)
+    ]
+    related_service.check_update_action.side_effect = ValueError("Unsupported action")
+    sync_plan = SyncPlan()
+
+    plan_related_components(related_service, sync_plan, "product.xlsx")  # act
+
+    assert sync_plan.entries[0].action == PlanAction.CONFLICT
+    assert sync_plan.entries[0].detail == "Unsupported action"
+
+
+def test_plan_related_components_fetch_error(related_service):
+    related_service.api.list.side_effect = MPTAPIError("API Error", "Error listing items")
+    sync_plan = SyncPlan()
+
+    plan_related_components(related_service, sync_plan, "product.xlsx")  # act
+
+    assert len(sync_plan.entries) == 1
+    assert sync_plan.entries[0].action == PlanAction.CONFLICT
+    related_service.file_manager.read_data.assert_not_called()
@@ -0,0 +1,108 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from cli.core.handlers.excel_file_handler import ExcelFileHandler
+from cli.core.models import DataCollectionModel
+from cli.core.products.constants import (
+    ITEMS_GROUP_ID,
+    PARAMETERS_GROUP_ID,
+    TAB_AGREEMENT_PARAMETERS,
+    TAB_ITEMS,
+    TAB_TEMPLATES,
+    TEMPLATES_CONTENT,
+)
+from cli.core.products.handlers import ItemExcelFileManager
+from cli.core.products.services.workbook_id_remapper import (
+    ITEM_GROUP_REFERENCES,
+    PARAMETER_GROUP_REFERENCES,
+    PARAMETER_REFERENCES,
+    IdReference,
+    WorkbookIdRemapper,
+)
+
+
+def created(old_id, new_id):
+    return DataCollectionModel(collection={old_id: SimpleNamespace(id=new_id)})
+
+
+def column(file_path, sheet_name, field):
+    file_handler = ExcelFileHandler(Path(file_path))
+    return [
+        cell_value
+        for _, cell_value in file_handler.get_column_from_horizontal_sheet(sheet_name, field)
+    ]
+
+
+@pytest.fixture
+def id_remapper(product_new_file):
+    return WorkbookIdRemapper(ExcelFileHandler(Path(product_new_file)))
+
+
+def test_apply(mocker, product_new_file, id_remapper):
+    write_spy = mocker.spy(ExcelFileHandler, "write")
+    id_remapper.add(ITEM_GROUP_REFERENCES, created("IGR-4944-4118-0002", "IGR-0000-0000-0001"))
+    id_remapper.add(PARAMETER_GROUP_REFERENCES, created("PGR-4944-4118-0002", "PGR-0000-0000-0001"))
+
+    result = id_remapper.apply()
+
+    assert result == 3
+    write_spy.assert_called_once()
+    assert column(product_new_file, TAB_ITEMS, ITEMS_GROUP_ID)[:2] == [
+        "IGR-0000-0000-0001",
+        "IGR-0000-0000-0001",
+    ]
+    assert column(product_new_file, TAB_AGREEMENT_PARAMETERS, PARAMETERS_GROUP_ID)[:2] == [
+        "PGR-0000-0000-0001",
+        None,
+    ]
+
+
+def test_apply_shares_file_handler(product_new_file):
+    file_handler = ExcelFileHandler(Path(product_new_file))
+    file_manager = ItemExcelFileManager(product_new_file, file_handler)
+    id_remapper = WorkbookIdRemapper(file_handler)
+    id_remapper.add(ITEM_GROUP_REFERENCES, created("IGR-4944-4118-0002", "IGR-0000-0000-0001"))
+    id_remapper.apply()
+
+    file_manager.write_ids({"A2": "ITM-0000-0000-0001"})  # act
+
+    assert column(product_new_file, TAB_ITEMS, ITEMS_GROUP_ID)[:2] == [
+        "IGR-0000-0000-0001",
+        "IGR-0000-0000-0001",
+    ]
+
+
+def test_apply_embedded(product_new_file, id_remapper):
+    id_remapper.add(PARAMETER_REFERENCES, created("PAR-4944-4118-0001", "PAR-0000-0000-0001"))
+
+    result = id_remapper.apply()
+
+    assert result == 1
+    assert column(product_new_file, TAB_TEMPLATES, TEMPLATES_CONTENT)[:2] == [
+        "Test content **Azure** {{ PAR-0000-0000-0001 }}",
+        "Test content **Azure**",
+    ]
+
+
+def test_apply_clears_queue(mocker, id_remapper):
+    id_remapper.add(ITEM_GROUP_REFERENCES, created("IGR-4944-4118-0002", "IGR-0000-0000-0001"))
+    id_remapper.apply()
+    write_spy = mocker.spy(ExcelFileHandler, "write")
+
+    result = id_remapper.apply()
+
+    assert result == 0
+    write_spy.assert_not_called()
+
+
+def test_apply_nothing_to_rewrite(mocker, id_remapper):
+    write_spy = mocker.spy(ExcelFileHandler, "write")
+    id_remapper.add(ITEM_GROUP_REFERENCES, created("IGR-9999", "IGR-0000-0000-0001"))
+    id_remapper.add(PARAMETER_GROUP_REFERENCES, None)
+    id_remapper.add((IdReference("Missing", ITEMS_GROUP_ID),), created("IGR-1", "IGR-2"))
+
+    result = id_remapper.apply()
+
+    assert result == 0
+    write_spy.assert_not_called()
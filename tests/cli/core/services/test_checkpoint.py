@@ -0,0 +1,85 @@
+import json
+
+import pytest
+from cli.core.services.checkpoint import SyncCheckpoint
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return tmp_path / "PRC-1234.xlsx.checkpoint.jsonl"
+
+
+def test_for_workbook(tmp_path):
+    workbook_path = tmp_path / "PRC-1234.xlsx"
+
+    result = SyncCheckpoint.for_workbook(str(workbook_path))
+
+    assert result.journal_path == tmp_path / "PRC-1234.xlsx.checkpoint.jsonl"
+
+
+def test_record(journal_path):
+    checkpoint = SyncCheckpoint(journal_path)
+
+    checkpoint.record("Price Items", "A2", "PRI-1")  # act
+
+    journal_lines = journal_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(journal_line) for journal_line in journal_lines] == [
+        {"tab": "Price Items", "row": "A2", "id": "PRI-1"}
+    ]
+
+
+def test_resume(journal_path):
+    checkpoint = SyncCheckpoint(journal_path)
+    checkpoint.record("Price Items", "A2", "PRI-1")
+    checkpoint.record("Price Items", "A3", "PRI-2")
+    checkpoint.record("Items", "A2", "ITM-1")
+
+    result = SyncCheckpoint(journal_path, is_resumed=True)
+
+    assert result.completed_ids("Price Items") == {"A2": "PRI-1", "A3": "PRI-2"}
+    assert result.completed_ids("Items") == {"A2": "ITM-1"}
+    assert result.completed_ids("Templates") == {}
+
+
+def test_resume_source_ids(journal_path):
+    checkpoint = SyncCheckpoint(journal_path)
+    checkpoint.record("Items", "A2", "ITM-1", "ITM-0001")
+    checkpoint.record("Items", "A3", "ITM-2")
+
+    result = SyncCheckpoint(journal_path, is_resumed=True)
+
+    assert result.completed_ids("Items") == {"A2": "ITM-1", "A3": "ITM-2"}
+    assert result.source_ids("Items") == {"A2": "ITM-0001"}
+
+
+def test_resume_skips_truncated_line(journal_path):
+    SyncCheckpoint(journal_path).record("Price Items", "A2", "PRI-1")
+    with journal_path.open("a", encoding="utf-8") as journal:
+        journal.write('{"tab": "Price Items", "row": "A3"')
+
+    result = SyncCheckpoint(journal_path, is_resumed=True)
+
+    assert result.completed_ids("Price Items") == {"A2": "PRI-1"}
+
+
+def test_resume_without_journal(journal_path):
+    result = SyncCheckpoint(journal_path, is_resumed=True)
+
+    assert result.completed_ids("Price Items") == {}
+
+
+def test_start_over(journal_path):
+    SyncCheckpoint(journal_path).record("Price Items", "A2", "PRI-1")
+
+    SyncCheckpoint(journal_path)  # act
+
+    assert not journal_path.exists()
+
+
+def test_clear(journal_path):
+    checkpoint = SyncCheckpoint(journal_path)
+    checkpoint.record("Price Items", "A2", "PRI-1")
+
+    checkpoint.clear()  # act
+
+    assert not journal_path.exists()
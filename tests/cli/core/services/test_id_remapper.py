@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import pytest
+from cli.core.models import DataCollectionModel
+from cli.core.services.id_remapper import IdRemapper
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("{{ PAR-1 }} and {{ PAR-2 }}", "{{ NEW-1 }} and {{ NEW-2 }}"),
+        ("PAR-1PAR-1", "NEW-1NEW-1"),
+        ("PAR-12 PAR-1", "NEW-12 NEW-1"),
+        ("PAR-13", "NEW-13"),
+        ("no ids", "no ids"),
+        ("", ""),
+    ],
+)
+def test_remap(text, expected):
+    id_remapper = IdRemapper({"PAR-1": "NEW-1", "PAR-12": "NEW-12", "PAR-2": "NEW-2"})
+
+    result = id_remapper.remap(text)
+
+    assert result == expected
+
+
+def test_remap_does_not_chain():
+    id_remapper = IdRemapper({"A": "B", "B": "C"})
+
+    result = id_remapper.remap("A B")
+
+    assert result == "B C"
+
+
+def test_remap_escapes_ids():
+    id_remapper = IdRemapper({"a.b(c)*": "new"})
+
+    result = id_remapper.remap("axb(c)* a.b(c)*")
+
+    assert result == "axb(c)* new"
+
+
+def test_remap_empty():
+    id_remapper = IdRemapper({"PAR-1": "PAR-1"})
+
+    result = id_remapper.remap("PAR-1")
+
+    assert not id_remapper
+    assert result == "PAR-1"
+
+
+def test_from_collection():
+    collection = DataCollectionModel(
+        collection={"old_id": SimpleNamespace(id="new_id"), "same_id": None}
+    )
+
+    result = IdRemapper.from_collection(collection)
+
+    assert result.id_map == {"old_id": "new_id"}
+
+
+def test_from_collection_none():
+    result = IdRemapper.from_collection(None)
+
+    assert not result
@@ -0,0 +1,109 @@
+import logging
+from types import MappingProxyType
+
+import pytest
+from cli.core.errors import MPTAPIError
+from cli.core.services.remote_state import RemoteState
+
+PAGE_QUERY = MappingProxyType({"offset": 0, "limit": 1})
+
+
+@pytest.fixture
+def remote_state():
+    return RemoteState(is_enabled=True)
+
+
+@pytest.fixture
+def api(mocker):
+    return mocker.Mock(spec_set=["list"])
+
+
+def remote_page(remote_record, offset=0, total=1):
+    return {"data": [remote_record], "meta": {"offset": offset, "limit": 1, "total": total}}
+
+
+def test_prefetch_paginates(api, remote_state):
+    api.list.side_effect = [
+        remote_page({"id": "ID-1"}, total=2),
+        remote_page({"id": "ID-2"}, offset=1, total=2),
+    ]
+
+    remote_state.prefetch(api, PAGE_QUERY)  # act
+
+    assert api.list.call_count == 2
+    assert remote_state.find("ID-1") == {"id": "ID-1"}
+    assert remote_state.find("ID-2") == {"id": "ID-2"}
+
+
+def test_prefetch_by_key_path(api, remote_state):
+    remote_record = {"id": "ID-1", "externalIds": {"vendor": "VENDOR-1"}}
+    api.list.return_value = remote_page(remote_record)
+
+    remote_state.prefetch(api, PAGE_QUERY, "externalIds.vendor")  # act
+
+    assert remote_state.find("VENDOR-1") == remote_record
+    assert remote_state.find("ID-1") is None
+
+
+def test_prefetch_disabled(api):
+    remote_state = RemoteState()
+
+    remote_state.prefetch(api, PAGE_QUERY)  # act
+
+    api.list.assert_not_called()
+
+
+def test_prefetch_error(api, remote_state, caplog):
+    api.list.side_effect = MPTAPIError("API Error", "Error listing resources")
+
+    with caplog.at_level(logging.WARNING):
+        remote_state.prefetch(api, PAGE_QUERY)  # act
+
+    assert "Unable to prefetch the remote state" in caplog.text
+    assert remote_state.find("ID-1") is None
+
+
+def test_find_unchanged(api, remote_state):
+    remote_record = {"id": "ID-1", "name": "Name", "status": "Published"}
+    api.list.return_value = remote_page(remote_record)
+    remote_state.prefetch(api, PAGE_QUERY)
+
+    result = remote_state.find_unchanged("ID-1", {"name": "Name"})
+
+    assert result == remote_record
+    assert remote_state.find_unchanged("ID-1", {"name": "New name"}) is None
+
+
+def test_find_changes(api, remote_state):
+    remote_record = {"id": "ID-1", "name": "Name", "terms": {"period": "1m", "model": "usage"}}
+    api.list.return_value = remote_page(remote_record)
+    remote_state.prefetch(api, PAGE_QUERY)
+    payload = {"name": "Name", "description": "New", "terms": {"period": "1y"}}
+
+    result = remote_state.find_changes("ID-1", payload)
+
+    assert result == {"description": "New", "terms": {"period": "1y"}}
+
+
+def test_find_changes_not_prefetched(remote_state):
+    payload = {"name": "Name"}
+
+    result = remote_state.find_changes("ID-1", payload)
+
+    assert result == payload
+
+
+def test_fetch_when_disabled(api):
+    remote_state = RemoteState()
+    api.list.return_value = remote_page({"id": "ID-1"})
+
+    remote_state.fetch(api, PAGE_QUERY)  # act
+
+    assert remote_state.find("ID-1") == {"id": "ID-1"}
+
+
+def test_fetch_error(api, remote_state):
+    api.list.side_effect = MPTAPIError("API Error", "Error listing resources")
+
+    with pytest.raises(MPTAPIError):
+        remote_state.fetch(api, PAGE_QUERY)
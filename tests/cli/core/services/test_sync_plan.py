@@ -0,0 +1,70 @@
+import json
+from collections import Counter
+
+import pytest
+from cli.core.services.sync_plan import PlanAction, PlanEntry, SyncPlan, update_action
+
+
+@pytest.fixture
+def sync_plan():
+    sync_plan = SyncPlan()
+    sync_plan.add(PlanEntry("product.xlsx", "General", None, "PRD-1", PlanAction.UPDATE))
+    sync_plan.add(PlanEntry("product.xlsx", "Items", "A2", "ITM-1", PlanAction.UNCHANGED))
+    sync_plan.add(PlanEntry("product.xlsx", "Items", "A3", "ITM-2", PlanAction.CREATE))
+    sync_plan.add(PlanEntry("product.xlsx", "Items", "A4", "ITM-3", PlanAction.CREATE))
+    return sync_plan
+
+
+@pytest.mark.parametrize(
+    ("remote_record", "expected_action"),
+    [
+        (None, PlanAction.CONFLICT),
+        ({"id": "ID-1", "name": "Name"}, PlanAction.UNCHANGED),
+        ({"id": "ID-1", "name": "Other name"}, PlanAction.UPDATE),
+    ],
+)
+def test_update_action(remote_record, expected_action):
+    result = update_action({"name": "Name"}, remote_record)
+
+    assert result == expected_action
+
+
+def test_summary(sync_plan):
+    result = sync_plan.summary()
+
+    assert result == {
+        ("product.xlsx", "General"): Counter({PlanAction.UPDATE: 1}),
+        ("product.xlsx", "Items"): Counter({PlanAction.UNCHANGED: 1, PlanAction.CREATE: 2}),
+    }
+
+
+def test_has_conflicts(sync_plan):
+    sync_plan.add(PlanEntry("product.xlsx", "Items", "A5", "ITM-4", PlanAction.CONFLICT))
+
+    result = sync_plan.has_conflicts
+
+    assert result is True
+
+
+def test_has_no_conflicts(sync_plan):
+    result = sync_plan.has_conflicts
+
+    assert result is False
+
+
+def test_write_json(tmp_path, sync_plan):
+    plan_path = tmp_path / "plans" / "plan.json"
+
+    sync_plan.write_json(plan_path)  # act
+
+    plan_entries = json.loads(plan_path.read_text(encoding="utf-8"))
+    assert len(plan_entries) == 4
+    assert plan_entries[1] == {
+        "source": "product.xlsx",
+        "tab": "Items",
+        "coordinate": "A2",
+        "row_id": "ITM-1",
+        "action": "unchanged",
+        "remote_id": None,
+        "detail": "",
+    }
@@ -3,12 +3,14 @@ from types import SimpleNamespace
 
 import pytest
 from cli.core.error_wrappers import ApiErrorWrapper, HttpErrorWrapper
-from mpt_api_client.exceptions import MPTHttpError
+from mpt_api_client.exceptions import MPTHttpError, MPTMaxRetryError
 
 
 @pytest.fixture
 def error_factory():
-    return lambda request_msg, response_body: RuntimeError(f"{request_msg}|{response_body}")
+    return lambda request_msg, response_body, status_code=None, **_kwargs: RuntimeError(
+        f"{request_msg}|{response_body}|{status_code}"
+    )
 
 
 @pytest.fixture
@@ -47,5 +49,15 @@ def test_api_wrapper_raises_factory_error(error_factory, http_error_callable):
         error_factory,
     )
 
-    with pytest.raises(RuntimeError, match="boom"):
+    with pytest.raises(RuntimeError, match=r"boom|500"):
+        wrapper()
+
+
+def test_api_wrapper_error_without_response(mocker, error_factory):
+    wrapper = ApiErrorWrapper(
+        mocker.Mock(side_effect=MPTMaxRetryError("Connection reset", 1)),
+        error_factory,
+    )
+
+    with pytest.raises(RuntimeError, match=r"No response|None"):
         wrapper()
@@ -1,3 +1,5 @@
+from http import HTTPStatus
+
 import pytest
 from cli.core.errors import MPTAPIError, wrap_http_error
 from requests import RequestException, Response
@@ -101,3 +103,29 @@ def test_wrap_http_error_non_dict_payload(mocker):
         wrapped()
 
     assert "invalid payload content" in str(error.value)
+
+
+@pytest.mark.parametrize(
+    ("status_code", "expected"),
+    [
+        (None, False),
+        (HTTPStatus.INTERNAL_SERVER_ERROR, True),
+        (HTTPStatus.SERVICE_UNAVAILABLE, True),
+        (HTTPStatus.BAD_REQUEST, False),
+        (HTTPStatus.NOT_FOUND, False),
+    ],
+)
+def test_mpt_api_error_is_transient(status_code, expected):
+    error = MPTAPIError("API Error", "Error", status_code)
+
+    result = error.is_transient
+
+    assert result is expected
+
+
+def test_connection_error_is_transient():
+    error = MPTAPIError("Connection reset", "No response", is_connection_error=True)
+
+    result = error.is_transient
+
+    assert result is True
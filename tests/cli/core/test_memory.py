@@ -0,0 +1,121 @@
+import pytest
+import typer
+from cli.core.errors import MemoryBudgetExceededError
+from cli.core.memory import (
+    MEMORY_BUDGET_EXIT_CODE,
+    MemoryBudgetAction,
+    MemoryTracker,
+    memory_phase,
+)
+from cli.core.state import state
+
+ALLOCATION_SIZE = 1024 * 1024
+BUDGET_BYTES = 10
+
+
+@pytest.fixture
+def memory_tracker():
+    tracker = MemoryTracker()
+    tracker.start()
+    yield tracker
+    tracker.stop()
+
+
+@pytest.fixture
+def abort_memory_tracker(mocker):
+    tracker = MemoryTracker(budget_bytes=1024, budget_action=MemoryBudgetAction.ABORT)
+    mocker.patch.object(state, "memory_tracker", tracker)
+    tracker.start()
+    yield tracker
+    tracker.stop()
+
+
+def test_phase_records_peak_and_retained(memory_tracker):
+    with memory_tracker.phase("Load workbook"):
+        result = bytearray(ALLOCATION_SIZE)
+
+    phase_memory = memory_tracker.phases[0]
+    assert phase_memory.name == "Load workbook"
+    assert phase_memory.calls == 1
+    assert phase_memory.peak_bytes >= len(result)
+    assert phase_memory.retained_bytes >= len(result)
+
+
+def test_phase_aggregates_runs(memory_tracker):
+    for _ in range(3):
+        with memory_tracker.phase("Decode rows"):
+            bytearray(ALLOCATION_SIZE)  # act
+
+    phase_calls = [(phase.name, phase.calls) for phase in memory_tracker.phases]
+    assert phase_calls == [("Decode rows", 3)]
+
+
+def test_nested_phase_peak_accounted_to_outer(memory_tracker):
+    with memory_tracker.phase("Export"), memory_tracker.phase("Page"):
+        bytearray(ALLOCATION_SIZE)  # act
+
+    outer_phase, inner_phase = sorted(memory_tracker.phases, key=lambda phase: phase.name)
+    assert inner_phase.peak_bytes >= ALLOCATION_SIZE
+    assert outer_phase.peak_bytes >= inner_phase.peak_bytes
+
+
+def test_stop_records_total_peak():
+    tracker = MemoryTracker()
+    tracker.start()
+    with tracker.phase("Save workbook"):
+        bytearray(ALLOCATION_SIZE)
+
+    tracker.stop()  # act
+
+    assert tracker.total_peak_bytes >= ALLOCATION_SIZE
+
+
+def test_phase_without_tracing_is_noop():
+    tracker = MemoryTracker()
+
+    with tracker.phase("Load workbook"):
+        bytearray(ALLOCATION_SIZE)  # act
+
+    assert tracker.phases == []
+
+
+def test_check_budget_warns_once(mocker):
+    console_mock = mocker.patch("cli.core.memory.console", autospec=True)
+    tracker = MemoryTracker(budget_bytes=BUDGET_BYTES)
+    tracker.check_budget("Decode rows", BUDGET_BYTES + 1)
+
+    tracker.check_budget("Decode rows", BUDGET_BYTES + 2)  # act
+
+    console_mock.print.assert_called_once()
+
+
+def test_check_budget_aborts():
+    tracker = MemoryTracker(budget_bytes=BUDGET_BYTES, budget_action=MemoryBudgetAction.ABORT)
+
+    with pytest.raises(MemoryBudgetExceededError, match="exceeded the budget"):
+        tracker.check_budget("Decode rows", BUDGET_BYTES + 1)
+
+
+def test_check_budget_within_budget():
+    tracker = MemoryTracker(budget_bytes=BUDGET_BYTES, budget_action=MemoryBudgetAction.ABORT)
+
+    tracker.check_budget("Decode rows", BUDGET_BYTES)  # act
+
+    assert tracker.phases == []
+
+
+def test_memory_phase_aborts_with_exit_code(abort_memory_tracker):
+    with pytest.raises(typer.Exit) as error, memory_phase("Export price items page"):
+        bytearray(ALLOCATION_SIZE)
+
+    assert error.value.exit_code == MEMORY_BUDGET_EXIT_CODE
+    assert abort_memory_tracker.phases[0].name == "Export price items page"
+
+
+def test_memory_phase_disabled(mocker):
+    mocker.patch.object(state, "memory_tracker", None)
+
+    with memory_phase("Load workbook"):
+        result = len(bytearray(ALLOCATION_SIZE))
+
+    assert result == ALLOCATION_SIZE
@@ -1,4 +1,5 @@
-from cli.core.nested_dicts import set_dict_value
+import pytest
+from cli.core.nested_dicts import get_dict_value, is_subset, set_dict_value
 
 
 def test_set_dict_value():
@@ -26,3 +27,40 @@ def test_set_dict_value_overwrites_falsy_value():
     result = set_dict_value(original_dict, path, "test")
 
     assert result == {"a": {"b": "test"}}
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("a.b.c", "test"),
+        ("a.b", {"c": "test"}),
+        ("a.x.c", None),
+        ("a.b.c.d", None),
+    ],
+)
+def test_get_dict_value(path, expected):
+    original_dict = {"a": {"b": {"c": "test"}}}
+
+    result = get_dict_value(original_dict, path)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("expected", "actual", "is_contained"),
+    [
+        ({"a": 1}, {"a": 1, "b": 2}, True),
+        ({"a": {"b": 1}}, {"a": {"b": 1, "c": 2}}, True),
+        ({"a": None}, {}, True),
+        ([{"b": 1}], [{"b": 1, "c": 2}], True),
+        ({"a": 1.0}, {"a": 1}, True),
+        ({"a": 1}, {"a": 2}, False),
+        ({"a": 1}, {}, False),
+        ({"a": {"b": 1}}, {"a": "b"}, False),
+        ({"a": [1]}, {"a": [1, 2]}, False),
+    ],
+)
+def test_is_subset(expected, actual, is_contained):
+    result = is_subset(expected, actual)
+
+    assert result is is_contained
@@ -0,0 +1,123 @@
+import json
+import os
+import pstats
+from http import HTTPStatus
+
+import pytest
+from cli.core.mpt.tracing import RequestTrace
+from cli.core.profiling import (
+    Profiler,
+    request_to_chrome_event,
+    span_to_chrome_event,
+    trace_span,
+)
+from cli.core.spans import Span, SpanRecorder
+from cli.core.state import state
+
+TRACE_ORIGIN = 100
+SPAN_STARTED_AT = 100.5
+SPAN_DURATION_MS = 2.5
+REQUEST_STARTED_AT = 101
+REQUEST_LATENCY_MS = 12
+RESPONSE_BYTES = 42
+
+
+@pytest.fixture
+def span_recorder(mocker):
+    recorder = SpanRecorder()
+    mocker.patch.object(state, "span_recorder", recorder)
+    return recorder
+
+
+def test_trace_span_disabled(mocker):
+    mocker.patch.object(state, "span_recorder", None)
+
+    with trace_span("Retrieve product", "flow"):
+        result = 1 + 1
+
+    assert result == 2
+
+
+def test_trace_span_records(span_recorder):
+    with trace_span("Retrieve product", "flow"):
+        result = sum(range(3))
+
+    assert result == 3
+    assert [(span.name, span.category) for span in span_recorder.spans] == [
+        ("Retrieve product", "flow")
+    ]
+
+
+@trace_span("decorated")
+def decorated_function():
+    return "result"
+
+
+def test_trace_span_as_decorator(span_recorder):
+    result = decorated_function()
+
+    assert result == "result"
+    assert [(span.name, span.category) for span in span_recorder.spans] == [
+        ("decorated", "service")
+    ]
+
+
+def test_span_to_chrome_event():
+    span = Span(
+        name="ItemService.update",
+        category="service",
+        started_at=SPAN_STARTED_AT,
+        duration_ms=SPAN_DURATION_MS,
+        thread_id=7,
+    )
+
+    result = span_to_chrome_event(span, origin=TRACE_ORIGIN)
+
+    assert result == {
+        "name": "ItemService.update",
+        "cat": "service",
+        "ph": "X",
+        "pid": os.getpid(),
+        "ts": 500000,
+        "dur": 2500,
+        "tid": 7,
+    }
+
+
+def test_request_to_chrome_event():
+    trace = RequestTrace(
+        method="GET",
+        endpoint="/public/v1/catalog/products/{id}",
+        status=HTTPStatus.OK,
+        latency_ms=REQUEST_LATENCY_MS,
+        request_bytes=0,
+        response_bytes=RESPONSE_BYTES,
+        started_at=REQUEST_STARTED_AT,
+    )
+
+    result = request_to_chrome_event(trace, origin=TRACE_ORIGIN)
+
+    assert result == {
+        "name": "GET /public/v1/catalog/products/{id}",
+        "cat": "api",
+        "ph": "X",
+        "pid": os.getpid(),
+        "tid": "api",
+        "ts": 1000000,
+        "dur": 12000,
+        "args": {"status": HTTPStatus.OK, "bytes": RESPONSE_BYTES},
+    }
+
+
+def test_profiler_writes_profile_and_chrome_trace(tmp_path):
+    profiler = Profiler(tmp_path / "run.prof")
+    profiler.start()
+    with profiler.span_recorder.span("Update product", "flow"):
+        sum(range(10))
+
+    profiler.stop([])  # act
+
+    assert pstats.Stats(str(profiler.profile_path)).total_calls > 0
+    assert profiler.chrome_trace_path == tmp_path / "run.trace.json"
+    chrome_trace = json.loads(profiler.chrome_trace_path.read_text(encoding="utf-8"))
+    assert [event["name"] for event in chrome_trace["traceEvents"]] == ["Update product"]
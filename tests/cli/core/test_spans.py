@@ -0,0 +1,27 @@
+import threading
+
+import pytest
+from cli.core.spans import SpanRecorder
+
+
+def test_span_records_duration():
+    span_recorder = SpanRecorder()
+
+    with span_recorder.span("ItemService.update", "service"):
+        result = sum(range(3))
+
+    span = span_recorder.spans[0]
+    assert result == 3
+    assert span.name == "ItemService.update"
+    assert span.category == "service"
+    assert span.duration_ms >= 0
+    assert span.thread_id == threading.get_ident()
+
+
+def test_span_records_on_error():
+    span_recorder = SpanRecorder()
+
+    with pytest.raises(ValueError, match="boom"), span_recorder.span("Load workbook", "excel"):
+        raise ValueError("boom")
+
+    assert [span.name for span in span_recorder.spans] == ["Load workbook"]
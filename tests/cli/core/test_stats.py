@@ -46,3 +46,17 @@ def test_stats_collectors_do_not_share_errors():
     result = second_collector.errors.is_empty()
 
     assert result is True
+
+
+def test_add_unchanged():
+    stats = PriceListStatsCollector()
+
+    stats.add_unchanged("Price Items")  # act
+
+    assert stats.tabs["Price Items"] == {
+        "synced": 0,
+        "error": 0,
+        "total": 1,
+        "skipped": 0,
+        "unchanged": 1,
+    }
@@ -0,0 +1,111 @@
+import pytest
+from cli.plugins.audit_plugin.audit_diff import AuditChange, AuditTreeDiff, ListAligner
+
+
+def parameter(external_id, name):
+    return {"externalId": external_id, "name": name}
+
+
+def test_compare_equal_trails():
+    audit_trail = {"object": {"id": "PRD-1", "parameters": [parameter("p1", "Name")]}}
+
+    result = AuditTreeDiff.compare(audit_trail, {**audit_trail})
+
+    assert result == []
+
+
+def test_compare_nested_values():
+    source_trail = {"object": {"name": "old", "status": "Draft", "settings": {"a": 1}}}
+    target_trail = {"object": {"name": "new", "status": "Draft", "settings": {"b": 2}}}
+
+    result = AuditTreeDiff.compare(source_trail, target_trail)
+
+    assert result == [
+        AuditChange("object.name", "old", "new"),
+        AuditChange("object.settings.a", 1, None),
+        AuditChange("object.settings.b", None, 2),
+    ]
+
+
+def test_compare_missing_equals_null():
+    result = AuditTreeDiff.compare({"object": {"name": None}}, {"object": {}})
+
+    assert result == []
+
+
+def test_compare_insert_into_identified_list():
+    source_trail = {"parameters": [parameter("p1", "First"), parameter("p2", "Second")]}
+    target_trail = {
+        "parameters": [
+            parameter("p1", "First"),
+            parameter("p3", "Third"),
+            parameter("p2", "Second"),
+        ]
+    }
+
+    result = AuditTreeDiff.compare(source_trail, target_trail)
+
+    assert result == [
+        AuditChange("parameters[1].externalId (externalId: p3)", None, "p3"),
+        AuditChange("parameters[1].name (externalId: p3)", None, "Third"),
+    ]
+
+
+def test_compare_moved_and_changed_element():
+    source_trail = {"parameters": [parameter("p1", "First"), parameter("p2", "Second")]}
+    target_trail = {"parameters": [parameter("p2", "Renamed"), parameter("p1", "First")]}
+
+    result = AuditTreeDiff.compare(source_trail, target_trail)
+
+    assert result == [AuditChange("parameters[0].name (externalId: p2)", "Second", "Renamed")]
+
+
+def test_compare_removed_element():
+    second_item = {"id": "ITM-2", "name": "Two"}
+    source_trail = {"items": [{"id": "ITM-1", "name": "One"}, second_item]}
+    target_trail = {"items": [second_item]}
+
+    result = AuditTreeDiff.compare(source_trail, target_trail)
+
+    assert result == [
+        AuditChange("items[0].id", "ITM-1", None),
+        AuditChange("items[0].name", "One", None),
+    ]
+
+
+def test_compare_scalar_list():
+    source_trail = {"tags": ["a", "b", "c"]}
+    target_trail = {"tags": ["a", "x", "c", "d"]}
+
+    result = AuditTreeDiff.compare(source_trail, target_trail)
+
+    assert result == [
+        AuditChange("tags[1]", "b", "x"),
+        AuditChange("tags[3]", None, "d"),
+    ]
+
+
+def test_compare_outermost_external_id():
+    source_trail = {"groups": [{"externalId": "g1", "options": [parameter("o1", "Old")]}]}
+    target_trail = {"groups": [{"externalId": "g1", "options": [parameter("o1", "New")]}]}
+
+    result = AuditTreeDiff.compare(source_trail, target_trail)
+
+    assert result == [AuditChange("groups[0].options[0].name (externalId: g1)", "Old", "New")]
+
+
+@pytest.mark.parametrize(
+    ("source_list", "target_list", "expected_pairs"),
+    [
+        ([], [], []),
+        ([1, 2], [1, 2], [(0, 0), (1, 1)]),
+        ([1, 2], [2], [(1, 0), (0, None)]),
+        ([1], [3, 1], [(None, 0), (0, 1)]),
+        ([{"id": "a"}, {"id": "b"}], [{"id": "b"}, {"id": "a"}], [(1, 0), (0, 1)]),  # noqa: WPS221
+        ([{"id": "a"}, 1], [{"id": "c"}, 2], [(None, 0), (0, None), (1, 1)]),  # noqa: WPS221
+    ],
+)
+def test_list_aligner(source_list, target_list, expected_pairs):
+    result = ListAligner(source_list, target_list).align()
+
+    assert result == expected_pairs
@@ -1,4 +1,5 @@
 import pytest
+from cli.core.state import state
 from cli.swocli import app
 from typer.testing import CliRunner
 
@@ -31,3 +32,85 @@ def test_version():
     result = runner.invoke(app, ["--version"])
 
     assert result.exit_code == 0
+
+
+def test_trace_prints_summary_and_dumps_traces(mocker, tmp_path):
+    mocker.patch("cli.core.accounts.app.get_or_create_accounts", return_value=[], autospec=True)
+    trace_file = tmp_path / "traces.jsonl"
+
+    result = runner.invoke(app, ["--trace-file", str(trace_file), "accounts", "list"])
+
+    assert result.exit_code == 0, result.stdout
+    assert trace_file.exists()
+    assert "Request traces have been written to" in result.stdout
+
+
+def test_profile_writes_profile_and_chrome_trace(mocker, tmp_path):
+    mocker.patch("cli.core.accounts.app.get_or_create_accounts", return_value=[], autospec=True)
+    profile_path = tmp_path / "run.prof"
+
+    result = runner.invoke(app, ["--profile", str(profile_path), "accounts", "list"])
+
+    assert result.exit_code == 0, result.stdout
+    assert profile_path.exists()
+    assert (tmp_path / "run.trace.json").exists()
+    assert "Chrome trace has been written to" in result.stdout
+
+
+def test_track_memory_prints_memory_report(mocker):
+    mocker.patch("cli.core.accounts.app.get_or_create_accounts", return_value=[], autospec=True)
+
+    result = runner.invoke(app, ["--memory-budget", "1024", "accounts", "list"])
+
+    assert result.exit_code == 0, result.stdout
+    assert "Memory peak" in result.stdout
+
+
+def test_record_writes_cassette(mocker, tmp_path):
+    mocker.patch("cli.core.accounts.app.get_or_create_accounts", return_value=[], autospec=True)
+    cassette_path = tmp_path / "cassette.jsonl"
+
+    result = runner.invoke(app, ["--record", str(cassette_path), "accounts", "list"])
+
+    assert result.exit_code == 0, result.stdout
+    assert cassette_path.exists()
+    assert "0 API exchanges have been recorded to" in result.stdout
+
+
+def test_record_and_replay_are_exclusive(tmp_path):
+    cassette_path = tmp_path / "cassette.jsonl"
+    cassette_path.write_text("", encoding="utf-8")
+
+    result = runner.invoke(
+        app, ["--record", str(cassette_path), "--replay", str(cassette_path), "accounts", "list"]
+    )
+
+    assert result.exit_code == 1
+    assert "Cannot use both --record and --replay together" in result.stdout
+
+
+def test_max_request_rate_sets_governor_rate(mocker):
+    mocker.patch("cli.core.accounts.app.get_or_create_accounts", return_value=[], autospec=True)
+    mocker.patch.object(state, "request_governor", None)
+
+    result = runner.invoke(app, ["--max-request-rate", "5", "accounts", "list"])
+
+    assert state.request_governor.settings.max_rate == 5, result.stdout
+
+
+def test_max_retries_sets_governor_retries(mocker):
+    mocker.patch("cli.core.accounts.app.get_or_create_accounts", return_value=[], autospec=True)
+    mocker.patch.object(state, "request_governor", None)
+
+    result = runner.invoke(app, ["--max-retries", "0", "accounts", "list"])
+
+    assert state.request_governor.settings.max_retries == 0, result.stdout
+
+
+def test_cache_ttl_enables_response_cache(mocker):
+    mocker.patch("cli.core.accounts.app.get_or_create_accounts", return_value=[], autospec=True)
+    mocker.patch.object(state, "response_cache", None)
+
+    result = runner.invoke(app, ["--cache-ttl", "60", "accounts", "list"])
+
+    assert state.response_cache.ttl == 60, result.stdout
@@ -0,0 +1,23 @@
+from tests.workloads.fake_api import (
+    FakeMPTAPI,
+    FakeMPTServer,
+    FaultInjection,
+    seed_price_list,
+    seed_product_catalog,
+)
+from tests.workloads.generator import (
+    ProductWorkload,
+    generate_price_list_workbook,
+    generate_product_workbook,
+)
+
+__all__ = [
+    "FakeMPTAPI",
+    "FakeMPTServer",
+    "FaultInjection",
+    "ProductWorkload",
+    "generate_price_list_workbook",
+    "generate_product_workbook",
+    "seed_price_list",
+    "seed_product_catalog",
+]
@@ -0,0 +1,81 @@
+"""Generate synthetic workbooks from the command line.
+
+Examples:
+    python -m tests.workloads product PRD-1234-1234.xlsx --items 10000 --parameters 5000
+    python -m tests.workloads pricelist PRC-1234-1234-1234.xlsx --price-items 50000
+    python -m tests.workloads serve --port 8000 --items 10000 --latency 0.05
+"""
+
+import threading
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from tests.workloads import ProductWorkload, generate_price_list_workbook, generate_product_workbook
+from tests.workloads.fake_api import (
+    FakeMPTAPI,
+    FakeMPTServer,
+    FaultInjection,
+    seed_price_list,
+    seed_product_catalog,
+)
+
+app = typer.Typer(help="Generate synthetic workbooks and serve a fake Marketplace API.")
+
+
+@app.command("product")
+def product(  # noqa: WPS211
+    file_path: Annotated[Path, typer.Argument(dir_okay=False)],
+    item_count: Annotated[int, typer.Option("--items", min=0)] = 10000,
+    item_group_count: Annotated[int, typer.Option("--item-groups", min=1)] = 20,
+    parameter_group_count: Annotated[int, typer.Option("--parameter-groups", min=1)] = 20,
+    parameter_count: Annotated[
+        int, typer.Option("--parameters", min=0, help="Spread across all parameter scopes")
+    ] = 5000,
+    template_count: Annotated[int, typer.Option("--templates", min=0)] = 30,
+) -> None:
+    """Generate a product definition workbook."""
+    workload = ProductWorkload(
+        item_count=item_count,
+        item_group_count=item_group_count,
+        parameter_group_count=parameter_group_count,
+        parameter_count=parameter_count,
+        template_count=template_count,
+    )
+    typer.echo(f"Product definition written to {generate_product_workbook(file_path, workload)}")
+
+
+@app.command("pricelist")
+def price_list(
+    file_path: Annotated[Path, typer.Argument(dir_okay=False)],
+    price_items: Annotated[int, typer.Option(min=0)] = 50000,
+) -> None:
+    """Generate a price list workbook."""
+    typer.echo(f"Price list written to {generate_price_list_workbook(file_path, price_items)}")
+
+
+@app.command("serve")
+def serve(  # noqa: WPS211
+    port: Annotated[int, typer.Option(min=0)] = 8000,
+    item_count: Annotated[int, typer.Option("--items", min=0)] = 10000,
+    price_items: Annotated[int, typer.Option(min=0)] = 50000,
+    latency: Annotated[float, typer.Option(min=0, help="Seconds added to every request")] = 0,
+    error_rate: Annotated[float, typer.Option(min=0, max=1)] = 0,
+    error_status: Annotated[int, typer.Option()] = 503,
+) -> None:
+    """Serve a seeded fake Marketplace API until interrupted."""
+    api = FakeMPTAPI()
+    seed_product_catalog(api, ProductWorkload(item_count=item_count))
+    seed_price_list(api, price_items)
+    faults = FaultInjection(latency=latency, error_rate=error_rate, error_status=error_status)
+    with FakeMPTServer(api, faults, ("127.0.0.1", port)) as server:
+        typer.echo(f"Fake Marketplace API listening on {server.base_url}, press Ctrl+C to stop")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            typer.echo(f"Served {server.request_count} requests")
+
+
+if __name__ == "__main__":
+    app()
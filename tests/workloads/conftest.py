@@ -0,0 +1,35 @@
+import pytest
+from mpt_api_client import MPTClient
+from mpt_api_client.auth import BearerTokenAuthentication
+
+from tests.workloads.fake_api import (
+    FakeMPTAPI,
+    FakeMPTServer,
+    seed_price_list,
+    seed_product_catalog,
+)
+from tests.workloads.generator import ProductWorkload
+
+SEEDED_ITEM_COUNT = 25
+
+
+@pytest.fixture
+def fake_api():
+    api = FakeMPTAPI()
+    seed_product_catalog(api, ProductWorkload(item_count=SEEDED_ITEM_COUNT, parameter_count=10))
+    seed_price_list(api, price_items=5)
+    return api
+
+
+@pytest.fixture
+def fake_server(fake_api):
+    with FakeMPTServer(fake_api) as server:
+        yield server
+
+
+@pytest.fixture
+def fake_mpt_client(fake_server):
+    return MPTClient.from_config(
+        authentication=BearerTokenAuthentication("idt:TKN-1234-1234:synthetic"),
+        base_url=fake_server.base_url,
+    )
@@ -0,0 +1,443 @@
+"""Local stand-in for the Marketplace API endpoints the ``*APIService`` classes call.
+
+Resources live in memory, keyed by collection path such as ``catalog/products`` or
+``catalog/price-lists/PRC-1234-1234-1234/items``. The server answers with the same
+pagination envelope as the real API, so ``MPTClient`` and the API services work against it
+unchanged. Latency and error injection make it usable for end-to-end throughput tests.
+"""
+
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from email import policy
+from email.parser import BytesParser
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from types import MappingProxyType, TracebackType
+from typing import Any, Self
+
+from tests.workloads import records
+from tests.workloads.generator import PARAMETER_FILE_MANAGERS, ProductWorkload
+from tests.workloads.rql import parse_query_string, resolve_field
+
+API_PREFIX = "/public/v1/"
+COLLECTION_ID_PREFIXES = MappingProxyType({
+    "api-tokens": "TKN",
+    "item-groups": "IGR",
+    "items": "ITM",
+    "parameter-groups": "PGR",
+    "parameters": "PAR",
+    "price-lists": "PRC",
+    "products": "PRD",
+    "records": "AUD",
+    "templates": "TPL",
+    "units-of-measure": "UNT",
+})
+ACTION_STATUSES = MappingProxyType({
+    "publish": "Published",
+    "review": "Pending",
+    "unpublish": "Unpublished",
+})
+RETRYABLE_STATUSES = frozenset((HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE))
+DEFAULT_PAGE_SIZE = 100
+AUDIT_RECORDS_COUNT = 10
+
+type Collection = dict[str, dict[str, Any]]
+type Payload = dict[str, Any] | None
+
+
+@dataclass(frozen=True)
+class FakeResponse:
+    """Status and JSON body returned by the fake API."""
+
+    status: int
+    body: Any = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Route:
+    """The collection and resource a request path addresses.
+
+    Attributes:
+        collection_path: Collection path without the API prefix, e.g. ``catalog/items``.
+        raw_query: Query string, RQL included.
+        resource_id: Resource ID, when the path addresses one resource.
+        sub_resource: Trailing action or sub-resource name, e.g. ``publish`` or ``settings``.
+
+    """
+
+    collection_path: str
+    raw_query: str = ""
+    resource_id: str | None = None
+    sub_resource: str | None = None
+
+    @classmethod
+    def from_path(cls, path: str) -> Self:
+        """Split a request path with its query string into a route."""
+        route_path, _, raw_query = path.removeprefix(API_PREFIX).partition("?")
+        segments = route_path.strip("/").split("/")
+        # After the namespace, paths alternate collection names and IDs, e.g.
+        # catalog/products/PRD-1/templates/TPL-1. A trailing segment that is not a collection
+        # is an action (POST .../publish) or a sub-resource update (PUT .../settings).
+        if len(segments) % 2:
+            return cls("/".join(segments[:-1]), raw_query, segments[-1])  # noqa: WPS221
+        if len(segments) == 2 or segments[-1] in COLLECTION_ID_PREFIXES:
+            return cls("/".join(segments), raw_query)
+        return cls("/".join(segments[:-2]), raw_query, *segments[-2:])  # noqa: WPS221
+
+
+@dataclass(frozen=True)
+class FaultInjection:
+    """Latency and errors added to every request served by :class:`FakeMPTServer`.
+
+    Attributes:
+        latency: Seconds to wait before answering each request.
+        error_rate: Fraction of requests, between 0 and 1, answered with ``error_status``.
+        error_status: HTTP status of injected errors. 429 and 503 carry ``Retry-After``.
+        seed: Seed of the random generator choosing the failed requests.
+
+    """
+
+    latency: float = 0
+    error_rate: float = 0
+    error_status: int = HTTPStatus.SERVICE_UNAVAILABLE
+    seed: int | None = None
+
+
+def error_response(status: int, detail: str) -> FakeResponse:
+    """Build an error in the problem-details shape the Marketplace API uses."""
+    http_status = HTTPStatus(status)
+    return FakeResponse(
+        status,
+        {"status": status, "title": http_status.phrase, "detail": detail, "traceId": "fake"},
+    )
+
+
+class FakeMPTAPI:
+    """In-memory Marketplace API.
+
+    ``handle`` routes a request to a list, get, create, update, delete or action on the
+    addressed collection. Collections do not need to be declared up front: posting to any
+    collection path creates it.
+    """
+
+    def __init__(self) -> None:
+        self._collections: defaultdict[str, Collection] = defaultdict(dict)
+        self._sequence = count(1)
+        self._lock = threading.Lock()
+
+    def seed(self, collection_path: str, json_records: list[dict[str, Any]]) -> None:
+        """Store records in a collection, replacing records with the same ID."""
+        with self._lock:
+            collection = self._collections[collection_path]
+            collection.update((json_record["id"], json_record) for json_record in json_records)
+
+    def records(self, collection_path: str) -> list[dict[str, Any]]:
+        """Return the records currently stored in a collection."""
+        with self._lock:
+            return list(self._collections[collection_path].values())
+
+    def dispatch(self, method: str, path: str, payload: Payload) -> FakeResponse:
+        """Serve one request.
+
+        Args:
+            method: HTTP method.
+            path: Request path with the query string, e.g. ``/public/v1/catalog/items?limit=1``.
+            payload: Decoded JSON body, if any.
+
+        Returns:
+            The response to send.
+
+        """
+        route = Route.from_path(path)
+        try:
+            with self._lock:
+                collection = self._collections[route.collection_path]
+                if route.resource_id is None:
+                    return self._dispatch_collection(method, route, payload)
+                if route.resource_id not in collection:
+                    return error_response(HTTPStatus.NOT_FOUND, f"{route.resource_id} not found")
+                return self._dispatch_resource(method, collection, route, payload)
+        except ValueError as error:
+            return error_response(HTTPStatus.BAD_REQUEST, str(error))
+
+    def _dispatch_collection(self, method: str, route: Route, payload: Payload) -> FakeResponse:
+        if method == "POST":
+            return FakeResponse(
+                HTTPStatus.CREATED, self._create(route.collection_path, payload or {})
+            )
+        if method != "GET":
+            return error_response(
+                HTTPStatus.METHOD_NOT_ALLOWED, f"{method} {route.collection_path}"
+            )
+
+        query_params, predicate = parse_query_string(route.raw_query)
+        matched = [
+            json_record
+            for json_record in self._collections[route.collection_path].values()
+            if predicate(json_record)
+        ]
+        _sort_records(matched, query_params.get("order", ""))
+        limit = int(query_params.get("limit", DEFAULT_PAGE_SIZE))
+        offset = int(query_params.get("offset", 0))
+        return FakeResponse(
+            HTTPStatus.OK,
+            {
+                "$meta": {"pagination": {"offset": offset, "limit": limit, "total": len(matched)}},
+                "data": matched[offset : offset + limit],
+            },
+        )
+
+    def _dispatch_resource(
+        self, method: str, collection: Collection, route: Route, payload: Payload
+    ) -> FakeResponse:
+        json_record = collection[str(route.resource_id)]
+        sub_resource = route.sub_resource
+        if method == "DELETE":
+            collection.pop(json_record["id"])
+            return FakeResponse(HTTPStatus.NO_CONTENT)
+        if method in {"PUT", "PATCH"}:
+            target = json_record.setdefault(sub_resource, {}) if sub_resource else json_record
+            _merge(target, payload or {})
+        elif method == "POST" and sub_resource:
+            json_record["status"] = ACTION_STATUSES.get(sub_resource, json_record.get("status"))
+        return FakeResponse(HTTPStatus.OK, json_record)
+
+    def _create(self, collection_path: str, payload: dict[str, Any]) -> dict[str, Any]:
+        collection_name = collection_path.rsplit("/", 1)[-1]
+        prefix = COLLECTION_ID_PREFIXES.get(collection_name, "OBJ")
+        resource_id = records.child_id(prefix, "FAKE-0000-0000", next(self._sequence))
+        json_record = {**payload, "id": resource_id, "audit": records.audit(0)}
+        self._collections[collection_path][resource_id] = json_record
+        return json_record
+
+
+class FakeMPTServer:
+    """Serve a :class:`FakeMPTAPI` over HTTP on a background thread.
+
+    Use it as a context manager and point ``MPTClient`` or an account environment at
+    ``base_url``::
+
+        with FakeMPTServer(api, FaultInjection(latency=0.05)) as server:
+            client = MPTClient.from_config(authentication=..., base_url=server.base_url)
+
+    """
+
+    def __init__(
+        self,
+        api: FakeMPTAPI | None = None,
+        faults: FaultInjection | None = None,
+        address: tuple[str, int] = ("127.0.0.1", 0),
+    ) -> None:
+        self.api = api or FakeMPTAPI()
+        self.faults = faults or FaultInjection()
+        self.request_count = 0
+        self._random = random.Random(self.faults.seed)  # noqa: S311
+        self._counter_lock = threading.Lock()
+        self._http_server = ThreadingHTTPServer(address, _FakeMPTRequestHandler)
+        self._http_server.fake_server = self  # type: ignore[attr-defined]
+        self._thread = threading.Thread(target=self._http_server.serve_forever, daemon=True)
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._http_server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """Start serving requests on the background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving requests and release the socket."""
+        self._http_server.shutdown()
+        self._http_server.server_close()
+
+    def respond(self, method: str, path: str, payload: Payload) -> FakeResponse:
+        """Apply the fault injection settings and let the API serve the request."""
+        with self._counter_lock:
+            self.request_count += 1
+            is_failed = self._random.random() < self.faults.error_rate
+
+        time.sleep(self.faults.latency)
+        if not is_failed:
+            return self.api.dispatch(method, path, payload)
+
+        response = error_response(self.faults.error_status, "Injected error")
+        if self.faults.error_status in RETRYABLE_STATUSES:
+            response.headers["Retry-After"] = "0"
+        return response
+
+
+def seed_product_catalog(
+    api: FakeMPTAPI, workload: ProductWorkload, product_id: str = records.PRODUCT_ID
+) -> None:
+    """Store a product with its items, groups, parameters, templates and audit records.
+
+    The records are the ones :func:`generate_product_workbook` writes, so a generated
+    workbook syncs against the seeded catalog as an update of existing resources. A vendor
+    and an operations API token are stored too, so ``swocli accounts add`` works against
+    the server.
+    """
+    api.seed(
+        "accounts/api-tokens",
+        [
+            records.api_token_record(),
+            records.api_token_record(records.OPERATIONS_API_TOKEN_ID, records.OPERATIONS_ACCOUNT),
+        ],
+    )
+    api.seed("catalog/units-of-measure", [records.unit_of_measure_record()])
+    api.seed("catalog/products", [records.product_record(product_id)])
+    api.seed(
+        "catalog/items",
+        [
+            records.item_record(index, workload.item_group_count, product_id)
+            for index in _indexes(workload.item_count)
+        ],
+    )
+    api.seed(
+        "audit/records",
+        [records.audit_record(index, product_id) for index in _indexes(AUDIT_RECORDS_COUNT)],
+    )
+    _seed_product_components(api, workload, product_id)
+
+
+def seed_price_list(
+    api: FakeMPTAPI, price_items: int, price_list_id: str = records.PRICE_LIST_ID
+) -> None:
+    """Store a price list with the price items :func:`generate_price_list_workbook` writes."""
+    api.seed("catalog/price-lists", [records.price_list_record(price_list_id)])
+    api.seed(
+        f"catalog/price-lists/{price_list_id}/items",
+        [records.price_item_record(index, price_list_id) for index in _indexes(price_items)],
+    )
+
+
+class _FakeMPTRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self._respond()
+
+    def do_POST(self) -> None:
+        self._respond()
+
+    def do_PUT(self) -> None:
+        self._respond()
+
+    def do_PATCH(self) -> None:
+        self._respond()
+
+    def do_DELETE(self) -> None:
+        self._respond()
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002, WPS125
+        """Keep the console quiet; use ``--trace`` on the CLI side to inspect requests."""
+
+    def _respond(self) -> None:  # noqa: WPS210
+        fake_server: FakeMPTServer = self.server.fake_server  # type: ignore[attr-defined]
+        request_body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        payload = _decode_payload(self.headers.get("Content-Type", ""), request_body)
+        response = fake_server.respond(self.command, self.path, payload)
+        response_body = json.dumps(response.body).encode() if response.body else b""
+        self.send_response(response.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response_body)))
+        for header_name, header_value in response.headers.items():
+            self.send_header(header_name, header_value)
+        self.end_headers()
+        self.wfile.write(response_body)
+
+
+def _decode_payload(content_type: str, request_body: bytes) -> Payload:
+    if not request_body:
+        return None
+    if not content_type.startswith("multipart/"):
+        return json.loads(request_body)
+
+    # The JSON part of a multipart create is the resource; file parts are ignored.
+    message = BytesParser(policy=policy.default).parsebytes(
+        b"".join((b"Content-Type: ", content_type.encode(), b"\r\n\r\n", request_body))
+    )
+    return next(
+        json.loads(part.get_payload(decode=True))
+        for part in message.iter_parts()
+        if part.get_content_type() == "application/json"
+    )
+
+
+def _seed_product_components(api: FakeMPTAPI, workload: ProductWorkload, product_id: str) -> None:
+    product_path = f"catalog/products/{product_id}"
+    scopes = [scope for scope, _, _ in PARAMETER_FILE_MANAGERS]
+    api.seed(
+        f"{product_path}/item-groups",
+        [
+            records.item_group_record(index, product_id)
+            for index in _indexes(workload.item_group_count)
+        ],
+    )
+    api.seed(
+        f"{product_path}/parameter-groups",
+        [
+            records.parameter_group_record(index, product_id)
+            for index in _indexes(workload.parameter_group_count)
+        ],
+    )
+    # Same round-robin scope assignment as the workbook generator.
+    api.seed(
+        f"{product_path}/parameters",
+        [
+            records.parameter_record(
+                index, scopes[(index - 1) % len(scopes)], workload.parameter_group_count, product_id
+            )
+            for index in _indexes(workload.parameter_count)
+        ],
+    )
+    api.seed(
+        f"{product_path}/templates",
+        [records.template_record(index, product_id) for index in _indexes(workload.template_count)],
+    )
+
+
+def _merge(target: dict[str, Any], payload: dict[str, Any]) -> None:
+    # Nested references such as {"product": {"id": ...}} only carry the ID in update
+    # payloads; merging keeps the expanded fields the real API would render.
+    for field_name, field_value in payload.items():
+        nested = target.get(field_name)
+        if isinstance(nested, dict) and isinstance(field_value, dict):
+            _merge(nested, field_value)
+        else:
+            target[field_name] = field_value
+
+
+def _sort_records(json_records: list[dict[str, Any]], order: str) -> None:
+    # Sorting by the last key first keeps earlier keys dominant since sort is stable.
+    for order_field in reversed(order.split(",")):
+        field_path = order_field.lstrip("-")
+        if field_path:
+            json_records.sort(key=_sort_key(field_path), reverse=order_field.startswith("-"))
+
+
+def _sort_key(field_path: str) -> Callable[[dict[str, Any]], str]:
+    return lambda json_record: str(resolve_field(json_record, field_path))
+
+
+def _indexes(count_value: int) -> range:
+    return range(1, count_value + 1)
@@ -0,0 +1,197 @@
+"""Write synthetic product and price list workbooks through the real export code path.
+
+Records are turned into data models with ``from_json`` and written by the same file
+managers the export commands use, so the generated workbooks carry the real column
+layout, styles and data validations.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from cli.core.price_lists.handlers import PriceListExcelFileManager, PriceListItemExcelFileManager
+from cli.core.price_lists.models import ItemData as PriceItemData
+from cli.core.price_lists.models import PriceListData
+from cli.core.price_lists.models.item import ItemAction
+from cli.core.products import handlers as product_handlers
+from cli.core.products import models as product_models
+from cli.core.products.handlers.parameters_excel_file_manager import AssetParametersExcelFileManager
+from cli.core.products.models import DataActionEnum
+
+from tests.workloads import records
+
+PARAMETER_FILE_MANAGERS = (
+    (
+        "Agreement",
+        product_handlers.AgreementParametersExcelFileManager,
+        product_models.AgreementParametersData,
+    ),
+    ("Asset", AssetParametersExcelFileManager, product_models.AssetParametersData),
+    ("Item", product_handlers.ItemParametersExcelFileManager, product_models.ItemParametersData),
+    (
+        "Request",
+        product_handlers.RequestParametersExcelFileManager,
+        product_models.RequestParametersData,
+    ),
+    (
+        "Subscription",
+        product_handlers.SubscriptionParametersExcelFileManager,
+        product_models.SubscriptionParametersData,
+    ),
+)
+
+
+@dataclass(frozen=True)
+class ProductWorkload:
+    """Row counts of a synthetic product definition.
+
+    Attributes:
+        item_count: Number of rows in the Items tab.
+        item_group_count: Number of rows in the Items Groups tab.
+        parameter_group_count: Number of rows in the Parameters Groups tab.
+        parameter_count: Number of parameters, spread evenly across all parameter scopes.
+        template_count: Number of rows in the Templates tab.
+        action: Action written in every row of the related tabs. ``update`` makes a sync
+            send every row to the API; the default leaves the rows skipped, like an export.
+
+    """
+
+    item_count: int = 10
+    item_group_count: int = 2
+    parameter_group_count: int = 2
+    parameter_count: int = 10
+    template_count: int = 3
+    action: DataActionEnum = DataActionEnum.SKIP
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows in the related tabs, General and Settings excluded."""
+        return (
+            self.item_count
+            + self.item_group_count
+            + self.parameter_group_count
+            + self.parameter_count
+            + self.template_count
+        )
+
+
+def generate_product_workbook(
+    file_path: Path, workload: ProductWorkload, product_id: str = records.PRODUCT_ID
+) -> Path:
+    """Write a product definition workbook with the given row counts.
+
+    Args:
+        file_path: Destination workbook. It is overwritten if it exists.
+        workload: Row counts per tab.
+        product_id: Product ID written in the General tab and used in every resource ID.
+
+    Returns:
+        The path of the generated workbook.
+
+    """
+    file_path.unlink(missing_ok=True)
+    target = str(file_path)
+    _write_general(target, product_id)
+    _write_tab(
+        product_handlers.ItemGroupExcelFileManager(target),
+        product_models.ItemGroupData,
+        [
+            records.item_group_record(index, product_id)
+            for index in _indexes(workload.item_group_count)
+        ],
+        workload.action,
+    )
+    _write_tab(
+        product_handlers.ParameterGroupExcelFileManager(target),
+        product_models.ParameterGroupData,
+        [
+            records.parameter_group_record(index, product_id)
+            for index in _indexes(workload.parameter_group_count)
+        ],
+        workload.action,
+    )
+    _write_parameters(target, workload, product_id)
+    _write_tab(
+        product_handlers.ItemExcelFileManager(target),
+        product_models.ItemData,
+        [
+            records.item_record(index, workload.item_group_count, product_id)
+            for index in _indexes(workload.item_count)
+        ],
+        workload.action,
+    )
+    _write_tab(
+        product_handlers.TemplateExcelFileManager(target),
+        product_models.TemplateData,
+        [records.template_record(index, product_id) for index in _indexes(workload.template_count)],
+        workload.action,
+    )
+    return file_path
+
+
+def generate_price_list_workbook(
+    file_path: Path,
+    price_items: int,
+    price_list_id: str = records.PRICE_LIST_ID,
+    action: ItemAction = ItemAction.SKIP,
+) -> Path:
+    """Write a price list workbook with the given number of price items.
+
+    Args:
+        file_path: Destination workbook. It is overwritten if it exists.
+        price_items: Number of rows in the Price Items tab.
+        price_list_id: Price list ID written in the General tab and used in item IDs.
+        action: Action written in every price item row.
+
+    Returns:
+        The path of the generated workbook.
+
+    """
+    file_path.unlink(missing_ok=True)
+    target = str(file_path)
+    price_list_file_manager = PriceListExcelFileManager(target)
+    price_list_file_manager.create_tab()
+    price_list_file_manager.add(PriceListData.from_json(records.price_list_record(price_list_id)))
+    _write_tab(
+        PriceListItemExcelFileManager(target),
+        PriceItemData,
+        [records.price_item_record(index, price_list_id) for index in _indexes(price_items)],
+        action,
+    )
+    return file_path
+
+
+def _indexes(count: int) -> range:
+    return range(1, count + 1)
+
+
+def _write_general(target: str, product_id: str) -> None:
+    product = product_models.ProductData.from_json(records.product_record(product_id))
+    product_file_manager = product_handlers.ProductExcelFileManager(target)
+    product_file_manager.create_tab()
+    product_file_manager.add(product)
+    settings_file_manager = product_handlers.SettingsExcelFileManager(target)
+    settings_file_manager.create_tab()
+    settings_file_manager.add(product.settings.records)
+
+
+def _write_parameters(target: str, workload: ProductWorkload, product_id: str) -> None:
+    # Parameters are dealt round-robin to the scopes so every scope tab gets its share.
+    scopes_count = len(PARAMETER_FILE_MANAGERS)
+    for scope_index, (scope, file_manager_class, data_model) in enumerate(PARAMETER_FILE_MANAGERS):
+        _write_tab(
+            file_manager_class(target),
+            data_model,
+            [
+                records.parameter_record(index, scope, workload.parameter_group_count, product_id)
+                for index in range(scope_index + 1, workload.parameter_count + 1, scopes_count)
+            ],
+            workload.action,
+        )
+
+
+def _write_tab(file_manager, data_model, json_records, action: DataActionEnum | ItemAction) -> None:
+    data_models = [data_model.from_json(json_record) for json_record in json_records]
+    for row_model in data_models:
+        row_model.action = action
+    file_manager.create_tab()
+    file_manager.add(data_models)
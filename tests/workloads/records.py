@@ -0,0 +1,254 @@
+"""Synthetic Marketplace API payloads shaped like the real catalog responses.
+
+Every factory is deterministic for a given index so generated workbooks and fake API
+responses stay stable between runs.
+"""
+
+import datetime as dt
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+PRODUCT_ID = "PRD-1234-1234"
+PRICE_LIST_ID = "PRC-1234-1234-1234"
+VENDOR_ACCOUNT = MappingProxyType({
+    "id": "ACC-1234-1234",
+    "type": "Vendor",
+    "name": "Synthetic Vendor",
+})
+OPERATIONS_ACCOUNT = MappingProxyType({
+    "id": "ACC-0000-0001",
+    "type": "Operations",
+    "name": "Synthetic Operations",
+})
+API_TOKEN_ID = "TKN-1234-1234"
+OPERATIONS_API_TOKEN_ID = "TKN-0000-0001"
+UNIT_OF_MEASURE = MappingProxyType({"id": "UNT-1916", "name": "user"})
+AUDIT_STARTED_AT = dt.datetime.fromisoformat("2025-06-03T13:00:00+00:00")
+SCOPE_PHASES = MappingProxyType({
+    "Agreement": "Order",
+    "Asset": "Fulfillment",
+    "Item": "Configuration",
+    "Request": "Order",
+    "Subscription": "Fulfillment",
+})
+TEMPLATE_TYPES = ("OrderProcessing", "OrderCompleted", "OrderQuerying")
+ITEM_TERMS = (
+    {"model": "one-time", "period": "one-time"},
+    {"model": "quantity", "period": "1m", "commitment": "1y"},
+    {"model": "quantity", "period": "1y", "commitment": "1y"},
+)
+DISPLAY_ORDER_STEP = 10
+ITEM_PRICE_STEP = 0.25
+USERS_COUNT = 100
+
+
+def child_id(prefix: str, parent_id: str, index: int) -> str:
+    """Build the ID of a resource nested under a parent, e.g. ``ITM-1234-1234-0001``."""
+    _, parent_number = parent_id.split("-", 1)
+    return f"{prefix}-{parent_number}-{index:04d}"  # noqa: WPS237
+
+
+def external_ids(index: int) -> dict[str, str]:
+    """Return the vendor and operations external IDs of the item with the given index."""
+    return {"vendor": f"VND-{index:06d}", "operations": f"OPS-{index:06d}"}  # noqa: WPS237
+
+
+def audit(index: int) -> dict[str, Any]:
+    """Return the audit block shared by every catalog resource."""
+    user_id = child_id("USR", "USR-0000", index % USERS_COUNT)
+    return {
+        "created": {"at": "2024-03-19T11:16:57.932Z", "by": {"id": user_id}},
+        "updated": {"at": "2025-06-03T13:06:19.743Z", "by": {"id": user_id}},
+    }
+
+
+def product_record(product_id: str = PRODUCT_ID) -> dict[str, Any]:
+    """Return a product payload with every setting the General and Settings tabs need."""
+    return {
+        "id": product_id,
+        "name": f"Synthetic product {product_id}",
+        "shortDescription": "Synthetic product generated for performance tests",
+        "longDescription": "Synthetic product generated for performance tests",
+        "externalIds": {"operations": ""},
+        "website": "https://www.example.com/",
+        "status": "Draft",
+        "vendor": dict(VENDOR_ACCOUNT),
+        "settings": {
+            "productOrdering": True,
+            "productRequests": {"enabled": False},
+            "itemSelection": True,
+            "orderQueueChanges": False,
+            "preValidation": {
+                "purchaseOrderDraft": True,
+                "purchaseOrderQuerying": True,
+                "changeOrderDraft": True,
+                "configurationOrderDraft": False,
+                "terminationOrder": True,
+                "productRequest": False,
+            },
+            "splitBilling": {"enabled": False},
+            "subscriptionCessation": {"enabled": True, "mode": "Termination"},
+        },
+        "audit": audit(0),
+    }
+
+
+def item_group_record(index: int, product_id: str = PRODUCT_ID) -> dict[str, Any]:
+    """Return the item group payload with the given index."""
+    return {
+        "id": child_id("IGR", product_id, index),
+        "name": f"Item group {index}",
+        "label": f"Item group {index}",
+        "description": f"Synthetic item group {index}",
+        "displayOrder": index * DISPLAY_ORDER_STEP,
+        "default": index == 1,
+        "multiple": True,
+        "required": index == 1,
+        "audit": audit(index),
+    }
+
+
+def item_record(index: int, item_groups: int, product_id: str = PRODUCT_ID) -> dict[str, Any]:
+    """Return the item payload with the given index, spread across the item groups."""
+    group_index = index % max(item_groups, 1) + 1
+    return {
+        "id": child_id("ITM", product_id, index),
+        "name": f"Synthetic item {index}",
+        "description": f"Synthetic item {index} description",
+        "externalIds": external_ids(index),
+        "group": {"id": child_id("IGR", product_id, group_index), "name": "Item group"},
+        "unit": dict(UNIT_OF_MEASURE),
+        "terms": ITEM_TERMS[index % len(ITEM_TERMS)],
+        "quantityNotApplicable": False,
+        "status": "Draft",
+        "product": {"id": product_id},
+        "audit": audit(index),
+    }
+
+
+def parameter_group_record(index: int, product_id: str = PRODUCT_ID) -> dict[str, Any]:
+    """Return the parameter group payload with the given index."""
+    return {
+        "id": child_id("PGR", product_id, index),
+        "name": f"Parameter group {index}",
+        "label": f"Parameter group {index}",
+        "description": f"Synthetic parameter group {index}",
+        "displayOrder": index * DISPLAY_ORDER_STEP,
+        "default": index == 1,
+        "audit": audit(index),
+    }
+
+
+def parameter_record(
+    index: int, scope: str, parameter_groups: int, product_id: str = PRODUCT_ID
+) -> dict[str, Any]:
+    """Return the parameter payload with the given index for one parameter scope."""
+    group_index = index % max(parameter_groups, 1) + 1
+    return {
+        "id": child_id("PAR", product_id, index),
+        "name": f"{scope} parameter {index}",
+        "description": f"Synthetic {scope.lower()} parameter {index}",
+        "group": {"id": child_id("PGR", product_id, group_index), "name": "Parameter group"},
+        "scope": scope,
+        "phase": SCOPE_PHASES[scope],
+        "context": "None",
+        "externalId": f"{scope.lower()}Parameter{index}",
+        "displayOrder": index * DISPLAY_ORDER_STEP,
+        "constraints": {"hidden": False, "readonly": False, "required": index % 2 == 0},
+        "options": {"hintText": f"Hint {index}", "placeholderText": f"Placeholder {index}"},
+        "type": "SingleLineText",
+        "status": "Active",
+        "audit": audit(index),
+    }
+
+
+def template_record(index: int, product_id: str = PRODUCT_ID) -> dict[str, Any]:
+    """Return the template payload with the given index."""
+    return {
+        "id": child_id("TPL", product_id, index),
+        "name": f"Template {index}",
+        "content": f"# Template {index}\n\nThank you for your order.",
+        "type": TEMPLATE_TYPES[index % len(TEMPLATE_TYPES)],
+        "default": False,
+        "audit": audit(index),
+    }
+
+
+def price_list_record(
+    price_list_id: str = PRICE_LIST_ID, product_id: str = PRODUCT_ID
+) -> dict[str, Any]:
+    """Return a price list payload."""
+    return {
+        "id": price_list_id,
+        "currency": "USD",
+        "precision": 2,
+        "defaultMarkup": 10,
+        "notes": "Synthetic price list generated for performance tests",
+        "externalIds": {},
+        "product": {"id": product_id, "name": f"Synthetic product {product_id}"},
+        "vendor": {"id": "ACC-1234-1234", "name": "Synthetic Vendor"},
+        "audit": audit(0),
+    }
+
+
+def price_item_record(
+    index: int, price_list_id: str = PRICE_LIST_ID, product_id: str = PRODUCT_ID
+) -> dict[str, Any]:
+    """Return the price list item payload with the given index."""
+    unit_price = round(1 + index * ITEM_PRICE_STEP, 2)
+    return {
+        "id": child_id("PRI", price_list_id, index),
+        "status": "ForSale",
+        "unitLP": unit_price,
+        "unitPP": unit_price,
+        "markup": 10,
+        "margin": 0,
+        "unitSP": unit_price,
+        "PPx1": unit_price,
+        "PPxM": unit_price,
+        "PPxY": unit_price,
+        "SPx1": unit_price,
+        "SPxM": unit_price,
+        "SPxY": unit_price,
+        "priceList": {"id": price_list_id, "currency": "USD", "precision": 2},
+        "item": {
+            "id": child_id("ITM", product_id, index),
+            "name": f"Synthetic item {index}",
+            "externalIds": external_ids(index),
+            "terms": {"period": "1y", "commitment": "1y"},
+            "status": "ForSale",
+        },
+        "audit": audit(index),
+    }
+
+
+def unit_of_measure_record() -> dict[str, Any]:
+    """Return the unit of measure every synthetic item uses."""
+    return {**UNIT_OF_MEASURE, "description": "Synthetic unit of measure", "audit": audit(0)}
+
+
+def api_token_record(
+    token_id: str = API_TOKEN_ID, account: Mapping[str, str] = VENDOR_ACCOUNT
+) -> dict[str, Any]:
+    """Return the API token payload ``accounts add`` resolves the account from."""
+    return {
+        "id": token_id,
+        "name": "Synthetic token",
+        "account": dict(account),
+        "token": f"idt:{token_id}:synthetic",
+    }
+
+
+def audit_record(index: int, object_id: str, object_type: str = "Product") -> dict[str, Any]:
+    """Return the audit record with the given index for one audited object."""
+    timestamp = AUDIT_STARTED_AT + dt.timedelta(minutes=index)
+    return {
+        "id": child_id("AUD", object_id, index),
+        "timestamp": timestamp.isoformat().replace("+00:00", "Z"),
+        "event": f"{object_type.lower()}.updated",
+        "object": {"id": object_id, "objectType": object_type, "name": f"Synthetic {object_id}"},
+        "actor": {"id": child_id("USR", "USR-0000", index % USERS_COUNT), "type": "User"},
+        "details": f"Synthetic change {index}",
+        "documents": [],
+    }
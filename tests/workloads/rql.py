@@ -0,0 +1,171 @@
+"""Evaluate the subset of RQL the API services send against in-memory records.
+
+Supported operators: ``and``, ``or``, ``not``, ``eq``, ``ne``, ``in``, ``out``, ``like`` and
+``ilike``. Field paths are dotted (``item.externalIds.vendor``) and matched
+case-insensitively, the same way the Marketplace API resolves them.
+"""
+
+import operator
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from types import MappingProxyType
+from typing import Any
+from urllib.parse import unquote
+
+type Record = Mapping[str, Any]
+type Predicate = Callable[[Record], bool]
+
+QUERY_PARAMETERS = frozenset(("limit", "offset", "order", "select"))
+SPECIAL_CHARACTERS = "(),"
+
+
+@dataclass(frozen=True)
+class RQLNode:
+    """A parsed RQL call such as ``eq(status,Draft)``.
+
+    Attributes:
+        operator: Call name. Empty for a parenthesised value list, e.g. ``(a,b)``.
+        arguments: Nested calls or plain string values.
+
+    """
+
+    operator: str
+    arguments: tuple["RQLNode | str", ...]
+
+
+def resolve_field(record: Record, field_path: str) -> Any:
+    """Return the value at a dotted field path, or None if any step is missing."""
+    field_value: Any = record
+    for key in field_path.lower().split("."):
+        if not isinstance(field_value, Mapping):
+            return None
+        field_value = next(
+            (nested for name, nested in field_value.items() if name.lower() == key), None
+        )
+    return field_value
+
+
+def parse_rql(expression: str) -> RQLNode:
+    """Parse one RQL expression.
+
+    Args:
+        expression: The expression, e.g. ``and(eq(status,Draft),ilike(name,*cloud*))``.
+
+    Returns:
+        The root call of the expression.
+
+    Raises:
+        ValueError: If the expression is not a single well-formed call.
+
+    """
+    root_node, position = _parse_argument(expression, 0)
+    if not isinstance(root_node, RQLNode) or position != len(expression):
+        raise ValueError(f"Invalid RQL expression: {expression}")
+    return root_node
+
+
+def build_predicate(rql_node: RQLNode) -> Predicate:
+    """Turn a parsed RQL call into a record predicate.
+
+    Raises:
+        ValueError: If the call uses an unsupported operator.
+
+    """
+    rql_operator = rql_node.operator
+    if rql_operator in {"and", "or", "not"}:
+        predicates = [build_predicate(argument) for argument in _nodes(rql_node)]
+        if rql_operator == "and":
+            return lambda record: all(predicate(record) for predicate in predicates)
+        if rql_operator == "or":
+            return lambda record: any(predicate(record) for predicate in predicates)
+        return lambda record: not predicates[0](record)
+
+    field_path, expected = rql_node.arguments
+    comparison = _COMPARISONS.get(rql_operator)
+    if comparison is None or not isinstance(field_path, str):
+        raise ValueError(f"Unsupported RQL operator: {rql_operator}")
+    return lambda record: comparison(_as_text(resolve_field(record, field_path)), expected)
+
+
+def parse_query_string(raw_query: str) -> tuple[dict[str, str], Predicate]:
+    """Split a raw query string into plain parameters and one combined RQL predicate.
+
+    The Marketplace client appends RQL calls to the query string unencoded next to
+    ``limit``, ``offset``, ``order`` and ``select``. Calls without a record field, like
+    ``render()``, are ignored.
+
+    Args:
+        raw_query: The query string without the leading ``?``.
+
+    Returns:
+        The plain parameters and a predicate matching every RQL call.
+
+    """
+    query_params: dict[str, str] = {}
+    predicates: list[Predicate] = []
+    for query_part in map(unquote, filter(None, raw_query.split("&"))):
+        parameter_name, _, parameter_value = query_part.partition("=")
+        if parameter_name in QUERY_PARAMETERS:
+            query_params[parameter_name] = parameter_value
+        else:
+            predicates.extend(_query_part_predicates(query_part))
+    return query_params, lambda record: all(predicate(record) for predicate in predicates)
+
+
+def _query_part_predicates(query_part: str) -> list[Predicate]:
+    rql_node = parse_rql(query_part)
+    return [build_predicate(rql_node)] if rql_node.arguments else []
+
+
+def _parse_argument(expression: str, position: int) -> tuple[RQLNode | str, int]:
+    if expression.startswith("'", position):
+        closing_position = expression.index("'", position + 1)
+        return expression[position + 1 : closing_position], closing_position + 1
+
+    end = position
+    while end < len(expression) and expression[end] not in SPECIAL_CHARACTERS:
+        end += 1
+    if expression.startswith("(", end):
+        return _parse_call(expression, expression[position:end], end + 1)
+    return expression[position:end], end
+
+
+def _parse_call(expression: str, rql_operator: str, position: int) -> tuple[RQLNode, int]:
+    arguments = []
+    while not expression.startswith(")", position):
+        if position >= len(expression):
+            raise ValueError(f"Unterminated RQL call {rql_operator}: {expression}")
+        argument, position = _parse_argument(expression, position)
+        arguments.append(argument)
+        if expression.startswith(",", position):
+            position += 1
+    return RQLNode(rql_operator, tuple(arguments)), position + 1
+
+
+def _nodes(rql_node: RQLNode) -> list[RQLNode]:
+    return [argument for argument in rql_node.arguments if isinstance(argument, RQLNode)]
+
+
+def _choices(expected: RQLNode | str) -> set[str]:
+    if isinstance(expected, RQLNode):
+        return {str(argument) for argument in expected.arguments}
+    return {expected}
+
+
+def _as_text(field_value: Any) -> str:
+    if field_value is None:
+        return "null"
+    if isinstance(field_value, bool):
+        return str(field_value).lower()
+    return str(field_value)
+
+
+_COMPARISONS: Mapping[str, Callable[[str, Any], bool]] = MappingProxyType({
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "in": lambda actual, expected: actual in _choices(expected),
+    "out": lambda actual, expected: actual not in _choices(expected),
+    "like": fnmatchcase,
+    "ilike": lambda actual, expected: fnmatchcase(actual.lower(), expected.lower()),
+})
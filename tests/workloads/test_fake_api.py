@@ -0,0 +1,118 @@
+from http import HTTPStatus
+
+import pytest
+from cli.core.errors import MPTAPIError
+from cli.core.price_lists.api import PriceListItemAPIService
+from cli.core.products.api import ItemAPIService, ProductAPIService, TemplateAPIService
+from cli.plugins.audit_plugin.api import get_audit_records_by_object
+
+from tests.workloads.fake_api import FakeMPTServer, FaultInjection, Route
+from tests.workloads.records import PRICE_LIST_ID, PRODUCT_ID
+
+FAULT_LATENCY = 0.25
+
+
+@pytest.mark.parametrize(
+    ("path", "expected_route"),
+    [
+        ("/public/v1/catalog/products?limit=1", Route("catalog/products", "limit=1")),
+        ("/public/v1/catalog/products/PRD-1", Route("catalog/products", "", "PRD-1")),
+        (
+            "/public/v1/catalog/products/PRD-1/item-groups",
+            Route("catalog/products/PRD-1/item-groups"),
+        ),
+        ("/public/v1/catalog/items/ITM-1/publish", Route("catalog/items", "", "ITM-1", "publish")),
+        (
+            "/public/v1/catalog/products/PRD-1/settings",
+            Route("catalog/products", "", "PRD-1", "settings"),
+        ),
+    ],
+)
+def test_route_from_path(path, expected_route):
+    result = Route.from_path(path)
+
+    assert result == expected_route
+
+
+def test_list_paginates_filtered_records(fake_mpt_client):
+    service = ItemAPIService(fake_mpt_client, PRODUCT_ID)
+
+    result = service.list({"product.id": PRODUCT_ID, "limit": 10, "offset": 20})
+
+    assert result["meta"] == {"limit": 10, "offset": 20, "total": 25}
+    assert [product_item["id"] for product_item in result["data"]] == [
+        "ITM-1234-1234-0021",
+        "ITM-1234-1234-0022",
+        "ITM-1234-1234-0023",
+        "ITM-1234-1234-0024",
+        "ITM-1234-1234-0025",
+    ]
+
+
+def test_list_filters_nested_fields(fake_mpt_client):
+    service = PriceListItemAPIService(fake_mpt_client, PRICE_LIST_ID)
+
+    result = service.list({"item.ExternalIds.vendor": "VND-000003", "limit": 1})
+
+    assert result["meta"]["total"] == 1
+    assert result["data"][0]["id"] == "PRI-1234-1234-1234-0003"
+
+
+def test_create_update_and_get(fake_mpt_client, fake_api):
+    service = TemplateAPIService(fake_mpt_client, PRODUCT_ID)
+    template = service.post(json={"name": "New template", "type": "OrderProcessing"})
+
+    service.update(template["id"], {"name": "Renamed template"})  # act
+
+    assert service.get(template["id"])["name"] == "Renamed template"
+    assert len(fake_api.records(f"catalog/products/{PRODUCT_ID}/templates")) == 4
+
+
+def test_update_multipart(fake_mpt_client):
+    service = ProductAPIService(fake_mpt_client)
+
+    fake_mpt_client.catalog.products.update(PRODUCT_ID, {"name": "Renamed product"})  # act
+
+    assert service.get(PRODUCT_ID)["name"] == "Renamed product"
+
+
+def test_post_action(fake_mpt_client):
+    service = ItemAPIService(fake_mpt_client, PRODUCT_ID)
+
+    service.post_action("ITM-1234-1234-0001", "publish")  # act
+
+    assert service.get("ITM-1234-1234-0001")["status"] == "Published"
+
+
+def test_update_sub_resource(fake_mpt_client):
+    service = ProductAPIService(fake_mpt_client)
+
+    service.update(f"{PRODUCT_ID}/settings", {"itemSelection": False})  # act
+
+    assert service.get(PRODUCT_ID)["settings"]["itemSelection"] is False
+
+
+def test_audit_records_ordered_by_timestamp(fake_mpt_client):
+    result = get_audit_records_by_object(fake_mpt_client, PRODUCT_ID, limit=2)
+
+    assert [record["id"] for record in result] == ["AUD-1234-1234-0010", "AUD-1234-1234-0009"]
+
+
+def test_missing_resource(fake_mpt_client):
+    with pytest.raises(MPTAPIError, match="404"):
+        ProductAPIService(fake_mpt_client).get("PRD-0000-0000")
+
+
+def test_fault_injection(fake_api, mocker):
+    sleep_mock = mocker.patch("tests.workloads.fake_api.time.sleep")
+    faults = FaultInjection(
+        latency=FAULT_LATENCY, error_rate=1, error_status=HTTPStatus.TOO_MANY_REQUESTS
+    )
+    server = FakeMPTServer(fake_api, faults)
+
+    result = server.respond("GET", f"/public/v1/catalog/products/{PRODUCT_ID}", None)
+
+    assert result.status == HTTPStatus.TOO_MANY_REQUESTS
+    assert result.headers == {"Retry-After": "0"}
+    assert server.request_count == 1
+    sleep_mock.assert_called_once_with(FAULT_LATENCY)
@@ -0,0 +1,56 @@
+import pytest
+from cli.core.price_lists.handlers import PriceListExcelFileManager, PriceListItemExcelFileManager
+from cli.core.products import handlers as product_handlers
+
+from tests.workloads import (
+    ProductWorkload,
+    generate_price_list_workbook,
+    generate_product_workbook,
+)
+from tests.workloads.records import PRICE_LIST_ID, PRODUCT_ID
+
+PARAMETER_COUNT = 11
+PRICE_ITEM_COUNT = 25
+
+
+@pytest.fixture
+def workload():
+    return ProductWorkload(
+        item_count=7,
+        item_group_count=3,
+        parameter_group_count=2,
+        parameter_count=PARAMETER_COUNT,
+        template_count=4,
+    )
+
+
+def test_generate_product_workbook(tmp_path, workload):
+    result = generate_product_workbook(tmp_path / "product.xlsx", workload)
+
+    product_file_manager = product_handlers.ProductExcelFileManager(str(result))
+    product_file_manager.check_required_tabs()
+    product_file_manager.check_required_fields_by_section()
+    assert product_file_manager.read_data().id == PRODUCT_ID
+    product_items = list(product_handlers.ItemExcelFileManager(str(result)).read_data())
+    assert len(product_items) == workload.item_count
+    assert len({row.group_id for row in product_items}) == workload.item_group_count
+
+
+def test_generate_product_workbook_components(tmp_path, workload):
+    result = generate_product_workbook(tmp_path / "product.xlsx", workload)
+
+    agreement_parameters = product_handlers.AgreementParametersExcelFileManager(str(result))
+    assert len(list(agreement_parameters.read_data())) == 3
+    templates = product_handlers.TemplateExcelFileManager(str(result))
+    assert len(list(templates.read_data())) == workload.template_count
+
+
+def test_generate_price_list_workbook(tmp_path):
+    result = generate_price_list_workbook(
+        tmp_path / "price_list.xlsx", price_items=PRICE_ITEM_COUNT
+    )
+
+    assert PriceListExcelFileManager(str(result)).read_data().id == PRICE_LIST_ID
+    price_items = list(PriceListItemExcelFileManager(str(result)).read_data())
+    assert len(price_items) == PRICE_ITEM_COUNT
+    assert price_items[-1].vendor_id == "VND-000025"
@@ -0,0 +1,58 @@
+import pytest
+
+from tests.workloads.rql import RQLNode, build_predicate, parse_query_string, parse_rql
+
+
+@pytest.fixture
+def rql_record():
+    return {
+        "name": "Cloud Backup",
+        "status": "Draft",
+        "default": True,
+        "item": {"externalIds": {"vendor": "VND-000001"}},
+    }
+
+
+def test_parse_rql():
+    result = parse_rql("and(eq(status,'Draft'),in(id,(A,B)))")
+
+    status_node = RQLNode("eq", ("status", "Draft"))
+    id_node = RQLNode("in", ("id", RQLNode("", ("A", "B"))))
+    assert result == RQLNode("and", (status_node, id_node))
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected_match"),
+    [
+        ("eq(status,Draft)", True),
+        ("ne(status,Draft)", False),
+        ("eq(default,true)", True),
+        ("eq(item.ExternalIds.vendor,VND-000001)", True),
+        ("eq(missing,null)", True),
+        ("in(status,(Draft,Published))", True),
+        ("out(status,(Draft,Published))", False),
+        ("ilike(name,*backup*)", True),
+        ("like(name,*backup*)", False),
+        ("or(eq(status,Published),not(eq(default,false)))", True),
+    ],
+)
+def test_build_predicate(rql_record, expression, expected_match):
+    predicate = build_predicate(parse_rql(expression))
+
+    result = predicate(rql_record)
+
+    assert result is expected_match
+
+
+def test_parse_query_string(rql_record):
+    result = parse_query_string("limit=10&offset=0&order=-name&eq(status,%27Draft%27)&render()")
+
+    query_params, predicate = result
+    assert query_params == {"limit": "10", "offset": "0", "order": "-name"}
+    assert predicate(rql_record) is True
+
+
+@pytest.mark.parametrize("expression", ["eq(status,Draft", "status", "gt(price,1)"])
+def test_invalid_rql(expression):
+    with pytest.raises(ValueError):
+        build_predicate(parse_rql(expression))